@@ -0,0 +1,164 @@
+"""
+Cafe24 계정 저장소
+accounts.json 에 저장된 멀티 계정(쇼핑몰) 정보와 토큰을 읽고 쓰는 공용 모듈
+app.py 와 CLI 도구들이 함께 사용
+
+요청마다 shop_id 로 계정을 바로 찾으므로 (get_account) 여러 쇼핑몰을 동시에 처리할 수 있음
+current_account 는 shop_id 를 주지 않는 기존 클라이언트 / CLI 용 기본값
+
+읽고-수정하고-쓰기는 스레드 잠금 + accounts.json.lock 파일 잠금(fcntl) 안에서 하므로
+gunicorn 워커 / 스케줄러 / CLI 가 동시에 저장해도 서로의 변경을 덮어쓰지 않음
+(fcntl 이 없는 Windows 에서는 한 프로세스 안에서만 보호)
+"""
+import os
+import json
+import time
+import secrets
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 계정 파일 경로
+ACCOUNTS_FILE = 'accounts.json'
+
+# OAuth state 유효 시간 (인증 시작 ~ 콜백)
+OAUTH_STATE_TTL = 600
+
+# 읽고-수정하고-쓰는 동안 다른 요청의 저장이 끼어들지 않도록
+_write_lock = threading.RLock()
+_lock_depth = 0  # 같은 스레드에서 중첩된 잠금 수 (파일 잠금은 가장 바깥에서 한 번만)
+
+
+@contextmanager
+def _store_lock():
+    """스레드 잠금 + 프로세스 간 파일 잠금 (같은 스레드에서 중첩 가능)"""
+    global _lock_depth
+    with _write_lock:
+        lock_file = None
+        if _lock_depth == 0 and fcntl is not None:
+            lock_file = open(f"{ACCOUNTS_FILE}.lock", 'a')
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            if lock_file is not None:
+                # 닫으면 파일 잠금도 풀림
+                lock_file.close()
+
+
+def load_accounts():
+    """계정 목록 로드"""
+    if os.path.exists(ACCOUNTS_FILE):
+        with open(ACCOUNTS_FILE, 'r') as f:
+            return json.load(f)
+    return {'accounts': {}, 'current_account': None}
+
+
+def save_accounts(accounts_data):
+    """계정 목록 저장 (임시 파일에 쓴 뒤 교체, 읽는 쪽이 반쯤 쓴 파일을 보지 않음)
+
+    다른 저장과 합쳐야 하면 load_accounts 부터 _store_lock 안에서 호출
+    """
+    # 쓰는 프로세스/스레드마다 임시 파일을 나눔
+    tmp_path = f"{ACCOUNTS_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _store_lock():
+        with open(tmp_path, 'w') as f:
+            json.dump(accounts_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, ACCOUNTS_FILE)
+
+
+def get_account(shop_id):
+    """Shop ID로 계정 가져오기"""
+    return load_accounts()['accounts'].get(shop_id)
+
+
+def get_current_account():
+    """현재 선택된 계정 가져오기"""
+    accounts_data = load_accounts()
+    current_id = accounts_data.get('current_account')
+    if current_id and current_id in accounts_data['accounts']:
+        return accounts_data['accounts'][current_id]
+    return None
+
+
+def save_account(shop_id, account_info):
+    """계정 정보 저장"""
+    with _store_lock():
+        accounts_data = load_accounts()
+        accounts_data['accounts'][shop_id] = account_info
+        if not accounts_data.get('current_account'):
+            accounts_data['current_account'] = shop_id
+        save_accounts(accounts_data)
+
+
+def save_token(shop_id, token_data):
+    """토큰만 교체 (그 사이 바뀐 다른 계정 정보는 유지), 계정이 없으면 False"""
+    with _store_lock():
+        accounts_data = load_accounts()
+        account = accounts_data['accounts'].get(shop_id)
+        if account is None:
+            return False
+        account['token'] = token_data
+        save_accounts(accounts_data)
+        return True
+
+
+def set_current_account(shop_id):
+    """기본 계정 변경, 계정이 없으면 False"""
+    with _store_lock():
+        accounts_data = load_accounts()
+        if shop_id not in accounts_data['accounts']:
+            return False
+        accounts_data['current_account'] = shop_id
+        save_accounts(accounts_data)
+        return True
+
+
+def remove_account(shop_id):
+    """계정 삭제 (기본 계정이었으면 남은 첫 번째 계정으로), 계정이 없으면 False"""
+    with _store_lock():
+        accounts_data = load_accounts()
+        if shop_id not in accounts_data['accounts']:
+            return False
+        del accounts_data['accounts'][shop_id]
+        if accounts_data.get('current_account') == shop_id:
+            accounts_data['current_account'] = next(iter(accounts_data['accounts']), None)
+        save_accounts(accounts_data)
+        return True
+
+
+def create_oauth_state(shop_id, ttl=OAUTH_STATE_TTL):
+    """OAuth 인증 시작용 state (추측할 수 없는 값, 서버에 shop_id 와 함께 보관)
+
+    accounts.json 에 두므로 콜백을 다른 프로세스(gunicorn 워커)가 받아도 찾을 수 있음
+    (다른 프로세스의 저장과 겹쳐도 파일 잠금으로 state 가 사라지지 않음)
+    """
+    state = secrets.token_urlsafe(24)
+    now = int(time.time())
+    with _store_lock():
+        accounts_data = load_accounts()
+        states = {key: value for key, value in accounts_data.get('oauth_states', {}).items()
+                  if value.get('expires_at', 0) > now}
+        states[state] = {'shop_id': shop_id, 'expires_at': now + ttl}
+        accounts_data['oauth_states'] = states
+        save_accounts(accounts_data)
+    return state
+
+
+def pop_oauth_state(state):
+    """state 에 해당하는 shop_id (한 번만 사용 가능), 없거나 만료됐으면 None"""
+    if not state:
+        return None
+    with _store_lock():
+        accounts_data = load_accounts()
+        entry = accounts_data.get('oauth_states', {}).pop(state, None)
+        if entry is None:
+            return None
+        save_accounts(accounts_data)
+    return entry['shop_id'] if entry.get('expires_at', 0) > time.time() else None
@@ -9,12 +9,23 @@ import json
 import time
 import webbrowser
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, redirect
+from flask import Flask, render_template, request, jsonify, redirect, send_file
 import requests
 from dotenv import load_dotenv, set_key
 from apscheduler.schedulers.background import BackgroundScheduler
 import atexit
 import base64
+import sqlite3
+from account_store import (load_accounts, get_account, get_current_account, save_account, save_token,
+                           set_current_account, remove_account, create_oauth_state, pop_oauth_state)
+from webhook_queue import WebhookQueue, verify_signature, idempotency_key
+from cafe24_api import Cafe24Session
+from bulk_write import bulk_write
+from docs_search import search as search_docs
+from docs_assets import DocsAssets
+from token_refresh import RefreshAheadPolicy, refresh_access_token, token_expires_at
+from token_cache import TokenCache
+from param_validators import validate_request
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -25,9 +36,11 @@ load_dotenv()
 
 # 설정 파일 경로
 CONFIG_FILE = 'config.json'
-ACCOUNTS_FILE = 'accounts.json'
 ENV_FILE = '../.env'
 
+# 요청 대상 쇼핑몰 (없으면 accounts.json 의 기본 계정)
+SHOP_ID_HEADER = 'X-Shop-Id'
+
 # 전역 변수로 앱 설정 저장
 app_config = {}
 
@@ -61,40 +74,42 @@ def extract_shop_id(app_url):
     return ''
 
 
-def load_accounts():
-    """계정 목록 로드"""
-    if os.path.exists(ACCOUNTS_FILE):
-        with open(ACCOUNTS_FILE, 'r') as f:
-            return json.load(f)
-    return {'accounts': {}, 'current_account': None}
-
+def request_account(shop_id=None):
+    """요청 대상 계정 (경로의 shop_id > X-Shop-Id 헤더 > ?shop_id= > 저장된 기본 계정)
 
-def save_accounts(accounts_data):
-    """계정 목록 저장"""
-    with open(ACCOUNTS_FILE, 'w') as f:
-        json.dump(accounts_data, f, indent=2, ensure_ascii=False)
+    shop_id 를 지정했는데 없는 계정이면 None (기본 계정으로 대신하지 않음)
+    """
+    shop_id = shop_id or request.headers.get(SHOP_ID_HEADER) or request.args.get('shop_id')
+    account = get_account(shop_id) if shop_id else get_current_account()
+    if account and account.get('shop_id'):
+        sync_shared_token(account['shop_id'], account)
+    return account
 
 
-def get_current_account():
-    """현재 선택된 계정 가져오기"""
-    accounts_data = load_accounts()
-    current_id = accounts_data.get('current_account')
-    if current_id and current_id in accounts_data['accounts']:
-        return accounts_data['accounts'][current_id]
-    return None
+def sync_shared_token(shop_id, account):
+    """다른 서버가 갱신한 토큰이 더 새것이면 받아서 accounts.json 에도 저장 (공유 캐시를 쓸 때만)"""
+    if token_cache is None:
+        return
+    token = account.get('token')
+    shared = token_cache.fresher(shop_id, token)
+    if shared is not token:
+        account['token'] = shared
+        save_token(shop_id, shared)
 
 
-def save_account(shop_id, account_info):
-    """계정 정보 저장"""
-    accounts_data = load_accounts()
-    accounts_data['accounts'][shop_id] = account_info
-    if not accounts_data.get('current_account'):
-        accounts_data['current_account'] = shop_id
-    save_accounts(accounts_data)
+def store_token(shop_id, token_data):
+    """새 토큰 저장 (공유 캐시를 쓰면 다른 서버에도 알림)"""
+    save_token(shop_id, token_data)
+    if token_cache is not None:
+        token_cache.put(shop_id, token_data)
 
 
 def auto_refresh_tokens():
-    """모든 계정의 토큰을 자동으로 갱신"""
+    """토큰 미리 갱신 (refresh_policy 주기마다 실행)
+
+    만료 전 구간 안의 토큰마다 다른 시점에 갱신하고 한 주기에 보내는 수를 제한해서
+    같은 시각에 만료되는 토큰이 많아도 Cafe24로 가는 갱신 요청은 고르게 유지
+    """
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 토큰 갱신 작업 시작...")
 
     accounts_data = load_accounts()
@@ -102,103 +117,54 @@ def auto_refresh_tokens():
         print("  → 등록된 계정이 없습니다.")
         return
 
-    current_time = int(time.time())
-    refresh_threshold = 3600  # 1시간 (3600초) 남았을 때 갱신
-
+    # 다른 서버가 이미 갱신한 토큰은 다시 갱신하지 않음
     for shop_id, account in accounts_data['accounts'].items():
-        token = account.get('token', {})
-
-        if not token or not token.get('refresh_token'):
-            print(f"  → {shop_id}: 토큰 없음, 스킵")
+        sync_shared_token(shop_id, account)
+
+    planned, stats = refresh_policy.plan(accounts_data['accounts'])
+    print(f"  → 갱신 {len(planned)}개 (급한 토큰 {stats['urgent']}개), "
+          f"갱신 시점 전 {stats['waiting']}개, 다음 주기로 미룸 {stats['deferred']}개, "
+          f"실패 후 대기 {stats['backoff']}개")
+    if stats['urgent'] > refresh_policy.max_per_cycle:
+        print("  ⚠️  급한 갱신이 주기당 제한보다 많습니다. TOKEN_REFRESH_WINDOW / TOKEN_REFRESH_MAX_PER_CYCLE 를 늘려주세요.")
+
+    pace = refresh_policy.pace(len(planned))
+    for i, (shop_id, time_remaining) in enumerate(planned):
+        if i and pace:
+            time.sleep(pace)
+
+        planned_expires_at = token_expires_at(accounts_data['accounts'][shop_id].get('token') or {})
+        lock = token_cache.acquire_refresh_lock(shop_id) if token_cache is not None else True
+        if not lock:
+            print(f"  - {shop_id}: 다른 서버가 갱신 중, 건너뜀")
             continue
-
-        # 토큰 만료 시간 확인
-        expires_at = token.get('expires_at', 0)
         try:
-            expires_at = int(expires_at)
-        except (ValueError, TypeError):
-            expires_at = 0
-
-        time_remaining = expires_at - current_time
-
-        # 만료까지 1시간 미만 남았으면 갱신
-        if time_remaining < refresh_threshold and time_remaining > 0:
-            print(f"  → {shop_id}: 토큰 갱신 필요 (남은 시간: {time_remaining // 60}분)")
-
-            try:
-                # 토큰 갱신 API 호출
-                token_url = f"https://{shop_id}.cafe24api.com/api/v2/oauth/token"
-
-                data = {
-                    'grant_type': 'refresh_token',
-                    'refresh_token': token['refresh_token']
-                }
-
-                credentials = f"{account['client_id']}:{account['client_secret']}"
-                encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
-                headers = {
-                    'Authorization': f'Basic {encoded_credentials}',
-                    'Content-Type': 'application/x-www-form-urlencoded'
-                }
-
-                response = requests.post(token_url, data=data, headers=headers)
-                response.raise_for_status()
-
-                result = response.json()
-
-                # 새 토큰으로 업데이트
-                new_expires_in = result.get('expires_in', 7200)
-                new_expires_at = current_time + new_expires_in
-
-                token_data = {
-                    'access_token': result['access_token'],
-                    'refresh_token': result.get('refresh_token', token['refresh_token']),
-                    'expires_at': new_expires_at,
-                    'issued_at': datetime.now().isoformat()
-                }
-
-                account['token'] = token_data
-                save_account(shop_id, account)
-
-                print(f"  ✓ {shop_id}: 토큰 갱신 성공! (새 만료 시간: {new_expires_in // 3600}시간 후)")
-
-            except Exception as e:
-                print(f"  ✗ {shop_id}: 토큰 갱신 실패 - {str(e)}")
-
-        elif time_remaining <= 0:
-            print(f"  → {shop_id}: 토큰 만료됨, Refresh Token으로 갱신 시도")
-            # 만료된 경우에도 Refresh Token이 유효하면 갱신 시도
-            try:
-                token_url = f"https://{shop_id}.cafe24api.com/api/v2/oauth/token"
-                data = {
-                    'grant_type': 'refresh_token',
-                    'refresh_token': token['refresh_token']
-                }
-                credentials = f"{account['client_id']}:{account['client_secret']}"
-                encoded_credentials = base64.b64encode(credentials.encode()).decode()
-                headers = {
-                    'Authorization': f'Basic {encoded_credentials}',
-                    'Content-Type': 'application/x-www-form-urlencoded'
-                }
-                response = requests.post(token_url, data=data, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-                new_expires_in = result.get('expires_in', 7200)
-                new_expires_at = current_time + new_expires_in
-                token_data = {
-                    'access_token': result['access_token'],
-                    'refresh_token': result.get('refresh_token', token['refresh_token']),
-                    'expires_at': new_expires_at,
-                    'issued_at': datetime.now().isoformat()
-                }
-                account['token'] = token_data
-                save_account(shop_id, account)
+            # 계획한 뒤(pace 대기 중) 다른 서버/프로세스가 갱신했으면 다시 갱신하지 않음
+            # (이전 Refresh Token을 또 쓰면 실패하거나 방금 발급된 토큰을 무효로 만들 수 있음)
+            account = get_account(shop_id)
+            if not account:
+                continue
+            sync_shared_token(shop_id, account)
+            if token_expires_at(account.get('token') or {}) > planned_expires_at:
+                print(f"  - {shop_id}: 다른 서버가 이미 갱신함, 건너뜀")
+                continue
+
+            token_data = refresh_access_token(shop_id, account)
+            store_token(shop_id, token_data)
+            refresh_policy.record_success(shop_id)
+            if time_remaining > 0:
+                print(f"  ✓ {shop_id}: 토큰 갱신 성공 (남은 시간 {time_remaining // 60}분에 갱신)")
+            else:
                 print(f"  ✓ {shop_id}: 만료된 토큰 갱신 성공!")
-            except Exception as e:
-                print(f"  ✗ {shop_id}: Refresh Token도 만료됨 - 재인증 필요")
-        else:
-            print(f"  → {shop_id}: 토큰 정상 (남은 시간: {time_remaining // 3600}시간 {(time_remaining % 3600) // 60}분)")
+        except Exception as e:
+            retry_in = refresh_policy.record_failure(shop_id, planned_expires_at)
+            if time_remaining > 0:
+                print(f"  ✗ {shop_id}: 토큰 갱신 실패 - {str(e)} ({retry_in // 60}분 뒤 다시 시도)")
+            else:
+                print(f"  ✗ {shop_id}: Refresh Token도 만료됨 - 재인증 필요 ({retry_in // 60}분 뒤 다시 시도)")
+        finally:
+            if token_cache is not None:
+                token_cache.release_refresh_lock(shop_id, lock)
 
     print("자동 토큰 갱신 작업 완료\n")
 
@@ -214,6 +180,7 @@ def index():
 def get_accounts():
     """모든 계정 목록 조회"""
     accounts_data = load_accounts()
+    accounts_data.pop('oauth_states', None)
     # 토큰 상태 계산
     for shop_id, account in accounts_data['accounts'].items():
         if account.get('token'):
@@ -243,14 +210,14 @@ def get_accounts():
 
 @app.route('/api/accounts/switch', methods=['POST'])
 def switch_account():
-    """계정 전환"""
+    """기본 계정 변경 (shop_id 없이 호출하는 기존 클라이언트 / CLI 용)
+
+    웹 화면은 선택한 계정을 브라우저에 저장하고 X-Shop-Id 헤더로 보내므로 이 API를 쓰지 않음
+    """
     data = request.json
     shop_id = data.get('shop_id')
 
-    accounts_data = load_accounts()
-    if shop_id in accounts_data['accounts']:
-        accounts_data['current_account'] = shop_id
-        save_accounts(accounts_data)
+    if set_current_account(shop_id):
         return jsonify({'success': True, 'message': f'{shop_id} 계정으로 전환되었습니다.'})
 
     return jsonify({'success': False, 'message': '계정을 찾을 수 없습니다.'})
@@ -262,30 +229,20 @@ def delete_account():
     data = request.json
     shop_id = data.get('shop_id')
 
-    accounts_data = load_accounts()
-    if shop_id in accounts_data['accounts']:
-        del accounts_data['accounts'][shop_id]
-
-        # 현재 계정이 삭제된 경우
-        if accounts_data['current_account'] == shop_id:
-            # 다른 계정이 있으면 첫 번째 계정으로 전환
-            if accounts_data['accounts']:
-                accounts_data['current_account'] = list(accounts_data['accounts'].keys())[0]
-            else:
-                accounts_data['current_account'] = None
-
-        save_accounts(accounts_data)
+    # 현재 계정이 삭제되면 다른 계정이 있을 때 첫 번째 계정으로 전환
+    if remove_account(shop_id):
         return jsonify({'success': True, 'message': f'{shop_id} 계정이 삭제되었습니다.'})
 
     return jsonify({'success': False, 'message': '계정을 찾을 수 없습니다.'})
 
 
 @app.route('/api/config', methods=['GET', 'POST'])
-def handle_config():
+@app.route('/api/shops/<shop_id>/config', methods=['GET'])
+def handle_config(shop_id=None):
     """설정 관리 API"""
     if request.method == 'GET':
-        # 현재 선택된 계정 정보 반환
-        account = get_current_account()
+        # 요청한 계정 정보 반환
+        account = request_account(shop_id)
         if account:
             return jsonify(account)
         return jsonify({})
@@ -318,9 +275,10 @@ def handle_config():
 
 
 @app.route('/api/auth/start')
-def start_auth():
+@app.route('/api/shops/<shop_id>/auth/start')
+def start_auth(shop_id=None):
     """인증 시작 - Authorization URL 생성"""
-    account = get_current_account()
+    account = request_account(shop_id)
 
     if not account or not account.get('client_id') or not account.get('shop_id'):
         return jsonify({'success': False, 'message': '설정을 먼저 입력해주세요.'})
@@ -353,7 +311,7 @@ def start_auth():
     params = {
         'response_type': 'code',
         'client_id': config['client_id'],
-        'state': 'app_install',
+        'state': create_oauth_state(config['shop_id']),  # 콜백에서 어느 계정의 인증인지 찾는 데 사용
         'redirect_uri': redirect_uri,
         'scope': scope_string
     }
@@ -386,8 +344,13 @@ def auth_callback():
                              success=False,
                              message='인증 코드를 받지 못했습니다.')
 
-    # Access Token 발급
-    account = get_current_account()
+    # Access Token 발급 (인증 시작 시 만든 state 로 계정 찾기, 모르는 state 는 거부)
+    shop_id = pop_oauth_state(state)
+    if not shop_id:
+        return render_template('callback.html',
+                             success=False,
+                             message='인증 요청이 만료되었거나 올바르지 않습니다. 다시 인증해주세요.')
+    account = get_account(shop_id)
     if not account:
         return render_template('callback.html',
                              success=False,
@@ -438,13 +401,10 @@ def auth_callback():
         }
 
         # 계정에 토큰 저장 (멀티 계정 시스템)
-        shop_id = config['shop_id']
-        account = get_current_account()
         account['token'] = token_data
-        save_account(shop_id, account)
+        store_token(config['shop_id'], token_data)
 
         # 레거시 config.json도 업데이트 (호환성)
-        config['token'] = token_data
         save_config(config)
 
         # 환경 변수 파일에도 저장
@@ -463,63 +423,29 @@ def auth_callback():
 
 
 @app.route('/api/token/refresh', methods=['POST'])
-def refresh_token():
+@app.route('/api/shops/<shop_id>/token/refresh', methods=['POST'])
+def refresh_token(shop_id=None):
     """토큰 갱신"""
-    account = get_current_account()
+    account = request_account(shop_id)
 
     if not account or not account.get('token', {}).get('refresh_token'):
         return jsonify({'success': False, 'message': 'Refresh Token이 없습니다.'})
 
     config = account
-    token_url = f"https://{config['shop_id']}.cafe24api.com/api/v2/oauth/token"
-
-    data = {
-        'grant_type': 'refresh_token',
-        'refresh_token': config['token']['refresh_token']
-    }
-
-    # Authorization 헤더: Basic Auth (client_id:client_secret를 Base64 인코딩)
-    import base64
-    credentials = f"{config['client_id']}:{config['client_secret']}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
-    headers = {
-        'Authorization': f'Basic {encoded_credentials}',
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
 
     try:
-        response = requests.post(token_url, data=data, headers=headers)
-        response.raise_for_status()
-
-        result = response.json()
-
-        # 새 토큰으로 업데이트
-        # expires_at 계산: expires_in이 있으면 사용, 없으면 기본 2시간
-        current_time = int(time.time())
-        expires_in = result.get('expires_in', 7200)
-        expires_at = current_time + expires_in
-
-        token_data = {
-            'access_token': result['access_token'],
-            'refresh_token': result.get('refresh_token', config['token']['refresh_token']),
-            'expires_at': expires_at,
-            'issued_at': datetime.now().isoformat()
-        }
+        token_data = refresh_access_token(config['shop_id'], config)
 
         # 계정에 토큰 저장 (멀티 계정 시스템)
-        shop_id = config['shop_id']
-        account = get_current_account()
         account['token'] = token_data
-        save_account(shop_id, account)
+        store_token(config['shop_id'], token_data)
 
         # 레거시 config.json도 업데이트 (호환성)
-        config['token'] = token_data
         save_config(config)
 
         # 환경 변수 파일에도 저장
-        update_env_file('ACCESS_TOKEN', result['access_token'])
-        update_env_file('REFRESH_TOKEN', result.get('refresh_token', config['token']['refresh_token']))
+        update_env_file('ACCESS_TOKEN', token_data['access_token'])
+        update_env_file('REFRESH_TOKEN', token_data['refresh_token'])
 
         return jsonify({
             'success': True,
@@ -532,9 +458,10 @@ def refresh_token():
 
 
 @app.route('/api/token/status')
-def token_status():
+@app.route('/api/shops/<shop_id>/token/status')
+def token_status(shop_id=None):
     """토큰 상태 확인"""
-    account = get_current_account()
+    account = request_account(shop_id)
     if not account:
         return jsonify({
             'has_token': False,
@@ -571,9 +498,10 @@ def token_status():
 
 
 @app.route('/api/test', methods=['POST'])
-def test_api():
+@app.route('/api/shops/<shop_id>/test', methods=['POST'])
+def test_api(shop_id=None):
     """API 테스트"""
-    account = get_current_account()
+    account = request_account(shop_id)
     if not account:
         return jsonify({'success': False, 'message': '계정을 선택해주세요.'})
 
@@ -583,7 +511,25 @@ def test_api():
     if not token.get('access_token'):
         return jsonify({'success': False, 'message': 'Access Token이 없습니다.'})
 
-    endpoint = request.json.get('endpoint', '/api/v2/admin/products')
+    data = request.json or {}
+    endpoint = data.get('endpoint', '/api/v2/admin/products')
+    method = str(data.get('method', 'GET')).upper()
+    body = data.get('body')
+    if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+        return jsonify({'success': False, 'message': 'method는 GET/POST/PUT/DELETE 중 하나여야 합니다.'}), 400
+    if body is not None and (method == 'GET' or not isinstance(body, dict)):
+        return jsonify({'success': False, 'message': 'body는 POST/PUT/DELETE의 JSON 객체만 보낼 수 있습니다.'}), 400
+
+    # 문서화된 작업 (작업별 지표 / 캐시 TTL / scope 확인용, 문서에 없는 경로면 None)
+    # 실제로 보낼 method / 본문 그대로 검사, 스펙과 맞지 않는 파라미터는 Cafe24로 보내지 않고 바로 400
+    operation, errors = validate_request(method, endpoint, body)
+    if errors:
+        return jsonify({
+            'success': False,
+            'message': '요청 파라미터 오류: ' + ', '.join(f"{error['field']} - {error['message']}" for error in errors),
+            'errors': errors,
+            'operation': operation
+        }), 400
 
     url = f"https://{config['shop_id']}.cafe24api.com{endpoint}"
 
@@ -597,10 +543,10 @@ def test_api():
     try:
         # 디버깅: 요청 정보 로깅
         print(f"API Test Request:")
-        print(f"  URL: {url}")
+        print(f"  {method} {url}")
         print(f"  Headers: {headers}")
 
-        response = requests.get(url, headers=headers)
+        response = requests.request(method, url, headers=headers, json=body)
 
         # 디버깅: 응답 정보 로깅
         print(f"  Response Status: {response.status_code}")
@@ -612,6 +558,7 @@ def test_api():
         return jsonify({
             'success': True,
             'status_code': response.status_code,
+            'operation': operation,
             'data': response.json()
         })
 
@@ -626,13 +573,161 @@ def test_api():
         return jsonify({
             'success': False,
             'message': f'API 호출 실패: {error_detail}',
-            'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
+            'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None,
+            'operation': operation
         })
 
 
+@app.route('/api/bulk', methods=['POST'])
+@app.route('/api/shops/<shop_id>/bulk', methods=['POST'])
+def bulk_write_api(shop_id=None):
+    """대량 쓰기 (requests 배열을 받는 Admin API에 자동 분할 전송)"""
+    account = request_account(shop_id)
+    if not account:
+        return jsonify({'success': False, 'message': '계정을 선택해주세요.'})
+
+    data = request.json or {}
+    method = data.get('method', 'POST').upper()
+    path = data.get('path', '')
+    items = data.get('items', [])
+
+    if method not in ('POST', 'PUT', 'DELETE') or not path.startswith('/api/v2/admin/'):
+        return jsonify({'success': False, 'message': 'method(POST/PUT/DELETE)와 Admin API path를 확인해주세요.'})
+    if not isinstance(items, list) or not items:
+        return jsonify({'success': False, 'message': 'items 배열이 비어 있습니다.'})
+
+    try:
+        batch_size = int(data['batch_size']) if data.get('batch_size') is not None else None
+        workers = int(data.get('workers', 4))
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': 'batch_size와 workers는 정수여야 합니다.'}), 400
+    if (batch_size is not None and batch_size < 1) or not 1 <= workers <= 16:
+        return jsonify({'success': False, 'message': 'batch_size는 1 이상, workers는 1~16이어야 합니다.'}), 400
+
+    try:
+        session = Cafe24Session(account['shop_id'], account)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+    try:
+        result = bulk_write(
+            session, method, path, items,
+            batch_size=batch_size,
+            workers=workers,
+            shop_no=data.get('shop_no', 1)
+        )
+    finally:
+        session.close()
+
+    return jsonify({'success': result['failed'] == 0, **result})
+
+
+@app.route('/api/webhooks/cafe24', methods=['POST'])
+def receive_webhook():
+    """Cafe24 웹훅 수신 (검증 후 큐에 저장하고 즉시 응답)"""
+    raw_body = request.get_data()
+
+    try:
+        payload = json.loads(raw_body)
+    except ValueError:
+        return jsonify({'success': False, 'message': '잘못된 요청 본문입니다.'}), 400
+    resource = payload.get('resource') if isinstance(payload, dict) else None
+    if not isinstance(resource, dict):
+        return jsonify({'success': False, 'message': '잘못된 요청 본문입니다.'}), 400
+
+    shop_id = resource.get('mall_id')
+    account = get_account(shop_id) if shop_id else None
+    if not account:
+        return jsonify({'success': False, 'message': '계정을 찾을 수 없습니다.'}), 404
+
+    if not verify_signature(account, raw_body, request.headers):
+        return jsonify({'success': False, 'message': '웹훅 검증 실패'}), 401
+
+    # 처리는 워커가 담당, 여기서는 저장만 하고 바로 응답
+    is_new = webhook_queue.enqueue(shop_id, payload, idempotency_key(raw_body, request.headers))
+
+    return jsonify({'success': True, 'duplicate': not is_new})
+
+
+@app.route('/api/webhooks/stats')
+def webhook_stats():
+    """웹훅 큐 상태 조회"""
+    return jsonify(webhook_queue.stats())
+
+
+@app.route('/api/docs/search')
+def docs_search_api():
+    """스크래핑한 API 문서 검색 (q: 검색어, method / category / api_type: 필터)"""
+    started = time.perf_counter()
+    try:
+        limit = min(int(request.args.get('limit', 20)), 100)
+        results = search_docs(
+            request.args.get('q', ''),
+            method=request.args.get('method') or None,
+            category=request.args.get('category') or None,
+            api_type=request.args.get('api_type') or None,
+            limit=limit
+        )
+    except sqlite3.NotSupportedError as e:
+        # 서버의 SQLite 버전 문제 (요청 문제가 아님)
+        return jsonify({'success': False, 'message': str(e)}), 500
+    except (ValueError, sqlite3.Error) as e:
+        return jsonify({'success': False, 'message': f'검색 실패: {e}'}), 400
+
+    return jsonify({
+        'success': True,
+        'count': len(results),
+        'took_ms': round((time.perf_counter() - started) * 1000, 2),
+        'results': results
+    })
+
+
+@app.route('/api/docs/<path:relative_path>')
+def docs_file(relative_path):
+    """생성된 문서 파일 (api-index.json, categories/admin/products.json 등)
+
+    생성 시 만들어 둔 .br / .gz 압축본을 그대로 전송, ETag는 내용 해시
+    """
+    accepted = [encoding for encoding in ('br', 'gzip') if request.accept_encodings[encoding]]
+    asset = docs_assets.resolve(relative_path, accepted)
+    if asset is None:
+        return jsonify({'success': False, 'message': '문서를 찾을 수 없습니다.'}), 404
+
+    if request.if_none_match.contains(asset['etag']):
+        response = app.response_class(status=304)
+    else:
+        # 파일 경로로 넘기면 WSGI 서버의 file_wrapper(sendfile)로 전송
+        response = send_file(asset['path'], mimetype=asset['mimetype'], conditional=False, etag=False)
+        if asset['encoding']:
+            response.headers['Content-Encoding'] = asset['encoding']
+    response.set_etag(asset['etag'])
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.cache_control.no_cache = True
+    return response
+
+
+docs_assets = DocsAssets()
+
+# 웹훅 처리 워커 (import 시점이 아니라 요청을 받는 프로세스에서 첫 요청 때 시작)
+webhook_queue = WebhookQueue()
+atexit.register(webhook_queue.stop)
+
+
+@app.before_request
+def start_webhook_workers():
+    if not webhook_queue.threads:
+        webhook_queue.start()
+
+
+# 여러 서버가 함께 쓰는 토큰 캐시 (TOKEN_CACHE_URL 이 있을 때만)
+token_cache = TokenCache.from_env()
+if token_cache is not None:
+    atexit.register(token_cache.close)
+
 # 자동 토큰 갱신 스케줄러 초기화
+refresh_policy = RefreshAheadPolicy()
 scheduler = BackgroundScheduler()
-scheduler.add_job(func=auto_refresh_tokens, trigger="interval", hours=1)  # 1시간마다 실행
+scheduler.add_job(func=auto_refresh_tokens, trigger="interval", seconds=refresh_policy.interval)  # 기본 5분마다 실행
 scheduler.start()
 
 # 앱 종료 시 스케줄러도 종료
@@ -652,7 +747,7 @@ if __name__ == '__main__':
         print()
         print('브라우저에서 http://localhost:5001 을 열어주세요.')
         print()
-        print('🔄 자동 토큰 갱신 기능 활성화 (1시간마다 체크)')
+        print(f'🔄 자동 토큰 갱신 기능 활성화 ({refresh_policy.interval}초마다 체크, 만료 {refresh_policy.window}초 전부터 갱신)')
         print()
         print('종료하려면 Ctrl+C를 누르세요.')
         print('=' * 80)
@@ -0,0 +1,141 @@
+"""
+이미지 전처리 벤치마크
+docs/cafe24/screenshots 의 저장된 스크린샷으로 전처리 설정별
+전송 바이트 / 추정 이미지 토큰 / 생략된 빈 타일 수를 비교
+
+--live N 을 주면 각 설정으로 처음 N개 타일을 실제 Vision API로 분석해서
+원본 대비 엔드포인트 재현율(recall)도 측정 (OPENROUTER_API_KEY 필요, 결과는 캐시됨)
+
+사용법:
+    python bench_preprocess.py
+    python bench_preprocess.py --crop-left 280 --live 20 --report preprocess-report.json
+"""
+import os
+import json
+import time
+import base64
+import asyncio
+import argparse
+from pathlib import Path
+from image_preprocess import ImagePreprocessor, estimate_image_tokens, image_size
+
+SCREENSHOT_DIR = 'docs/cafe24/screenshots'
+
+
+def build_configs(crop_left):
+    """비교할 전처리 설정 목록 (None = 원본 그대로)"""
+    return {
+        'original': None,
+        'crop+trim': ImagePreprocessor(crop_left=crop_left),
+        'crop+trim+1024': ImagePreprocessor(crop_left=crop_left, max_width=1024),
+        'gray+jpeg': ImagePreprocessor(crop_left=crop_left, grayscale=True, image_format='jpeg', quality=80),
+        'gray+webp+1024': ImagePreprocessor(crop_left=crop_left, max_width=1024, grayscale=True,
+                                            image_format='webp', quality=75),
+    }
+
+
+def measure_offline(paths, preprocessor):
+    """설정 하나에 대한 바이트/토큰/빈 타일 통계"""
+    sent_bytes = 0
+    tokens = 0
+    skipped = 0
+    started = time.perf_counter()
+
+    for path in paths:
+        image_bytes = path.read_bytes()
+        if preprocessor:
+            processed = preprocessor.process(image_bytes)
+            if processed is None:
+                skipped += 1
+                continue
+            image_bytes = processed[0]
+        sent_bytes += len(base64.b64encode(image_bytes))
+        tokens += estimate_image_tokens(*image_size(image_bytes))
+
+    return {
+        'tiles': len(paths),
+        'skipped_blank': skipped,
+        'base64_bytes': sent_bytes,
+        'estimated_image_tokens': tokens,
+        'preprocess_seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+async def measure_live(paths, configs):
+    """설정별로 실제 분석해서 원본 대비 재현율 계산"""
+    from scrape_cafe24_vision import VisionAPIScraper
+    from vision_cache import VisionCache
+
+    found = {}
+    usage = {}
+    for name, preprocessor in configs.items():
+        scraper = VisionAPIScraper(cache=VisionCache(), preprocessor=preprocessor)
+        tiles = [{'index': i, 'path': str(path)} for i, path in enumerate(paths)]
+        results = await scraper.analyze_screenshots(tiles, 'bench')
+        found[name] = {
+            f"{ep.get('method')}:{ep.get('path')}"
+            for result in results for ep in result.get('endpoints', [])
+        }
+        usage[name] = scraper.usage.prompt_tokens
+
+    baseline = found['original']
+    return {
+        name: {
+            'endpoints': len(keys),
+            'prompt_tokens': usage[name],  # 캐시에서 가져온 타일은 0
+            'recall': round(len(keys & baseline) / len(baseline), 3) if baseline else None
+        }
+        for name, keys in found.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vision 이미지 전처리 벤치마크')
+    parser.add_argument('--screenshots', default=SCREENSHOT_DIR, help='스크린샷 디렉토리')
+    parser.add_argument('--crop-left', type=int, default=0, help='왼쪽에서 잘라낼 폭 (사이드바, px)')
+    parser.add_argument('--live', type=int, default=0, help='실제 API로 재현율을 측정할 타일 수')
+    parser.add_argument('--report', help='결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    paths = sorted(Path(args.screenshots).glob('*.png'))
+    configs = build_configs(args.crop_left)
+
+    print("\n" + "="*60)
+    print(f"🧪 이미지 전처리 벤치마크 ({len(paths)}개 스크린샷)")
+    print("="*60)
+
+    report = {'screenshots': len(paths), 'configs': {}}
+    baseline = None
+    for name, preprocessor in configs.items():
+        stats = measure_offline(paths, preprocessor)
+        stats['settings'] = preprocessor.describe() if preprocessor else None
+        report['configs'][name] = stats
+        baseline = baseline or stats
+
+        byte_ratio = stats['base64_bytes'] / baseline['base64_bytes'] * 100 if baseline['base64_bytes'] else 0
+        token_ratio = stats['estimated_image_tokens'] / baseline['estimated_image_tokens'] * 100 \
+            if baseline['estimated_image_tokens'] else 0
+        print(f"\n  [{name}]")
+        print(f"    - 전송 바이트: {stats['base64_bytes'] / 1024 / 1024:.1f}MB ({byte_ratio:.0f}%)")
+        print(f"    - 추정 이미지 토큰: {stats['estimated_image_tokens']:,} ({token_ratio:.0f}%)")
+        print(f"    - 빈 타일 생략: {stats['skipped_blank']}개")
+        print(f"    - 전처리 시간: {stats['preprocess_seconds']}초")
+
+    if args.live:
+        if not os.getenv('OPENROUTER_API_KEY'):
+            print("\n  ⚠️  OPENROUTER_API_KEY가 없어 재현율 측정을 건너뜁니다.")
+        else:
+            live = asyncio.run(measure_live(paths[:args.live], configs))
+            print(f"\n  📈 엔드포인트 재현율 (원본 대비, {args.live}개 타일)")
+            for name, stats in live.items():
+                report['configs'][name]['live'] = stats
+                print(f"    - {name}: {stats['endpoints']}개, recall {stats['recall']}, 실제 입력 토큰 {stats['prompt_tokens']:,}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 {args.report} 저장")
+
+
+if __name__ == '__main__':
+    main()
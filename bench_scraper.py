@@ -0,0 +1,125 @@
+"""
+스크래퍼 파이프라인 벤치마크 (오프라인)
+docs/cafe24/screenshots 의 저장된 스크린샷으로 캡처 → 분석 → 중복 제거 → OpenAPI 변환을
+실행하고 처리량과 최대 메모리를 측정 (스펙 파일은 쓰지 않음)
+
+분석 백엔드:
+    stub   - 가짜 응답 (--latency 로 API 지연 흉내)
+    replay - --record 로 녹화해 둔 실제 응답 재생
+
+사용법:
+    python bench_scraper.py
+    python bench_scraper.py --analyzer stub --latency 0.5 --concurrency 1,4,8
+    python bench_scraper.py --analyzer replay --batch-size 4 --report scraper-bench.json
+"""
+import io
+import json
+import time
+import asyncio
+import argparse
+import resource
+import tracemalloc
+from contextlib import redirect_stdout
+from scrape_cafe24_vision import VisionAPIScraper
+from vision_analyzers import ReplayAnalyzer, StubAnalyzer, DEFAULT_RECORD_DIR
+
+
+def build_analyzer(args):
+    if args.analyzer == 'replay':
+        return ReplayAnalyzer(args.record_dir, latency=args.latency)
+    return StubAnalyzer(latency=args.latency)
+
+
+async def run_once(args, concurrency):
+    """한 번 실행해서 단계별 시간/메모리 측정"""
+    analyzer = build_analyzer(args)
+    scraper = VisionAPIScraper(
+        max_concurrency=concurrency,
+        requests_per_second=args.rps,
+        mode='vision',
+        capture_mode='saved',
+        batch_size=args.batch_size,
+        analyzer=analyzer
+    )
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        admin_endpoints, front_endpoints = await scraper.scrape_all()
+    scraped = time.perf_counter()
+
+    scraper.convert_to_openapi(admin_endpoints + front_endpoints)
+    spec_bytes = len(json.dumps(scraper.openapi_spec, ensure_ascii=False).encode('utf-8'))
+    finished = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report = scraper.usage.report()
+    tiles = report['analyzed_tiles'] + report['cache_hits']
+    elapsed = finished - started
+    result = {
+        'concurrency': concurrency,
+        'tiles': tiles,
+        'requests': report['requests'],
+        'endpoints': len(admin_endpoints) + len(front_endpoints),
+        'paths': len(scraper.openapi_spec['paths']),
+        'spec_bytes': spec_bytes,
+        'scrape_seconds': round(scraped - started, 3),
+        'convert_seconds': round(finished - scraped, 4),
+        'total_seconds': round(elapsed, 3),
+        'tiles_per_second': round(tiles / elapsed, 1) if elapsed else None,
+        'peak_traced_mb': round(peak / 1024 / 1024, 2),
+        'prompt_tokens': report['prompt_tokens'],
+        'completion_tokens': report['completion_tokens']
+    }
+    if isinstance(analyzer, ReplayAnalyzer):
+        result['replay_hits'] = analyzer.hits
+        result['replay_misses'] = analyzer.misses
+    if args.verbose:
+        print(output.getvalue())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스크래퍼 파이프라인 벤치마크')
+    parser.add_argument('--analyzer', choices=['stub', 'replay'], default='stub', help='분석 백엔드')
+    parser.add_argument('--record-dir', default=DEFAULT_RECORD_DIR, help='replay 녹화 디렉토리')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 지연 (초)')
+    parser.add_argument('--concurrency', default='4', help='동시 분석 수 (쉼표로 여러 값)')
+    parser.add_argument('--rps', type=float, default=1000.0, help='초당 요청 수 제한')
+    parser.add_argument('--batch-size', type=int, default=1, help='요청당 최대 타일 수')
+    parser.add_argument('--report', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--verbose', action='store_true', help='스크래퍼 출력 표시')
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print(f"🏁 스크래퍼 파이프라인 벤치마크 (analyzer={args.analyzer}, latency={args.latency}s)")
+    print("="*60)
+
+    results = []
+    for concurrency in [int(value) for value in args.concurrency.split(',')]:
+        result = asyncio.run(run_once(args, concurrency))
+        results.append(result)
+        print(f"\n  [동시 {concurrency}]")
+        print(f"    - 타일: {result['tiles']}개, 요청: {result['requests']}회, "
+              f"엔드포인트: {result['endpoints']}개 (경로 {result['paths']}개)")
+        print(f"    - 처리량: {result['tiles_per_second']} 타일/초 "
+              f"(스크래핑 {result['scrape_seconds']}초, 변환 {result['convert_seconds']}초)")
+        print(f"    - 최대 메모리 (tracemalloc): {result['peak_traced_mb']}MB")
+        if 'replay_misses' in result:
+            print(f"    - 녹화 적중: {result['replay_hits']}회, 없음: {result['replay_misses']}회")
+
+    # Linux는 KB 단위
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\n  📈 프로세스 최대 RSS: {max_rss_mb:.1f}MB")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'analyzer': args.analyzer, 'latency': args.latency, 'batch_size': args.batch_size,
+                       'max_rss_mb': round(max_rss_mb, 1), 'runs': results}, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 {args.report} 저장")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Cafe24 멀티 쇼핑몰 대량 내보내기 CLI
+- 저장된 계정(accounts.json)의 모든 쇼핑몰을 병렬로 처리
+- 쇼핑몰 내부에서는 순차 페이지네이션 + 쇼핑몰별 호출 제한 준수
+- 쇼핑몰/리소스별 gzip NDJSON 저장
+- 페이지마다 체크포인트 저장 → 중단 후 재실행 시 이어서 진행
+
+사용 예:
+    python bulk_export.py
+    python bulk_export.py --resources products orders --workers 16
+    python bulk_export.py --shops myshop1 myshop2 --reset
+
+출력 위치: exports/{실행일}/{shop_id}/{resource}.ndjson.gz
+같은 날 다시 실행하면 중단된 지점부터 이어서 진행
+(주문은 체크포인트의 조회 기간이 이번 --start-date/--end-date 와 다르면 처음부터 다시 내보냄)
+"""
+import os
+import json
+import gzip
+import argparse
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from account_store import load_accounts
+from cafe24_api import Cafe24Session, RESOURCES
+
+EXPORTS_DIR = 'exports'
+PAGE_LIMIT = 100
+
+print_lock = threading.Lock()
+
+
+def log(message):
+    """스레드 간 출력이 섞이지 않도록 출력"""
+    with print_lock:
+        print(message, flush=True)
+
+
+class Checkpoint:
+    """쇼핑몰별 체크포인트 ({output}/{shop_id}/checkpoint.json)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.data = json.load(f)
+
+    def get(self, resource, window=None):
+        """리소스 진행 상태 (window: 기간으로 조회하는 리소스의 [시작일, 종료일])
+
+        저장된 상태가 다른 기간의 것이면 offset 이 다른 결과 집합을 가리키므로 새 상태 반환
+        """
+        state = self.data.get(resource)
+        if state is not None and state.get('window') == window:
+            return state
+        return {'offset': 0, 'since': None, 'records': 0, 'file_size': 0, 'done': False, 'window': window}
+
+    def save(self, resource, state):
+        """임시 파일에 쓴 뒤 교체 (중단되어도 체크포인트가 깨지지 않도록)"""
+        self.data[resource] = state
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+def date_window(resource, start_date, end_date):
+    """기간으로 조회하는 리소스면 [시작일, 종료일], 아니면 None"""
+    return [start_date, end_date] if resource == 'orders' else None
+
+
+def build_params(resource, state, start_date, end_date):
+    """리소스별 조회 파라미터 생성"""
+    spec = RESOURCES[resource]
+    params = {'limit': PAGE_LIMIT}
+
+    if spec['since_param']:
+        # since_* 방식: offset 제한 없이 마지막 ID 이후부터 조회
+        if state['since'] is not None:
+            params[spec['since_param']] = state['since']
+    else:
+        params['offset'] = state['offset']
+
+    if date_window(resource, start_date, end_date):
+        params['start_date'] = start_date
+        params['end_date'] = end_date
+
+    return params
+
+
+def export_resource(session, shop_dir, checkpoint, resource, start_date, end_date):
+    """리소스 하나를 끝까지 페이지네이션하며 저장"""
+    spec = RESOURCES[resource]
+    window = date_window(resource, start_date, end_date)
+    state = checkpoint.get(resource, window)
+    out_path = os.path.join(shop_dir, f"{resource}.ndjson.gz")
+
+    saved = checkpoint.data.get(resource)
+    if saved is not None and saved.get('window') != window:
+        # 다른 기간으로 받던 파일은 이어붙이지 않고 처음부터 (file_size 0 까지 잘라냄)
+        log(f"  ↺ {session.shop_id}/{resource}: 조회 기간이 {saved.get('window')} → {window} 로 바뀌어 처음부터 다시 내보냄")
+
+    if state['done']:
+        log(f"  → {session.shop_id}/{resource}: 이미 완료됨, 스킵")
+        return state['records']
+
+    # 마지막 체크포인트 이후에 쓰다 만 데이터 제거
+    if os.path.exists(out_path) and os.path.getsize(out_path) > state['file_size']:
+        with open(out_path, 'r+b') as f:
+            f.truncate(state['file_size'])
+
+    while True:
+        params = build_params(resource, state, start_date, end_date)
+        result = session.get(spec['path'], params=params)
+        items = result.get(spec['key'], [])
+
+        if items:
+            # 페이지마다 독립된 gzip 멤버로 추가 (이어붙인 gzip도 유효한 파일)
+            with open(out_path, 'ab') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb') as gz:
+                    for item in items:
+                        gz.write(json.dumps(item, ensure_ascii=False).encode('utf-8'))
+                        gz.write(b'\n')
+                raw.flush()
+                os.fsync(raw.fileno())
+
+            state['records'] += len(items)
+            state['offset'] += len(items)
+            if spec['since_param']:
+                state['since'] = items[-1].get(spec['id_field'])
+            state['file_size'] = os.path.getsize(out_path)
+
+        state['done'] = len(items) < PAGE_LIMIT
+        checkpoint.save(resource, state)
+
+        if state['done']:
+            break
+
+    log(f"  ✓ {session.shop_id}/{resource}: {state['records']}건")
+    return state['records']
+
+
+def export_shop(shop_id, account, resources, output_dir, start_date, end_date, reset):
+    """쇼핑몰 하나 내보내기 (리소스 순차 처리)"""
+    shop_dir = os.path.join(output_dir, shop_id)
+    os.makedirs(shop_dir, exist_ok=True)
+
+    checkpoint_path = os.path.join(shop_dir, 'checkpoint.json')
+    if reset:
+        for name in [checkpoint_path] + [os.path.join(shop_dir, f"{r}.ndjson.gz") for r in resources]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    checkpoint = Checkpoint(checkpoint_path)
+    session = Cafe24Session(shop_id, account)
+    counts = {}
+    try:
+        for resource in resources:
+            counts[resource] = export_resource(session, shop_dir, checkpoint, resource, start_date, end_date)
+    finally:
+        session.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cafe24 멀티 쇼핑몰 대량 내보내기')
+    parser.add_argument('--shops', nargs='*', help='대상 Shop ID (기본: 등록된 전체 계정)')
+    parser.add_argument('--resources', nargs='*', default=list(RESOURCES.keys()),
+                        choices=list(RESOURCES.keys()), help='내보낼 리소스')
+    parser.add_argument('--output', default=os.path.join(EXPORTS_DIR, datetime.now().strftime('%Y-%m-%d')),
+                        help='출력 디렉토리 (기본: exports/실행일)')
+    parser.add_argument('--workers', type=int, default=8, help='동시에 처리할 쇼핑몰 수')
+    parser.add_argument('--start-date', default=(datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d'),
+                        help='주문 조회 시작일 (YYYY-MM-DD)')
+    parser.add_argument('--end-date', default=datetime.now().strftime('%Y-%m-%d'),
+                        help='주문 조회 종료일 (YYYY-MM-DD)')
+    parser.add_argument('--reset', action='store_true', help='체크포인트를 지우고 처음부터 다시 내보내기')
+    args = parser.parse_args()
+
+    accounts = load_accounts()['accounts']
+    shop_ids = args.shops or list(accounts.keys())
+
+    print("=" * 60)
+    print("📦 Cafe24 대량 내보내기")
+    print("=" * 60)
+    print(f"  - 대상 쇼핑몰: {len(shop_ids)}개")
+    print(f"  - 리소스: {', '.join(args.resources)}")
+    print(f"  - 출력 디렉토리: {args.output}")
+    print()
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for shop_id in shop_ids:
+            account = accounts.get(shop_id)
+            if not account:
+                log(f"  ✗ {shop_id}: 계정을 찾을 수 없습니다.")
+                failed.append(shop_id)
+                continue
+            future = executor.submit(export_shop, shop_id, account, args.resources, args.output,
+                                     args.start_date, args.end_date, args.reset)
+            futures[future] = shop_id
+
+        for future in as_completed(futures):
+            shop_id = futures[future]
+            try:
+                counts = future.result()
+                log(f"✅ {shop_id}: " + ', '.join(f"{r} {c}건" for r, c in counts.items()))
+            except Exception as e:
+                log(f"❌ {shop_id}: 내보내기 실패 - {e}")
+                failed.append(shop_id)
+
+    print()
+    print("=" * 60)
+    print(f"완료: {len(shop_ids) - len(failed)}개 성공, {len(failed)}개 실패")
+    if failed:
+        print(f"실패한 쇼핑몰: {', '.join(failed)} (다시 실행하면 체크포인트부터 이어서 진행)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Cafe24 대량 쓰기 헬퍼
+여러 건을 한 번에 받는 Admin API(`requests` 배열)에 맞춰 입력을 자동으로 나누어 전송
+
+- 엔드포인트별 최대 배치 크기 단위로 분할 (BATCH_SIZE_LIMITS, 없으면 MAX_BATCH_SIZE)
+- 분할된 배치는 호출 제한 안에서 병렬 전송
+- 결과는 입력 행 순서대로 반환 (부분 실패도 원래 행에 매핑)
+
+사용 예:
+    from account_store import get_account
+    from cafe24_api import Cafe24Session
+    from bulk_write import bulk_write
+
+    session = Cafe24Session('myshop', get_account('myshop'))
+    result = bulk_write(session, 'PUT', '/api/v2/admin/products/12/variants', variants)
+    for row in result['results']:
+        if not row['success']:
+            print(row['index'], row['error'])
+"""
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import route_trie
+
+# Cafe24 다중 요청 기본 최대 건수
+MAX_BATCH_SIZE = 100
+
+# 기본값과 다른 엔드포인트별 최대 건수: (METHOD, 경로 템플릿) -> 건수
+# 예: ('PUT', '/api/v2/admin/products/{product_no}/variants'): 50
+BATCH_SIZE_LIMITS = {}
+
+
+def max_batch_size(method, path):
+    """엔드포인트의 요청당 최대 건수 (실제 경로는 route_trie로 경로 템플릿을 찾아 조회)"""
+    method = method.upper()
+    if (method, path) in BATCH_SIZE_LIMITS:
+        return BATCH_SIZE_LIMITS[(method, path)]
+    if BATCH_SIZE_LIMITS:
+        try:
+            operation = route_trie.resolve(method, path)
+        except (OSError, ValueError):
+            operation = None
+        if operation is not None:
+            return BATCH_SIZE_LIMITS.get((method, operation['template']), MAX_BATCH_SIZE)
+    return MAX_BATCH_SIZE
+
+
+def chunk_items(items, batch_size):
+    """(시작 인덱스, 배치) 목록으로 분할"""
+    return [(start, items[start:start + batch_size]) for start in range(0, len(items), batch_size)]
+
+
+def _response_items(data):
+    """응답 본문에서 요청 순서와 대응되는 결과 배열 추출"""
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def _error_message(response):
+    try:
+        error = response.json().get('error', {})
+        return error.get('message') or response.text
+    except ValueError:
+        return response.text
+
+
+def write_chunk(session, method, path, start, chunk, shop_no):
+    """배치 하나 전송 후 행별 결과 반환"""
+    body = {'shop_no': shop_no, 'requests': chunk}
+
+    # POST/PUT은 429 / 연결 전 실패만 재시도 (Cafe24Session.request), 이미 처리된 배치를 다시 보내지 않음
+    try:
+        data = session.request(method, path, json=body, max_retries=3)
+    except requests.HTTPError as e:
+        # 배치 전체 실패: 배치에 속한 모든 행을 실패로 기록
+        message = _error_message(e.response)
+        return [
+            {'index': start + i, 'success': False, 'status_code': e.response.status_code, 'error': message}
+            for i in range(len(chunk))
+        ]
+    except requests.RequestException as e:
+        return [{'index': start + i, 'success': False, 'error': str(e)} for i in range(len(chunk))]
+
+    items = _response_items(data)
+    results = []
+    for i in range(len(chunk)):
+        item = items[i] if i < len(items) else None
+        if item is None:
+            results.append({'index': start + i, 'success': False, 'error': '응답에 결과가 없습니다.'})
+        elif isinstance(item, dict) and item.get('error'):
+            # 207 Multi-Status: 행별 오류
+            error = item['error']
+            results.append({
+                'index': start + i,
+                'success': False,
+                'error': error.get('message') if isinstance(error, dict) else str(error)
+            })
+        else:
+            results.append({'index': start + i, 'success': True, 'data': item})
+    return results
+
+
+def bulk_write(session, method, path, items, batch_size=None, workers=4, shop_no=1):
+    """대량 쓰기 실행 (batch_size는 엔드포인트 최대 건수를 넘지 않음, None이면 최대 건수)
+
+    session의 leaky bucket을 모든 배치가 공유하므로 병렬로 보내도 호출 제한을 넘지 않음
+    """
+    limit = max_batch_size(method, path)
+    batch_size = max(1, min(batch_size or limit, limit))
+    chunks = chunk_items(items, batch_size)
+
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(write_chunk, session, method, path, start, chunk, shop_no)
+            for start, chunk in chunks
+        ]
+        for future in futures:
+            for row in future.result():
+                results[row['index']] = row
+
+    succeeded = sum(1 for row in results if row['success'])
+    return {
+        'total': len(items),
+        'batches': len(chunks),
+        'succeeded': succeeded,
+        'failed': len(items) - succeeded,
+        'results': results
+    }
@@ -0,0 +1,180 @@
+"""
+Cafe24 Admin API 호출 공용 모듈
+- 쇼핑몰별 커넥션 풀 세션
+- Cafe24 leaky bucket 호출 제한 준수 (X-Api-Call-Limit 헤더 동기화)
+- 401이면 account_store 에서 토큰을 다시 읽어 한 번 재시도 (오래 걸리는 작업 중 자동 갱신된 토큰 사용)
+"""
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from account_store import get_account
+
+API_VERSION = '2025-09-01'
+
+# 서버 오류/연결 끊김 후 다시 보내도 결과가 같은 메서드
+# (POST/PUT은 요청이 처리됐는지 알 수 없으므로 429와 연결 전 실패만 재시도)
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'DELETE'))
+
+# 대량 조회 대상 리소스 정의
+RESOURCES = {
+    'products': {
+        'path': '/api/v2/admin/products',
+        'key': 'products',
+        'id_field': 'product_no',
+        'since_param': 'since_product_no',
+    },
+    'orders': {
+        'path': '/api/v2/admin/orders',
+        'key': 'orders',
+        'id_field': 'order_id',
+        'since_param': None,
+    },
+    'customers': {
+        'path': '/api/v2/admin/customersprivacy',
+        'key': 'customersprivacy',
+        'id_field': 'member_id',
+        'since_param': None,
+    },
+}
+
+
+class LeakyBucket:
+    """Cafe24 leaky bucket 호출 제한 (기본 버킷 40회, 초당 2회 배출)"""
+
+    def __init__(self, capacity=40, leak_rate=2.0, headroom=2):
+        self.capacity = capacity
+        self.leak_rate = leak_rate
+        self.headroom = headroom  # 다른 클라이언트 몫으로 남겨둘 여유분
+        self.level = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _leak(self, now):
+        elapsed = now - self.updated
+        self.level = max(0.0, self.level - elapsed * self.leak_rate)
+        self.updated = now
+
+    def acquire(self):
+        """호출 1회 분량의 여유가 생길 때까지 대기"""
+        while True:
+            with self.lock:
+                self._leak(time.monotonic())
+                limit = self.capacity - self.headroom
+                if self.level + 1 <= limit:
+                    self.level += 1
+                    return
+                wait = (self.level + 1 - limit) / self.leak_rate
+            time.sleep(wait)
+
+    def sync(self, call_limit_header):
+        """응답 헤더(X-Api-Call-Limit: 사용량/버킷크기)로 로컬 상태 보정"""
+        if not call_limit_header:
+            return
+        try:
+            used, capacity = (int(x) for x in call_limit_header.split('/'))
+        except ValueError:
+            return
+        with self.lock:
+            self._leak(time.monotonic())
+            self.capacity = capacity
+            self.level = max(self.level, float(used))
+
+
+class Cafe24Session:
+    """쇼핑몰 하나에 대한 Admin API 세션 (커넥션 재사용 + 호출 제한)"""
+
+    def __init__(self, shop_id, account, bucket=None, pool_size=10, timeout=30, token_loader=None):
+        token = account.get('token', {})
+        if not token.get('access_token'):
+            raise ValueError(f"{shop_id}: Access Token이 없습니다.")
+
+        self.shop_id = shop_id
+        self.base_url = f"https://{shop_id}.cafe24api.com"
+        self.bucket = bucket or LeakyBucket()
+        self.timeout = timeout
+
+        # 401일 때 최신 토큰을 읽는 함수 (기본: accounts.json)
+        self.token_loader = token_loader or (lambda: (get_account(shop_id) or {}).get('token') or {})
+        self.access_token = token['access_token']
+        self.token_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Authorization': f"Bearer {token['access_token']}",
+            'Content-Type': 'application/json',
+            'X-Cafe24-Api-Version': API_VERSION,
+            'X-Cafe24-Client-Id': account.get('client_id', '')
+        })
+
+    def reload_token(self, rejected_token):
+        """저장소의 토큰이 거절된 토큰과 다르면 교체, 교체했으면 True
+
+        여러 스레드가 같은 401을 받아도 저장소는 한 번만 읽음
+        """
+        with self.token_lock:
+            if self.access_token != rejected_token:
+                # 다른 스레드가 이미 교체함
+                return True
+            access_token = self.token_loader().get('access_token')
+            if not access_token or access_token == rejected_token:
+                return False
+            self.access_token = access_token
+            self.session.headers['Authorization'] = f"Bearer {access_token}"
+            return True
+
+    def request(self, method, path, params=None, json=None, max_retries=5):
+        """호출 제한을 지키며 API 호출
+
+        재시도: 429 (처리 전 거절) / 연결 전 실패(ConnectTimeout)는 모든 메서드,
+        5xx / 연결 끊김은 IDEMPOTENT_METHODS만 (POST/PUT을 다시 보내면 중복 생성될 수 있음)
+        401은 저장소의 토큰이 바뀌었으면 새 토큰으로 한 번 다시 보냄 (재시도 횟수와 별도)
+        """
+        url = f"{self.base_url}{path}"
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        token_reloaded = False
+
+        while True:
+            self.bucket.acquire()
+            sent_token = self.access_token
+            try:
+                response = self.session.request(method, url, params=params, json=json, timeout=self.timeout)
+            except requests.ConnectTimeout:
+                # 연결도 못 했으므로 요청은 전송되지 않음
+                if attempt < max_retries:
+                    time.sleep(min(2 ** attempt, 30))
+                    attempt += 1
+                    continue
+                raise
+            except requests.ConnectionError:
+                if idempotent and attempt < max_retries:
+                    time.sleep(min(2 ** attempt, 30))
+                    attempt += 1
+                    continue
+                raise
+            self.bucket.sync(response.headers.get('X-Api-Call-Limit'))
+
+            if response.status_code == 401 and not token_reloaded:
+                # 만료된 토큰은 처리 전에 거절되므로 POST/PUT도 다시 보내도 안전
+                token_reloaded = True
+                if self.reload_token(sent_token):
+                    continue
+
+            if response.status_code == 429 or (idempotent and response.status_code >= 500):
+                if attempt < max_retries:
+                    # 버킷이 비워질 시간만큼 대기
+                    time.sleep(min(2 ** attempt, 30))
+                    attempt += 1
+                    continue
+
+            response.raise_for_status()
+            return response.json()
+
+    def get(self, path, params=None):
+        return self.request('GET', path, params=params)
+
+    def close(self):
+        self.session.close()
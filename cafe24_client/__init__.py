@@ -0,0 +1,81 @@
+"""
+Cafe24 Python 클라이언트
+카테고리 모듈(cafe24_client/admin, cafe24_client/front)은 generate_client.py 로 생성
+
+사용 예:
+    from cafe24_client import Cafe24Client
+
+    client = Cafe24Client('myshop')
+    client.admin.products.get(limit=10)
+    client.admin.products.get_product_variants(128)
+"""
+import importlib
+from functools import partial
+from urllib.parse import quote
+from account_store import get_account
+from cafe24_api import Cafe24Session
+
+
+def build_path(pieces, args):
+    """미리 분리된 경로 조각에 인자를 채워 경로 생성"""
+    return ''.join(
+        piece if piece.__class__ is str else quote(str(args[piece]), safe='')
+        for piece in pieces
+    )
+
+
+class _BoundModule:
+    """카테고리 모듈의 함수에 client를 바인딩"""
+
+    def __init__(self, client, module):
+        self._client = client
+        self._module = module
+
+    def __getattr__(self, name):
+        func = getattr(self._module, name)
+        bound = partial(func, self._client)
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return [name for name in dir(self._module) if not name.startswith('_')]
+
+
+class _Namespace:
+    """client.admin / client.front: 카테고리 모듈을 처음 접근할 때 로드"""
+
+    def __init__(self, client, api_type):
+        self._client = client
+        self._package = importlib.import_module(f'{__name__}.{api_type}')
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        bound = _BoundModule(self._client, getattr(self._package, name))
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return list(self._package.CATEGORIES)
+
+
+class Cafe24Client:
+    """계정 저장소의 토큰과 커넥션 풀 세션을 사용하는 Cafe24 API 클라이언트"""
+
+    def __init__(self, shop_id, account=None, session=None):
+        account = account or get_account(shop_id)
+        if not account:
+            raise ValueError(f"{shop_id}: 계정을 찾을 수 없습니다.")
+
+        self.shop_id = shop_id
+        self.session = session or Cafe24Session(shop_id, account)
+        self.admin = _Namespace(self, 'admin')
+        self.front = _Namespace(self, 'front')
+
+    def call(self, route, args, params=None, data=None):
+        """라우트 테이블 항목으로 API 호출"""
+        method, pieces = route
+        return self.session.request(method, build_path(pieces, args), params=params or None, json=data)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,109 @@
+"""
+Cafe24 Admin API 모듈 (처음 접근할 때 로드)
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+import importlib
+
+CATEGORIES = (
+    'activitylogs',
+    'apps',
+    'appstore',
+    'autodisplay',
+    'automails',
+    'automessages',
+    'benefits',
+    'boards',
+    'brands',
+    'bundleproducts',
+    'cancellation',
+    'cancellationrequests',
+    'carriers',
+    'carts',
+    'cashreceipt',
+    'categories',
+    'classifications',
+    'collectrequests',
+    'commenttemplates',
+    'commonevents',
+    'control',
+    'coupons',
+    'credits',
+    'currency',
+    'customerevents',
+    'customergroups',
+    'customers',
+    'customersprivacy',
+    'dashboard',
+    'databridge',
+    'discountcodes',
+    'dormantaccount',
+    'exchange',
+    'exchangerequests',
+    'financials',
+    'fulfillments',
+    'icons',
+    'images',
+    'information',
+    'kakaoalimtalk',
+    'kakaopay',
+    'labels',
+    'mains',
+    'manufacturers',
+    'menus',
+    'mobile',
+    'naverpay',
+    'orderform',
+    'orders',
+    'origin',
+    'payment',
+    'paymentgateway',
+    'paymentmethods',
+    'payments',
+    'points',
+    'policy',
+    'privacy',
+    'products',
+    'recipes',
+    'recipientgroups',
+    'redirects',
+    'refunds',
+    'regionalsurcharges',
+    'reports',
+    'reservations',
+    'restocknotification',
+    'return_',
+    'returnrequests',
+    'scripttags',
+    'seo',
+    'serialcoupons',
+    'shipments',
+    'shipping',
+    'shippingmanager',
+    'shippingorigins',
+    'shops',
+    'sms',
+    'socials',
+    'store',
+    'subscription',
+    'suppliers',
+    'taxmanager',
+    'themes',
+    'translations',
+    'trends',
+    'unpaidorders',
+    'urgentinquiry',
+    'users',
+    'webhooks',
+)
+
+
+def __getattr__(name):
+    if name in CATEGORIES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(CATEGORIES))
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - activitylogs
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/activitylogs',)),
+    'get_by_process_no': ('GET', ('/api/v2/admin/activitylogs/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Activitylogs 조회
+
+    활동로그(Activitylog)는 쇼핑몰 관리자가 쇼핑몰 어드민에서 진행한 운영 활동을 기록한 내역입니다.
+
+    GET /api/v2/admin/activitylogs
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_by_process_no(client: "Cafe24Client", process_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """특정 Activitylog 조회
+
+    활동로그 리소스를 사용하여 쇼핑몰의 활동로그를 생성하거나 조회할 수 있습니다.
+
+    GET /api/v2/admin/activitylogs/{process_no}
+    """
+    return client.call(_ROUTES['get_by_process_no'], (process_no, ), params=params)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - apps
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/apps',)),
+    'update': ('PUT', ('/api/v2/admin/apps',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """앱 목록 조회
+
+    앱 정보를 조회하고 수정할 수 있는 리스트입니다.
+
+    GET /api/v2/admin/apps
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """앱 정보 수정
+
+    앱의 버전 정보를 조회하거나 변경할 수 있습니다.
+
+    PUT /api/v2/admin/apps
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - appstore
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_orders_by_order_id': ('GET', ('/api/v2/admin/appstore/orders/', 0)),
+    'create_orders': ('POST', ('/api/v2/admin/appstore/orders',)),
+    'get_payments': ('GET', ('/api/v2/admin/appstore/payments',)),
+    'get_payments_count': ('GET', ('/api/v2/admin/appstore/payments/count',)),
+}
+
+
+def get_orders_by_order_id(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """앱스토어 주문 조회
+
+    앱스토어 주문 상세 정보를 조회합니다.
+
+    GET /api/v2/admin/appstore/orders/{order_id}
+    """
+    return client.call(_ROUTES['get_orders_by_order_id'], (order_id, ), params=params)
+
+
+def create_orders(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """앱스토어 주문 생성
+
+    앱스토어 주문을 생성합니다.
+
+    POST /api/v2/admin/appstore/orders
+    """
+    return client.call(_ROUTES['create_orders'], (), params=params, data=data)
+
+
+def get_payments(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """앱스토어 결제 조회
+
+    앱스토어 결제 정보를 조회합니다.
+
+    GET /api/v2/admin/appstore/payments
+    """
+    return client.call(_ROUTES['get_payments'], (), params=params)
+
+
+def get_payments_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """앱스토어 결제 건수 조회
+
+    앱스토어 결제 건수를 조회합니다.
+
+    GET /api/v2/admin/appstore/payments/count
+    """
+    return client.call(_ROUTES['get_payments_count'], (), params=params)
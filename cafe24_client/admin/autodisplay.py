@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - autodisplay
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/autodisplay',)),
+    'create': ('POST', ('/api/v2/admin/autodisplay',)),
+    'update_by_display_no': ('PUT', ('/api/v2/admin/autodisplay/', 0)),
+    'delete_by_display_no': ('DELETE', ('/api/v2/admin/autodisplay/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Autodisplay
+
+    자동 진열(Autodisplay)은 상품 분류에 특정 조건에 따라 상품을 자동으로 진열해주는 기능입니다.
+
+    GET /api/v2/admin/autodisplay
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Autodisplay
+
+    자동 진열(Autodisplay)은 상품 분류에 특정 조건에 따라 상품을 자동으로 진열해주는 기능입니다.
+
+    POST /api/v2/admin/autodisplay
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_display_no(client: "Cafe24Client", display_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Autodisplay
+
+    자동 진열(Autodisplay)은 상품 분류에 특정 조건에 따라 상품을 자동으로 진열해주는 기능입니다.
+
+    PUT /api/v2/admin/autodisplay/{display_no}
+    """
+    return client.call(_ROUTES['update_by_display_no'], (display_no, ), params=params, data=data)
+
+
+def delete_by_display_no(client: "Cafe24Client", display_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Autodisplay
+
+    자동 진열(Autodisplay)은 상품 분류에 특정 조건에 따라 상품을 자동으로 진열해주는 기능입니다.
+
+    DELETE /api/v2/admin/autodisplay/{display_no}
+    """
+    return client.call(_ROUTES['delete_by_display_no'], (display_no, ), params=params, data=data)
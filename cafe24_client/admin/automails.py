@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - automails
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/automails',)),
+    'update': ('PUT', ('/api/v2/admin/automails',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Automails 조회
+
+    자동 알림 메일 관리에서 메일 항목별 고객, 운영자, 공급사 설정 값을 관리할 수 있습니다.
+
+    GET /api/v2/admin/automails
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Automails 수정
+
+    자동 알림 메일 관리에서 메일 항목별 고객, 운영자, 공급사 설정 값을 관리할 수 있습니다.
+
+    PUT /api/v2/admin/automails
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - automessages
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_arguments': ('GET', ('/api/v2/admin/automessages/arguments',)),
+    'get_setting': ('GET', ('/api/v2/admin/automessages/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/automessages/setting',)),
+}
+
+
+def get_arguments(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Automessages arguments 조회
+
+    자동메시지 변수(Automessages arguments)는 자동메시지 발신 시 사용할 수 있는 변수를 확인하는 리소스입니다.
+
+    GET /api/v2/admin/automessages/arguments
+    """
+    return client.call(_ROUTES['get_arguments'], (), params=params)
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Automessages setting 조회
+
+    자동메시지 설정 조회
+
+    GET /api/v2/admin/automessages/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Automessages setting 수정
+
+    자동메시지 설정 수정
+
+    PUT /api/v2/admin/automessages/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
@@ -0,0 +1,90 @@
+"""
+Cafe24 Admin API - benefits
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/benefits/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/benefits/setting',)),
+    'get': ('GET', ('/api/v2/admin/benefits',)),
+    'create': ('POST', ('/api/v2/admin/benefits',)),
+    'get_count': ('GET', ('/api/v2/admin/benefits/count',)),
+    'get_by_benefit_no': ('GET', ('/api/v2/admin/benefits/', 0)),
+    'update_by_benefit_no': ('PUT', ('/api/v2/admin/benefits/', 0)),
+    'delete_by_benefit_no': ('DELETE', ('/api/v2/admin/benefits/', 0)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Benefits setting 조회
+
+    혜택 설정 조회
+
+    GET /api/v2/admin/benefits/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Benefits setting 수정
+
+    혜택 설정 수정
+
+    PUT /api/v2/admin/benefits/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of customer benefits
+
+    혜택(Benefits)은 쇼핑몰 고객에게 제공하는 증정 또는 할인과 같은 고객 혜택입니다.
+
+    GET /api/v2/admin/benefits
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a customer benefit
+
+    POST /api/v2/admin/benefits
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a count of customer benefits
+
+    GET /api/v2/admin/benefits/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_benefit_no(client: "Cafe24Client", benefit_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a customer benefit
+
+    GET /api/v2/admin/benefits/{benefit_no}
+    """
+    return client.call(_ROUTES['get_by_benefit_no'], (benefit_no, ), params=params)
+
+
+def update_by_benefit_no(client: "Cafe24Client", benefit_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a customer benefit
+
+    PUT /api/v2/admin/benefits/{benefit_no}
+    """
+    return client.call(_ROUTES['update_by_benefit_no'], (benefit_no, ), params=params, data=data)
+
+
+def delete_by_benefit_no(client: "Cafe24Client", benefit_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a customer benefit
+
+    DELETE /api/v2/admin/benefits/{benefit_no}
+    """
+    return client.call(_ROUTES['delete_by_benefit_no'], (benefit_no, ), params=params, data=data)
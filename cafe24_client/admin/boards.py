@@ -0,0 +1,177 @@
+"""
+Cafe24 Admin API - boards
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/boards/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/boards/setting',)),
+    'get': ('GET', ('/api/v2/admin/boards',)),
+    'get_by_board_no': ('GET', ('/api/v2/admin/boards/', 0)),
+    'update_by_board_no': ('PUT', ('/api/v2/admin/boards/', 0)),
+    'get_board_articles': ('GET', ('/api/v2/admin/boards/', 0, '/articles')),
+    'create_board_articles': ('POST', ('/api/v2/admin/boards/', 0, '/articles')),
+    'update_board_articles_by_article_no': ('PUT', ('/api/v2/admin/boards/', 0, '/articles/', 1)),
+    'delete_board_articles_by_article_no': ('DELETE', ('/api/v2/admin/boards/', 0, '/articles/', 1)),
+    'get_board_articles_article_comments': ('GET', ('/api/v2/admin/boards/', 0, '/articles/', 1, '/comments')),
+    'create_board_articles_article_comments': ('POST', ('/api/v2/admin/boards/', 0, '/articles/', 1, '/comments')),
+    'delete_board_articles_article_comments_by_comment_no': ('DELETE', ('/api/v2/admin/boards/', 0, '/articles/', 1, '/comments/', 2)),
+    'get_board_comments': ('GET', ('/api/v2/admin/boards/', 0, '/comments')),
+    'get_board_seo': ('GET', ('/api/v2/admin/boards/', 0, '/seo')),
+    'update_board_seo': ('PUT', ('/api/v2/admin/boards/', 0, '/seo')),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Boards setting 조회
+
+    게시판 설정 조회
+
+    GET /api/v2/admin/boards/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Boards setting 수정
+
+    게시판 설정 수정
+
+    PUT /api/v2/admin/boards/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Boards 목록 조회
+
+    게시판(Boards)은 상품문의나 상품후기 등 고객의 반응이 글로 게시되는 공간입니다. 게시판 리스트에서는 현재 쇼핑몰에 있는 게시판의 목록을 확인할 수 있습니다.
+
+    GET /api/v2/admin/boards
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_by_board_no(client: "Cafe24Client", board_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """특정 Board 조회
+
+    게시판(Boards)은 상품문의나 상품후기 등 고객의 반응이 글로 게시되는 공간입니다. 게시판 리스트에서는 현재 쇼핑몰에 있는 게시판의 목록을 확인할 수 있습니다.
+
+    GET /api/v2/admin/boards/{board_no}
+    """
+    return client.call(_ROUTES['get_by_board_no'], (board_no, ), params=params)
+
+
+def update_by_board_no(client: "Cafe24Client", board_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """특정 Board 수정
+
+    게시판(Boards)은 상품문의나 상품후기 등 고객의 반응이 글로 게시되는 공간입니다. 게시판 리스트에서는 현재 쇼핑몰에 있는 게시판의 목록을 확인할 수 있습니다.
+
+    PUT /api/v2/admin/boards/{board_no}
+    """
+    return client.call(_ROUTES['update_by_board_no'], (board_no, ), params=params, data=data)
+
+
+def get_board_articles(client: "Cafe24Client", board_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """게시물 목록 조회
+
+    특정 게시판의 게시물 목록을 조회합니다.
+
+    GET /api/v2/admin/boards/{board_no}/articles
+    """
+    return client.call(_ROUTES['get_board_articles'], (board_no, ), params=params)
+
+
+def create_board_articles(client: "Cafe24Client", board_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """게시물 생성
+
+    특정 게시판에 게시물을 생성합니다.
+
+    POST /api/v2/admin/boards/{board_no}/articles
+    """
+    return client.call(_ROUTES['create_board_articles'], (board_no, ), params=params, data=data)
+
+
+def update_board_articles_by_article_no(client: "Cafe24Client", board_no: Union[int, str], article_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """게시물 수정
+
+    특정 게시판의 게시물을 수정합니다.
+
+    PUT /api/v2/admin/boards/{board_no}/articles/{article_no}
+    """
+    return client.call(_ROUTES['update_board_articles_by_article_no'], (board_no, article_no, ), params=params, data=data)
+
+
+def delete_board_articles_by_article_no(client: "Cafe24Client", board_no: Union[int, str], article_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """게시물 삭제
+
+    특정 게시판의 게시물을 삭제합니다.
+
+    DELETE /api/v2/admin/boards/{board_no}/articles/{article_no}
+    """
+    return client.call(_ROUTES['delete_board_articles_by_article_no'], (board_no, article_no, ), params=params, data=data)
+
+
+def get_board_articles_article_comments(client: "Cafe24Client", board_no: Union[int, str], article_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """댓글 목록 조회
+
+    특정 게시물의 댓글 목록을 조회합니다.
+
+    GET /api/v2/admin/boards/{board_no}/articles/{article_no}/comments
+    """
+    return client.call(_ROUTES['get_board_articles_article_comments'], (board_no, article_no, ), params=params)
+
+
+def create_board_articles_article_comments(client: "Cafe24Client", board_no: Union[int, str], article_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """댓글 생성
+
+    특정 게시물에 댓글을 생성합니다.
+
+    POST /api/v2/admin/boards/{board_no}/articles/{article_no}/comments
+    """
+    return client.call(_ROUTES['create_board_articles_article_comments'], (board_no, article_no, ), params=params, data=data)
+
+
+def delete_board_articles_article_comments_by_comment_no(client: "Cafe24Client", board_no: Union[int, str], article_no: Union[int, str], comment_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """댓글 삭제
+
+    특정 게시물의 댓글을 삭제합니다.
+
+    DELETE /api/v2/admin/boards/{board_no}/articles/{article_no}/comments/{comment_no}
+    """
+    return client.call(_ROUTES['delete_board_articles_article_comments_by_comment_no'], (board_no, article_no, comment_no, ), params=params, data=data)
+
+
+def get_board_comments(client: "Cafe24Client", board_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Boards comments
+
+    대량으로 게시판 댓글을 관리하기 위한 기능을 제공합니다.
+
+    GET /api/v2/admin/boards/{board_no}/comments
+    """
+    return client.call(_ROUTES['get_board_comments'], (board_no, ), params=params)
+
+
+def get_board_seo(client: "Cafe24Client", board_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Boards seo
+
+    게시판 SEO의 설정을 관리하기 위한 기능을 제공합니다.
+
+    GET /api/v2/admin/boards/{board_no}/seo
+    """
+    return client.call(_ROUTES['get_board_seo'], (board_no, ), params=params)
+
+
+def update_board_seo(client: "Cafe24Client", board_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Boards seo
+
+    게시판 SEO의 설정을 관리하기 위한 기능을 제공합니다.
+
+    PUT /api/v2/admin/boards/{board_no}/seo
+    """
+    return client.call(_ROUTES['update_board_seo'], (board_no, ), params=params, data=data)
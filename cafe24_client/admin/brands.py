@@ -0,0 +1,59 @@
+"""
+Cafe24 Admin API - brands
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/brands',)),
+    'create': ('POST', ('/api/v2/admin/brands',)),
+    'get_count': ('GET', ('/api/v2/admin/brands/count',)),
+    'update_by_brand_code': ('PUT', ('/api/v2/admin/brands/', 0)),
+    'delete_by_brand_code': ('DELETE', ('/api/v2/admin/brands/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve brands
+
+    브랜드(Brands)는 쇼핑몰 상품의 '브랜드'를 나타냅니다.
+
+    GET /api/v2/admin/brands
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Add brand
+
+    POST /api/v2/admin/brands
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Count brands
+
+    GET /api/v2/admin/brands/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def update_by_brand_code(client: "Cafe24Client", brand_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update brand
+
+    PUT /api/v2/admin/brands/{brand_code}
+    """
+    return client.call(_ROUTES['update_by_brand_code'], (brand_code, ), params=params, data=data)
+
+
+def delete_by_brand_code(client: "Cafe24Client", brand_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete brand
+
+    DELETE /api/v2/admin/brands/{brand_code}
+    """
+    return client.call(_ROUTES['delete_by_brand_code'], (brand_code, ), params=params, data=data)
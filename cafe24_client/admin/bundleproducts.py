@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - bundleproducts
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/bundleproducts',)),
+    'create': ('POST', ('/api/v2/admin/bundleproducts',)),
+    'get_by_product_no': ('GET', ('/api/v2/admin/bundleproducts/', 0)),
+    'update_by_product_no': ('PUT', ('/api/v2/admin/bundleproducts/', 0)),
+    'delete_by_product_no': ('DELETE', ('/api/v2/admin/bundleproducts/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Bundleproducts
+
+    번들 상품 목록을 조회합니다.
+
+    GET /api/v2/admin/bundleproducts
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create Bundleproduct
+
+    새로운 번들 상품을 생성합니다.
+
+    POST /api/v2/admin/bundleproducts
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_product_no(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Bundleproduct Details
+
+    특정 번들 상품의 상세 정보를 조회합니다.
+
+    GET /api/v2/admin/bundleproducts/{product_no}
+    """
+    return client.call(_ROUTES['get_by_product_no'], (product_no, ), params=params)
+
+
+def update_by_product_no(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update Bundleproduct
+
+    기존 번들 상품을 수정합니다.
+
+    PUT /api/v2/admin/bundleproducts/{product_no}
+    """
+    return client.call(_ROUTES['update_by_product_no'], (product_no, ), params=params, data=data)
+
+
+def delete_by_product_no(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete Bundleproduct
+
+    기존 번들 상품을 삭제합니다.
+
+    DELETE /api/v2/admin/bundleproducts/{product_no}
+    """
+    return client.call(_ROUTES['delete_by_product_no'], (product_no, ), params=params, data=data)
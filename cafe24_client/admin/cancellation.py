@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - cancellation
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_by_claim_code': ('GET', ('/api/v2/admin/cancellation/', 0)),
+    'create': ('POST', ('/api/v2/admin/cancellation',)),
+    'update': ('PUT', ('/api/v2/admin/cancellation',)),
+}
+
+
+def get_by_claim_code(client: "Cafe24Client", claim_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Cancellation
+
+    취소(Cancellation)는 특정 주문을 배송 전에 취소하는 기능입니다.
+
+    GET /api/v2/admin/cancellation/{claim_code}
+    """
+    return client.call(_ROUTES['get_by_claim_code'], (claim_code, ), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cancellation
+
+    취소(Cancellation)는 특정 주문을 배송 전에 취소하는 기능입니다.
+
+    POST /api/v2/admin/cancellation
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cancellation
+
+    취소(Cancellation)는 특정 주문을 배송 전에 취소하는 기능입니다.
+
+    PUT /api/v2/admin/cancellation
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - cancellationrequests
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/admin/cancellationrequests',)),
+    'update': ('PUT', ('/api/v2/admin/cancellationrequests',)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cancellationrequests
+
+    취소요청(Cancellationrequests)은 주문에 대한 취소요청에 관한 기능입니다.
+
+    POST /api/v2/admin/cancellationrequests
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cancellationrequests
+
+    취소요청(Cancellationrequests)은 주문에 대한 취소요청에 관한 기능입니다.
+
+    PUT /api/v2/admin/cancellationrequests
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
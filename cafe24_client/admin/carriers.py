@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - carriers
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/carriers',)),
+    'create': ('POST', ('/api/v2/admin/carriers',)),
+    'get_by_carrier_id': ('GET', ('/api/v2/admin/carriers/', 0)),
+    'update_by_carrier_id': ('PUT', ('/api/v2/admin/carriers/', 0)),
+    'delete_by_carrier_id': ('DELETE', ('/api/v2/admin/carriers/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Carriers 목록 조회
+
+    등록된 배송사를 조회합니다.
+
+    GET /api/v2/admin/carriers
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Carriers 생성
+
+    새로운 배송사를 생성합니다.
+
+    POST /api/v2/admin/carriers
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_carrier_id(client: "Cafe24Client", carrier_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Carriers 상세 조회
+
+    특정 배송사의 상세 정보를 조회합니다.
+
+    GET /api/v2/admin/carriers/{carrier_id}
+    """
+    return client.call(_ROUTES['get_by_carrier_id'], (carrier_id, ), params=params)
+
+
+def update_by_carrier_id(client: "Cafe24Client", carrier_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Carriers 수정
+
+    기존 배송사의 정보를 수정합니다.
+
+    PUT /api/v2/admin/carriers/{carrier_id}
+    """
+    return client.call(_ROUTES['update_by_carrier_id'], (carrier_id, ), params=params, data=data)
+
+
+def delete_by_carrier_id(client: "Cafe24Client", carrier_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Carriers 삭제
+
+    등록된 배송사를 삭제합니다.
+
+    DELETE /api/v2/admin/carriers/{carrier_id}
+    """
+    return client.call(_ROUTES['delete_by_carrier_id'], (carrier_id, ), params=params, data=data)
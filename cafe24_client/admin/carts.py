@@ -0,0 +1,43 @@
+"""
+Cafe24 Admin API - carts
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/carts/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/carts/setting',)),
+    'get': ('GET', ('/api/v2/admin/carts',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve cart settings
+
+    장바구니 설정을 조회합니다.
+
+    GET /api/v2/admin/carts/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update cart settings
+
+    장바구니 설정을 업데이트합니다.
+
+    PUT /api/v2/admin/carts/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Carts
+
+    GET /api/v2/admin/carts
+    """
+    return client.call(_ROUTES['get'], (), params=params)
@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - cashreceipt
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/cashreceipt',)),
+    'create': ('POST', ('/api/v2/admin/cashreceipt',)),
+    'update_by_cashreceipt_no': ('PUT', ('/api/v2/admin/cashreceipt/', 0)),
+    'update_cashreceipt_cancellation': ('PUT', ('/api/v2/admin/cashreceipt/', 0, '/cancellation')),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Cashreceipt 조회
+
+    현금영수증 리스트를 조회합니다.
+
+    GET /api/v2/admin/cashreceipt
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cashreceipt 생성
+
+    현금영수증을 발급합니다.
+
+    POST /api/v2/admin/cashreceipt
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_cashreceipt_no(client: "Cafe24Client", cashreceipt_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cashreceipt 수정
+
+    발급된 현금영수증을 수정합니다.
+
+    PUT /api/v2/admin/cashreceipt/{cashreceipt_no}
+    """
+    return client.call(_ROUTES['update_by_cashreceipt_no'], (cashreceipt_no, ), params=params, data=data)
+
+
+def update_cashreceipt_cancellation(client: "Cafe24Client", cashreceipt_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Cashreceipt 취소
+
+    발행된 현금영수증에 대해 신청취소를 합니다.
+
+    PUT /api/v2/admin/cashreceipt/{cashreceipt_no}/cancellation
+    """
+    return client.call(_ROUTES['update_cashreceipt_cancellation'], (cashreceipt_no, ), params=params, data=data)
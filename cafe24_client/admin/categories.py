@@ -0,0 +1,232 @@
+"""
+Cafe24 Admin API - categories
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_properties_setting': ('GET', ('/api/v2/admin/categories/properties/setting',)),
+    'update_properties_setting': ('PUT', ('/api/v2/admin/categories/properties/setting',)),
+    'get_category_products': ('GET', ('/api/v2/admin/categories/', 0, '/products')),
+    'create_category_products': ('POST', ('/api/v2/admin/categories/', 0, '/products')),
+    'update_category_products': ('PUT', ('/api/v2/admin/categories/', 0, '/products')),
+    'get_category_products_count': ('GET', ('/api/v2/admin/categories/', 0, '/products/count')),
+    'delete_category_products_by_product_no': ('DELETE', ('/api/v2/admin/categories/', 0, '/products/', 1)),
+    'get_properties': ('GET', ('/api/v2/admin/categories/properties',)),
+    'create_properties': ('POST', ('/api/v2/admin/categories/properties',)),
+    'update_properties': ('PUT', ('/api/v2/admin/categories/properties',)),
+    'get': ('GET', ('/api/v2/admin/categories',)),
+    'create': ('POST', ('/api/v2/admin/categories',)),
+    'get_count': ('GET', ('/api/v2/admin/categories/count',)),
+    'get_by_category_no': ('GET', ('/api/v2/admin/categories/', 0)),
+    'update_by_category_no': ('PUT', ('/api/v2/admin/categories/', 0)),
+    'delete_by_category_no': ('DELETE', ('/api/v2/admin/categories/', 0)),
+    'get_category_decorationimages': ('GET', ('/api/v2/admin/categories/', 0, '/decorationimages')),
+    'update_category_decorationimages': ('PUT', ('/api/v2/admin/categories/', 0, '/decorationimages')),
+    'get_category_seo': ('GET', ('/api/v2/admin/categories/', 0, '/seo')),
+    'update_category_seo': ('PUT', ('/api/v2/admin/categories/', 0, '/seo')),
+}
+
+
+def get_properties_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve categories properties settings
+
+    카테고리 속성 설정을 조회합니다.
+
+    GET /api/v2/admin/categories/properties/setting
+    """
+    return client.call(_ROUTES['get_properties_setting'], (), params=params)
+
+
+def update_properties_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update categories properties settings
+
+    카테고리 속성 설정을 업데이트합니다.
+
+    PUT /api/v2/admin/categories/properties/setting
+    """
+    return client.call(_ROUTES['update_properties_setting'], (), params=params, data=data)
+
+
+def get_category_products(client: "Cafe24Client", category_no: int, **params: Any) -> Dict[str, Any]:
+    """Retrieve products in a category
+
+    카테고리의 상품을 조회합니다
+
+    GET /api/v2/admin/categories/{category_no}/products
+    """
+    return client.call(_ROUTES['get_category_products'], (category_no, ), params=params)
+
+
+def create_category_products(client: "Cafe24Client", category_no: int, *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Add a product to a category
+
+    카테고리에 상품을 추가합니다
+
+    POST /api/v2/admin/categories/{category_no}/products
+    """
+    return client.call(_ROUTES['create_category_products'], (category_no, ), params=params, data=data)
+
+
+def update_category_products(client: "Cafe24Client", category_no: int, *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update products in a category
+
+    카테고리의 상품을 수정합니다
+
+    PUT /api/v2/admin/categories/{category_no}/products
+    """
+    return client.call(_ROUTES['update_category_products'], (category_no, ), params=params, data=data)
+
+
+def get_category_products_count(client: "Cafe24Client", category_no: int, **params: Any) -> Dict[str, Any]:
+    """Count products in a category
+
+    카테고리의 상품 수를 조회합니다
+
+    GET /api/v2/admin/categories/{category_no}/products/count
+    """
+    return client.call(_ROUTES['get_category_products_count'], (category_no, ), params=params)
+
+
+def delete_category_products_by_product_no(client: "Cafe24Client", category_no: int, product_no: int, *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Remove a product from a category
+
+    카테고리에서 상품을 삭제합니다
+
+    DELETE /api/v2/admin/categories/{category_no}/products/{product_no}
+    """
+    return client.call(_ROUTES['delete_category_products_by_product_no'], (category_no, product_no, ), params=params, data=data)
+
+
+def get_properties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Categories properties
+
+    상품 목록 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    GET /api/v2/admin/categories/properties
+    """
+    return client.call(_ROUTES['get_properties'], (), params=params)
+
+
+def create_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Categories properties
+
+    상품 목록 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    POST /api/v2/admin/categories/properties
+    """
+    return client.call(_ROUTES['create_properties'], (), params=params, data=data)
+
+
+def update_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Categories properties
+
+    상품 목록 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    PUT /api/v2/admin/categories/properties
+    """
+    return client.call(_ROUTES['update_properties'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """카테고리 목록 조회
+
+    쇼핑몰의 카테고리 목록을 조회합니다
+
+    GET /api/v2/admin/categories
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """카테고리 생성
+
+    새로운 카테고리를 생성합니다
+
+    POST /api/v2/admin/categories
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """카테고리 개수 조회
+
+    쇼핑몰의 카테고리 개수를 조회합니다
+
+    GET /api/v2/admin/categories/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_category_no(client: "Cafe24Client", category_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """카테고리 상세 조회
+
+    특정 카테고리의 상세 정보를 조회합니다
+
+    GET /api/v2/admin/categories/{category_no}
+    """
+    return client.call(_ROUTES['get_by_category_no'], (category_no, ), params=params)
+
+
+def update_by_category_no(client: "Cafe24Client", category_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """카테고리 수정
+
+    특정 카테고리의 정보를 수정합니다
+
+    PUT /api/v2/admin/categories/{category_no}
+    """
+    return client.call(_ROUTES['update_by_category_no'], (category_no, ), params=params, data=data)
+
+
+def delete_by_category_no(client: "Cafe24Client", category_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """카테고리 삭제
+
+    특정 카테고리를 삭제합니다
+
+    DELETE /api/v2/admin/categories/{category_no}
+    """
+    return client.call(_ROUTES['delete_by_category_no'], (category_no, ), params=params, data=data)
+
+
+def get_category_decorationimages(client: "Cafe24Client", category_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """카테고리 장식 이미지 조회
+
+    특정 카테고리의 장식 이미지를 조회합니다
+
+    GET /api/v2/admin/categories/{category_no}/decorationimages
+    """
+    return client.call(_ROUTES['get_category_decorationimages'], (category_no, ), params=params)
+
+
+def update_category_decorationimages(client: "Cafe24Client", category_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """카테고리 장식 이미지 수정
+
+    특정 카테고리의 장식 이미지를 수정합니다
+
+    PUT /api/v2/admin/categories/{category_no}/decorationimages
+    """
+    return client.call(_ROUTES['update_category_decorationimages'], (category_no, ), params=params, data=data)
+
+
+def get_category_seo(client: "Cafe24Client", category_no: int, **params: Any) -> Dict[str, Any]:
+    """카테고리 SEO 조회
+
+    특정 카테고리의 SEO 설정과 설정값을 조회할 수 있는 기능입니다.
+
+    GET /api/v2/admin/categories/{category_no}/seo
+    """
+    return client.call(_ROUTES['get_category_seo'], (category_no, ), params=params)
+
+
+def update_category_seo(client: "Cafe24Client", category_no: int, *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """카테고리 SEO 업데이트
+
+    특정 카테고리의 SEO 설정을 업데이트할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/categories/{category_no}/seo
+    """
+    return client.call(_ROUTES['update_category_seo'], (category_no, ), params=params, data=data)
@@ -0,0 +1,32 @@
+"""
+Cafe24 Admin API - classifications
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/classifications',)),
+    'get_count': ('GET', ('/api/v2/admin/classifications/count',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve classifications
+
+    자체분류(Classifications)는 상품등록시 사용한 자체분류에 입력하는 정보입니다.
+
+    GET /api/v2/admin/classifications
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Count classifications
+
+    GET /api/v2/admin/classifications/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
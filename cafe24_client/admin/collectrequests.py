@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - collectrequests
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'update_by_request_no': ('PUT', ('/api/v2/admin/collectrequests/', 0)),
+}
+
+
+def update_by_request_no(client: "Cafe24Client", request_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Collectrequests 수정
+
+    수거신청 정보를 수정합니다.
+
+    PUT /api/v2/admin/collectrequests/{request_no}
+    """
+    return client.call(_ROUTES['update_by_request_no'], (request_no, ), params=params, data=data)
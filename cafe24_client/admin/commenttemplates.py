@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - commenttemplates
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/commenttemplates',)),
+    'create': ('POST', ('/api/v2/admin/commenttemplates',)),
+    'get_by_comment_no': ('GET', ('/api/v2/admin/commenttemplates/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Commenttemplates
+
+    게시판 내에서 자주 사용하는 단말을 관리할 수 있는 기능입니다.
+
+    GET /api/v2/admin/commenttemplates
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Commenttemplates
+
+    게시판 내에서 자주 사용하는 단말을 관리할 수 있는 기능입니다.
+
+    POST /api/v2/admin/commenttemplates
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_comment_no(client: "Cafe24Client", comment_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Commenttemplates
+
+    게시판 내에서 자주 사용하는 단말을 관리할 수 있는 기능입니다.
+
+    GET /api/v2/admin/commenttemplates/{comment_no}
+    """
+    return client.call(_ROUTES['get_by_comment_no'], (comment_no, ), params=params)
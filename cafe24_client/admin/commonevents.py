@@ -0,0 +1,48 @@
+"""
+Cafe24 Admin API - commonevents
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/commonevents',)),
+    'create': ('POST', ('/api/v2/admin/commonevents',)),
+    'update_by_event_no': ('PUT', ('/api/v2/admin/commonevents/', 0)),
+    'delete_by_event_no': ('DELETE', ('/api/v2/admin/commonevents/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve common events
+
+    GET /api/v2/admin/commonevents
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a common event
+
+    POST /api/v2/admin/commonevents
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_event_no(client: "Cafe24Client", event_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a common event
+
+    PUT /api/v2/admin/commonevents/{event_no}
+    """
+    return client.call(_ROUTES['update_by_event_no'], (event_no, ), params=params, data=data)
+
+
+def delete_by_event_no(client: "Cafe24Client", event_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a common event
+
+    DELETE /api/v2/admin/commonevents/{event_no}
+    """
+    return client.call(_ROUTES['delete_by_event_no'], (event_no, ), params=params, data=data)
@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - control
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'update': ('PUT', ('/api/v2/admin/control',)),
+}
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Control
+
+    주문 입금확인 제어버튼 기능을 제공합니다.
+
+    PUT /api/v2/admin/control
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
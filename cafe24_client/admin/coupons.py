@@ -0,0 +1,92 @@
+"""
+Cafe24 Admin API - coupons
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/coupons/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/coupons/setting',)),
+    'get': ('GET', ('/api/v2/admin/coupons',)),
+    'create': ('POST', ('/api/v2/admin/coupons',)),
+    'get_count': ('GET', ('/api/v2/admin/coupons/count',)),
+    'update_by_coupon_no': ('PUT', ('/api/v2/admin/coupons/', 0)),
+    'get_coupon_issues': ('GET', ('/api/v2/admin/coupons/', 0, '/issues')),
+    'create_coupon_issues': ('POST', ('/api/v2/admin/coupons/', 0, '/issues')),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve coupon settings
+
+    쿠폰 설정(Coupons setting)은 쇼핑몰에서 사용할 쿠폰의 기본적인 설정을 입력할 수 있습니다.
+
+    GET /api/v2/admin/coupons/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update coupon settings
+
+    쿠폰 설정(Coupons setting)은 쇼핑몰에서 사용할 쿠폰의 기본적인 설정을 입력할 수 있습니다.
+
+    PUT /api/v2/admin/coupons/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of coupons
+
+    GET /api/v2/admin/coupons
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a coupon
+
+    POST /api/v2/admin/coupons
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a count of coupons
+
+    GET /api/v2/admin/coupons/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def update_by_coupon_no(client: "Cafe24Client", coupon_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a coupon
+
+    PUT /api/v2/admin/coupons/{coupon_no}
+    """
+    return client.call(_ROUTES['update_by_coupon_no'], (coupon_no, ), params=params, data=data)
+
+
+def get_coupon_issues(client: "Cafe24Client", coupon_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Coupons issues 조회
+
+    쿠폰 발급(Coupons issues)은 생성된 쿠폰에 관한 기능입니다.
+
+    GET /api/v2/admin/coupons/{coupon_no}/issues
+    """
+    return client.call(_ROUTES['get_coupon_issues'], (coupon_no, ), params=params)
+
+
+def create_coupon_issues(client: "Cafe24Client", coupon_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Coupons issues 생성
+
+    생성된 쿠폰에 대한 발급.
+
+    POST /api/v2/admin/coupons/{coupon_no}/issues
+    """
+    return client.call(_ROUTES['create_coupon_issues'], (coupon_no, ), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - credits
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/credits',)),
+    'get_report': ('GET', ('/api/v2/admin/credits/report',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve credits information
+
+    예치금(Credits)은 주문 환불시 환불수단으로서 받을 수 있는 현금성 자산입니다.
+
+    GET /api/v2/admin/credits
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_report(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Credits report
+
+    예치금 통계(Credit report)는 지정한 기간동안의 예치금 통계를 조회할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/credits/report
+    """
+    return client.call(_ROUTES['get_report'], (), params=params)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - currency
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/currency',)),
+    'update': ('PUT', ('/api/v2/admin/currency',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve currency information
+
+    환율 정보(Currency)는 쇼핑몰의 화폐 정보, 환율 정보 등을 확인할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/currency
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update currency information
+
+    환율 정보(Currency)는 쇼핑몰의 화폐 정보, 환율 정보 등을 확인할 수 있는 리소스입니다.
+
+    PUT /api/v2/admin/currency
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
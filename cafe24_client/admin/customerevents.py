@@ -0,0 +1,41 @@
+"""
+Cafe24 Admin API - customerevents
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/customerevents',)),
+    'create': ('POST', ('/api/v2/admin/customerevents',)),
+    'update': ('PUT', ('/api/v2/admin/customerevents',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customer events 조회
+
+    고객 이벤트에 대한 정보를 조회합니다.
+
+    GET /api/v2/admin/customerevents
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """회원정보 이벤트 생성
+
+    POST /api/v2/admin/customerevents
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """회원정보 이벤트 수정
+
+    PUT /api/v2/admin/customerevents
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
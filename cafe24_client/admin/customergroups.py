@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - customergroups
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/customergroups',)),
+    'get_count': ('GET', ('/api/v2/admin/customergroups/count',)),
+    'get_by_group_no': ('GET', ('/api/v2/admin/customergroups/', 0)),
+    'create_group_customers': ('POST', ('/api/v2/admin/customergroups/', 0, '/customers')),
+    'get_setting': ('GET', ('/api/v2/admin/customergroups/setting',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customergroups 조회
+
+    회원등급을 검색하여 관리할 수 있습니다.
+
+    GET /api/v2/admin/customergroups
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customergroups 수 조회
+
+    회원등급의 수를 조회합니다.
+
+    GET /api/v2/admin/customergroups/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_group_no(client: "Cafe24Client", group_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """특정 Customergroup 조회
+
+    특정 회원등급을 조회합니다.
+
+    GET /api/v2/admin/customergroups/{group_no}
+    """
+    return client.call(_ROUTES['get_by_group_no'], (group_no, ), params=params)
+
+
+def create_group_customers(client: "Cafe24Client", group_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Customergroups customers 추가
+
+    특정 회원등급의 회원과 관련된 기능입니다.
+
+    POST /api/v2/admin/customergroups/{group_no}/customers
+    """
+    return client.call(_ROUTES['create_group_customers'], (group_no, ), params=params, data=data)
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customergroups setting
+
+    회원등급에 대한 쇼핑몰 설정 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/customergroups/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
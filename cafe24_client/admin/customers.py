@@ -0,0 +1,270 @@
+"""
+Cafe24 Admin API - customers
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/customers/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/customers/setting',)),
+    'get': ('GET', ('/api/v2/admin/customers',)),
+    'delete_by_member_id': ('DELETE', ('/api/v2/admin/customers/', 0)),
+    'get_member_autoupdate': ('GET', ('/api/v2/admin/customers/', 0, '/autoupdate')),
+    'get_member_memos_count': ('GET', ('/api/v2/admin/customers/', 0, '/memos/count')),
+    'get_member_memos': ('GET', ('/api/v2/admin/customers/', 0, '/memos')),
+    'create_member_memos': ('POST', ('/api/v2/admin/customers/', 0, '/memos')),
+    'get_member_memos_by_memo_no': ('GET', ('/api/v2/admin/customers/', 0, '/memos/', 1)),
+    'update_member_memos_by_memo_no': ('PUT', ('/api/v2/admin/customers/', 0, '/memos/', 1)),
+    'delete_member_memos_by_memo_no': ('DELETE', ('/api/v2/admin/customers/', 0, '/memos/', 1)),
+    'get_member_paymentinformation': ('GET', ('/api/v2/admin/customers/', 0, '/paymentinformation')),
+    'delete_member_paymentinformation': ('DELETE', ('/api/v2/admin/customers/', 0, '/paymentinformation')),
+    'delete_member_paymentinformation_by_payment_method_id': ('DELETE', ('/api/v2/admin/customers/', 0, '/paymentinformation/', 1)),
+    'get_member_plusapp': ('GET', ('/api/v2/admin/customers/', 0, '/plusapp')),
+    'get_member_social': ('GET', ('/api/v2/admin/customers/', 0, '/social')),
+    'get_properties': ('GET', ('/api/v2/admin/customers/properties',)),
+    'update_properties': ('PUT', ('/api/v2/admin/customers/properties',)),
+    'get_member_coupons': ('GET', ('/api/v2/admin/customers/', 0, '/coupons')),
+    'get_member_coupons_count': ('GET', ('/api/v2/admin/customers/', 0, '/coupons/count')),
+    'delete_member_coupons_by_coupon_no': ('DELETE', ('/api/v2/admin/customers/', 0, '/coupons/', 1)),
+    'get_member_wishlist_count': ('GET', ('/api/v2/admin/customers/', 0, '/wishlist/count')),
+    'get_member_wishlist': ('GET', ('/api/v2/admin/customers/', 0, '/wishlist')),
+    'create_member_invitation': ('POST', ('/api/v2/admin/customers/', 0, '/invitation')),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve customer settings
+
+    회원관련 설정 시 회원가입약관을 조회할 수 있습니다.
+
+    GET /api/v2/admin/customers/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update customer settings
+
+    회원관련 설정 시 회원가입약관을 조회할 수 있습니다.
+
+    PUT /api/v2/admin/customers/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customers
+
+    회원(Customer)은 쇼핑몰의 상품을 구매하는 고객을 뜻합니다.
+
+    GET /api/v2/admin/customers
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def delete_by_member_id(client: "Cafe24Client", member_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete Customer
+
+    특정 회원을 삭제합니다.
+
+    DELETE /api/v2/admin/customers/{member_id}
+    """
+    return client.call(_ROUTES['delete_by_member_id'], (member_id, ), params=params, data=data)
+
+
+def get_member_autoupdate(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Customers autoupdate
+
+    회원 별 회원등급 자동변경 정보(다음 예상 등급)를 조회할 수 있습니다.
+
+    GET /api/v2/admin/customers/{member_id}/autoupdate
+    """
+    return client.call(_ROUTES['get_member_autoupdate'], (member_id, ), params=params)
+
+
+def get_member_memos_count(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Customers memos count
+
+    회원 메모 수를 조회합니다.
+
+    GET /api/v2/admin/customers/{member_id}/memos/count
+    """
+    return client.call(_ROUTES['get_member_memos_count'], (member_id, ), params=params)
+
+
+def get_member_memos(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Customers memos list
+
+    회원 메모 목록을 조회합니다.
+
+    GET /api/v2/admin/customers/{member_id}/memos
+    """
+    return client.call(_ROUTES['get_member_memos'], (member_id, ), params=params)
+
+
+def create_member_memos(client: "Cafe24Client", member_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create customer memo
+
+    회원 메모를 등록합니다.
+
+    POST /api/v2/admin/customers/{member_id}/memos
+    """
+    return client.call(_ROUTES['create_member_memos'], (member_id, ), params=params, data=data)
+
+
+def get_member_memos_by_memo_no(client: "Cafe24Client", member_id: Union[int, str], memo_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Customers memo detail
+
+    특정 회원 메모를 조회합니다.
+
+    GET /api/v2/admin/customers/{member_id}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['get_member_memos_by_memo_no'], (member_id, memo_no, ), params=params)
+
+
+def update_member_memos_by_memo_no(client: "Cafe24Client", member_id: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update customer memo
+
+    특정 회원 메모를 수정합니다.
+
+    PUT /api/v2/admin/customers/{member_id}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['update_member_memos_by_memo_no'], (member_id, memo_no, ), params=params, data=data)
+
+
+def delete_member_memos_by_memo_no(client: "Cafe24Client", member_id: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete customer memo
+
+    특정 회원 메모를 삭제합니다.
+
+    DELETE /api/v2/admin/customers/{member_id}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['delete_member_memos_by_memo_no'], (member_id, memo_no, ), params=params, data=data)
+
+
+def get_member_paymentinformation(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a customer's list of payment information
+
+    회원이 결제한 결제수단에 대해 목록조회, 삭제가 가능합니다.
+
+    GET /api/v2/admin/customers/{member_id}/paymentinformation
+    """
+    return client.call(_ROUTES['get_member_paymentinformation'], (member_id, ), params=params)
+
+
+def delete_member_paymentinformation(client: "Cafe24Client", member_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete customer's payment information
+
+    회원이 결제한 결제수단에 대해 목록조회, 삭제가 가능합니다.
+
+    DELETE /api/v2/admin/customers/{member_id}/paymentinformation
+    """
+    return client.call(_ROUTES['delete_member_paymentinformation'], (member_id, ), params=params, data=data)
+
+
+def delete_member_paymentinformation_by_payment_method_id(client: "Cafe24Client", member_id: Union[int, str], payment_method_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete specific payment method
+
+    회원이 결제한 결제수단에 대해 목록조회, 삭제가 가능합니다.
+
+    DELETE /api/v2/admin/customers/{member_id}/paymentinformation/{payment_method_id}
+    """
+    return client.call(_ROUTES['delete_member_paymentinformation_by_payment_method_id'], (member_id, payment_method_id, ), params=params, data=data)
+
+
+def get_member_plusapp(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve customer's plusapp information
+
+    쇼핑몰 회원의 플러스앱 설치 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/customers/{member_id}/plusapp
+    """
+    return client.call(_ROUTES['get_member_plusapp'], (member_id, ), params=params)
+
+
+def get_member_social(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve customer's social information
+
+    GET /api/v2/admin/customers/{member_id}/social
+    """
+    return client.call(_ROUTES['get_member_social'], (member_id, ), params=params)
+
+
+def get_properties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Customers properties 조회
+
+    회원가입항목 설정을 관리 할 수 있습니다. 기본회원가입항목, 상세회원가입항목 사용여부 확인이 가능하여 회원가입 시 필요항목 및 추가항목(생년월일, 결혼기념일, 배우자 생일 등) 설정을 조회하거나 수정할 수 있습니다.
+
+    GET /api/v2/admin/customers/properties
+    """
+    return client.call(_ROUTES['get_properties'], (), params=params)
+
+
+def update_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Customers properties 수정
+
+    회원가입항목 설정을 관리 할 수 있습니다. 기본회원가입항목, 상세회원가입항목 사용여부 확인이 가능하여 회원가입 시 필요항목 및 추가항목(생년월일, 결혼기념일, 배우자 생일 등) 설정을 조회하거나 수정할 수 있습니다.
+
+    PUT /api/v2/admin/customers/properties
+    """
+    return client.call(_ROUTES['update_properties'], (), params=params, data=data)
+
+
+def get_member_coupons(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """회원 쿠폰 조회
+
+    회원에게 발급된 쿠폰을 조회하거나 삭제할 수 있습니다
+
+    GET /api/v2/admin/customers/{member_id}/coupons
+    """
+    return client.call(_ROUTES['get_member_coupons'], (member_id, ), params=params)
+
+
+def get_member_coupons_count(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """회원 쿠폰 수 조회
+
+    GET /api/v2/admin/customers/{member_id}/coupons/count
+    """
+    return client.call(_ROUTES['get_member_coupons_count'], (member_id, ), params=params)
+
+
+def delete_member_coupons_by_coupon_no(client: "Cafe24Client", member_id: Union[int, str], coupon_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """회원 쿠폰 삭제
+
+    DELETE /api/v2/admin/customers/{member_id}/coupons/{coupon_no}
+    """
+    return client.call(_ROUTES['delete_member_coupons_by_coupon_no'], (member_id, coupon_no, ), params=params, data=data)
+
+
+def get_member_wishlist_count(client: "Cafe24Client", member_id: str, **params: Any) -> Dict[str, Any]:
+    """회원 관심상품 수 조회
+
+    회원의 관심상품 수를 조회할 수 있는 API입니다
+
+    GET /api/v2/admin/customers/{member_id}/wishlist/count
+    """
+    return client.call(_ROUTES['get_member_wishlist_count'], (member_id, ), params=params)
+
+
+def get_member_wishlist(client: "Cafe24Client", member_id: str, **params: Any) -> Dict[str, Any]:
+    """회원 관심상품 목록 조회
+
+    회원의 관심상품 목록을 조회할 수 있는 API입니다
+
+    GET /api/v2/admin/customers/{member_id}/wishlist
+    """
+    return client.call(_ROUTES['get_member_wishlist'], (member_id, ), params=params)
+
+
+def create_member_invitation(client: "Cafe24Client", member_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Customers invitation
+
+    회원 초대(invitation)는 계정을 활성화하기 위해 SMS, 이메일 등으로 초대 메시지를 발송하는 기능입니다.
+
+    POST /api/v2/admin/customers/{member_id}/invitation
+    """
+    return client.call(_ROUTES['create_member_invitation'], (member_id, ), params=params, data=data)
@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - customersprivacy
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/customersprivacy',)),
+    'get_count': ('GET', ('/api/v2/admin/customersprivacy/count',)),
+    'get_by_member_id': ('GET', ('/api/v2/admin/customersprivacy/', 0)),
+    'update_by_member_id': ('PUT', ('/api/v2/admin/customersprivacy/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve customer privacy information
+
+    특정 회원의 개인정보에 대한 리소스입니다.
+
+    GET /api/v2/admin/customersprivacy
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve count of customer privacy records
+
+    특정 회원의 개인정보에 대한 리소스입니다.
+
+    GET /api/v2/admin/customersprivacy/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_member_id(client: "Cafe24Client", member_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve specific customer privacy information
+
+    특정 회원의 개인정보에 대한 리소스입니다.
+
+    GET /api/v2/admin/customersprivacy/{member_id}
+    """
+    return client.call(_ROUTES['get_by_member_id'], (member_id, ), params=params)
+
+
+def update_by_member_id(client: "Cafe24Client", member_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update specific customer privacy information
+
+    특정 회원의 개인정보를 업데이트하는 리소스입니다.
+
+    PUT /api/v2/admin/customersprivacy/{member_id}
+    """
+    return client.call(_ROUTES['update_by_member_id'], (member_id, ), params=params, data=data)
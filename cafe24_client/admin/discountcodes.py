@@ -0,0 +1,59 @@
+"""
+Cafe24 Admin API - discountcodes
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/discountcodes',)),
+    'create': ('POST', ('/api/v2/admin/discountcodes',)),
+    'get_by_discount_code_no': ('GET', ('/api/v2/admin/discountcodes/', 0)),
+    'update_by_discount_code_no': ('PUT', ('/api/v2/admin/discountcodes/', 0)),
+    'delete_by_discount_code_no': ('DELETE', ('/api/v2/admin/discountcodes/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of discount codes
+
+    할인코드를 관리하는 기능을 제공합니다
+
+    GET /api/v2/admin/discountcodes
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a discount code
+
+    POST /api/v2/admin/discountcodes
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_discount_code_no(client: "Cafe24Client", discount_code_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a discount code
+
+    GET /api/v2/admin/discountcodes/{discount_code_no}
+    """
+    return client.call(_ROUTES['get_by_discount_code_no'], (discount_code_no, ), params=params)
+
+
+def update_by_discount_code_no(client: "Cafe24Client", discount_code_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a discount code
+
+    PUT /api/v2/admin/discountcodes/{discount_code_no}
+    """
+    return client.call(_ROUTES['update_by_discount_code_no'], (discount_code_no, ), params=params, data=data)
+
+
+def delete_by_discount_code_no(client: "Cafe24Client", discount_code_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a discount code
+
+    DELETE /api/v2/admin/discountcodes/{discount_code_no}
+    """
+    return client.call(_ROUTES['delete_by_discount_code_no'], (discount_code_no, ), params=params, data=data)
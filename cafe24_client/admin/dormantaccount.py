@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - dormantaccount
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/dormantaccount',)),
+    'update': ('PUT', ('/api/v2/admin/dormantaccount',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Dormantaccount
+
+    휴면 회원 기능을 설정하고 조회할 수 있습니다. 휴면회원 기능은 기본몰에서만 호출 가능합니다.
+
+    GET /api/v2/admin/dormantaccount
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Dormantaccount
+
+    휴면 회원 기능을 설정하고 조회할 수 있습니다. 휴면회원 기능은 기본몰에서만 호출 가능합니다.
+
+    PUT /api/v2/admin/dormantaccount
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
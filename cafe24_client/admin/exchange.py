@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - exchange
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_by_claim_code': ('GET', ('/api/v2/admin/exchange/', 0)),
+    'create': ('POST', ('/api/v2/admin/exchange',)),
+    'update': ('PUT', ('/api/v2/admin/exchange',)),
+}
+
+
+def get_by_claim_code(client: "Cafe24Client", claim_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Exchange 조회
+
+    교환(Exchange)은 주문의 교환 접수 상태를 변경하는 리소스입니다.
+
+    GET /api/v2/admin/exchange/{claim_code}
+    """
+    return client.call(_ROUTES['get_by_claim_code'], (claim_code, ), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Exchange 생성
+
+    교환 접수를 할 수 있으며 교환이 접수된 주문의 상태를 수정할 수 있습니다.
+
+    POST /api/v2/admin/exchange
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Exchange 수정
+
+    교환 접수를 할 수 있으며 교환이 접수된 주문의 상태를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/exchange
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,78 @@
+"""
+Cafe24 Admin API - financials
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_paymentgateway': ('GET', ('/api/v2/admin/financials/paymentgateway',)),
+    'get_store': ('GET', ('/api/v2/admin/financials/store',)),
+    'get_monthlyreviews': ('GET', ('/api/v2/admin/financials/monthlyreviews',)),
+    'get_dailysales': ('GET', ('/api/v2/admin/financials/dailysales',)),
+    'get_monthlysales': ('GET', ('/api/v2/admin/financials/monthlysales',)),
+    'get_dailyvisits': ('GET', ('/api/v2/admin/financials/dailyvisits',)),
+}
+
+
+def get_paymentgateway(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials paymentgateway
+
+    Financials paymentgateway(PG 정산)는 PG사별 계약정보를 제공합니다.
+
+    GET /api/v2/admin/financials/paymentgateway
+    """
+    return client.call(_ROUTES['get_paymentgateway'], (), params=params)
+
+
+def get_store(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials store
+
+    Financials store(상점의 거래정보)는 상점의 PG사별 거래정보를 제공합니다.
+
+    GET /api/v2/admin/financials/store
+    """
+    return client.call(_ROUTES['get_store'], (), params=params)
+
+
+def get_monthlyreviews(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials monthlyreviews
+
+    월별 리뷰 통계(financials monthlyreviews)는 월별 리뷰 정보를 제공합니다. 검색 기간 내의 월별 리뷰 개수 합계, 월별 리뷰 평점 평균을 확인할 수 있습니다.
+
+    GET /api/v2/admin/financials/monthlyreviews
+    """
+    return client.call(_ROUTES['get_monthlyreviews'], (), params=params)
+
+
+def get_dailysales(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials dailysales
+
+    일별 매출(Financials dailysales)은 PG사별, 일별 매출 정보를 제공합니다. 검색 조건에 부합하는 매출 정보 검색이 가능합니다.
+
+    GET /api/v2/admin/financials/dailysales
+    """
+    return client.call(_ROUTES['get_dailysales'], (), params=params)
+
+
+def get_monthlysales(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials monthlysales
+
+    월별 매출(Financials monthlysales)은 PG사별, 월별 매출 정보를 제공합니다. 검색 조건에 부합하는 매출 정보 검색이 가능합니다.
+
+    GET /api/v2/admin/financials/monthlysales
+    """
+    return client.call(_ROUTES['get_monthlysales'], (), params=params)
+
+
+def get_dailyvisits(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Financials dailyvisits
+
+    일별 방문수(Financials dailyvisits)는 검색 기간 내의 일별 방문수를 제공합니다.
+
+    GET /api/v2/admin/financials/dailyvisits
+    """
+    return client.call(_ROUTES['get_dailyvisits'], (), params=params)
@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - fulfillments
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/admin/fulfillments',)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """배송 정보 등록
+
+    배송업체와 연동하여 배송 정보를 등록하는 기능입니다.
+
+    POST /api/v2/admin/fulfillments
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
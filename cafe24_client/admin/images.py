@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - images
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/images/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/images/setting',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Images setting
+
+    상품 이미지 사이즈 설정 값을 조회하거나 수정할 수 있습니다.
+
+    GET /api/v2/admin/images/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Images setting
+
+    상품 이미지 사이즈 설정 값을 조회하거나 수정할 수 있습니다.
+
+    PUT /api/v2/admin/images/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
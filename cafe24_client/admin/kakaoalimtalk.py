@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - kakaoalimtalk
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_profile': ('GET', ('/api/v2/admin/kakaoalimtalk/profile',)),
+    'get_setting': ('GET', ('/api/v2/admin/kakaoalimtalk/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/kakaoalimtalk/setting',)),
+}
+
+
+def get_profile(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Kakaoalimtalk profile
+
+    상점의 카카오채널 프로필키 등록여부를 확인할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/kakaoalimtalk/profile
+    """
+    return client.call(_ROUTES['get_profile'], (), params=params)
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Kakaoalimtalk setting
+
+    카카오알림톡 서비스(Kakaoalimtalk setting) 사용 여부를 조회하고 설정을 변경하는 리소스입니다.
+
+    GET /api/v2/admin/kakaoalimtalk/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Kakaoalimtalk setting
+
+    카카오알림톡 서비스(Kakaoalimtalk setting) 사용 여부를 조회하고 설정을 변경하는 리소스입니다.
+
+    PUT /api/v2/admin/kakaoalimtalk/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
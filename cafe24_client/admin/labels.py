@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - labels
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/labels',)),
+    'create': ('POST', ('/api/v2/admin/labels',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """라벨 조회
+
+    각각의 주문을 쉽게 식별하고 구분할 수 있도록 도와주는 기능입니다.
+
+    GET /api/v2/admin/labels
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """라벨 생성
+
+    각각의 주문을 쉽게 식별하고 구분할 수 있도록 도와주는 기능입니다.
+
+    POST /api/v2/admin/labels
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
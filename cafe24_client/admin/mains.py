@@ -0,0 +1,160 @@
+"""
+Cafe24 Admin API - mains
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_properties_setting': ('GET', ('/api/v2/admin/mains/properties/setting',)),
+    'update_properties_setting': ('PUT', ('/api/v2/admin/mains/properties/setting',)),
+    'get_display_group_products': ('GET', ('/api/v2/admin/mains/', 0, '/products')),
+    'create_display_group_products': ('POST', ('/api/v2/admin/mains/', 0, '/products')),
+    'update_display_group_products': ('PUT', ('/api/v2/admin/mains/', 0, '/products')),
+    'get_display_group_products_count': ('GET', ('/api/v2/admin/mains/', 0, '/products/count')),
+    'delete_display_group_products_by_product_no': ('DELETE', ('/api/v2/admin/mains/', 0, '/products/', 1)),
+    'get_properties': ('GET', ('/api/v2/admin/mains/properties',)),
+    'create_properties': ('POST', ('/api/v2/admin/mains/properties',)),
+    'update_properties': ('PUT', ('/api/v2/admin/mains/properties',)),
+    'get': ('GET', ('/api/v2/admin/mains',)),
+    'create': ('POST', ('/api/v2/admin/mains',)),
+    'update_by_display_group': ('PUT', ('/api/v2/admin/mains/', 0)),
+    'delete_by_display_group': ('DELETE', ('/api/v2/admin/mains/', 0)),
+}
+
+
+def get_properties_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Mains properties setting 조회
+
+    메인 화면에 표시되는 항목의 추가 설정을 조회하고 수정할 수 있습니다.
+
+    GET /api/v2/admin/mains/properties/setting
+    """
+    return client.call(_ROUTES['get_properties_setting'], (), params=params)
+
+
+def update_properties_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains properties setting 수정
+
+    메인 화면에 표시되는 항목의 추가 설정을 조회하고 수정할 수 있습니다.
+
+    PUT /api/v2/admin/mains/properties/setting
+    """
+    return client.call(_ROUTES['update_properties_setting'], (), params=params, data=data)
+
+
+def get_display_group_products(client: "Cafe24Client", display_group: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Mains products
+
+    특정 메인분류에 배치된 상품을 목록으로 조회하거나 상품등록, 수정, 삭제할 수 있습니다.
+
+    GET /api/v2/admin/mains/{display_group}/products
+    """
+    return client.call(_ROUTES['get_display_group_products'], (display_group, ), params=params)
+
+
+def create_display_group_products(client: "Cafe24Client", display_group: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains products
+
+    특정 메인분류에 배치된 상품을 목록으로 조회하거나 상품등록, 수정, 삭제할 수 있습니다.
+
+    POST /api/v2/admin/mains/{display_group}/products
+    """
+    return client.call(_ROUTES['create_display_group_products'], (display_group, ), params=params, data=data)
+
+
+def update_display_group_products(client: "Cafe24Client", display_group: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains products
+
+    특정 메인분류에 배치된 상품을 목록으로 조회하거나 상품등록, 수정, 삭제할 수 있습니다.
+
+    PUT /api/v2/admin/mains/{display_group}/products
+    """
+    return client.call(_ROUTES['update_display_group_products'], (display_group, ), params=params, data=data)
+
+
+def get_display_group_products_count(client: "Cafe24Client", display_group: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Mains products
+
+    특정 메인분류에 배치된 상품을 목록으로 조회하거나 상품등록, 수정, 삭제할 수 있습니다.
+
+    GET /api/v2/admin/mains/{display_group}/products/count
+    """
+    return client.call(_ROUTES['get_display_group_products_count'], (display_group, ), params=params)
+
+
+def delete_display_group_products_by_product_no(client: "Cafe24Client", display_group: Union[int, str], product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains products
+
+    특정 메인분류에 배치된 상품을 목록으로 조회하거나 상품등록, 수정, 삭제할 수 있습니다.
+
+    DELETE /api/v2/admin/mains/{display_group}/products/{product_no}
+    """
+    return client.call(_ROUTES['delete_display_group_products_by_product_no'], (display_group, product_no, ), params=params, data=data)
+
+
+def get_properties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Mains properties
+
+    메인 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    GET /api/v2/admin/mains/properties
+    """
+    return client.call(_ROUTES['get_properties'], (), params=params)
+
+
+def create_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains properties
+
+    메인 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    POST /api/v2/admin/mains/properties
+    """
+    return client.call(_ROUTES['create_properties'], (), params=params, data=data)
+
+
+def update_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mains properties
+
+    메인 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    PUT /api/v2/admin/mains/properties
+    """
+    return client.call(_ROUTES['update_properties'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve main categories
+
+    메인분류(Mains)는 쇼핑몰의 상품을 메인화면에 진열할 수 있는 기능입니다.
+
+    GET /api/v2/admin/mains
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Add main category
+
+    POST /api/v2/admin/mains
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_display_group(client: "Cafe24Client", display_group: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update main category
+
+    PUT /api/v2/admin/mains/{display_group}
+    """
+    return client.call(_ROUTES['update_by_display_group'], (display_group, ), params=params, data=data)
+
+
+def delete_by_display_group(client: "Cafe24Client", display_group: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete main category
+
+    DELETE /api/v2/admin/mains/{display_group}
+    """
+    return client.call(_ROUTES['delete_by_display_group'], (display_group, ), params=params, data=data)
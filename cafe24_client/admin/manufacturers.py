@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - manufacturers
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/manufacturers',)),
+    'create': ('POST', ('/api/v2/admin/manufacturers',)),
+    'get_by_manufacturer_code': ('GET', ('/api/v2/admin/manufacturers/', 0)),
+    'update_by_manufacturer_code': ('PUT', ('/api/v2/admin/manufacturers/', 0)),
+    'get_count': ('GET', ('/api/v2/admin/manufacturers/count',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of manufacturers
+
+    제조사 목록을 조회합니다.
+
+    GET /api/v2/admin/manufacturers
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a manufacturer
+
+    새로운 제조사를 생성합니다.
+
+    POST /api/v2/admin/manufacturers
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_manufacturer_code(client: "Cafe24Client", manufacturer_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a manufacturer
+
+    특정 제조사를 조회합니다.
+
+    GET /api/v2/admin/manufacturers/{manufacturer_code}
+    """
+    return client.call(_ROUTES['get_by_manufacturer_code'], (manufacturer_code, ), params=params)
+
+
+def update_by_manufacturer_code(client: "Cafe24Client", manufacturer_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a manufacturer
+
+    기존 제조사를 수정합니다.
+
+    PUT /api/v2/admin/manufacturers/{manufacturer_code}
+    """
+    return client.call(_ROUTES['update_by_manufacturer_code'], (manufacturer_code, ), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a count of manufacturers
+
+    제조사 수를 조회합니다.
+
+    GET /api/v2/admin/manufacturers/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - mobile
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/mobile/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/mobile/setting',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Mobile setting 조회
+
+    쇼핑몰의 모바일 쇼핑몰 설정에 관한 리스트입니다.
+
+    GET /api/v2/admin/mobile/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Mobile setting 수정
+
+    쇼핑몰의 모바일 쇼핑몰 설정에 관한 리스트입니다.
+
+    PUT /api/v2/admin/mobile/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
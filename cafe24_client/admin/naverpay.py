@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - naverpay
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/naverpay/setting',)),
+    'create_setting': ('POST', ('/api/v2/admin/naverpay/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/naverpay/setting',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Naverpay setting 조회
+
+    네이버페이 공통인증키를 조회할 수 있는 기능입니다.
+
+    GET /api/v2/admin/naverpay/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def create_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Naverpay setting 생성
+
+    네이버페이 공통인증키를 생성할 수 있는 기능입니다.
+
+    POST /api/v2/admin/naverpay/setting
+    """
+    return client.call(_ROUTES['create_setting'], (), params=params, data=data)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Naverpay setting 수정
+
+    네이버페이 공통인증키를 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/naverpay/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
@@ -0,0 +1,72 @@
+"""
+Cafe24 Admin API - orderform
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/orderform/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/orderform/setting',)),
+    'get_properties': ('GET', ('/api/v2/admin/orderform/properties',)),
+    'create_properties': ('POST', ('/api/v2/admin/orderform/properties',)),
+    'update_properties_by_orderform_property_id': ('PUT', ('/api/v2/admin/orderform/properties/', 0)),
+    'delete_properties_by_orderform_property_id': ('DELETE', ('/api/v2/admin/orderform/properties/', 0)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orderform setting 조회
+
+    주문서 입력항목을 조회할 수 있습니다.
+
+    GET /api/v2/admin/orderform/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orderform setting 수정
+
+    주문서 입력항목을 수정할 수 있습니다.
+
+    PUT /api/v2/admin/orderform/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get_properties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """주문서 속성 조회
+
+    주문서의 속성을 조회하는 기능입니다.
+
+    GET /api/v2/admin/orderform/properties
+    """
+    return client.call(_ROUTES['get_properties'], (), params=params)
+
+
+def create_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """create_properties
+
+    POST /api/v2/admin/orderform/properties
+    """
+    return client.call(_ROUTES['create_properties'], (), params=params, data=data)
+
+
+def update_properties_by_orderform_property_id(client: "Cafe24Client", orderform_property_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """update_properties_by_orderform_property_id
+
+    PUT /api/v2/admin/orderform/properties/{orderform_property_id}
+    """
+    return client.call(_ROUTES['update_properties_by_orderform_property_id'], (orderform_property_id, ), params=params, data=data)
+
+
+def delete_properties_by_orderform_property_id(client: "Cafe24Client", orderform_property_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """delete_properties_by_orderform_property_id
+
+    DELETE /api/v2/admin/orderform/properties/{orderform_property_id}
+    """
+    return client.call(_ROUTES['delete_properties_by_orderform_property_id'], (orderform_property_id, ), params=params, data=data)
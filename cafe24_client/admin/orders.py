@@ -0,0 +1,752 @@
+"""
+Cafe24 Admin API - orders
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/orders/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/orders/setting',)),
+    'get_status': ('GET', ('/api/v2/admin/orders/status',)),
+    'update_status': ('PUT', ('/api/v2/admin/orders/status',)),
+    'get': ('GET', ('/api/v2/admin/orders',)),
+    'update': ('PUT', ('/api/v2/admin/orders',)),
+    'get_by_order_id': ('GET', ('/api/v2/admin/orders/', 0)),
+    'update_by_order_id': ('PUT', ('/api/v2/admin/orders/', 0)),
+    'get_count': ('GET', ('/api/v2/admin/orders/count',)),
+    'delete_order_autocalculation': ('DELETE', ('/api/v2/admin/orders/', 0, '/autocalculation')),
+    'get_order_buyer': ('GET', ('/api/v2/admin/orders/', 0, '/buyer')),
+    'update_order_buyer': ('PUT', ('/api/v2/admin/orders/', 0, '/buyer')),
+    'get_order_buyer_history': ('GET', ('/api/v2/admin/orders/', 0, '/buyer/history')),
+    'create_order_cancellation': ('POST', ('/api/v2/admin/orders/', 0, '/cancellation')),
+    'update_order_cancellation_by_claim_code': ('PUT', ('/api/v2/admin/orders/', 0, '/cancellation/', 1)),
+    'create_order_exchange': ('POST', ('/api/v2/admin/orders/', 0, '/exchange')),
+    'update_order_exchange_by_claim_code': ('PUT', ('/api/v2/admin/orders/', 0, '/exchange/', 1)),
+    'update_order_exchangerequests': ('PUT', ('/api/v2/admin/orders/', 0, '/exchangerequests')),
+    'get_order_items': ('GET', ('/api/v2/admin/orders/', 0, '/items')),
+    'create_order_items': ('POST', ('/api/v2/admin/orders/', 0, '/items')),
+    'update_order_items_by_order_item_code': ('PUT', ('/api/v2/admin/orders/', 0, '/items/', 1)),
+    'get_order_items_order_item_labels': ('GET', ('/api/v2/admin/orders/', 0, '/items/', 1, '/labels')),
+    'create_order_items_order_item_labels': ('POST', ('/api/v2/admin/orders/', 0, '/items/', 1, '/labels')),
+    'update_order_items_order_item_labels': ('PUT', ('/api/v2/admin/orders/', 0, '/items/', 1, '/labels')),
+    'delete_order_items_order_item_labels_by_name': ('DELETE', ('/api/v2/admin/orders/', 0, '/items/', 1, '/labels/', 2)),
+    'create_order_items_order_item_options': ('POST', ('/api/v2/admin/orders/', 0, '/items/', 1, '/options')),
+    'update_order_items_order_item_options': ('PUT', ('/api/v2/admin/orders/', 0, '/items/', 1, '/options')),
+    'get_order_memos': ('GET', ('/api/v2/admin/orders/', 0, '/memos')),
+    'create_order_memos': ('POST', ('/api/v2/admin/orders/', 0, '/memos')),
+    'update_order_memos_by_memo_no': ('PUT', ('/api/v2/admin/orders/', 0, '/memos/', 1)),
+    'delete_order_memos_by_memo_no': ('DELETE', ('/api/v2/admin/orders/', 0, '/memos/', 1)),
+    'update_order_payments': ('PUT', ('/api/v2/admin/orders/', 0, '/payments')),
+    'get_order_paymenttimeline': ('GET', ('/api/v2/admin/orders/', 0, '/paymenttimeline')),
+    'get_order_paymenttimeline_by_payment_no': ('GET', ('/api/v2/admin/orders/', 0, '/paymenttimeline/', 1)),
+    'get_order_receivers': ('GET', ('/api/v2/admin/orders/', 0, '/receivers')),
+    'update_order_receivers': ('PUT', ('/api/v2/admin/orders/', 0, '/receivers')),
+    'update_order_receivers_by_shipping_code': ('PUT', ('/api/v2/admin/orders/', 0, '/receivers/', 1)),
+    'get_order_receivers_history': ('GET', ('/api/v2/admin/orders/', 0, '/receivers/history')),
+    'update_order_refunds_by_refund_code': ('PUT', ('/api/v2/admin/orders/', 0, '/refunds/', 1)),
+    'create_order_return_': ('POST', ('/api/v2/admin/orders/', 0, '/return')),
+    'update_order_return__by_claim_code': ('PUT', ('/api/v2/admin/orders/', 0, '/return/', 1)),
+    'get_order_shipments': ('GET', ('/api/v2/admin/orders/', 0, '/shipments')),
+    'create_order_shipments': ('POST', ('/api/v2/admin/orders/', 0, '/shipments')),
+    'update_order_shipments_by_shipping_code': ('PUT', ('/api/v2/admin/orders/', 0, '/shipments/', 1)),
+    'delete_order_shipments_by_shipping_code': ('DELETE', ('/api/v2/admin/orders/', 0, '/shipments/', 1)),
+    'get_order_shippingfeecancellation': ('GET', ('/api/v2/admin/orders/', 0, '/shippingfeecancellation')),
+    'create_order_shippingfeecancellation': ('POST', ('/api/v2/admin/orders/', 0, '/shippingfeecancellation')),
+    'create_order_shortagecancellation': ('POST', ('/api/v2/admin/orders/', 0, '/shortagecancellation')),
+    'get_benefits': ('GET', ('/api/v2/admin/orders/benefits',)),
+    'create_calculation': ('POST', ('/api/v2/admin/orders/calculation',)),
+    'get_coupons': ('GET', ('/api/v2/admin/orders/coupons',)),
+    'get_dashboard': ('GET', ('/api/v2/admin/orders/dashboard',)),
+    'get_inflowgroups': ('GET', ('/api/v2/admin/orders/inflowgroups',)),
+    'create_inflowgroups': ('POST', ('/api/v2/admin/orders/inflowgroups',)),
+    'update_inflowgroups_by_inflow_group_id': ('PUT', ('/api/v2/admin/orders/inflowgroups/', 0)),
+    'delete_inflowgroups_by_inflow_group_id': ('DELETE', ('/api/v2/admin/orders/inflowgroups/', 0)),
+    'get_inflowgroups_group_inflows': ('GET', ('/api/v2/admin/orders/inflowgroups/', 0, '/inflows')),
+    'create_inflowgroups_group_inflows': ('POST', ('/api/v2/admin/orders/inflowgroups/', 0, '/inflows')),
+    'update_inflowgroups_group_inflows_by_inflow_id': ('PUT', ('/api/v2/admin/orders/inflowgroups/', 0, '/inflows/', 1)),
+    'delete_inflowgroups_group_inflows_by_inflow_id': ('DELETE', ('/api/v2/admin/orders/inflowgroups/', 0, '/inflows/', 1)),
+    'get_memos': ('GET', ('/api/v2/admin/orders/memos',)),
+    'get_migrations': ('GET', ('/api/v2/admin/orders/migrations',)),
+    'create_migrations': ('POST', ('/api/v2/admin/orders/migrations',)),
+    'update_migrations': ('PUT', ('/api/v2/admin/orders/migrations',)),
+    'delete_migrations_by_order_id': ('DELETE', ('/api/v2/admin/orders/migrations/', 0)),
+    'get_paymentamount': ('GET', ('/api/v2/admin/orders/paymentamount',)),
+    'get_saleschannels': ('GET', ('/api/v2/admin/orders/saleschannels',)),
+    'create_saleschannels': ('POST', ('/api/v2/admin/orders/saleschannels',)),
+    'update_saleschannels_by_sales_channel_id': ('PUT', ('/api/v2/admin/orders/saleschannels/', 0)),
+    'delete_saleschannels_by_sales_channel_id': ('DELETE', ('/api/v2/admin/orders/saleschannels/', 0)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders setting 조회
+
+    주문 설정에 대해 조회할 수 있는 기능입니다.
+
+    GET /api/v2/admin/orders/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders setting 수정
+
+    주문 설정에 대해 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/orders/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get_status(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders status
+
+    쇼핑몰에서 사용하는 주문상태 유형 및 표기를 관리할 수 있습니다
+
+    GET /api/v2/admin/orders/status
+    """
+    return client.call(_ROUTES['get_status'], (), params=params)
+
+
+def update_status(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders status
+
+    쇼핑몰에서 사용하는 주문상태 유형 및 표기를 관리할 수 있습니다
+
+    PUT /api/v2/admin/orders/status
+    """
+    return client.call(_ROUTES['update_status'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """get
+
+    GET /api/v2/admin/orders
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """update
+
+    PUT /api/v2/admin/orders
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
+
+
+def get_by_order_id(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """get_by_order_id
+
+    GET /api/v2/admin/orders/{order_id}
+    """
+    return client.call(_ROUTES['get_by_order_id'], (order_id, ), params=params)
+
+
+def update_by_order_id(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """update_by_order_id
+
+    PUT /api/v2/admin/orders/{order_id}
+    """
+    return client.call(_ROUTES['update_by_order_id'], (order_id, ), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """get_count
+
+    GET /api/v2/admin/orders/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def delete_order_autocalculation(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Remove auto calculation setting of a specific order
+
+    DELETE /api/v2/admin/orders/{order_id}/autocalculation
+    """
+    return client.call(_ROUTES['delete_order_autocalculation'], (order_id, ), params=params, data=data)
+
+
+def get_order_buyer(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders buyer
+
+    주문자(Buyer)는 쇼핑몰의 상품을 주문한 사람을 나타냅니다.
+
+    GET /api/v2/admin/orders/{order_id}/buyer
+    """
+    return client.call(_ROUTES['get_order_buyer'], (order_id, ), params=params)
+
+
+def update_order_buyer(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update order buyer information
+
+    특정 주문의 주문자 정보(이름, 주소, 전화번호, 이메일 등)를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/buyer
+    """
+    return client.call(_ROUTES['update_order_buyer'], (order_id, ), params=params, data=data)
+
+
+def get_order_buyer_history(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders buyer history
+
+    주문자 수정 이력(Buyer History)은 특정 주문의 주문자 정보가 수정된 이력을 나타냅니다.
+
+    GET /api/v2/admin/orders/{order_id}/buyer/history
+    """
+    return client.call(_ROUTES['get_order_buyer_history'], (order_id, ), params=params)
+
+
+def create_order_cancellation(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders cancellation
+
+    주문 취소(Orders cancellation)는 배송 전인 특정 주문 하나를 취소 처리할 수 있는 기능입니다.
+
+    POST /api/v2/admin/orders/{order_id}/cancellation
+    """
+    return client.call(_ROUTES['create_order_cancellation'], (order_id, ), params=params, data=data)
+
+
+def update_order_cancellation_by_claim_code(client: "Cafe24Client", order_id: Union[int, str], claim_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders cancellation update
+
+    해당 API를 사용하여 취소요청처리한 경우 완료뿐만 아니라 함께 PG 취소도 같이 진행할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/cancellation/{claim_code}
+    """
+    return client.call(_ROUTES['update_order_cancellation_by_claim_code'], (order_id, claim_code, ), params=params, data=data)
+
+
+def create_order_exchange(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders exchange
+
+    주문 교환(Orders exchange)은 주문의 교환 접수 상태와 관련된 기능입니다.
+
+    POST /api/v2/admin/orders/{order_id}/exchange
+    """
+    return client.call(_ROUTES['create_order_exchange'], (order_id, ), params=params, data=data)
+
+
+def update_order_exchange_by_claim_code(client: "Cafe24Client", order_id: Union[int, str], claim_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders exchange
+
+    특정 주문에 대해 교환 접수를 할 수 있으며 교환이 접수된 주문의 상태를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/exchange/{claim_code}
+    """
+    return client.call(_ROUTES['update_order_exchange_by_claim_code'], (order_id, claim_code, ), params=params, data=data)
+
+
+def update_order_exchangerequests(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders exchangerequests
+
+    교환 처리를 요청한 주문의 교환접수를 거부할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/exchangerequests
+    """
+    return client.call(_ROUTES['update_order_exchangerequests'], (order_id, ), params=params, data=data)
+
+
+def get_order_items(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders items
+
+    GET /api/v2/admin/orders/{order_id}/items
+    """
+    return client.call(_ROUTES['get_order_items'], (order_id, ), params=params)
+
+
+def create_order_items(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items
+
+    POST /api/v2/admin/orders/{order_id}/items
+    """
+    return client.call(_ROUTES['create_order_items'], (order_id, ), params=params, data=data)
+
+
+def update_order_items_by_order_item_code(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items
+
+    PUT /api/v2/admin/orders/{order_id}/items/{order_item_code}
+    """
+    return client.call(_ROUTES['update_order_items_by_order_item_code'], (order_id, order_item_code, ), params=params, data=data)
+
+
+def get_order_items_order_item_labels(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders items labels
+
+    원하는 주문 품목에 라벨을 남기거나 조회, 수정, 삭제할 수 있습니다.
+
+    GET /api/v2/admin/orders/{order_id}/items/{order_item_code}/labels
+    """
+    return client.call(_ROUTES['get_order_items_order_item_labels'], (order_id, order_item_code, ), params=params)
+
+
+def create_order_items_order_item_labels(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items labels
+
+    원하는 주문 품목에 라벨을 남기거나 조회, 수정, 삭제할 수 있습니다.
+
+    POST /api/v2/admin/orders/{order_id}/items/{order_item_code}/labels
+    """
+    return client.call(_ROUTES['create_order_items_order_item_labels'], (order_id, order_item_code, ), params=params, data=data)
+
+
+def update_order_items_order_item_labels(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items labels
+
+    원하는 주문 품목에 라벨을 남기거나 조회, 수정, 삭제할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/items/{order_item_code}/labels
+    """
+    return client.call(_ROUTES['update_order_items_order_item_labels'], (order_id, order_item_code, ), params=params, data=data)
+
+
+def delete_order_items_order_item_labels_by_name(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], name: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items labels
+
+    원하는 주문 품목에 라벨을 남기거나 조회, 수정, 삭제할 수 있습니다.
+
+    DELETE /api/v2/admin/orders/{order_id}/items/{order_item_code}/labels/{name}
+    """
+    return client.call(_ROUTES['delete_order_items_order_item_labels_by_name'], (order_id, order_item_code, name, ), params=params, data=data)
+
+
+def create_order_items_order_item_options(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items options
+
+    주문 품목에 추가입력 옵션을 등록, 수정, 삭제할 수 있습니다.
+
+    POST /api/v2/admin/orders/{order_id}/items/{order_item_code}/options
+    """
+    return client.call(_ROUTES['create_order_items_order_item_options'], (order_id, order_item_code, ), params=params, data=data)
+
+
+def update_order_items_order_item_options(client: "Cafe24Client", order_id: Union[int, str], order_item_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders items options
+
+    주문 품목에 추가입력 옵션을 등록, 수정, 삭제할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/items/{order_item_code}/options
+    """
+    return client.call(_ROUTES['update_order_items_order_item_options'], (order_id, order_item_code, ), params=params, data=data)
+
+
+def get_order_memos(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders memos 조회
+
+    특정 주문의 메모에 대한 하위 리소스입니다.
+
+    GET /api/v2/admin/orders/{order_id}/memos
+    """
+    return client.call(_ROUTES['get_order_memos'], (order_id, ), params=params)
+
+
+def create_order_memos(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders memos 생성
+
+    특정 주문에 대한 메모를 생성합니다.
+
+    POST /api/v2/admin/orders/{order_id}/memos
+    """
+    return client.call(_ROUTES['create_order_memos'], (order_id, ), params=params, data=data)
+
+
+def update_order_memos_by_memo_no(client: "Cafe24Client", order_id: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders memos 수정
+
+    특정 주문의 메모를 수정합니다.
+
+    PUT /api/v2/admin/orders/{order_id}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['update_order_memos_by_memo_no'], (order_id, memo_no, ), params=params, data=data)
+
+
+def delete_order_memos_by_memo_no(client: "Cafe24Client", order_id: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders memos 삭제
+
+    특정 주문의 메모를 삭제합니다.
+
+    DELETE /api/v2/admin/orders/{order_id}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['delete_order_memos_by_memo_no'], (order_id, memo_no, ), params=params, data=data)
+
+
+def update_order_payments(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders payments 수정
+
+    특정 주문의 결제상태에 대한 기능입니다.
+
+    PUT /api/v2/admin/orders/{order_id}/payments
+    """
+    return client.call(_ROUTES['update_order_payments'], (order_id, ), params=params, data=data)
+
+
+def get_order_paymenttimeline(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders paymenttimeline
+
+    주문의 결제타임라인(Orders paymenttimeline)은 특정 주문의 결제에 대한 시간적인 연대기에 대한 기능입니다
+
+    GET /api/v2/admin/orders/{order_id}/paymenttimeline
+    """
+    return client.call(_ROUTES['get_order_paymenttimeline'], (order_id, ), params=params)
+
+
+def get_order_paymenttimeline_by_payment_no(client: "Cafe24Client", order_id: Union[int, str], payment_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders paymenttimeline with payment number
+
+    GET /api/v2/admin/orders/{order_id}/paymenttimeline/{payment_no}
+    """
+    return client.call(_ROUTES['get_order_paymenttimeline_by_payment_no'], (order_id, payment_no, ), params=params)
+
+
+def get_order_receivers(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders receivers
+
+    주문수령자 정보(Orders receivers)는 주문한 상품을 배송 받을 수령자의 이름, 연락처, 주소 등의 정보에 대한 기능 입니다.
+
+    GET /api/v2/admin/orders/{order_id}/receivers
+    """
+    return client.call(_ROUTES['get_order_receivers'], (order_id, ), params=params)
+
+
+def update_order_receivers(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update orders receivers
+
+    PUT /api/v2/admin/orders/{order_id}/receivers
+    """
+    return client.call(_ROUTES['update_order_receivers'], (order_id, ), params=params, data=data)
+
+
+def update_order_receivers_by_shipping_code(client: "Cafe24Client", order_id: Union[int, str], shipping_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update orders receivers with shipping code
+
+    PUT /api/v2/admin/orders/{order_id}/receivers/{shipping_code}
+    """
+    return client.call(_ROUTES['update_order_receivers_by_shipping_code'], (order_id, shipping_code, ), params=params, data=data)
+
+
+def get_order_receivers_history(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders receivers history
+
+    주문-수령자 이력(Orders receivers history)은 특정 주문의 수령자 정보 변경이력에 대한 기능입니다. 수정일(updated_date) 파라미터를 통해 언제 정보가 변경되었는지 확인할 수 있습니다.
+
+    GET /api/v2/admin/orders/{order_id}/receivers/history
+    """
+    return client.call(_ROUTES['get_order_receivers_history'], (order_id, ), params=params)
+
+
+def update_order_refunds_by_refund_code(client: "Cafe24Client", order_id: Union[int, str], refund_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders refunds
+
+    주문 환불(Orders refunds)은 특정 주문의 환불상태와 관련된 기능입니다. 특정 주문의 환불상태를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/refunds/{refund_code}
+    """
+    return client.call(_ROUTES['update_order_refunds_by_refund_code'], (order_id, refund_code, ), params=params, data=data)
+
+
+def create_order_return_(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create an order return
+
+    특정 주문을 반품처리 하거나, 반품처리중인 주문의 상태를 수정할 수 있습니다.
+
+    POST /api/v2/admin/orders/{order_id}/return
+    """
+    return client.call(_ROUTES['create_order_return_'], (order_id, ), params=params, data=data)
+
+
+def update_order_return__by_claim_code(client: "Cafe24Client", order_id: Union[int, str], claim_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update an order return
+
+    특정 주문을 반품처리 하거나, 반품처리중인 주문의 상태를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/orders/{order_id}/return/{claim_code}
+    """
+    return client.call(_ROUTES['update_order_return__by_claim_code'], (order_id, claim_code, ), params=params, data=data)
+
+
+def get_order_shipments(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Get order shipments
+
+    주문을 배송처리하기 위해 필요한 배송 정보를 조회합니다.
+
+    GET /api/v2/admin/orders/{order_id}/shipments
+    """
+    return client.call(_ROUTES['get_order_shipments'], (order_id, ), params=params)
+
+
+def create_order_shipments(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create order shipments
+
+    주문을 배송처리하기 위해 필요한 배송 정보를 생성합니다.
+
+    POST /api/v2/admin/orders/{order_id}/shipments
+    """
+    return client.call(_ROUTES['create_order_shipments'], (order_id, ), params=params, data=data)
+
+
+def update_order_shipments_by_shipping_code(client: "Cafe24Client", order_id: Union[int, str], shipping_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update order shipments
+
+    주문을 배송처리하기 위해 필요한 배송 정보를 수정합니다.
+
+    PUT /api/v2/admin/orders/{order_id}/shipments/{shipping_code}
+    """
+    return client.call(_ROUTES['update_order_shipments_by_shipping_code'], (order_id, shipping_code, ), params=params, data=data)
+
+
+def delete_order_shipments_by_shipping_code(client: "Cafe24Client", order_id: Union[int, str], shipping_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete order shipments
+
+    주문을 배송처리하기 위해 필요한 배송 정보를 삭제합니다.
+
+    DELETE /api/v2/admin/orders/{order_id}/shipments/{shipping_code}
+    """
+    return client.call(_ROUTES['delete_order_shipments_by_shipping_code'], (order_id, shipping_code, ), params=params, data=data)
+
+
+def get_order_shippingfeecancellation(client: "Cafe24Client", order_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Orders shippingfeecancellation
+
+    주문의 배송비취소(Orders shippingfeecancellation)를 통해 주문의 취소현황을 조회하거나 취소처리를 요청할 수 있습니다
+
+    GET /api/v2/admin/orders/{order_id}/shippingfeecancellation
+    """
+    return client.call(_ROUTES['get_order_shippingfeecancellation'], (order_id, ), params=params)
+
+
+def create_order_shippingfeecancellation(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders shippingfeecancellation
+
+    주문의 배송비취소(Orders shippingfeecancellation)를 통해 주문의 취소현황을 조회하거나 취소처리를 요청할 수 있습니다
+
+    POST /api/v2/admin/orders/{order_id}/shippingfeecancellation
+    """
+    return client.call(_ROUTES['create_order_shippingfeecancellation'], (order_id, ), params=params, data=data)
+
+
+def create_order_shortagecancellation(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders shortagecancellation
+
+    주문의 재고부족취소(Orders shortagecancellation)는 이벤트 혹은 재고설정의 착오 등으로 인해 보유한 재고보다 많은 수량이 판매되었을 때
+
+    POST /api/v2/admin/orders/{order_id}/shortagecancellation
+    """
+    return client.call(_ROUTES['create_order_shortagecancellation'], (order_id, ), params=params, data=data)
+
+
+def get_benefits(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders benefits
+
+    주문혜택(Orders benefits)은 특정 주문에 적용된 혜택에 관한 기능입니다.
+
+    GET /api/v2/admin/orders/benefits
+    """
+    return client.call(_ROUTES['get_benefits'], (), params=params)
+
+
+def create_calculation(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders calculation
+
+    주문의 결제예정금액 계산(Orders calculation)은 주문의 배송추가 등을 체크하여 결제예정금액을 계산하는 기능입니다.
+
+    POST /api/v2/admin/orders/calculation
+    """
+    return client.call(_ROUTES['create_calculation'], (), params=params, data=data)
+
+
+def get_coupons(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders coupons
+
+    주문 쿠폰(Orders coupons)은 주문에 적용된 쿠폰에 관한 기능입니다. 특정 주문에 대해 적용된 쿠폰의 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/orders/coupons
+    """
+    return client.call(_ROUTES['get_coupons'], (), params=params)
+
+
+def get_dashboard(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders dashboard
+
+    주문관련 요약 정보를 확인할 수 있습니다. 이 정보는 최근 한달동안 누적된 데이터를 기반으로 합니다.
+
+    GET /api/v2/admin/orders/dashboard
+    """
+    return client.call(_ROUTES['get_dashboard'], (), params=params)
+
+
+def get_inflowgroups(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve inflow groups
+
+    유입경로 그룹을 조회합니다.
+
+    GET /api/v2/admin/orders/inflowgroups
+    """
+    return client.call(_ROUTES['get_inflowgroups'], (), params=params)
+
+
+def create_inflowgroups(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create an inflow group
+
+    유입경로 그룹을 생성합니다.
+
+    POST /api/v2/admin/orders/inflowgroups
+    """
+    return client.call(_ROUTES['create_inflowgroups'], (), params=params, data=data)
+
+
+def update_inflowgroups_by_inflow_group_id(client: "Cafe24Client", inflow_group_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update an inflow group
+
+    유입경로 그룹을 수정합니다.
+
+    PUT /api/v2/admin/orders/inflowgroups/{inflow_group_id}
+    """
+    return client.call(_ROUTES['update_inflowgroups_by_inflow_group_id'], (inflow_group_id, ), params=params, data=data)
+
+
+def delete_inflowgroups_by_inflow_group_id(client: "Cafe24Client", inflow_group_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete an inflow group
+
+    유입경로 그룹을 삭제합니다.
+
+    DELETE /api/v2/admin/orders/inflowgroups/{inflow_group_id}
+    """
+    return client.call(_ROUTES['delete_inflowgroups_by_inflow_group_id'], (inflow_group_id, ), params=params, data=data)
+
+
+def get_inflowgroups_group_inflows(client: "Cafe24Client", group_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve inflows of a group
+
+    유입경로 그룹의 inflows를 조회합니다.
+
+    GET /api/v2/admin/orders/inflowgroups/{group_id}/inflows
+    """
+    return client.call(_ROUTES['get_inflowgroups_group_inflows'], (group_id, ), params=params)
+
+
+def create_inflowgroups_group_inflows(client: "Cafe24Client", group_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create an inflow in a group
+
+    유입경로 그룹에 inflow를 생성합니다.
+
+    POST /api/v2/admin/orders/inflowgroups/{group_id}/inflows
+    """
+    return client.call(_ROUTES['create_inflowgroups_group_inflows'], (group_id, ), params=params, data=data)
+
+
+def update_inflowgroups_group_inflows_by_inflow_id(client: "Cafe24Client", group_id: Union[int, str], inflow_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update an inflow in a group
+
+    유입경로 그룹의 inflow를 수정합니다.
+
+    PUT /api/v2/admin/orders/inflowgroups/{group_id}/inflows/{inflow_id}
+    """
+    return client.call(_ROUTES['update_inflowgroups_group_inflows_by_inflow_id'], (group_id, inflow_id, ), params=params, data=data)
+
+
+def delete_inflowgroups_group_inflows_by_inflow_id(client: "Cafe24Client", group_id: Union[int, str], inflow_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete an inflow in a group
+
+    유입경로 그룹의 inflow를 삭제합니다.
+
+    DELETE /api/v2/admin/orders/inflowgroups/{group_id}/inflows/{inflow_id}
+    """
+    return client.call(_ROUTES['delete_inflowgroups_group_inflows_by_inflow_id'], (group_id, inflow_id, ), params=params, data=data)
+
+
+def get_memos(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders memos
+
+    주문 메모에 대한 조회, 등록, 수정, 삭제를 할 수 있습니다.
+
+    GET /api/v2/admin/orders/memos
+    """
+    return client.call(_ROUTES['get_memos'], (), params=params)
+
+
+def get_migrations(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Orders migrations
+
+    이전된 몰의 주문에 대한 주문정보를 등록, 조회, 수정, 삭제할 수 있습니다.
+
+    GET /api/v2/admin/orders/migrations
+    """
+    return client.call(_ROUTES['get_migrations'], (), params=params)
+
+
+def create_migrations(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders migrations
+
+    이전된 몰의 주문에 대한 주문정보를 등록, 조회, 수정, 삭제할 수 있습니다.
+
+    POST /api/v2/admin/orders/migrations
+    """
+    return client.call(_ROUTES['create_migrations'], (), params=params, data=data)
+
+
+def update_migrations(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders migrations
+
+    이전된 몰의 주문에 대한 주문정보를 등록, 조회, 수정, 삭제할 수 있습니다.
+
+    PUT /api/v2/admin/orders/migrations
+    """
+    return client.call(_ROUTES['update_migrations'], (), params=params, data=data)
+
+
+def delete_migrations_by_order_id(client: "Cafe24Client", order_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Orders migrations
+
+    이전된 몰의 주문에 대한 주문정보를 등록, 조회, 수정, 삭제할 수 있습니다.
+
+    DELETE /api/v2/admin/orders/migrations/{order_id}
+    """
+    return client.call(_ROUTES['delete_migrations_by_order_id'], (order_id, ), params=params, data=data)
+
+
+def get_paymentamount(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a payment amount
+
+    주문의 실결제금액(Orders paymentamount)은 특정 주문의 실제 결제금액에 대한 기능입니다. 1개 혹은 여러 개의 주문에 대한 실제 결제금액 관련된 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/orders/paymentamount
+    """
+    return client.call(_ROUTES['get_paymentamount'], (), params=params)
+
+
+def get_saleschannels(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve sales channels
+
+    주문 판매채널(Orders saleschannels)은 통합 주문의 판매채널 조회, 등록, 수정, 삭제를 할 수 있습니다. 주문 판매채널은 하위 리소스로 주문(Orders) 하위에서만 사용할 수 있습니다.
+
+    GET /api/v2/admin/orders/saleschannels
+    """
+    return client.call(_ROUTES['get_saleschannels'], (), params=params)
+
+
+def create_saleschannels(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a sales channel
+
+    POST /api/v2/admin/orders/saleschannels
+    """
+    return client.call(_ROUTES['create_saleschannels'], (), params=params, data=data)
+
+
+def update_saleschannels_by_sales_channel_id(client: "Cafe24Client", sales_channel_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a sales channel
+
+    PUT /api/v2/admin/orders/saleschannels/{sales_channel_id}
+    """
+    return client.call(_ROUTES['update_saleschannels_by_sales_channel_id'], (sales_channel_id, ), params=params, data=data)
+
+
+def delete_saleschannels_by_sales_channel_id(client: "Cafe24Client", sales_channel_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a sales channel
+
+    DELETE /api/v2/admin/orders/saleschannels/{sales_channel_id}
+    """
+    return client.call(_ROUTES['delete_saleschannels_by_sales_channel_id'], (sales_channel_id, ), params=params, data=data)
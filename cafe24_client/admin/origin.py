@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - origin
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/origin',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve origin information
+
+    원산지 정보를 조회합니다.
+
+    GET /api/v2/admin/origin
+    """
+    return client.call(_ROUTES['get'], (), params=params)
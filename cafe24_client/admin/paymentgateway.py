@@ -0,0 +1,77 @@
+"""
+Cafe24 Admin API - paymentgateway
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/admin/paymentgateway',)),
+    'update_by_client_id': ('PUT', ('/api/v2/admin/paymentgateway/', 0)),
+    'delete_by_client_id': ('DELETE', ('/api/v2/admin/paymentgateway/', 0)),
+    'get_client_paymentmethods': ('GET', ('/api/v2/admin/paymentgateway/', 0, '/paymentmethods')),
+    'create_client_paymentmethods': ('POST', ('/api/v2/admin/paymentgateway/', 0, '/paymentmethods')),
+    'update_client_paymentmethods_by_payment_method_id': ('PUT', ('/api/v2/admin/paymentgateway/', 0, '/paymentmethods/', 1)),
+    'delete_client_paymentmethods_by_payment_method_id': ('DELETE', ('/api/v2/admin/paymentgateway/', 0, '/paymentmethods/', 1)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway
+
+    POST /api/v2/admin/paymentgateway
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_client_id(client: "Cafe24Client", client_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway
+
+    PUT /api/v2/admin/paymentgateway/{client_id}
+    """
+    return client.call(_ROUTES['update_by_client_id'], (client_id, ), params=params, data=data)
+
+
+def delete_by_client_id(client: "Cafe24Client", client_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway
+
+    DELETE /api/v2/admin/paymentgateway/{client_id}
+    """
+    return client.call(_ROUTES['delete_by_client_id'], (client_id, ), params=params, data=data)
+
+
+def get_client_paymentmethods(client: "Cafe24Client", client_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Paymentgateway paymentmethods 조회
+
+    PG의 결제수단(Paymentgateway paymentmethods)은 쇼핑몰에 등록된 PG의 결제수단에 대한 기능입니다. 특정 PG에서 제공하고 있는 결제수단의 등록, 조회, 수정, 삭제가 가능합니다.
+
+    GET /api/v2/admin/paymentgateway/{client_id}/paymentmethods
+    """
+    return client.call(_ROUTES['get_client_paymentmethods'], (client_id, ), params=params)
+
+
+def create_client_paymentmethods(client: "Cafe24Client", client_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway paymentmethods 등록
+
+    POST /api/v2/admin/paymentgateway/{client_id}/paymentmethods
+    """
+    return client.call(_ROUTES['create_client_paymentmethods'], (client_id, ), params=params, data=data)
+
+
+def update_client_paymentmethods_by_payment_method_id(client: "Cafe24Client", client_id: Union[int, str], payment_method_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway paymentmethods 수정
+
+    PUT /api/v2/admin/paymentgateway/{client_id}/paymentmethods/{payment_method_id}
+    """
+    return client.call(_ROUTES['update_client_paymentmethods_by_payment_method_id'], (client_id, payment_method_id, ), params=params, data=data)
+
+
+def delete_client_paymentmethods_by_payment_method_id(client: "Cafe24Client", client_id: Union[int, str], payment_method_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Paymentgateway paymentmethods 삭제
+
+    DELETE /api/v2/admin/paymentgateway/{client_id}/paymentmethods/{payment_method_id}
+    """
+    return client.call(_ROUTES['delete_client_paymentmethods_by_payment_method_id'], (client_id, payment_method_id, ), params=params, data=data)
@@ -0,0 +1,43 @@
+"""
+Cafe24 Admin API - paymentmethods
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/paymentmethods',)),
+    'get_code_paymentproviders': ('GET', ('/api/v2/admin/paymentmethods/', 0, '/paymentproviders')),
+    'update_code_paymentproviders_by_name': ('PUT', ('/api/v2/admin/paymentmethods/', 0, '/paymentproviders/', 1)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Paymentmethods 조회
+
+    GET /api/v2/admin/paymentmethods
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_code_paymentproviders(client: "Cafe24Client", code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve payment providers
+
+    쇼핑몰에 설정된 결제수단의 정보를 조회하거나 결제수단의 노출여부를 수정할 수 있습니다.
+
+    GET /api/v2/admin/paymentmethods/{code}/paymentproviders
+    """
+    return client.call(_ROUTES['get_code_paymentproviders'], (code, ), params=params)
+
+
+def update_code_paymentproviders_by_name(client: "Cafe24Client", code: Union[int, str], name: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update payment provider visibility
+
+    쇼핑몰에 설정된 결제수단의 정보를 조회하거나 결제수단의 노출여부를 수정할 수 있습니다.
+
+    PUT /api/v2/admin/paymentmethods/{code}/paymentproviders/{name}
+    """
+    return client.call(_ROUTES['update_code_paymentproviders_by_name'], (code, name, ), params=params, data=data)
@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - payments
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'update': ('PUT', ('/api/v2/admin/payments',)),
+}
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Payments
+
+    결제상태(Payments)는 특정 주문의 결제상태에 대해 기능입니다.
+
+    PUT /api/v2/admin/payments
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
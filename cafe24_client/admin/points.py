@@ -0,0 +1,100 @@
+"""
+Cafe24 Admin API - points
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/points/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/points/setting',)),
+    'get': ('GET', ('/api/v2/admin/points',)),
+    'create': ('POST', ('/api/v2/admin/points',)),
+    'get_autoexpiration': ('GET', ('/api/v2/admin/points/autoexpiration',)),
+    'create_autoexpiration': ('POST', ('/api/v2/admin/points/autoexpiration',)),
+    'delete_autoexpiration': ('DELETE', ('/api/v2/admin/points/autoexpiration',)),
+    'get_report': ('GET', ('/api/v2/admin/points/report',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve points settings
+
+    적립금 설정(Points setting)은 적립금 사용에 필요한 설정값을 관리하기 위한 기능입니다.
+
+    GET /api/v2/admin/points/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update points settings
+
+    적립금 설정(Points setting)은 적립금 사용에 필요한 설정값을 관리하기 위한 기능입니다.
+
+    PUT /api/v2/admin/points/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Points
+
+    적립금(Points)은 쇼핑몰 회원의 적립금의 조회, 통계, 차감을 할 수 있는 기능입니다.
+
+    GET /api/v2/admin/points
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Points
+
+    적립금(Points)은 쇼핑몰 회원의 적립금의 조회, 통계, 차감을 할 수 있는 기능입니다.
+
+    POST /api/v2/admin/points
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_autoexpiration(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve an automatic points expiration
+
+    포인트 자동만료(Points autoexpiration)는 포인트를 자동으로 만료시키는 것과 관련된 기능입니다. 자동만료 설정을 조회하거나 등록 및 삭제가 가능합니다.
+
+    GET /api/v2/admin/points/autoexpiration
+    """
+    return client.call(_ROUTES['get_autoexpiration'], (), params=params)
+
+
+def create_autoexpiration(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create an automatic points expiration
+
+    포인트 자동만료(Points autoexpiration)는 포인트를 자동으로 만료시키는 것과 관련된 기능입니다. 자동만료 설정을 조회하거나 등록 및 삭제가 가능합니다.
+
+    POST /api/v2/admin/points/autoexpiration
+    """
+    return client.call(_ROUTES['create_autoexpiration'], (), params=params, data=data)
+
+
+def delete_autoexpiration(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete an automatic points expiration
+
+    포인트 자동만료(Points autoexpiration)는 포인트를 자동으로 만료시키는 것과 관련된 기능입니다. 자동만료 설정을 조회하거나 등록 및 삭제가 가능합니다.
+
+    DELETE /api/v2/admin/points/autoexpiration
+    """
+    return client.call(_ROUTES['delete_autoexpiration'], (), params=params, data=data)
+
+
+def get_report(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Points report
+
+    적립금 통계(Points report)는 지정한 기간동안의 가용적립금의 증감 내역, 미가용 적립금의 총액 등 적립금과 관련된 통계를 조회할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/points/report
+    """
+    return client.call(_ROUTES['get_report'], (), params=params)
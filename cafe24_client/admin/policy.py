@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - policy
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/policy',)),
+    'update': ('PUT', ('/api/v2/admin/policy',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Policy 조회
+
+    쇼핑몰 이용약관 및 개인정보처리방침 약관의 정보를 관리합니다
+
+    GET /api/v2/admin/policy
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Policy 수정
+
+    쇼핑몰 이용약관 및 개인정보처리방침 약관의 정보를 관리합니다
+
+    PUT /api/v2/admin/policy
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
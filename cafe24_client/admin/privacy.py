@@ -0,0 +1,78 @@
+"""
+Cafe24 Admin API - privacy
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_boards': ('GET', ('/api/v2/admin/privacy/boards',)),
+    'update_boards': ('PUT', ('/api/v2/admin/privacy/boards',)),
+    'get_join': ('GET', ('/api/v2/admin/privacy/join',)),
+    'update_join': ('PUT', ('/api/v2/admin/privacy/join',)),
+    'get_orders': ('GET', ('/api/v2/admin/privacy/orders',)),
+    'update_orders': ('PUT', ('/api/v2/admin/privacy/orders',)),
+}
+
+
+def get_boards(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Privacy boards 조회
+
+    이용약관 중 게시판 글 작성시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    GET /api/v2/admin/privacy/boards
+    """
+    return client.call(_ROUTES['get_boards'], (), params=params)
+
+
+def update_boards(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Privacy boards 수정
+
+    이용약관 중 게시판 글 작성시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    PUT /api/v2/admin/privacy/boards
+    """
+    return client.call(_ROUTES['update_boards'], (), params=params, data=data)
+
+
+def get_join(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Privacy join 조회
+
+    이용약관 중 회원가입시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    GET /api/v2/admin/privacy/join
+    """
+    return client.call(_ROUTES['get_join'], (), params=params)
+
+
+def update_join(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Privacy join 수정
+
+    이용약관 중 회원가입시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    PUT /api/v2/admin/privacy/join
+    """
+    return client.call(_ROUTES['update_join'], (), params=params, data=data)
+
+
+def get_orders(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Privacy orders
+
+    이용약관 중 주문시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    GET /api/v2/admin/privacy/orders
+    """
+    return client.call(_ROUTES['get_orders'], (), params=params)
+
+
+def update_orders(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Privacy orders
+
+    이용약관 중 주문시점에 대한 개인정보처리방침을 조회할 수 있습니다
+
+    PUT /api/v2/admin/privacy/orders
+    """
+    return client.call(_ROUTES['update_orders'], (), params=params, data=data)
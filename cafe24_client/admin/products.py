@@ -0,0 +1,726 @@
+"""
+Cafe24 Admin API - products
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/products',)),
+    'create': ('POST', ('/api/v2/admin/products',)),
+    'get_properties_setting': ('GET', ('/api/v2/admin/products/properties/setting',)),
+    'update_properties_setting': ('PUT', ('/api/v2/admin/products/properties/setting',)),
+    'get_setting': ('GET', ('/api/v2/admin/products/setting',)),
+    'get_count': ('GET', ('/api/v2/admin/products/count',)),
+    'get_by_product_no': ('GET', ('/api/v2/admin/products/', 0)),
+    'update_by_product_no': ('PUT', ('/api/v2/admin/products/', 0)),
+    'delete_by_product_no': ('DELETE', ('/api/v2/admin/products/', 0)),
+    'create_product_additionalimages': ('POST', ('/api/v2/admin/products/', 0, '/additionalimages')),
+    'update_product_additionalimages': ('PUT', ('/api/v2/admin/products/', 0, '/additionalimages')),
+    'delete_product_additionalimages': ('DELETE', ('/api/v2/admin/products/', 0, '/additionalimages')),
+    'get_product_approve': ('GET', ('/api/v2/admin/products/', 0, '/approve')),
+    'create_product_approve': ('POST', ('/api/v2/admin/products/', 0, '/approve')),
+    'update_product_approve': ('PUT', ('/api/v2/admin/products/', 0, '/approve')),
+    'get_product_customproperties': ('GET', ('/api/v2/admin/products/', 0, '/customproperties')),
+    'update_product_customproperties_by_property_no': ('PUT', ('/api/v2/admin/products/', 0, '/customproperties/', 1)),
+    'delete_product_customproperties_by_property_no': ('DELETE', ('/api/v2/admin/products/', 0, '/customproperties/', 1)),
+    'get_product_decorationimages': ('GET', ('/api/v2/admin/products/', 0, '/decorationimages')),
+    'create_product_decorationimages': ('POST', ('/api/v2/admin/products/', 0, '/decorationimages')),
+    'update_product_decorationimages': ('PUT', ('/api/v2/admin/products/', 0, '/decorationimages')),
+    'delete_product_decorationimages_by_code': ('DELETE', ('/api/v2/admin/products/', 0, '/decorationimages/', 1)),
+    'get_product_discountprice': ('GET', ('/api/v2/admin/products/', 0, '/discountprice')),
+    'get_product_hits_count': ('GET', ('/api/v2/admin/products/', 0, '/hits/count')),
+    'get_product_icons': ('GET', ('/api/v2/admin/products/', 0, '/icons')),
+    'create_product_icons': ('POST', ('/api/v2/admin/products/', 0, '/icons')),
+    'update_product_icons': ('PUT', ('/api/v2/admin/products/', 0, '/icons')),
+    'delete_product_icons_by_code': ('DELETE', ('/api/v2/admin/products/', 0, '/icons/', 1)),
+    'create_product_images': ('POST', ('/api/v2/admin/products/', 0, '/images')),
+    'delete_product_images': ('DELETE', ('/api/v2/admin/products/', 0, '/images')),
+    'get_product_memos': ('GET', ('/api/v2/admin/products/', 0, '/memos')),
+    'create_product_memos': ('POST', ('/api/v2/admin/products/', 0, '/memos')),
+    'get_product_memos_by_memo_no': ('GET', ('/api/v2/admin/products/', 0, '/memos/', 1)),
+    'update_product_memos_by_memo_no': ('PUT', ('/api/v2/admin/products/', 0, '/memos/', 1)),
+    'delete_product_memos_by_memo_no': ('DELETE', ('/api/v2/admin/products/', 0, '/memos/', 1)),
+    'get_product_options': ('GET', ('/api/v2/admin/products/', 0, '/options')),
+    'create_product_options': ('POST', ('/api/v2/admin/products/', 0, '/options')),
+    'update_product_options': ('PUT', ('/api/v2/admin/products/', 0, '/options')),
+    'delete_product_options': ('DELETE', ('/api/v2/admin/products/', 0, '/options')),
+    'get_product_seo': ('GET', ('/api/v2/admin/products/', 0, '/seo')),
+    'update_product_seo': ('PUT', ('/api/v2/admin/products/', 0, '/seo')),
+    'get_product_tags_count': ('GET', ('/api/v2/admin/products/', 0, '/tags/count')),
+    'get_product_tags': ('GET', ('/api/v2/admin/products/', 0, '/tags')),
+    'create_product_tags': ('POST', ('/api/v2/admin/products/', 0, '/tags')),
+    'delete_product_tags_by_tag': ('DELETE', ('/api/v2/admin/products/', 0, '/tags/', 1)),
+    'get_product_variants': ('GET', ('/api/v2/admin/products/', 0, '/variants')),
+    'update_product_variants': ('PUT', ('/api/v2/admin/products/', 0, '/variants')),
+    'get_product_variants_by_variant_code': ('GET', ('/api/v2/admin/products/', 0, '/variants/', 1)),
+    'update_product_variants_by_variant_code': ('PUT', ('/api/v2/admin/products/', 0, '/variants/', 1)),
+    'delete_product_variants_by_variant_code': ('DELETE', ('/api/v2/admin/products/', 0, '/variants/', 1)),
+    'get_product_variants_variant_inventories': ('GET', ('/api/v2/admin/products/', 0, '/variants/', 1, '/inventories')),
+    'update_product_variants_variant_inventories': ('PUT', ('/api/v2/admin/products/', 0, '/variants/', 1, '/inventories')),
+    'get_customproperties': ('GET', ('/api/v2/admin/products/customproperties',)),
+    'create_customproperties': ('POST', ('/api/v2/admin/products/customproperties',)),
+    'update_customproperties_by_property_no': ('PUT', ('/api/v2/admin/products/customproperties/', 0)),
+    'delete_customproperties_by_property_no': ('DELETE', ('/api/v2/admin/products/customproperties/', 0)),
+    'get_decorationimages': ('GET', ('/api/v2/admin/products/decorationimages',)),
+    'get_icons': ('GET', ('/api/v2/admin/products/icons',)),
+    'create_images': ('POST', ('/api/v2/admin/products/images',)),
+    'get_properties': ('GET', ('/api/v2/admin/products/properties',)),
+    'create_properties': ('POST', ('/api/v2/admin/products/properties',)),
+    'update_properties': ('PUT', ('/api/v2/admin/products/properties',)),
+    'get_product_carts_count': ('GET', ('/api/v2/admin/products/', 0, '/carts/count')),
+    'get_product_carts': ('GET', ('/api/v2/admin/products/', 0, '/carts')),
+    'get_product_wishlist_customers': ('GET', ('/api/v2/admin/products/', 0, '/wishlist/customers')),
+    'get_product_wishlist_customers_count': ('GET', ('/api/v2/admin/products/', 0, '/wishlist/customers/count')),
+}
+
+
+def get(client: "Cafe24Client", *, brand_code: Optional[str] = None, **params: Any) -> Dict[str, Any]:
+    """상품 목록 조회
+
+    특정 브랜드 내에서 상품 판매가가 1000원 이상인 상품 조회
+
+    GET /api/v2/admin/products
+    """
+    if brand_code is not None:
+        params['brand_code'] = brand_code
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a new product
+
+    Adds a new product to the store.
+
+    POST /api/v2/admin/products
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_properties_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Products properties setting
+
+    상품 상세 화면에 표시되는 항목의 추가 설정을 조회하고 수정할 수 있습니다
+
+    GET /api/v2/admin/products/properties/setting
+    """
+    return client.call(_ROUTES['get_properties_setting'], (), params=params)
+
+
+def update_properties_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Products properties setting
+
+    상품 상세 화면에 표시되는 항목의 추가 설정을 조회하고 수정할 수 있습니다
+
+    PUT /api/v2/admin/products/properties/setting
+    """
+    return client.call(_ROUTES['update_properties_setting'], (), params=params, data=data)
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Products setting
+
+    GET /api/v2/admin/products/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Get product count
+
+    Returns the total number of products.
+
+    GET /api/v2/admin/products/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_product_no(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Get product details
+
+    Fetches details of a specific product.
+
+    GET /api/v2/admin/products/{product_no}
+    """
+    return client.call(_ROUTES['get_by_product_no'], (product_no, ), params=params)
+
+
+def update_by_product_no(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product
+
+    Updates the details of an existing product.
+
+    PUT /api/v2/admin/products/{product_no}
+    """
+    return client.call(_ROUTES['update_by_product_no'], (product_no, ), params=params, data=data)
+
+
+def delete_by_product_no(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete product
+
+    Removes a product from the store.
+
+    DELETE /api/v2/admin/products/{product_no}
+    """
+    return client.call(_ROUTES['delete_by_product_no'], (product_no, ), params=params, data=data)
+
+
+def create_product_additionalimages(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Add Additional Images
+
+    상품의 추가이미지를 나타내는 하위 리소스로, 상품(Products)리소스의 하위에세만 사용할 수 있습니다.
+
+    POST /api/v2/admin/products/{product_no}/additionalimages
+    """
+    return client.call(_ROUTES['create_product_additionalimages'], (product_no, ), params=params, data=data)
+
+
+def update_product_additionalimages(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update Additional Images
+
+    상품의 추가이미지를 수정합니다.
+
+    PUT /api/v2/admin/products/{product_no}/additionalimages
+    """
+    return client.call(_ROUTES['update_product_additionalimages'], (product_no, ), params=params, data=data)
+
+
+def delete_product_additionalimages(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete Additional Images
+
+    상품의 추가이미지를 삭제합니다.
+
+    DELETE /api/v2/admin/products/{product_no}/additionalimages
+    """
+    return client.call(_ROUTES['delete_product_additionalimages'], (product_no, ), params=params, data=data)
+
+
+def get_product_approve(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a product approval status
+
+    상품 승인(Products approve)은 공급사가 업로드한 상품을 검토 후 승인하는 기능입니다.
+
+    GET /api/v2/admin/products/{product_no}/approve
+    """
+    return client.call(_ROUTES['get_product_approve'], (product_no, ), params=params)
+
+
+def create_product_approve(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a product approval request
+
+    해당 기능은 일부 쇼핑몰에만 적용된 상태로, 공급사 상품 승인 기능을 사용중인 몰에서만 사용할 수 있습니다.
+
+    POST /api/v2/admin/products/{product_no}/approve
+    """
+    return client.call(_ROUTES['create_product_approve'], (product_no, ), params=params, data=data)
+
+
+def update_product_approve(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a product approval status
+
+    PUT /api/v2/admin/products/{product_no}/approve
+    """
+    return client.call(_ROUTES['update_product_approve'], (product_no, ), params=params, data=data)
+
+
+def get_product_customproperties(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve custom properties of a product
+
+    상품이 등록된 사용자정의 속성을 관리 기능을 제공합니다.
+
+    GET /api/v2/admin/products/{product_no}/customproperties
+    """
+    return client.call(_ROUTES['get_product_customproperties'], (product_no, ), params=params)
+
+
+def update_product_customproperties_by_property_no(client: "Cafe24Client", product_no: Union[int, str], property_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a custom property of a product
+
+    PUT /api/v2/admin/products/{product_no}/customproperties/{property_no}
+    """
+    return client.call(_ROUTES['update_product_customproperties_by_property_no'], (product_no, property_no, ), params=params, data=data)
+
+
+def delete_product_customproperties_by_property_no(client: "Cafe24Client", product_no: Union[int, str], property_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a custom property of a product
+
+    DELETE /api/v2/admin/products/{product_no}/customproperties/{property_no}
+    """
+    return client.call(_ROUTES['delete_product_customproperties_by_property_no'], (product_no, property_no, ), params=params, data=data)
+
+
+def get_product_decorationimages(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve decoration images of a product
+
+    GET /api/v2/admin/products/{product_no}/decorationimages
+    """
+    return client.call(_ROUTES['get_product_decorationimages'], (product_no, ), params=params)
+
+
+def create_product_decorationimages(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create decoration images for a product
+
+    POST /api/v2/admin/products/{product_no}/decorationimages
+    """
+    return client.call(_ROUTES['create_product_decorationimages'], (product_no, ), params=params, data=data)
+
+
+def update_product_decorationimages(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product decoration images
+
+    꾸미기 이미지는 하위 리소스로서 상품(Products) 하위에서만 사용할 수 있습니다.
+
+    PUT /api/v2/admin/products/{product_no}/decorationimages
+    """
+    return client.call(_ROUTES['update_product_decorationimages'], (product_no, ), params=params, data=data)
+
+
+def delete_product_decorationimages_by_code(client: "Cafe24Client", product_no: Union[int, str], code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Remove a product decoration image
+
+    DELETE /api/v2/admin/products/{product_no}/decorationimages/{code}
+    """
+    return client.call(_ROUTES['delete_product_decorationimages_by_code'], (product_no, code, ), params=params, data=data)
+
+
+def get_product_discountprice(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products discountprice
+
+    상품 할인가격(Discountprice)는 상품의 할인가격을 표시하는 리소스입니다.
+
+    GET /api/v2/admin/products/{product_no}/discountprice
+    """
+    return client.call(_ROUTES['get_product_discountprice'], (product_no, ), params=params)
+
+
+def get_product_hits_count(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products hits
+
+    상품 조회수(hits)는 상품을 쇼핑몰 고객들이 얼마나 조회했는지를 나타내는 지표입니다.
+
+    GET /api/v2/admin/products/{product_no}/hits/count
+    """
+    return client.call(_ROUTES['get_product_hits_count'], (product_no, ), params=params)
+
+
+def get_product_icons(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products icons
+
+    상품 아이콘은 상품을 강조하기 위해 상품 옆에 추가할 수 있는 작은 이미지들입니다.
+
+    GET /api/v2/admin/products/{product_no}/icons
+    """
+    return client.call(_ROUTES['get_product_icons'], (product_no, ), params=params)
+
+
+def create_product_icons(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Add product icon
+
+    상품에 아이콘을 추가합니다.
+
+    POST /api/v2/admin/products/{product_no}/icons
+    """
+    return client.call(_ROUTES['create_product_icons'], (product_no, ), params=params, data=data)
+
+
+def update_product_icons(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product icon
+
+    상품 아이콘을 업데이트합니다.
+
+    PUT /api/v2/admin/products/{product_no}/icons
+    """
+    return client.call(_ROUTES['update_product_icons'], (product_no, ), params=params, data=data)
+
+
+def delete_product_icons_by_code(client: "Cafe24Client", product_no: Union[int, str], code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete product icon
+
+    상품 아이콘을 삭제합니다.
+
+    DELETE /api/v2/admin/products/{product_no}/icons/{code}
+    """
+    return client.call(_ROUTES['delete_product_icons_by_code'], (product_no, code, ), params=params, data=data)
+
+
+def create_product_images(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 이미지 업로드
+
+    상품 이미지(Products Images)는 상품의 판매를 위해서 업로드한 상품의 사진이나 그림을 의미합니다.
+
+    POST /api/v2/admin/products/{product_no}/images
+    """
+    return client.call(_ROUTES['create_product_images'], (product_no, ), params=params, data=data)
+
+
+def delete_product_images(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 이미지 삭제
+
+    상품 이미지(Products Images)는 상품의 판매를 위해서 업로드한 상품의 사진이나 그림을 의미합니다.
+
+    DELETE /api/v2/admin/products/{product_no}/images
+    """
+    return client.call(_ROUTES['delete_product_images'], (product_no, ), params=params, data=data)
+
+
+def get_product_memos(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품 메모 목록 조회
+
+    상품 메모(Products memos)는 상품에 관한 특이사항을 메모하거나 운영자 간의 의사소통을 위한 도구로 활용할 수 있습니다.
+
+    GET /api/v2/admin/products/{product_no}/memos
+    """
+    return client.call(_ROUTES['get_product_memos'], (product_no, ), params=params)
+
+
+def create_product_memos(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 메모 생성
+
+    상품 메모(Products memos)는 상품에 관한 특이사항을 메모하거나 운영자 간의 의사소통을 위한 도구로 활용할 수 있습니다.
+
+    POST /api/v2/admin/products/{product_no}/memos
+    """
+    return client.call(_ROUTES['create_product_memos'], (product_no, ), params=params, data=data)
+
+
+def get_product_memos_by_memo_no(client: "Cafe24Client", product_no: Union[int, str], memo_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품 메모 조회
+
+    상품 메모(Products memos)는 상품에 관한 특이사항을 메모하거나 운영자 간의 의사소통을 위한 도구로 활용할 수 있습니다.
+
+    GET /api/v2/admin/products/{product_no}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['get_product_memos_by_memo_no'], (product_no, memo_no, ), params=params)
+
+
+def update_product_memos_by_memo_no(client: "Cafe24Client", product_no: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 메모 수정
+
+    상품 메모(Products memos)는 상품에 관한 특이사항을 메모하거나 운영자 간의 의사소통을 위한 도구로 활용할 수 있습니다.
+
+    PUT /api/v2/admin/products/{product_no}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['update_product_memos_by_memo_no'], (product_no, memo_no, ), params=params, data=data)
+
+
+def delete_product_memos_by_memo_no(client: "Cafe24Client", product_no: Union[int, str], memo_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 메모 삭제
+
+    상품 메모(Products memos)는 상품에 관한 특이사항을 메모하거나 운영자 간의 의사소통을 위한 도구로 활용할 수 있습니다.
+
+    DELETE /api/v2/admin/products/{product_no}/memos/{memo_no}
+    """
+    return client.call(_ROUTES['delete_product_memos_by_memo_no'], (product_no, memo_no, ), params=params, data=data)
+
+
+def get_product_options(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve product options
+
+    상품 옵션 목록을 조회합니다
+
+    GET /api/v2/admin/products/{product_no}/options
+    """
+    return client.call(_ROUTES['get_product_options'], (product_no, ), params=params)
+
+
+def create_product_options(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create product options
+
+    상품 옵션을 생성합니다
+
+    POST /api/v2/admin/products/{product_no}/options
+    """
+    return client.call(_ROUTES['create_product_options'], (product_no, ), params=params, data=data)
+
+
+def update_product_options(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product options
+
+    상품 옵션을 수정합니다
+
+    PUT /api/v2/admin/products/{product_no}/options
+    """
+    return client.call(_ROUTES['update_product_options'], (product_no, ), params=params, data=data)
+
+
+def delete_product_options(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete product options
+
+    상품 옵션을 삭제합니다
+
+    DELETE /api/v2/admin/products/{product_no}/options
+    """
+    return client.call(_ROUTES['delete_product_options'], (product_no, ), params=params, data=data)
+
+
+def get_product_seo(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve product SEO
+
+    상품 SEO 정보를 조회합니다
+
+    GET /api/v2/admin/products/{product_no}/seo
+    """
+    return client.call(_ROUTES['get_product_seo'], (product_no, ), params=params)
+
+
+def update_product_seo(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product SEO
+
+    상품 SEO 정보를 수정합니다
+
+    PUT /api/v2/admin/products/{product_no}/seo
+    """
+    return client.call(_ROUTES['update_product_seo'], (product_no, ), params=params, data=data)
+
+
+def get_product_tags_count(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품 태그 수 조회
+
+    특정 상품의 태그 수를 조회합니다.
+
+    GET /api/v2/admin/products/{product_no}/tags/count
+    """
+    return client.call(_ROUTES['get_product_tags_count'], (product_no, ), params=params)
+
+
+def get_product_tags(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품 태그 목록 조회
+
+    특정 상품의 태그 목록을 조회합니다.
+
+    GET /api/v2/admin/products/{product_no}/tags
+    """
+    return client.call(_ROUTES['get_product_tags'], (product_no, ), params=params)
+
+
+def create_product_tags(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 태그 추가
+
+    특정 상품에 태그를 추가합니다.
+
+    POST /api/v2/admin/products/{product_no}/tags
+    """
+    return client.call(_ROUTES['create_product_tags'], (product_no, ), params=params, data=data)
+
+
+def delete_product_tags_by_tag(client: "Cafe24Client", product_no: Union[int, str], tag: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """상품 태그 삭제
+
+    특정 상품의 태그를 삭제합니다.
+
+    DELETE /api/v2/admin/products/{product_no}/tags/{tag}
+    """
+    return client.call(_ROUTES['delete_product_tags_by_tag'], (product_no, tag, ), params=params, data=data)
+
+
+def get_product_variants(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품 변형 목록 조회
+
+    특정 상품의 변형 목록을 조회합니다.
+
+    GET /api/v2/admin/products/{product_no}/variants
+    """
+    return client.call(_ROUTES['get_product_variants'], (product_no, ), params=params)
+
+
+def update_product_variants(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update multiple product variants
+
+    여러 품목을 수정합니다.
+
+    PUT /api/v2/admin/products/{product_no}/variants
+    """
+    return client.call(_ROUTES['update_product_variants'], (product_no, ), params=params, data=data)
+
+
+def get_product_variants_by_variant_code(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a product variant
+
+    특정 품목을 조회합니다.
+
+    GET /api/v2/admin/products/{product_no}/variants/{variant_code}
+    """
+    return client.call(_ROUTES['get_product_variants_by_variant_code'], (product_no, variant_code, ), params=params)
+
+
+def update_product_variants_by_variant_code(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update a product variant
+
+    특정 품목을 수정합니다.
+
+    PUT /api/v2/admin/products/{product_no}/variants/{variant_code}
+    """
+    return client.call(_ROUTES['update_product_variants_by_variant_code'], (product_no, variant_code, ), params=params, data=data)
+
+
+def delete_product_variants_by_variant_code(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a product variant
+
+    특정 품목을 삭제합니다.
+
+    DELETE /api/v2/admin/products/{product_no}/variants/{variant_code}
+    """
+    return client.call(_ROUTES['delete_product_variants_by_variant_code'], (product_no, variant_code, ), params=params, data=data)
+
+
+def get_product_variants_variant_inventories(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve product variant inventories
+
+    품목의 재고를 조회합니다.
+
+    GET /api/v2/admin/products/{product_no}/variants/{variant_code}/inventories
+    """
+    return client.call(_ROUTES['get_product_variants_variant_inventories'], (product_no, variant_code, ), params=params)
+
+
+def update_product_variants_variant_inventories(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update product variant inventories
+
+    품목의 재고를 수정합니다.
+
+    PUT /api/v2/admin/products/{product_no}/variants/{variant_code}/inventories
+    """
+    return client.call(_ROUTES['update_product_variants_variant_inventories'], (product_no, variant_code, ), params=params, data=data)
+
+
+def get_customproperties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve user-defined properties
+
+    상품에 등록된 사용자정의 속성을 조회합니다.
+
+    GET /api/v2/admin/products/customproperties
+    """
+    return client.call(_ROUTES['get_customproperties'], (), params=params)
+
+
+def create_customproperties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create user-defined properties
+
+    상품에 사용자정의 속성을 생성합니다.
+
+    POST /api/v2/admin/products/customproperties
+    """
+    return client.call(_ROUTES['create_customproperties'], (), params=params, data=data)
+
+
+def update_customproperties_by_property_no(client: "Cafe24Client", property_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update user-defined properties
+
+    상품에 등록된 사용자정의 속성을 수정합니다.
+
+    PUT /api/v2/admin/products/customproperties/{property_no}
+    """
+    return client.call(_ROUTES['update_customproperties_by_property_no'], (property_no, ), params=params, data=data)
+
+
+def delete_customproperties_by_property_no(client: "Cafe24Client", property_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete user-defined properties
+
+    상품에 등록된 사용자정의 속성을 삭제합니다.
+
+    DELETE /api/v2/admin/products/customproperties/{property_no}
+    """
+    return client.call(_ROUTES['delete_customproperties_by_property_no'], (property_no, ), params=params, data=data)
+
+
+def get_decorationimages(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve decoration images
+
+    쇼핑몰에 등록된 꾸미기 이미지를 조회합니다.
+
+    GET /api/v2/admin/products/decorationimages
+    """
+    return client.call(_ROUTES['get_decorationimages'], (), params=params)
+
+
+def get_icons(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Products icons
+
+    상품 아이콘은 상품을 강조하기 위해 상품 옆에 추가할 수 있는 작은 이미지들입니다. 진열된 상품에 필요한 정보, '매진 임박' 등의 메시지를 추가하여 상품을 강조할 수 있습니다. 상품 아이콘은 하위 리소스로서 상품(Products) 하위에서만 사용할 수 있습니다.
+
+    GET /api/v2/admin/products/icons
+    """
+    return client.call(_ROUTES['get_icons'], (), params=params)
+
+
+def create_images(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Products images
+
+    상품 이미지(Products Images)는 상품의 판매를 위해서 업로드한 상품의 사진이나 그림을 의미합니다. 상품 이미지 API를 사용해 상품 상세페이지에서 사용할 이미지를 업로드하거나, 상품의 이미지를 업로드할 수 있습니다. 상품의 이미지는 Base64 코드로 인코딩하여 업로드할 수 있습니다.
+
+    POST /api/v2/admin/products/images
+    """
+    return client.call(_ROUTES['create_images'], (), params=params, data=data)
+
+
+def get_properties(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Products properties
+
+    상품 상세 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    GET /api/v2/admin/products/properties
+    """
+    return client.call(_ROUTES['get_properties'], (), params=params)
+
+
+def create_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Products properties
+
+    상품 상세 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    POST /api/v2/admin/products/properties
+    """
+    return client.call(_ROUTES['create_properties'], (), params=params, data=data)
+
+
+def update_properties(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Products properties
+
+    상품 상세 화면에 표시되는 항목을 조회하고 수정할 수 있습니다.
+
+    PUT /api/v2/admin/products/properties
+    """
+    return client.call(_ROUTES['update_properties'], (), params=params, data=data)
+
+
+def get_product_carts_count(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a count of carts containing a product
+
+    특정 상품을 장바구니에 담은 회원과 그 숫자를 조회할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/products/{product_no}/carts/count
+    """
+    return client.call(_ROUTES['get_product_carts_count'], (product_no, ), params=params)
+
+
+def get_product_carts(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of carts containing a product
+
+    특정 상품을 장바구니에 담은 회원의 ID, 담은날짜 회원의 수 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/products/{product_no}/carts
+    """
+    return client.call(_ROUTES['get_product_carts'], (product_no, ), params=params)
+
+
+def get_product_wishlist_customers(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of customers with a product in their wishlist
+
+    상품을 관심상품으로 담은 회원을 조회할 수 있는 리스트입니다.
+
+    GET /api/v2/admin/products/{product_no}/wishlist/customers
+    """
+    return client.call(_ROUTES['get_product_wishlist_customers'], (product_no, ), params=params)
+
+
+def get_product_wishlist_customers_count(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve a count of customers with a product in their wishlist
+
+    상품을 관심상품으로 담은 회원 수를 조회할 수 있는 리스트입니다.
+
+    GET /api/v2/admin/products/{product_no}/wishlist/customers/count
+    """
+    return client.call(_ROUTES['get_product_wishlist_customers_count'], (product_no, ), params=params)
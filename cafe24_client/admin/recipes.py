@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - recipes
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/recipes',)),
+    'create': ('POST', ('/api/v2/admin/recipes',)),
+    'delete_by_recipe_code': ('DELETE', ('/api/v2/admin/recipes/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Recipes
+
+    쇼핑몰에 레시피를 등록하거나, 등록된 레시피를 목록으로 조회하거나, 삭제할 수 있습니다.
+
+    GET /api/v2/admin/recipes
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Recipes
+
+    쇼핑몰에 레시피를 등록하거나, 등록된 레시피를 목록으로 조회하거나, 삭제할 수 있습니다.
+
+    POST /api/v2/admin/recipes
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def delete_by_recipe_code(client: "Cafe24Client", recipe_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Recipes
+
+    쇼핑몰에 레시피를 등록하거나, 등록된 레시피를 목록으로 조회하거나, 삭제할 수 있습니다.
+
+    DELETE /api/v2/admin/recipes/{recipe_code}
+    """
+    return client.call(_ROUTES['delete_by_recipe_code'], (recipe_code, ), params=params, data=data)
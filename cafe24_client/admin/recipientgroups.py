@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - recipientgroups
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/recipientgroups',)),
+    'create': ('POST', ('/api/v2/admin/recipientgroups',)),
+    'get_by_group_no': ('GET', ('/api/v2/admin/recipientgroups/', 0)),
+    'update_by_group_no': ('PUT', ('/api/v2/admin/recipientgroups/', 0)),
+    'delete_by_group_no': ('DELETE', ('/api/v2/admin/recipientgroups/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Recipientgroups 조회
+
+    발송 그룹을 조회합니다.
+
+    GET /api/v2/admin/recipientgroups
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Recipientgroup 생성
+
+    새로운 발송 그룹을 생성합니다.
+
+    POST /api/v2/admin/recipientgroups
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_group_no(client: "Cafe24Client", group_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Recipientgroup 상세 조회
+
+    특정 발송 그룹을 조회합니다.
+
+    GET /api/v2/admin/recipientgroups/{group_no}
+    """
+    return client.call(_ROUTES['get_by_group_no'], (group_no, ), params=params)
+
+
+def update_by_group_no(client: "Cafe24Client", group_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Recipientgroup 수정
+
+    기존 발송 그룹을 수정합니다.
+
+    PUT /api/v2/admin/recipientgroups/{group_no}
+    """
+    return client.call(_ROUTES['update_by_group_no'], (group_no, ), params=params, data=data)
+
+
+def delete_by_group_no(client: "Cafe24Client", group_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Recipientgroup 삭제
+
+    특정 발송 그룹을 삭제합니다.
+
+    DELETE /api/v2/admin/recipientgroups/{group_no}
+    """
+    return client.call(_ROUTES['delete_by_group_no'], (group_no, ), params=params, data=data)
@@ -0,0 +1,50 @@
+"""
+Cafe24 Admin API - redirects
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/redirects',)),
+    'create': ('POST', ('/api/v2/admin/redirects',)),
+    'update_by_id': ('PUT', ('/api/v2/admin/redirects/', 0)),
+    'delete_by_id': ('DELETE', ('/api/v2/admin/redirects/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Redirects 조회
+
+    특정 URL로 접속 했을때, 설정한 URL로 리다이렉트할 수 있는 리소스입니다.
+
+    GET /api/v2/admin/redirects
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Redirects 생성
+
+    POST /api/v2/admin/redirects
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update_by_id(client: "Cafe24Client", id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Redirects 수정
+
+    PUT /api/v2/admin/redirects/{id}
+    """
+    return client.call(_ROUTES['update_by_id'], (id, ), params=params, data=data)
+
+
+def delete_by_id(client: "Cafe24Client", id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Redirects 삭제
+
+    DELETE /api/v2/admin/redirects/{id}
+    """
+    return client.call(_ROUTES['delete_by_id'], (id, ), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - refunds
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/refunds',)),
+    'get_by_refund_code': ('GET', ('/api/v2/admin/refunds/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Refunds
+
+    환불(Refunds)은 주문의 상태가 환불과 관련된 상태에 대해 조회할 수 있는 기능입니다.
+
+    GET /api/v2/admin/refunds
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_by_refund_code(client: "Cafe24Client", refund_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Refunds by Code
+
+    환불코드, 환불뿐만 단건이 아닌 주문에 대해서는 조회할 수 없으므로 주문상태를 잘 확인하고 사용해주세요.
+
+    GET /api/v2/admin/refunds/{refund_code}
+    """
+    return client.call(_ROUTES['get_by_refund_code'], (refund_code, ), params=params)
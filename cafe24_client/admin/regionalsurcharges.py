@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - regionalsurcharges
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/regionalsurcharges',)),
+    'update': ('PUT', ('/api/v2/admin/regionalsurcharges',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Regional surcharges 조회
+
+    지역별 배송비를 설정하거나, 설정된 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/regionalsurcharges
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Regional surcharges 업데이트
+
+    지역별 배송비를 설정하거나, 설정된 정보를 조회할 수 있습니다.
+
+    PUT /api/v2/admin/regionalsurcharges
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - reports
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_hourlysales': ('GET', ('/api/v2/admin/reports/hourlysales',)),
+    'get_productsales': ('GET', ('/api/v2/admin/reports/productsales',)),
+    'get_salesvolume': ('GET', ('/api/v2/admin/reports/salesvolume',)),
+}
+
+
+def get_hourlysales(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Reports hourlysales
+
+    시간대별 정산통계(Reports hourlysales)는 특정 날짜와 시간을 기준으로 각종 매출에 관한 데이터를 조회할 수 있습니다.
+
+    GET /api/v2/admin/reports/hourlysales
+    """
+    return client.call(_ROUTES['get_hourlysales'], (), params=params)
+
+
+def get_productsales(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Reports productsales
+
+    상품판매통계(Reports productsales)를 활용하여 상품을 기준으로 판매된 통계를 조회할 수 있습니다.
+
+    GET /api/v2/admin/reports/productsales
+    """
+    return client.call(_ROUTES['get_productsales'], (), params=params)
+
+
+def get_salesvolume(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Reports salesvolume
+
+    판매수량 통계(Reports salesvolume)는 쇼핑몰의 상품이 판매된 수량의 통계에 대한 기능입니다.
+
+    GET /api/v2/admin/reports/salesvolume
+    """
+    return client.call(_ROUTES['get_salesvolume'], (), params=params)
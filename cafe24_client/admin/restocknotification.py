@@ -0,0 +1,32 @@
+"""
+Cafe24 Admin API - restocknotification
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/restocknotification/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/restocknotification/setting',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """재입고 알림 설정 조회
+
+    재입고 알림 상품의 설정 관련할 수 있습니다.
+
+    GET /api/v2/admin/restocknotification/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """재입고 알림 설정 수정
+
+    PUT /api/v2/admin/restocknotification/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - return_
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_by_claim_code': ('GET', ('/api/v2/admin/return/', 0)),
+    'create': ('POST', ('/api/v2/admin/return',)),
+    'update': ('PUT', ('/api/v2/admin/return',)),
+}
+
+
+def get_by_claim_code(client: "Cafe24Client", claim_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Return 조회
+
+    반품 리소스는 반품접수 이후부터 반품완료까지의 주문 상태를 조회할 수 있습니다.
+
+    GET /api/v2/admin/return/{claim_code}
+    """
+    return client.call(_ROUTES['get_by_claim_code'], (claim_code, ), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Return 생성
+
+    반품 리소스에서는 반품 정보를 조회하거나 반품을 처리할 수 있습니다.
+
+    POST /api/v2/admin/return
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Return 수정
+
+    반품 리소스에서는 반품 정보를 조회하거나 반품을 처리할 수 있습니다.
+
+    PUT /api/v2/admin/return
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - returnrequests
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/admin/returnrequests',)),
+    'update': ('PUT', ('/api/v2/admin/returnrequests',)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Returnrequests 생성
+
+    반품요청(Returnrequests)을 통해 특정 주문의 반품에 대한 요청을 접수하거나 거부할 수 있습니다.
+
+    POST /api/v2/admin/returnrequests
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Returnrequests 수정
+
+    반품요청(Returnrequests)을 통해 특정 주문의 반품에 대한 요청을 접수하거나 거부할 수 있습니다.
+
+    PUT /api/v2/admin/returnrequests
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
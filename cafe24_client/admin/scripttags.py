@@ -0,0 +1,78 @@
+"""
+Cafe24 Admin API - scripttags
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/scripttags',)),
+    'create': ('POST', ('/api/v2/admin/scripttags',)),
+    'get_count': ('GET', ('/api/v2/admin/scripttags/count',)),
+    'get_by_script_no': ('GET', ('/api/v2/admin/scripttags/', 0)),
+    'update_by_script_no': ('PUT', ('/api/v2/admin/scripttags/', 0)),
+    'delete_by_script_no': ('DELETE', ('/api/v2/admin/scripttags/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Scripttags
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    GET /api/v2/admin/scripttags
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Scripttags
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    POST /api/v2/admin/scripttags
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Scripttags Count
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    GET /api/v2/admin/scripttags/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_script_no(client: "Cafe24Client", script_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Scripttags
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    GET /api/v2/admin/scripttags/{script_no}
+    """
+    return client.call(_ROUTES['get_by_script_no'], (script_no, ), params=params)
+
+
+def update_by_script_no(client: "Cafe24Client", script_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Scripttags
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/scripttags/{script_no}
+    """
+    return client.call(_ROUTES['update_by_script_no'], (script_no, ), params=params, data=data)
+
+
+def delete_by_script_no(client: "Cafe24Client", script_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Scripttags
+
+    스크립트태그는 쇼핑몰의 특정 화면에 스크립트를 설치하기 위해 사용할 수 있는 기능입니다.
+
+    DELETE /api/v2/admin/scripttags/{script_no}
+    """
+    return client.call(_ROUTES['delete_by_script_no'], (script_no, ), params=params, data=data)
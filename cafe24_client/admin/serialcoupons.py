@@ -0,0 +1,61 @@
+"""
+Cafe24 Admin API - serialcoupons
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/serialcoupons',)),
+    'create': ('POST', ('/api/v2/admin/serialcoupons',)),
+    'delete_by_coupon_no': ('DELETE', ('/api/v2/admin/serialcoupons/', 0)),
+    'get_coupon_issues': ('GET', ('/api/v2/admin/serialcoupons/', 0, '/issues')),
+    'create_coupon_issues': ('POST', ('/api/v2/admin/serialcoupons/', 0, '/issues')),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve a list of serial coupons
+
+    시리얼코드로 쿠폰을 관리하는 기능을 제공합니다
+
+    GET /api/v2/admin/serialcoupons
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a serial coupon
+
+    POST /api/v2/admin/serialcoupons
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def delete_by_coupon_no(client: "Cafe24Client", coupon_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete a serial coupon
+
+    DELETE /api/v2/admin/serialcoupons/{coupon_no}
+    """
+    return client.call(_ROUTES['delete_by_coupon_no'], (coupon_no, ), params=params, data=data)
+
+
+def get_coupon_issues(client: "Cafe24Client", coupon_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve serial coupon issues
+
+    시리얼코드로 발급한 쿠폰을 관리하는 기능을 제공합니다
+
+    GET /api/v2/admin/serialcoupons/{coupon_no}/issues
+    """
+    return client.call(_ROUTES['get_coupon_issues'], (coupon_no, ), params=params)
+
+
+def create_coupon_issues(client: "Cafe24Client", coupon_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create a serial coupon issue
+
+    POST /api/v2/admin/serialcoupons/{coupon_no}/issues
+    """
+    return client.call(_ROUTES['create_coupon_issues'], (coupon_no, ), params=params, data=data)
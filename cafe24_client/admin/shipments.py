@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - shipments
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/admin/shipments',)),
+    'update': ('PUT', ('/api/v2/admin/shipments',)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipments 생성
+
+    배송(Shipments)은 주문의 하위리소스로 주문의 배송 정보를 한번에 등록하거나 수정할 수 있습니다.
+
+    POST /api/v2/admin/shipments
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipments 수정
+
+    배송(Shipments)은 주문의 하위리소스로 주문의 배송 정보를 한번에 등록하거나 수정할 수 있습니다.
+
+    PUT /api/v2/admin/shipments
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - shipping
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_suppliers_by_supplier_id': ('GET', ('/api/v2/admin/shipping/suppliers/', 0)),
+    'update_suppliers_by_supplier_id': ('PUT', ('/api/v2/admin/shipping/suppliers/', 0)),
+    'get': ('GET', ('/api/v2/admin/shipping',)),
+    'update': ('PUT', ('/api/v2/admin/shipping',)),
+}
+
+
+def get_suppliers_by_supplier_id(client: "Cafe24Client", supplier_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Shipping suppliers 조회
+
+    공급사 배송 관련 정보를 조회합니다.
+
+    GET /api/v2/admin/shipping/suppliers/{supplier_id}
+    """
+    return client.call(_ROUTES['get_suppliers_by_supplier_id'], (supplier_id, ), params=params)
+
+
+def update_suppliers_by_supplier_id(client: "Cafe24Client", supplier_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipping suppliers 수정
+
+    공급사 배송 관련 정보를 수정합니다.
+
+    PUT /api/v2/admin/shipping/suppliers/{supplier_id}
+    """
+    return client.call(_ROUTES['update_suppliers_by_supplier_id'], (supplier_id, ), params=params, data=data)
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Shipping 조회
+
+    배송 방법에 대한 상세 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/shipping
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def update(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipping 업데이트
+
+    배송 방법에 대한 상세 정보를 조회할 수 있습니다.
+
+    PUT /api/v2/admin/shipping
+    """
+    return client.call(_ROUTES['update'], (), params=params, data=data)
@@ -0,0 +1,23 @@
+"""
+Cafe24 Admin API - shippingmanager
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/shippingmanager',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve shipping manager settings
+
+    배송 관리자(Shippingmanager)는 배송 관리자 활성화 정보 관련 기능입니다. 배송 관리자의 사용 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/shippingmanager
+    """
+    return client.call(_ROUTES['get'], (), params=params)
@@ -0,0 +1,67 @@
+"""
+Cafe24 Admin API - shippingorigins
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/shippingorigins',)),
+    'create': ('POST', ('/api/v2/admin/shippingorigins',)),
+    'get_by_origin_code': ('GET', ('/api/v2/admin/shippingorigins/', 0)),
+    'update_by_origin_code': ('PUT', ('/api/v2/admin/shippingorigins/', 0)),
+    'delete_by_origin_code': ('DELETE', ('/api/v2/admin/shippingorigins/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Shipping origins 조회
+
+    출고지에 대한 정보를 관리하는 기능입니다.
+
+    GET /api/v2/admin/shippingorigins
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipping origin 생성
+
+    출고지에 대한 정보를 관리하는 기능입니다.
+
+    POST /api/v2/admin/shippingorigins
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_by_origin_code(client: "Cafe24Client", origin_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Shipping origin 조회
+
+    출고지에 대한 정보를 관리하는 기능입니다.
+
+    GET /api/v2/admin/shippingorigins/{origin_code}
+    """
+    return client.call(_ROUTES['get_by_origin_code'], (origin_code, ), params=params)
+
+
+def update_by_origin_code(client: "Cafe24Client", origin_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipping origin 업데이트
+
+    출고지에 대한 정보를 관리하는 기능입니다.
+
+    PUT /api/v2/admin/shippingorigins/{origin_code}
+    """
+    return client.call(_ROUTES['update_by_origin_code'], (origin_code, ), params=params, data=data)
+
+
+def delete_by_origin_code(client: "Cafe24Client", origin_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Shipping origin 삭제
+
+    출고지에 대한 정보를 관리하는 기능입니다.
+
+    DELETE /api/v2/admin/shippingorigins/{origin_code}
+    """
+    return client.call(_ROUTES['delete_by_origin_code'], (origin_code, ), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - shops
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/shops',)),
+    'get_by_shop_no': ('GET', ('/api/v2/admin/shops/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve shops
+
+    멀티쇼핑몰(Shops)은 한개의 판매아이디에서 두개 이상의 쇼핑몰을 운영하고 있는 경우 생성한 멀티 쇼핑몰의 정보입니다. 멀티쇼핑몰은 최대 15개까지 생성이 가능하며, 각각 다른 언어와 화폐로 생성할 수 있어 다국어 쇼핑몰을 운영하기 용이합니다.
+
+    GET /api/v2/admin/shops
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_by_shop_no(client: "Cafe24Client", shop_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve specific shop
+
+    멀티쇼핑몰(Shops)은 한개의 판매아이디에서 두개 이상의 쇼핑몰을 운영하고 있는 경우 생성한 멀티 쇼핑몰의 정보입니다. 멀티쇼핑몰은 최대 15개까지 생성이 가능하며, 각각 다른 언어와 화폐로 생성할 수 있어 다국어 쇼핑몰을 운영하기 용이합니다.
+
+    GET /api/v2/admin/shops/{shop_no}
+    """
+    return client.call(_ROUTES['get_by_shop_no'], (shop_no, ), params=params)
@@ -0,0 +1,76 @@
+"""
+Cafe24 Admin API - sms
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_setting': ('GET', ('/api/v2/admin/sms/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/sms/setting',)),
+    'create': ('POST', ('/api/v2/admin/sms',)),
+    'get_balance': ('GET', ('/api/v2/admin/sms/balance',)),
+    'get_receivers': ('GET', ('/api/v2/admin/sms/receivers',)),
+    'get_senders': ('GET', ('/api/v2/admin/sms/senders',)),
+}
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve SMS settings
+
+    SMS 설정(Sms setting)은 쇼핑몰의 SMS 설정에 관한 기능입니다.
+
+    GET /api/v2/admin/sms/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update SMS settings
+
+    SMS 설정(Sms setting)은 쇼핑몰의 SMS 설정에 관한 기능입니다.
+
+    PUT /api/v2/admin/sms/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """SMS 발송
+
+    SMS 메시지를 발송합니다.
+
+    POST /api/v2/admin/sms
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_balance(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Sms balance
+
+    문자발송잔수는 정량, 단발발송잔수에 대한 정보를 제공합니다.
+
+    GET /api/v2/admin/sms/balance
+    """
+    return client.call(_ROUTES['get_balance'], (), params=params)
+
+
+def get_receivers(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Sms receivers
+
+    수신자 등록 여부에 따라 운용자, 부운용자, 공급사의 알림 메시지 발송 여부를 확인할 수 있습니다.
+
+    GET /api/v2/admin/sms/receivers
+    """
+    return client.call(_ROUTES['get_receivers'], (), params=params)
+
+
+def get_senders(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Sms senders
+
+    GET /api/v2/admin/sms/senders
+    """
+    return client.call(_ROUTES['get_senders'], (), params=params)
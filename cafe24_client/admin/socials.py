@@ -0,0 +1,87 @@
+"""
+Cafe24 Admin API - socials
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_apple': ('GET', ('/api/v2/admin/socials/apple',)),
+    'update_apple': ('PUT', ('/api/v2/admin/socials/apple',)),
+    'get_kakaosync': ('GET', ('/api/v2/admin/socials/kakaosync',)),
+    'update_kakaosync': ('PUT', ('/api/v2/admin/socials/kakaosync',)),
+    'get_naverlogin': ('GET', ('/api/v2/admin/socials/naverlogin',)),
+    'update_naverlogin': ('PUT', ('/api/v2/admin/socials/naverlogin',)),
+    'get_navershopping': ('GET', ('/api/v2/admin/socials/navershopping',)),
+}
+
+
+def get_apple(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve Apple social settings
+
+    애플아이디 로그인(Socials apple)은 쇼핑몰 이용 고객의 애플아이디 로그인에 관한 기능입니다.
+
+    GET /api/v2/admin/socials/apple
+    """
+    return client.call(_ROUTES['get_apple'], (), params=params)
+
+
+def update_apple(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update Apple social settings
+
+    애플아이디 로그인(Socials apple)은 쇼핑몰 이용 고객의 애플아이디 로그인에 관한 기능입니다.
+
+    PUT /api/v2/admin/socials/apple
+    """
+    return client.call(_ROUTES['update_apple'], (), params=params, data=data)
+
+
+def get_kakaosync(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Retrieve KakaoSync settings
+
+    카카오싱크 SNS(Socials kakaosync)는 쇼핑몰의 카카오싱크에 대한 설정을 조회하거나 설정할 수 있는 기능입니다.
+
+    GET /api/v2/admin/socials/kakaosync
+    """
+    return client.call(_ROUTES['get_kakaosync'], (), params=params)
+
+
+def update_kakaosync(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update KakaoSync settings
+
+    카카오싱크 SNS(Socials kakaosync)는 쇼핑몰의 카카오싱크에 대한 설정을 조회하거나 설정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/socials/kakaosync
+    """
+    return client.call(_ROUTES['update_kakaosync'], (), params=params, data=data)
+
+
+def get_naverlogin(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Socials naverlogin
+
+    네이버 로그인 설정정보를 조회하고 설정정보를 변경하는 리소스입니다
+
+    GET /api/v2/admin/socials/naverlogin
+    """
+    return client.call(_ROUTES['get_naverlogin'], (), params=params)
+
+
+def update_naverlogin(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Socials naverlogin
+
+    네이버 로그인 설정정보를 조회하고 설정정보를 변경하는 리소스입니다
+
+    PUT /api/v2/admin/socials/naverlogin
+    """
+    return client.call(_ROUTES['update_naverlogin'], (), params=params, data=data)
+
+
+def get_navershopping(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Socials navershopping
+
+    GET /api/v2/admin/socials/navershopping
+    """
+    return client.call(_ROUTES['get_navershopping'], (), params=params)
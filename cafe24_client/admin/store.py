@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - store
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/store',)),
+    'get_accounts': ('GET', ('/api/v2/admin/store/accounts',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Store
+
+    상점(Store)은 쇼핑몰의 쇼핑몰명, 관리자 정보, 사업자 등록번호와 고객센터 전화번호 등 쇼핑몰의 기본적인 정보를 확인할 수 있는 기능입니다
+
+    GET /api/v2/admin/store
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_accounts(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Store accounts
+
+    상점 계좌(Store accounts)는 쇼핑몰의 무통장입금 정보에 대한 기능입니다.
+
+    GET /api/v2/admin/store/accounts
+    """
+    return client.call(_ROUTES['get_accounts'], (), params=params)
@@ -0,0 +1,100 @@
+"""
+Cafe24 Admin API - subscription
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_shipments_setting': ('GET', ('/api/v2/admin/subscription/shipments/setting',)),
+    'create_shipments_setting': ('POST', ('/api/v2/admin/subscription/shipments/setting',)),
+    'update_shipments_setting_by_subscription_no': ('PUT', ('/api/v2/admin/subscription/shipments/setting/', 0)),
+    'delete_shipments_setting_by_subscription_no': ('DELETE', ('/api/v2/admin/subscription/shipments/setting/', 0)),
+    'get_shipments': ('GET', ('/api/v2/admin/subscription/shipments',)),
+    'create_shipments': ('POST', ('/api/v2/admin/subscription/shipments',)),
+    'update_shipments_by_subscription_id': ('PUT', ('/api/v2/admin/subscription/shipments/', 0)),
+    'update_shipments_subscription_items': ('PUT', ('/api/v2/admin/subscription/shipments/', 0, '/items')),
+}
+
+
+def get_shipments_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Subscription shipments setting
+
+    정기배송 설정은 정기결제를 통해 이루어지는 정기배송에 대한 기능입니다.
+
+    GET /api/v2/admin/subscription/shipments/setting
+    """
+    return client.call(_ROUTES['get_shipments_setting'], (), params=params)
+
+
+def create_shipments_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create subscription shipment setting
+
+    정기배송 설정을 통해 쇼핑몰의 정기배송 상품을 생성하거나 정기배송 상품을 조회할 수 있습니다.
+
+    POST /api/v2/admin/subscription/shipments/setting
+    """
+    return client.call(_ROUTES['create_shipments_setting'], (), params=params, data=data)
+
+
+def update_shipments_setting_by_subscription_no(client: "Cafe24Client", subscription_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update subscription shipment setting
+
+    정기배송 기능을 사용하기 위해서는 먼저 정기배송 서비스가 신청되어 있어야 합니다.
+
+    PUT /api/v2/admin/subscription/shipments/setting/{subscription_no}
+    """
+    return client.call(_ROUTES['update_shipments_setting_by_subscription_no'], (subscription_no, ), params=params, data=data)
+
+
+def delete_shipments_setting_by_subscription_no(client: "Cafe24Client", subscription_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete subscription shipment setting
+
+    정기배송 서비스의 신청은 어드민에서 가능합니다.
+
+    DELETE /api/v2/admin/subscription/shipments/setting/{subscription_no}
+    """
+    return client.call(_ROUTES['delete_shipments_setting_by_subscription_no'], (subscription_no, ), params=params, data=data)
+
+
+def get_shipments(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Subscription shipments
+
+    정기배송(Subscription shipments)은 정기배송에 대한 조회, 등록, 수정, 삭제를 할 수 있는 기능입니다.
+
+    GET /api/v2/admin/subscription/shipments
+    """
+    return client.call(_ROUTES['get_shipments'], (), params=params)
+
+
+def create_shipments(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Subscription shipments
+
+    정기배송(Subscription shipments)은 정기배송에 대한 조회, 등록, 수정, 삭제를 할 수 있는 기능입니다.
+
+    POST /api/v2/admin/subscription/shipments
+    """
+    return client.call(_ROUTES['create_shipments'], (), params=params, data=data)
+
+
+def update_shipments_by_subscription_id(client: "Cafe24Client", subscription_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Subscription shipments
+
+    정기배송(Subscription shipments)은 정기배송에 대한 조회, 등록, 수정, 삭제를 할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/subscription/shipments/{subscription_id}
+    """
+    return client.call(_ROUTES['update_shipments_by_subscription_id'], (subscription_id, ), params=params, data=data)
+
+
+def update_shipments_subscription_items(client: "Cafe24Client", subscription_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Subscription shipments items
+
+    정기배송 품목(Subscription shipments items)을 통해 정기배송 품목별 수정을 할 수 있습니다.
+
+    PUT /api/v2/admin/subscription/shipments/{subscription_id}/items
+    """
+    return client.call(_ROUTES['update_shipments_subscription_items'], (subscription_id, ), params=params, data=data)
@@ -0,0 +1,185 @@
+"""
+Cafe24 Admin API - suppliers
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/suppliers',)),
+    'create': ('POST', ('/api/v2/admin/suppliers',)),
+    'get_count': ('GET', ('/api/v2/admin/suppliers/count',)),
+    'get_by_supplier_code': ('GET', ('/api/v2/admin/suppliers/', 0)),
+    'update_by_supplier_code': ('PUT', ('/api/v2/admin/suppliers/', 0)),
+    'delete_by_supplier_code': ('DELETE', ('/api/v2/admin/suppliers/', 0)),
+    'get_users': ('GET', ('/api/v2/admin/suppliers/users',)),
+    'create_users': ('POST', ('/api/v2/admin/suppliers/users',)),
+    'get_users_count': ('GET', ('/api/v2/admin/suppliers/users/count',)),
+    'get_users_by_user_id': ('GET', ('/api/v2/admin/suppliers/users/', 0)),
+    'update_users_by_user_id': ('PUT', ('/api/v2/admin/suppliers/users/', 0)),
+    'delete_users_by_user_id': ('DELETE', ('/api/v2/admin/suppliers/users/', 0)),
+    'get_users_supplier_regionalsurcharges': ('GET', ('/api/v2/admin/suppliers/users/', 0, '/regionalsurcharges')),
+    'create_users_supplier_regionalsurcharges': ('POST', ('/api/v2/admin/suppliers/users/', 0, '/regionalsurcharges')),
+    'delete_users_supplier_regionalsurcharges_by_regional_surcharge_id': ('DELETE', ('/api/v2/admin/suppliers/users/', 0, '/regionalsurcharges/', 1)),
+    'get_users_supplier_regionalsurcharges_setting': ('GET', ('/api/v2/admin/suppliers/users/', 0, '/regionalsurcharges/setting')),
+    'update_users_supplier_regionalsurcharges_setting': ('PUT', ('/api/v2/admin/suppliers/users/', 0, '/regionalsurcharges/setting')),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Suppliers 목록 조회
+
+    공급사 정보를 조회합니다.
+
+    GET /api/v2/admin/suppliers
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Supplier 생성
+
+    새로운 공급사를 생성합니다.
+
+    POST /api/v2/admin/suppliers
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Suppliers 수 조회
+
+    공급사 수를 조회합니다.
+
+    GET /api/v2/admin/suppliers/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_supplier_code(client: "Cafe24Client", supplier_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Supplier 상세 조회
+
+    특정 공급사 정보를 조회합니다.
+
+    GET /api/v2/admin/suppliers/{supplier_code}
+    """
+    return client.call(_ROUTES['get_by_supplier_code'], (supplier_code, ), params=params)
+
+
+def update_by_supplier_code(client: "Cafe24Client", supplier_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Supplier 수정
+
+    특정 공급사 정보를 수정합니다.
+
+    PUT /api/v2/admin/suppliers/{supplier_code}
+    """
+    return client.call(_ROUTES['update_by_supplier_code'], (supplier_code, ), params=params, data=data)
+
+
+def delete_by_supplier_code(client: "Cafe24Client", supplier_code: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Supplier 삭제
+
+    특정 공급사를 삭제합니다.
+
+    DELETE /api/v2/admin/suppliers/{supplier_code}
+    """
+    return client.call(_ROUTES['delete_by_supplier_code'], (supplier_code, ), params=params, data=data)
+
+
+def get_users(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Suppliers users
+
+    공급사 운영자(Supplier Users)는 공급사가 쇼핑몰에 로그인하여 상품을 직접 등록해야 할 경우 필요합니다.
+
+    GET /api/v2/admin/suppliers/users
+    """
+    return client.call(_ROUTES['get_users'], (), params=params)
+
+
+def create_users(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create supplier user
+
+    POST /api/v2/admin/suppliers/users
+    """
+    return client.call(_ROUTES['create_users'], (), params=params, data=data)
+
+
+def get_users_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Count suppliers users
+
+    GET /api/v2/admin/suppliers/users/count
+    """
+    return client.call(_ROUTES['get_users_count'], (), params=params)
+
+
+def get_users_by_user_id(client: "Cafe24Client", user_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Get supplier user by ID
+
+    GET /api/v2/admin/suppliers/users/{user_id}
+    """
+    return client.call(_ROUTES['get_users_by_user_id'], (user_id, ), params=params)
+
+
+def update_users_by_user_id(client: "Cafe24Client", user_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update supplier user
+
+    PUT /api/v2/admin/suppliers/users/{user_id}
+    """
+    return client.call(_ROUTES['update_users_by_user_id'], (user_id, ), params=params, data=data)
+
+
+def delete_users_by_user_id(client: "Cafe24Client", user_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete supplier user
+
+    DELETE /api/v2/admin/suppliers/users/{user_id}
+    """
+    return client.call(_ROUTES['delete_users_by_user_id'], (user_id, ), params=params, data=data)
+
+
+def get_users_supplier_regionalsurcharges(client: "Cafe24Client", supplier_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Get regional surcharges
+
+    공급사 지역별 배송비(Suppliers users regionalsurcharges)를 통해 공급사별로 지역별 배송비를 설정하거나, 설정된 정보를 조회할 수 있습니다.
+
+    GET /api/v2/admin/suppliers/users/{supplier_id}/regionalsurcharges
+    """
+    return client.call(_ROUTES['get_users_supplier_regionalsurcharges'], (supplier_id, ), params=params)
+
+
+def create_users_supplier_regionalsurcharges(client: "Cafe24Client", supplier_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create regional surcharge
+
+    POST /api/v2/admin/suppliers/users/{supplier_id}/regionalsurcharges
+    """
+    return client.call(_ROUTES['create_users_supplier_regionalsurcharges'], (supplier_id, ), params=params, data=data)
+
+
+def delete_users_supplier_regionalsurcharges_by_regional_surcharge_id(client: "Cafe24Client", supplier_id: Union[int, str], regional_surcharge_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Delete regional surcharge
+
+    DELETE /api/v2/admin/suppliers/users/{supplier_id}/regionalsurcharges/{regional_surcharge_id}
+    """
+    return client.call(_ROUTES['delete_users_supplier_regionalsurcharges_by_regional_surcharge_id'], (supplier_id, regional_surcharge_id, ), params=params, data=data)
+
+
+def get_users_supplier_regionalsurcharges_setting(client: "Cafe24Client", supplier_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Suppliers users regionalsurcharges setting 조회
+
+    공급사 지역별 배송비 설정을 조회합니다.
+
+    GET /api/v2/admin/suppliers/users/{supplier_id}/regionalsurcharges/setting
+    """
+    return client.call(_ROUTES['get_users_supplier_regionalsurcharges_setting'], (supplier_id, ), params=params)
+
+
+def update_users_supplier_regionalsurcharges_setting(client: "Cafe24Client", supplier_id: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Suppliers users regionalsurcharges setting 수정
+
+    공급사 지역별 배송비 설정값을 수정합니다.
+
+    PUT /api/v2/admin/suppliers/users/{supplier_id}/regionalsurcharges/setting
+    """
+    return client.call(_ROUTES['update_users_supplier_regionalsurcharges_setting'], (supplier_id, ), params=params, data=data)
@@ -0,0 +1,75 @@
+"""
+Cafe24 Admin API - themes
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/themes',)),
+    'get_count': ('GET', ('/api/v2/admin/themes/count',)),
+    'get_by_skin_no': ('GET', ('/api/v2/admin/themes/', 0)),
+    'get_skin_pages': ('GET', ('/api/v2/admin/themes/', 0, '/pages')),
+    'create_skin_pages': ('POST', ('/api/v2/admin/themes/', 0, '/pages')),
+    'update_skin_pages': ('PUT', ('/api/v2/admin/themes/', 0, '/pages')),
+    'delete_skin_pages': ('DELETE', ('/api/v2/admin/themes/', 0, '/pages')),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """get
+
+    GET /api/v2/admin/themes
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """get_count
+
+    GET /api/v2/admin/themes/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_skin_no(client: "Cafe24Client", skin_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """get_by_skin_no
+
+    GET /api/v2/admin/themes/{skin_no}
+    """
+    return client.call(_ROUTES['get_by_skin_no'], (skin_no, ), params=params)
+
+
+def get_skin_pages(client: "Cafe24Client", skin_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """get_skin_pages
+
+    GET /api/v2/admin/themes/{skin_no}/pages
+    """
+    return client.call(_ROUTES['get_skin_pages'], (skin_no, ), params=params)
+
+
+def create_skin_pages(client: "Cafe24Client", skin_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """create_skin_pages
+
+    POST /api/v2/admin/themes/{skin_no}/pages
+    """
+    return client.call(_ROUTES['create_skin_pages'], (skin_no, ), params=params, data=data)
+
+
+def update_skin_pages(client: "Cafe24Client", skin_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """update_skin_pages
+
+    PUT /api/v2/admin/themes/{skin_no}/pages
+    """
+    return client.call(_ROUTES['update_skin_pages'], (skin_no, ), params=params, data=data)
+
+
+def delete_skin_pages(client: "Cafe24Client", skin_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """delete_skin_pages
+
+    DELETE /api/v2/admin/themes/{skin_no}/pages
+    """
+    return client.call(_ROUTES['delete_skin_pages'], (skin_no, ), params=params, data=data)
@@ -0,0 +1,109 @@
+"""
+Cafe24 Admin API - translations
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_categories': ('GET', ('/api/v2/admin/translations/categories',)),
+    'update_categories_by_category_no': ('PUT', ('/api/v2/admin/translations/categories/', 0)),
+    'get_products': ('GET', ('/api/v2/admin/translations/products',)),
+    'update_products_by_product_no': ('PUT', ('/api/v2/admin/translations/products/', 0)),
+    'get_store': ('GET', ('/api/v2/admin/translations/store',)),
+    'update_store': ('PUT', ('/api/v2/admin/translations/store',)),
+    'get_themes': ('GET', ('/api/v2/admin/translations/themes',)),
+    'get_themes_by_skin_no': ('GET', ('/api/v2/admin/translations/themes/', 0)),
+    'update_themes_by_skin_no': ('PUT', ('/api/v2/admin/translations/themes/', 0)),
+}
+
+
+def get_categories(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Translations categories
+
+    상품 분류 번역 정보(Translations categories)는, 상품 분류의 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    GET /api/v2/admin/translations/categories
+    """
+    return client.call(_ROUTES['get_categories'], (), params=params)
+
+
+def update_categories_by_category_no(client: "Cafe24Client", category_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Translations categories
+
+    상품 분류 번역 정보(Translations categories)는, 상품 분류의 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/translations/categories/{category_no}
+    """
+    return client.call(_ROUTES['update_categories_by_category_no'], (category_no, ), params=params, data=data)
+
+
+def get_products(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Translations products
+
+    상품 번역 정보(Translations products)는, 상품의 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    GET /api/v2/admin/translations/products
+    """
+    return client.call(_ROUTES['get_products'], (), params=params)
+
+
+def update_products_by_product_no(client: "Cafe24Client", product_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Translations products
+
+    상품 번역 정보(Translations products)는, 상품의 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/translations/products/{product_no}
+    """
+    return client.call(_ROUTES['update_products_by_product_no'], (product_no, ), params=params, data=data)
+
+
+def get_store(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Translations store
+
+    GET /api/v2/admin/translations/store
+    """
+    return client.call(_ROUTES['get_store'], (), params=params)
+
+
+def update_store(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Translations store
+
+    상점 번역 정보(Translations store)는 상점의 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/translations/store
+    """
+    return client.call(_ROUTES['update_store'], (), params=params, data=data)
+
+
+def get_themes(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Translations themes
+
+    테마 번역 정보(Translations themes)는 다국어 코드화된 디자인 스킨에 담겨진 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    GET /api/v2/admin/translations/themes
+    """
+    return client.call(_ROUTES['get_themes'], (), params=params)
+
+
+def get_themes_by_skin_no(client: "Cafe24Client", skin_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Translations themes
+
+    테마 번역 정보(Translations themes)는 다국어 코드화된 디자인 스킨에 담겨진 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    GET /api/v2/admin/translations/themes/{skin_no}
+    """
+    return client.call(_ROUTES['get_themes_by_skin_no'], (skin_no, ), params=params)
+
+
+def update_themes_by_skin_no(client: "Cafe24Client", skin_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Translations themes
+
+    테마 번역 정보(Translations themes)는 다국어 코드화된 디자인 스킨에 담겨진 번역 정보를 조회하거나 수정할 수 있는 기능입니다.
+
+    PUT /api/v2/admin/translations/themes/{skin_no}
+    """
+    return client.call(_ROUTES['update_themes_by_skin_no'], (skin_no, ), params=params, data=data)
@@ -0,0 +1,21 @@
+"""
+Cafe24 Admin API - unpaidorders
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/unpaidorders',)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Unpaidorders
+
+    GET /api/v2/admin/unpaidorders
+    """
+    return client.call(_ROUTES['get'], (), params=params)
@@ -0,0 +1,56 @@
+"""
+Cafe24 Admin API - urgentinquiry
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/urgentinquiry',)),
+    'get_article_reply': ('GET', ('/api/v2/admin/urgentinquiry/', 0, '/reply')),
+    'create_article_reply': ('POST', ('/api/v2/admin/urgentinquiry/', 0, '/reply')),
+    'update_article_reply': ('PUT', ('/api/v2/admin/urgentinquiry/', 0, '/reply')),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Urgentinquiry
+
+    긴급문의 게시글에 대해 조회할 수 있습니다.
+
+    GET /api/v2/admin/urgentinquiry
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_article_reply(client: "Cafe24Client", article_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Retrieve urgent inquiry reply
+
+    긴급문의 게시물의 답변글을 조회합니다.
+
+    GET /api/v2/admin/urgentinquiry/{article_no}/reply
+    """
+    return client.call(_ROUTES['get_article_reply'], (article_no, ), params=params)
+
+
+def create_article_reply(client: "Cafe24Client", article_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Create urgent inquiry reply
+
+    긴급문의 게시물의 답변글을 등록합니다.
+
+    POST /api/v2/admin/urgentinquiry/{article_no}/reply
+    """
+    return client.call(_ROUTES['create_article_reply'], (article_no, ), params=params, data=data)
+
+
+def update_article_reply(client: "Cafe24Client", article_no: Union[int, str], *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Update urgent inquiry reply
+
+    긴급문의 게시물의 답변글을 수정합니다.
+
+    PUT /api/v2/admin/urgentinquiry/{article_no}/reply
+    """
+    return client.call(_ROUTES['update_article_reply'], (article_no, ), params=params, data=data)
@@ -0,0 +1,34 @@
+"""
+Cafe24 Admin API - users
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/admin/users',)),
+    'get_by_user_id': ('GET', ('/api/v2/admin/users/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Users
+
+    운영자(Users)는 쇼핑몰의 대표관리자와 대행어 쇼핑몰을 운영할 수 있는 운영자와 관련된 기능입니다.
+
+    GET /api/v2/admin/users
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_by_user_id(client: "Cafe24Client", user_id: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """User Details
+
+    특정 운영자를 조회할 수 있습니다.
+
+    GET /api/v2/admin/users/{user_id}
+    """
+    return client.call(_ROUTES['get_by_user_id'], (user_id, ), params=params)
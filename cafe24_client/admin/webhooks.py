@@ -0,0 +1,45 @@
+"""
+Cafe24 Admin API - webhooks
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_logs': ('GET', ('/api/v2/admin/webhooks/logs',)),
+    'get_setting': ('GET', ('/api/v2/admin/webhooks/setting',)),
+    'update_setting': ('PUT', ('/api/v2/admin/webhooks/setting',)),
+}
+
+
+def get_logs(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Webhooks logs
+
+    웹훅 로그(Webhooks logs)를 통해 앱에서 발생한 웹훅의 로그를 조회할 수 있습니다.
+
+    GET /api/v2/admin/webhooks/logs
+    """
+    return client.call(_ROUTES['get_logs'], (), params=params)
+
+
+def get_setting(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Webhooks setting
+
+    쇼핑몰이 웹훅 사용이 동의된 실시간 조회 정보 관련 동의에 대해 조회할 수 있습니다.
+
+    GET /api/v2/admin/webhooks/setting
+    """
+    return client.call(_ROUTES['get_setting'], (), params=params)
+
+
+def update_setting(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Webhooks setting
+
+    쇼핑몰이 웹훅 사용이 동의된 실시간 조회 정보 관련 동의에 대해 조회할 수 있습니다.
+
+    PUT /api/v2/admin/webhooks/setting
+    """
+    return client.call(_ROUTES['update_setting'], (), params=params, data=data)
@@ -0,0 +1,25 @@
+"""
+Cafe24 Front API 모듈 (처음 접근할 때 로드)
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+import importlib
+
+CATEGORIES = (
+    'carts',
+    'categories',
+    'mains',
+    'products',
+    'productsdetail',
+)
+
+
+def __getattr__(name):
+    if name in CATEGORIES:
+        module = importlib.import_module(f'{__name__}.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(CATEGORIES))
@@ -0,0 +1,23 @@
+"""
+Cafe24 Front API - carts
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'create': ('POST', ('/api/v2/carts',)),
+}
+
+
+def create(client: "Cafe24Client", *, data: Optional[Dict[str, Any]] = None, **params: Any) -> Dict[str, Any]:
+    """Carts
+
+    장바구니(Carts)는 상품을 주문하기 전 한 번에 주문할 수 있도록 상품을 미리 담아두는 기능입니다.
+
+    POST /api/v2/carts
+    """
+    return client.call(_ROUTES['create'], (), params=params, data=data)
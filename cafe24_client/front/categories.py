@@ -0,0 +1,63 @@
+"""
+Cafe24 Front API - categories
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/categories',)),
+    'get_category_products': ('GET', ('/api/v2/categories/', 0, '/products')),
+    'get_category_products_count': ('GET', ('/api/v2/categories/', 0, '/products/count')),
+    'get_count': ('GET', ('/api/v2/categories/count',)),
+    'get_by_category_no': ('GET', ('/api/v2/categories/', 0)),
+}
+
+
+def get(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """카테고리 목록 조회
+
+    쇼핑몰의 카테고리 목록을 조회합니다
+
+    GET /api/v2/categories
+    """
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_category_products(client: "Cafe24Client", category_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """카테고리 상품 조회
+
+    카테고리 상품 목록을 조회합니다
+
+    GET /api/v2/categories/{category_no}/products
+    """
+    return client.call(_ROUTES['get_category_products'], (category_no, ), params=params)
+
+
+def get_category_products_count(client: "Cafe24Client", category_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """카테고리 상품 수 조회
+
+    카테고리 상품의 개수를 조회합니다
+
+    GET /api/v2/categories/{category_no}/products/count
+    """
+    return client.call(_ROUTES['get_category_products_count'], (category_no, ), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """Categories Count
+
+    GET /api/v2/categories/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_category_no(client: "Cafe24Client", category_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Category Detail
+
+    GET /api/v2/categories/{category_no}
+    """
+    return client.call(_ROUTES['get_by_category_no'], (category_no, ), params=params)
@@ -0,0 +1,23 @@
+"""
+Cafe24 Front API - mains
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_display_group_products': ('GET', ('/api/v2/mains/', 0, '/products')),
+}
+
+
+def get_display_group_products(client: "Cafe24Client", display_group: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """메인 상품 조회
+
+    메인 상품 목록을 조회합니다
+
+    GET /api/v2/mains/{display_group}/products
+    """
+    return client.call(_ROUTES['get_display_group_products'], (display_group, ), params=params)
@@ -0,0 +1,142 @@
+"""
+Cafe24 Front API - products
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get': ('GET', ('/api/v2/products',)),
+    'get_count': ('GET', ('/api/v2/products/count',)),
+    'get_by_product_no': ('GET', ('/api/v2/products/', 0)),
+    'get_product_decorationimages': ('GET', ('/api/v2/products/', 0, '/decorationimages')),
+    'get_product_discountprice': ('GET', ('/api/v2/products/', 0, '/discountprice')),
+    'get_product_hits_count': ('GET', ('/api/v2/products/', 0, '/hits/count')),
+    'get_product_icons': ('GET', ('/api/v2/products/', 0, '/icons')),
+    'get_product_options': ('GET', ('/api/v2/products/', 0, '/options')),
+    'get_product_variants': ('GET', ('/api/v2/products/', 0, '/variants')),
+    'get_product_variants_by_variant_code': ('GET', ('/api/v2/products/', 0, '/variants/', 1)),
+    'get_product_variants_variant_inventories': ('GET', ('/api/v2/products/', 0, '/variants/', 1, '/inventories')),
+    'get_product_carts_count': ('GET', ('/api/v2/products/', 0, '/carts/count')),
+}
+
+
+def get(client: "Cafe24Client", *, limit: Optional[int] = None, offset: Optional[int] = None, **params: Any) -> Dict[str, Any]:
+    """Pagination
+
+    조회 결과가 많은 경우, 정해진 'limit' 기반 건수만큼 결과가 조회됩니다.
+
+    GET /api/v2/products
+    """
+    if limit is not None:
+        params['limit'] = limit
+    if offset is not None:
+        params['offset'] = offset
+    return client.call(_ROUTES['get'], (), params=params)
+
+
+def get_count(client: "Cafe24Client", **params: Any) -> Dict[str, Any]:
+    """get_count
+
+    GET /api/v2/products/count
+    """
+    return client.call(_ROUTES['get_count'], (), params=params)
+
+
+def get_by_product_no(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """get_by_product_no
+
+    GET /api/v2/products/{product_no}
+    """
+    return client.call(_ROUTES['get_by_product_no'], (product_no, ), params=params)
+
+
+def get_product_decorationimages(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products decorationimages
+
+    꾸미기 이미지(Decorationimages)는 쇼핑몰에 진열된 상품에 등록되어있는 꾸미기 이미지를 조회할 수 있습니다.
+
+    GET /api/v2/products/{product_no}/decorationimages
+    """
+    return client.call(_ROUTES['get_product_decorationimages'], (product_no, ), params=params)
+
+
+def get_product_discountprice(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products discountprice
+
+    GET /api/v2/products/{product_no}/discountprice
+    """
+    return client.call(_ROUTES['get_product_discountprice'], (product_no, ), params=params)
+
+
+def get_product_hits_count(client: "Cafe24Client", product_no: int, **params: Any) -> Dict[str, Any]:
+    """Products hits
+
+    상품 조회수(hits)는 상품을 쇼핑몰 고객들이 얼마나 조회했는지를 나타내는 지표입니다.
+
+    GET /api/v2/products/{product_no}/hits/count
+    """
+    return client.call(_ROUTES['get_product_hits_count'], (product_no, ), params=params)
+
+
+def get_product_icons(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products icons
+
+    상품 아이콘은 상품을 강조하기 위해 상품 옆에 추가할 수 있는 작은 이미지들입니다. 전달된 상품에 밀린 정보, '매진 임박' 등의 메시지를 추가하여 상품을 강조할 수 있습니다.
+
+    GET /api/v2/products/{product_no}/icons
+    """
+    return client.call(_ROUTES['get_product_icons'], (product_no, ), params=params)
+
+
+def get_product_options(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products options
+
+    상품 옵션(Products options)은 상품이 다른 색상이나 사이즈를 갖고 있는 경우 이를 각각의 옵션으로 구분할 수 있도록 하는 기능입니다.
+
+    GET /api/v2/products/{product_no}/options
+    """
+    return client.call(_ROUTES['get_product_options'], (product_no, ), params=params)
+
+
+def get_product_variants(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """상품의 품목 조회
+
+    상품의 품목(Products variants)은 쇼핑몰에서 판매되는 상품의 기본 단위입니다.
+
+    GET /api/v2/products/{product_no}/variants
+    """
+    return client.call(_ROUTES['get_product_variants'], (product_no, ), params=params)
+
+
+def get_product_variants_by_variant_code(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """특정 품목 조회
+
+    특정 상품의 품목을 조회합니다.
+
+    GET /api/v2/products/{product_no}/variants/{variant_code}
+    """
+    return client.call(_ROUTES['get_product_variants_by_variant_code'], (product_no, variant_code, ), params=params)
+
+
+def get_product_variants_variant_inventories(client: "Cafe24Client", product_no: Union[int, str], variant_code: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """품목 재고 조회
+
+    재고(Inventories)는 판매 가능한 해당 품목의 수량을 의미합니다.
+
+    GET /api/v2/products/{product_no}/variants/{variant_code}/inventories
+    """
+    return client.call(_ROUTES['get_product_variants_variant_inventories'], (product_no, variant_code, ), params=params)
+
+
+def get_product_carts_count(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Products carts
+
+    상품 장바구니(Products carts)는 특정 상품을 장바구니에 담은 회원과 그 숫자를 조회할 수 있는 리소스입니다.
+
+    GET /api/v2/products/{product_no}/carts/count
+    """
+    return client.call(_ROUTES['get_product_carts_count'], (product_no, ), params=params)
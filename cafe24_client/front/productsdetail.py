@@ -0,0 +1,23 @@
+"""
+Cafe24 Front API - productsdetail
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {
+    'get_by_product_no': ('GET', ('/api/v2/productsdetail/', 0)),
+}
+
+
+def get_by_product_no(client: "Cafe24Client", product_no: Union[int, str], **params: Any) -> Dict[str, Any]:
+    """Productsdetail
+
+    상품상세정보(Productsdetail)는 상품 상세페이지에 노출되는 항목과 그 값을 조회할 수 있는 기능입니다.
+
+    GET /api/v2/productsdetail/{product_no}
+    """
+    return client.call(_ROUTES['get_by_product_no'], (product_no, ), params=params)
@@ -0,0 +1,176 @@
+"""
+생성된 문서 파일 (api-index.json, categories/*.json 등) 서빙 도우미
+- 생성할 때 .gz / .br(brotli 설치 시) 압축본을 함께 만들어 두고 요청의 Accept-Encoding에 맞는 파일을 그대로 전송
+  압축본은 저장소에 올리지 않으므로 배포 빌드에서 만들고 (python docs_assets.py, render.yaml),
+  그래도 없거나 원본보다 오래됐으면 첫 요청 때 만듦
+- ETag는 generation-manifest.json 의 내용 해시 (압축본은 인코딩별로 다른 ETag)
+  매니페스트보다 나중에 수정된 파일은 직접 해시 (크기가 같은 수정도 ETag가 바뀜)
+- 매니페스트에 있는 파일만 서빙 (임의 경로 접근 불가)
+
+사용법:
+    python docs_assets.py          # 매니페스트의 모든 파일 압축본 생성 (없거나 오래된 것만)
+    python docs_assets.py --force
+"""
+import os
+import json
+import gzip
+import hashlib
+import argparse
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_SUFFIX = '.gz'
+BROTLI_SUFFIX = '.br'
+COMPRESSED_SUFFIXES = (GZIP_SUFFIX, BROTLI_SUFFIX)
+
+MIME_TYPES = {
+    '.json': 'application/json',
+    '.md': 'text/markdown; charset=utf-8',
+}
+
+
+def _write_bytes_atomic(path, data):
+    # 여러 프로세스/스레드가 같은 압축본을 동시에 만들 수 있으므로 임시 파일 이름을 나눔
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _is_fresh(variant_path, source_mtime):
+    try:
+        return os.stat(variant_path).st_mtime_ns >= source_mtime
+    except OSError:
+        return False
+
+
+def write_compressed_variants(path, force=False):
+    """path.gz / path.br 생성 (force가 아니면 원본보다 오래됐거나 없는 것만), 새로 만든 수 반환
+
+    gzip은 mtime=0 으로 만들어 내용이 같으면 압축본도 같은 바이트
+    """
+    source_mtime = os.stat(path).st_mtime_ns
+    targets = [(GZIP_SUFFIX, lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        targets.append((BROTLI_SUFFIX, lambda data: brotli.compress(data, quality=11)))
+
+    data = None
+    written = 0
+    for suffix, compress in targets:
+        variant_path = path + suffix
+        if not force and _is_fresh(variant_path, source_mtime):
+            continue
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        _write_bytes_atomic(variant_path, compress(data))
+        written += 1
+    return written
+
+
+def remove_compressed_variants(path):
+    for suffix in COMPRESSED_SUFFIXES:
+        try:
+            os.remove(f"{path}{suffix}")
+        except FileNotFoundError:
+            pass
+
+
+class DocsAssets:
+    """요청 경로 -> (전송할 파일, Content-Encoding, ETag, MIME 타입)"""
+
+    def __init__(self, docs_dir=None, manifest_file=None):
+        from verify_and_categorize import DOCS_DIR, MANIFEST_FILE
+
+        self.docs_dir = docs_dir or DOCS_DIR
+        self.manifest_file = manifest_file or MANIFEST_FILE
+        self.lock = threading.Lock()
+        self.manifest = {}
+        self.manifest_stamp = None
+        self.hashes = {}  # 매니페스트 이후 수정된 파일: 경로 -> (mtime, size, sha256)
+
+    def _files(self):
+        """매니페스트 (파일이 바뀌었을 때만 다시 읽음)"""
+        try:
+            stat = os.stat(self.manifest_file)
+        except OSError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self.manifest_stamp:
+            with self.lock:
+                if stamp != self.manifest_stamp:
+                    try:
+                        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                            self.manifest = json.load(f)['files']
+                    except (OSError, ValueError, KeyError):
+                        self.manifest = {}
+                    self.manifest_stamp = stamp
+        return self.manifest
+
+    def _digest(self, relative_path, path, stat, entry):
+        # 매니페스트는 파일을 쓴 뒤에 저장하므로, 그보다 나중에 바뀐 파일은 매니페스트 해시를 믿지 않음
+        if entry.get('size') == stat.st_size and stat.st_mtime_ns <= self.manifest_stamp[0]:
+            return entry['sha256']
+        cached = self.hashes.get(relative_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.hashes[relative_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def resolve(self, relative_path, accept_encodings=()):
+        """서빙할 파일 정보 dict, 매니페스트에 없거나 파일이 없으면 None
+
+        accept_encodings: 클라이언트가 받는 인코딩 (선호 순서)
+        """
+        entry = self._files().get(relative_path)
+        if entry is None:
+            return None
+        path = os.path.join(self.docs_dir, relative_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        digest = self._digest(relative_path, path, stat, entry)
+        mimetype = MIME_TYPES.get(os.path.splitext(relative_path)[1], 'application/octet-stream')
+
+        for encoding in accept_encodings:
+            suffix = {'br': BROTLI_SUFFIX, 'gzip': GZIP_SUFFIX}.get(encoding)
+            if suffix is None or (suffix == BROTLI_SUFFIX and brotli is None):
+                continue
+            # 없거나 원본보다 오래된 압축본(내용이 다를 수 있음)은 지금 만듦
+            if not _is_fresh(path + suffix, stat.st_mtime_ns):
+                with self.lock:
+                    if not _is_fresh(path + suffix, stat.st_mtime_ns):
+                        try:
+                            write_compressed_variants(path)
+                        except OSError:
+                            continue
+            return {'path': path + suffix, 'encoding': encoding, 'mimetype': mimetype,
+                    'etag': f"{digest[:32]}-{encoding}"}
+        return {'path': path, 'encoding': None, 'mimetype': mimetype, 'etag': digest[:32]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='생성된 문서 파일의 .gz / .br 압축본 생성')
+    parser.add_argument('--force', action='store_true', help='최신 압축본도 다시 생성')
+    args = parser.parse_args()
+
+    assets = DocsAssets()
+    files = assets._files()
+    written = 0
+    for relative_path in files:
+        path = os.path.join(assets.docs_dir, relative_path)
+        if os.path.exists(path):
+            written += write_compressed_variants(path, force=args.force)
+    print(f"✓ 압축본 {written}개 생성 (파일 {len(files)}개, brotli {'사용' if brotli else '없음'})")
+
+
+if __name__ == '__main__':
+    main()
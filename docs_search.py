@@ -0,0 +1,271 @@
+"""
+스크래핑한 API 문서 검색 인덱스 (SQLite FTS5)
+- 요약 / 설명 / 경로 / 파라미터 이름 전문 검색 (trigram 토크나이저라 한글 부분 일치 가능)
+- method / category / api_type 필터
+- verify_and_categorize.py 실행 시 함께 생성, 없으면 검색할 때 스펙에서 생성
+
+trigram은 3글자 이상만 색인에서 찾을 수 있으므로 '상품'처럼 짧은 검색어는
+본문 컬럼에서 직접 찾음 (문서 수천 건 기준 수 ms)
+
+인덱스에는 만들 때의 스펙 파일 mtime/크기를 저장하고, 스펙이 바뀌었으면 검색할 때 다시 생성
+trigram 토크나이저는 SQLite 3.34.0 이상 필요
+
+사용법:
+    python docs_search.py 상품 목록
+    python docs_search.py variants --method GET --api-type admin
+    python docs_search.py --rebuild
+"""
+import os
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from json_stream import iter_json_items
+
+SEARCH_DB = 'docs/cafe24/search.db'
+SPEC_FILES = {
+    'admin': 'docs/cafe24/specs/admin.json',
+    'front': 'docs/cafe24/specs/front.json',
+}
+MIN_INDEXED_TERM = 3  # trigram
+MIN_SQLITE_VERSION = (3, 34, 0)  # FTS5 trigram 토크나이저
+INDEX_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE endpoints (
+    id INTEGER PRIMARY KEY,
+    api_type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    description TEXT NOT NULL,
+    params TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX idx_endpoints_filter ON endpoints(api_type, category, method);
+CREATE INDEX idx_endpoints_method ON endpoints(method);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE VIRTUAL TABLE endpoints_fts USING fts5(
+    summary, description, path, params,
+    content='endpoints', content_rowid='id', tokenize='trigram'
+);
+"""
+
+# bm25 컬럼 가중치 (summary, description, path, params)
+RANK_WEIGHTS = (10.0, 2.0, 5.0, 3.0)
+
+_build_lock = threading.Lock()
+_verified = {}  # DB 경로 -> 마지막으로 확인한 스펙 파일 stamp
+
+
+def check_sqlite_version():
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise sqlite3.NotSupportedError(
+            f"문서 검색에는 SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} 이상이 필요합니다 "
+            f"(FTS5 trigram, 현재 {sqlite3.sqlite_version})"
+        )
+
+
+def _source_stamp(spec_files=SPEC_FILES):
+    """인덱스를 만든 스펙 파일 상태 (버전 + 파일별 mtime / 크기)"""
+    stamp = [INDEX_VERSION]
+    for api_type, spec_file in sorted(spec_files.items()):
+        try:
+            stat = os.stat(spec_file)
+            stamp.append([api_type, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            stamp.append([api_type, None, None])
+    return stamp
+
+
+def _index_stamp(db_path):
+    """인덱스에 저장된 stamp (없거나 읽을 수 없으면 None)"""
+    if not os.path.exists(db_path):
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+    except (sqlite3.Error, ValueError):
+        return None
+
+
+class SearchIndexBuilder:
+    """임시 DB에 모두 넣은 뒤 교체 (검색 중인 DB를 건드리지 않음)
+
+    스펙 파일 stamp는 읽기 전에 잡아 두므로, 만드는 도중 스펙이 바뀌면 다음 검색에서 다시 생성
+    """
+
+    def __init__(self, db_path=SEARCH_DB, spec_files=SPEC_FILES):
+        check_sqlite_version()
+        self.db_path = db_path
+        self.source = _source_stamp(spec_files)
+        self.tmp_path = f"{db_path}.tmp"
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        self.conn = sqlite3.connect(self.tmp_path)
+        self.conn.executescript(SCHEMA)
+        self.count = 0
+
+    def add(self, api_type, category, ep):
+        params = ' '.join(
+            str(param.get('name', '')) for param in ep.get('parameters') or [] if isinstance(param, dict)
+        )
+        summary = str(ep.get('summary') or '')
+        description = str(ep.get('description') or '')
+        path = str(ep.get('path') or '')
+        body = ' '.join((summary, description, path, params)).lower()
+
+        self.conn.execute(
+            "INSERT INTO endpoints (api_type, category, method, path, summary, description, params, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (api_type, category, str(ep.get('method') or '').upper(), path, summary, description, params, body)
+        )
+        self.count += 1
+
+    def finish(self):
+        self.conn.execute("INSERT INTO meta (key, value) VALUES ('source', ?)", (json.dumps(self.source),))
+        self.conn.execute("INSERT INTO endpoints_fts(endpoints_fts) VALUES ('rebuild')")
+        self.conn.execute("INSERT INTO endpoints_fts(endpoints_fts) VALUES ('optimize')")
+        self.conn.commit()
+        self.conn.close()
+        os.replace(self.tmp_path, self.db_path)
+
+    def abort(self):
+        self.conn.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def build_index(db_path=SEARCH_DB):
+    """스펙 파일에서 검색 인덱스 생성, 색인한 엔드포인트 수 반환"""
+    from verify_and_categorize import get_category
+
+    builder = SearchIndexBuilder(db_path)
+    try:
+        for api_type, spec_file in SPEC_FILES.items():
+            for ep in iter_json_items(spec_file, 'endpoints'):
+                builder.add(api_type, get_category(ep.get('path', ''), api_type), ep)
+    except Exception:
+        builder.abort()
+        raise
+    builder.finish()
+    return builder.count
+
+
+def ensure_index(db_path=SEARCH_DB):
+    """인덱스가 없거나 스펙 파일이 바뀌었으면 다시 생성 (동시에 여러 요청이 와도 한 번만)
+
+    스펙 파일 stat 만 비교하고, 인덱스의 stamp는 스펙이 바뀌었을 때만 다시 읽음
+    """
+    stamp = _source_stamp()
+    if _verified.get(db_path) == stamp:
+        return
+    with _build_lock:
+        if _verified.get(db_path) == stamp:
+            return
+        if _index_stamp(db_path) != stamp:
+            build_index(db_path)
+        _verified[db_path] = stamp
+
+
+def search(query='', method=None, category=None, api_type=None, limit=20, db_path=SEARCH_DB):
+    """검색어(공백으로 구분, 모두 포함)와 필터로 엔드포인트 검색"""
+    check_sqlite_version()
+    ensure_index(db_path)
+
+    terms = query.split()
+    indexed = [term for term in terms if len(term) >= MIN_INDEXED_TERM]
+    short = [term.lower() for term in terms if len(term) < MIN_INDEXED_TERM]
+
+    sql = "SELECT e.api_type, e.category, e.method, e.path, e.summary, e.description FROM endpoints e"
+    where = []
+    args = []
+
+    if indexed:
+        sql += " JOIN endpoints_fts ON endpoints_fts.rowid = e.id"
+        where.append("endpoints_fts MATCH ?")
+        args.append(' AND '.join('"{}"'.format(term.replace('"', '""')) for term in indexed))
+        order = "bm25(endpoints_fts, {}, {}, {}, {})".format(*RANK_WEIGHTS)
+    else:
+        order = "e.api_type, e.path, e.method"
+    order_args = []
+    if short:
+        # 짧은 검색어는 색인 순위가 없으므로 요약에 들어 있는 것을 앞으로
+        order = " + ".join("(instr(lower(e.summary), ?) > 0)" for _ in short) + " DESC, " + order
+        order_args = short
+
+    for term in short:
+        where.append("instr(e.body, ?) > 0")
+        args.append(term)
+    if method:
+        where.append("e.method = ?")
+        args.append(method.upper())
+    if category:
+        where.append("e.category = ?")
+        args.append(category)
+    if api_type:
+        where.append("e.api_type = ?")
+        args.append(api_type)
+
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY {order} LIMIT ?"
+    args.extend(order_args)
+    args.append(int(limit))
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(sql, args).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            'api_type': row[0],
+            'category': row[1],
+            'method': row[2],
+            'path': row[3],
+            'summary': row[4],
+            'description': row[5],
+            'file': f"categories/{row[0]}/{row[1]}.json"
+        }
+        for row in rows
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cafe24 API 문서 검색')
+    parser.add_argument('query', nargs='*', help='검색어 (공백으로 구분, 모두 포함)')
+    parser.add_argument('--method', help='HTTP 메서드 필터')
+    parser.add_argument('--category', help='카테고리 필터')
+    parser.add_argument('--api-type', choices=['admin', 'front'], help='API 종류 필터')
+    parser.add_argument('--limit', type=int, default=20, help='최대 결과 수')
+    parser.add_argument('--db', default=SEARCH_DB, help='검색 인덱스 파일')
+    parser.add_argument('--rebuild', action='store_true', help='스펙 파일에서 인덱스 다시 생성')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        started = time.perf_counter()
+        count = build_index(args.db)
+        print(f"✓ {args.db}: {count}개 엔드포인트 색인 ({time.perf_counter() - started:.2f}초)")
+        if not args.query:
+            return
+
+    started = time.perf_counter()
+    results = search(' '.join(args.query), args.method, args.category, args.api_type, args.limit, args.db)
+    took = (time.perf_counter() - started) * 1000
+
+    print(f"\n🔍 {len(results)}개 결과 ({took:.1f}ms)\n")
+    for result in results:
+        print(f"  {result['method']:6} {result['path']}")
+        print(f"         {result['summary']}  [{result['api_type']}/{result['category']}]")
+
+
+if __name__ == '__main__':
+    main()
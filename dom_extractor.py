@@ -0,0 +1,187 @@
+"""
+Cafe24 API 문서 DOM 추출기
+렌더링된 페이지의 DOM에서 메서드/경로/파라미터/응답 필드를 직접 읽어옴
+해석하지 못한 섹션만 화면 영역(clip)과 함께 돌려주어 Vision 분석으로 넘김
+"""
+import re
+
+# 제목(h1~h4) 단위로 섹션을 나누고, 섹션별 텍스트와 표를 그대로 수집
+COLLECT_SECTIONS_JS = r"""
+() => {
+    const HEADER_RE = /^H[1-4]$/;
+    const sections = [];
+
+    for (const header of document.querySelectorAll('h1, h2, h3, h4')) {
+        const nodes = [header];
+        let node = header.nextElementSibling;
+        while (node && !HEADER_RE.test(node.tagName)) {
+            nodes.push(node);
+            node = node.nextElementSibling;
+        }
+
+        const text = nodes.map(n => n.innerText || '').join('\n');
+        if (!/\/api\/v2\//.test(text) && !/\b(GET|POST|PUT|DELETE|PATCH)\b/.test(text)) {
+            continue;
+        }
+
+        const tables = [];
+        for (const n of nodes) {
+            const found = n.tagName === 'TABLE' ? [n] : Array.from(n.querySelectorAll('table'));
+            for (const table of found) {
+                const rows = Array.from(table.querySelectorAll('tr')).map(
+                    tr => Array.from(tr.querySelectorAll('th, td')).map(c => (c.innerText || '').trim())
+                );
+                // 표 바로 앞의 제목/문단으로 요청/응답 구분
+                let label = '';
+                let prev = table.previousElementSibling || (table.parentElement && table.parentElement.previousElementSibling);
+                if (prev) label = (prev.innerText || '').slice(0, 100);
+                tables.push({label: label, rows: rows});
+            }
+        }
+
+        const paragraph = nodes.find(n => n.tagName === 'P');
+        // 화면에 그려지지 않은 요소(접힌 탭 등)는 영역 계산에서 제외, 하나도 없으면 캡처 불가(clip: null)
+        const rects = nodes.map(n => n.getBoundingClientRect()).filter(r => r.height > 0 && r.width > 0);
+        let clip = null;
+        if (rects.length) {
+            const top = Math.min(...rects.map(r => r.top)) + window.scrollY;
+            const bottom = Math.max(...rects.map(r => r.bottom)) + window.scrollY;
+            clip = {x: 0, y: Math.max(0, top), width: document.documentElement.clientWidth, height: Math.max(1, bottom - top)};
+        }
+
+        sections.push({
+            title: (header.innerText || '').trim(),
+            description: paragraph ? (paragraph.innerText || '').trim() : '',
+            text: text,
+            tables: tables,
+            clip: clip
+        });
+    }
+    return sections;
+}
+"""
+
+ENDPOINT_RE = re.compile(r'\b(GET|POST|PUT|DELETE|PATCH)\s+(/api/v2/[^\s"\'<>]+)')
+RESPONSE_LABEL_RE = re.compile(r'response|응답', re.IGNORECASE)
+
+# 표 머리글 → 필드
+COLUMN_PATTERNS = {
+    'name': re.compile(r'parameter|param|field|name|파라미터|필드|항목|속성'),
+    'type': re.compile(r'type|타입|형식|자료형'),
+    'required': re.compile(r'required|필수'),
+    'description': re.compile(r'description|설명'),
+}
+REQUIRED_VALUES = {'required', 'y', 'yes', 'o', 'true', '필수'}
+
+
+def map_columns(header_row):
+    """표 머리글에서 필드별 열 번호 찾기"""
+    columns = {}
+    for i, cell in enumerate(header_row):
+        cell = cell.lower()
+        for field, pattern in COLUMN_PATTERNS.items():
+            if field not in columns and pattern.search(cell):
+                columns[field] = i
+                break
+    return columns
+
+
+def parse_table(table, path, method):
+    """표 하나를 (종류, 항목 목록)으로 변환, 해석할 수 없으면 None"""
+    rows = [row for row in table['rows'] if row]
+    if len(rows) < 2:
+        return None
+
+    columns = map_columns(rows[0])
+    if 'name' not in columns:
+        return None
+
+    def cell(row, field):
+        index = columns.get(field)
+        return row[index] if index is not None and index < len(row) else ''
+
+    kind = 'response' if RESPONSE_LABEL_RE.search(table['label']) else 'request'
+    items = []
+    for row in rows[1:]:
+        name = cell(row, 'name').split('\n')[0].strip()
+        if not name:
+            continue
+        item = {
+            'name': name,
+            'type': cell(row, 'type').lower() or 'string',
+            'description': cell(row, 'description')
+        }
+        if kind == 'request':
+            item['in'] = 'path' if f"{{{name}}}" in path else ('query' if method == 'GET' else 'body')
+            item['required'] = cell(row, 'required').strip().lower() in REQUIRED_VALUES or item['in'] == 'path'
+        items.append(item)
+    return kind, items
+
+
+def find_endpoints(text):
+    """텍스트에 나오는 (method, 경로) 목록 (쿼리 문자열 제외, 중복 제거, 나온 순서)"""
+    found = []
+    for match in ENDPOINT_RE.finditer(text):
+        key = (match.group(1), match.group(2).split('?')[0].rstrip('.,)'))
+        if key not in found:
+            found.append(key)
+    return found
+
+
+def section_to_endpoint(section):
+    """섹션을 엔드포인트로 변환, DOM만으로 해석할 수 없으면 None
+
+    - 엔드포인트가 여러 개인 섹션: 표가 어느 엔드포인트의 것인지 알 수 없음
+    - 표가 없는 섹션: 파라미터/응답이 표가 아닌 형식으로 되어 있을 수 있음
+    """
+    found = find_endpoints(section['text'])
+    if len(found) != 1 or not section['tables']:
+        return None
+
+    method, path = found[0]
+    parameters = []
+    response_fields = {}
+
+    for table in section['tables']:
+        parsed = parse_table(table, path, method)
+        if parsed is None:
+            # 알 수 없는 형식의 표가 있으면 Vision으로 넘김
+            return None
+        kind, items = parsed
+        if kind == 'request':
+            parameters.extend(items)
+        else:
+            for item in items:
+                response_fields[item['name']] = {'type': item['type'], 'description': item['description']}
+
+    endpoint = {
+        'method': method,
+        'path': path,
+        'summary': section['title'],
+        'description': section['description'],
+        'parameters': parameters,
+        'responses': {}
+    }
+    if response_fields:
+        endpoint['responses'] = {
+            '200': {
+                'description': '성공',
+                'schema': {'type': 'object', 'properties': response_fields}
+            }
+        }
+    return endpoint
+
+
+async def extract_sections(page):
+    """(해석된 엔드포인트 목록, 해석하지 못한 섹션 목록) 반환"""
+    sections = await page.evaluate(COLLECT_SECTIONS_JS)
+
+    endpoints = []
+    unresolved = []
+    for section in sections:
+        endpoint = section_to_endpoint(section)
+        if endpoint:
+            endpoints.append(endpoint)
+        else:
+            unresolved.append(section)
+    return endpoints, unresolved
@@ -0,0 +1,154 @@
+"""
+엔드포인트 조각 병합 인덱스
+겹치는 타일에서 같은 엔드포인트가 여러 조각으로 나오면 (예: 파라미터 표가 두 타일에 걸침)
+method + path 기준으로 하나로 합침
+
+- 파라미터 / 응답 필드는 이름 기준으로 합침
+- 같은 항목의 값이 다르면 신뢰도가 높은 조각의 값을 사용
+  (신뢰도가 같으면 빈 값보다 채워진 값, 더 긴 값 - 타일 경계에서 잘린 설명 대비)
+- 결과 순서는 처음 나온 위치(타일 번호) 순서
+"""
+
+
+def endpoint_key(endpoint):
+    method = str(endpoint.get('method', '')).strip().upper()
+    path = str(endpoint.get('path', '')).strip().split('?')[0]
+    if len(path) > 1:
+        path = path.rstrip('/')
+    return method, path
+
+
+def _is_empty(value):
+    return value is None or value == '' or value == [] or value == {}
+
+
+class _Field:
+    """값 하나와 그 값을 준 조각의 신뢰도"""
+    __slots__ = ('value', 'confidence')
+
+    def __init__(self, value, confidence):
+        self.value = value
+        self.confidence = confidence
+
+    def offer(self, value, confidence):
+        if _is_empty(value):
+            return
+        if _is_empty(self.value) or confidence > self.confidence or (
+                confidence == self.confidence and isinstance(value, str) and isinstance(self.value, str)
+                and len(value) > len(self.value)):
+            self.value = value
+            self.confidence = confidence
+
+
+class _Record:
+    """이름 붙은 항목 (파라미터, 응답 필드) 하나의 속성별 값"""
+
+    def __init__(self):
+        self.fields = {}
+
+    def merge(self, item, confidence):
+        for attr, value in item.items():
+            field = self.fields.get(attr)
+            if field is None:
+                self.fields[attr] = _Field(value, confidence)
+            else:
+                field.offer(value, confidence)
+
+    def to_dict(self):
+        return {attr: field.value for attr, field in self.fields.items()}
+
+
+class _Entry:
+    """엔드포인트 하나에 합쳐진 조각들"""
+
+    def __init__(self, method, path, position, sequence):
+        self.method = method
+        self.path = path
+        self.position = position
+        self.sequence = sequence
+        self.fragments = 0
+        self.fields = {}       # summary, description 등
+        self.parameters = {}   # 이름 -> _Record
+        self.responses = {}    # 상태 코드 -> {'fields': {...}, 'schema': {...}, 'properties': {이름: _Record}}
+
+    def merge(self, endpoint, confidence):
+        self.fragments += 1
+        for attr, value in endpoint.items():
+            if attr in ('method', 'path', 'parameters', 'responses', 'confidence'):
+                continue
+            field = self.fields.get(attr)
+            if field is None:
+                self.fields[attr] = _Field(value, confidence)
+            else:
+                field.offer(value, confidence)
+
+        for param in endpoint.get('parameters') or []:
+            if isinstance(param, dict) and param.get('name'):
+                self.parameters.setdefault(param['name'], _Record()).merge(param, confidence)
+
+        for code, response in (endpoint.get('responses') or {}).items():
+            if not isinstance(response, dict):
+                continue
+            merged = self.responses.setdefault(str(code), {'fields': _Record(), 'schema': _Record(), 'properties': {}})
+            merged['fields'].merge({k: v for k, v in response.items() if k != 'schema'}, confidence)
+            schema = response.get('schema')
+            if isinstance(schema, dict):
+                merged['schema'].merge({k: v for k, v in schema.items() if k != 'properties'}, confidence)
+                for name, prop in (schema.get('properties') or {}).items():
+                    if isinstance(prop, dict):
+                        merged['properties'].setdefault(name, _Record()).merge(prop, confidence)
+
+    def to_endpoint(self):
+        endpoint = {'method': self.method, 'path': self.path}
+        endpoint.update({attr: field.value for attr, field in self.fields.items()})
+        endpoint['parameters'] = [record.to_dict() for record in self.parameters.values()]
+
+        responses = {}
+        for code, merged in self.responses.items():
+            response = merged['fields'].to_dict()
+            if merged['schema'].fields or merged['properties']:
+                schema = merged['schema'].to_dict()
+                if merged['properties']:
+                    schema['properties'] = {name: record.to_dict() for name, record in merged['properties'].items()}
+                response['schema'] = schema
+            responses[code] = response
+        if responses:
+            endpoint['responses'] = responses
+        return endpoint
+
+
+class EndpointIndex:
+    def __init__(self, default_confidence=0.5):
+        self.default_confidence = default_confidence
+        self.entries = {}
+        self.fragments = 0
+
+    def add(self, endpoint, confidence=None, position=0):
+        """조각 하나 병합 (endpoint에 confidence가 있으면 그 값 우선)"""
+        method, path = endpoint_key(endpoint)
+        if not method or not path:
+            return
+        if endpoint.get('confidence') is not None:
+            confidence = endpoint['confidence']
+        if confidence is None:
+            confidence = self.default_confidence
+
+        self.fragments += 1
+        entry = self.entries.get((method, path))
+        if entry is None:
+            entry = self.entries[(method, path)] = _Entry(method, path, position, len(self.entries))
+        elif position < entry.position:
+            entry.position = position
+        entry.merge(endpoint, confidence)
+
+    def add_all(self, endpoints, confidence=None, position=0):
+        for endpoint in endpoints:
+            self.add(endpoint, confidence, position)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def endpoints(self):
+        """병합된 엔드포인트 목록 (처음 나온 위치 순서)"""
+        entries = sorted(self.entries.values(), key=lambda entry: (entry.position, entry.sequence))
+        return [entry.to_endpoint() for entry in entries]
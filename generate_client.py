@@ -0,0 +1,235 @@
+"""
+Cafe24 Python 클라이언트 생성기
+docs/cafe24/cafe24-openapi.json 으로부터 cafe24_client 패키지를 생성
+
+- 카테고리(태그)별로 모듈 하나씩 생성: cafe24_client/{admin,front}/{category}.py
+- 모듈은 처음 접근할 때 로드 (실행 시 스펙 파싱 없음)
+- 경로는 미리 조각낸 라우트 테이블로 생성 → 호출 시 문자열 파싱 없음
+
+사용법:
+    python generate_client.py
+"""
+import re
+import json
+import keyword
+import shutil
+from collections import defaultdict
+from pathlib import Path
+
+SPEC_FILE = 'docs/cafe24/cafe24-openapi.json'
+OUTPUT_DIR = Path('cafe24_client')
+
+VERBS = {'get': 'get', 'post': 'create', 'put': 'update', 'delete': 'delete'}
+PY_TYPES = {'integer': 'int', 'string': 'str', 'boolean': 'bool', 'number': 'float', 'array': 'List[Any]'}
+
+# 토큰 발급 등은 app.py에서 Basic 인증으로 처리하므로 제외
+SKIP_CATEGORIES = {'oauth'}
+RESERVED_NAMES = {'client', 'params', 'data'}
+
+
+def identifier(name):
+    """파이썬 식별자로 변환 (예약어는 뒤에 _ 추가)"""
+    name = re.sub(r'\W', '_', name)
+    if keyword.iskeyword(name) or name[0].isdigit():
+        name += '_'
+    return name
+
+
+def split_path(path):
+    """(api_type, category, 세그먼트 목록) 반환, 예시 경로(쿼리스트링/숫자 세그먼트)는 None"""
+    if '?' in path:
+        return None
+    segments = path.strip('/').split('/')
+    if segments[:2] != ['api', 'v2'] or any(s.isdigit() for s in segments):
+        return None
+
+    if segments[2:3] == ['admin']:
+        api_type, rest = 'admin', segments[3:]
+    else:
+        api_type, rest = 'front', segments[2:]
+
+    if not rest or rest[0].startswith('{'):
+        return None
+    return api_type, rest[0], rest[1:]
+
+
+def function_name(method, rest):
+    """예: GET /products/{product_no}/variants -> get_product_variants
+
+    중간 경로 인자는 접미사(_no, _code, _id)를 뗀 이름으로, 마지막 경로 인자는 by_{인자}로 표현
+    """
+    parts = [VERBS[method]]
+    for i, segment in enumerate(rest):
+        if not segment.startswith('{'):
+            parts.append(identifier(segment))
+        elif i == len(rest) - 1:
+            parts += ['by', identifier(segment[1:-1])]
+        else:
+            parts.append(re.sub(r'_(no|code|id)$', '', identifier(segment[1:-1])))
+    return '_'.join(parts)
+
+
+def route_pieces(path):
+    """경로를 (리터럴, 인자 인덱스, ...) 조각으로 미리 분리"""
+    pieces = []
+    names = []
+    for token in re.split(r'(\{[^}]+\})', path):
+        if not token:
+            continue
+        if token.startswith('{'):
+            pieces.append(len(names))
+            names.append(token[1:-1])
+        else:
+            pieces.append(token)
+    return tuple(pieces), names
+
+
+def docstring(text):
+    return text.replace('\\', '\\\\').replace('"""', "'''").strip()
+
+
+def render_function(name, method, path, operation):
+    pieces, path_names = route_pieces(path)
+    spec_params = {p.get('name'): p for p in operation.get('parameters', []) if isinstance(p, dict)}
+
+    args = ['client: "Cafe24Client"']
+    for raw in path_names:
+        py_type = PY_TYPES.get(spec_params.get(raw, {}).get('type'), 'Union[int, str]')
+        args.append(f"{identifier(raw)}: {py_type}")
+
+    query_names = []
+    for raw, param in spec_params.items():
+        if param.get('in') != 'query' or not raw or not raw.isidentifier() or keyword.iskeyword(raw):
+            continue
+        if raw in RESERVED_NAMES or raw in path_names:
+            continue
+        query_names.append(raw)
+
+    kwargs = [f"{raw}: Optional[{PY_TYPES.get(spec_params[raw].get('type'), 'Any')}] = None" for raw in query_names]
+    if method != 'get':
+        kwargs.append('data: Optional[Dict[str, Any]] = None')
+    kwargs.append('**params: Any')
+
+    if len(kwargs) > 1:
+        kwargs.insert(0, '*')
+    signature = ', '.join(args + kwargs)
+    summary = docstring(operation.get('summary') or name)
+    description = docstring(operation.get('description') or '')
+
+    lines = [f'def {name}({signature}) -> Dict[str, Any]:', f'    """{summary}', '']
+    if description and description != summary:
+        lines += [f'    {description}', '']
+    lines += [f'    {method.upper()} {path}', '    """']
+    for raw in query_names:
+        lines.append(f'    if {raw} is not None:')
+        lines.append(f"        params['{raw}'] = {raw}")
+    path_args = ''.join(f'{identifier(raw)}, ' for raw in path_names)
+    body = ', data=data' if method != 'get' else ''
+    lines.append(f"    return client.call(_ROUTES['{name}'], ({path_args}), params=params{body})")
+
+    route = f"    '{name}': ('{method.upper()}', {pieces!r}),"
+    return '\n'.join(lines), route
+
+
+def render_module(api_type, category, operations):
+    functions = []
+    routes = []
+    for name, method, path, operation in operations:
+        function_src, route = render_function(name, method, path, operation)
+        functions.append(function_src)
+        routes.append(route)
+
+    header = f'''"""
+Cafe24 {api_type.capitalize()} API - {category}
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cafe24_client import Cafe24Client
+
+# 함수명 -> (HTTP 메서드, 경로 조각)
+_ROUTES = {{
+{chr(10).join(routes)}
+}}
+'''
+    return header + '\n\n' + '\n\n\n'.join(functions) + '\n'
+
+
+def render_subpackage(api_type, modules):
+    names = ',\n'.join(f"    '{m}'" for m in sorted(modules))
+    return f'''"""
+Cafe24 {api_type.capitalize()} API 모듈 (처음 접근할 때 로드)
+generate_client.py 로 자동 생성된 파일입니다. 직접 수정하지 마세요.
+"""
+import importlib
+
+CATEGORIES = (
+{names},
+)
+
+
+def __getattr__(name):
+    if name in CATEGORIES:
+        module = importlib.import_module(f'{{__name__}}.{{name}}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(CATEGORIES))
+'''
+
+
+def main():
+    print("\n" + "="*60)
+    print("🛠️  Cafe24 Python 클라이언트 생성")
+    print("="*60)
+
+    with open(SPEC_FILE, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+
+    grouped = defaultdict(lambda: defaultdict(list))
+    skipped = 0
+    for path, methods in spec['paths'].items():
+        parsed = split_path(path)
+        if not parsed or parsed[1] in SKIP_CATEGORIES:
+            skipped += 1
+            continue
+        api_type, category, rest = parsed
+        for method, operation in methods.items():
+            if method not in VERBS:
+                continue
+            grouped[api_type][identifier(category)].append((function_name(method, rest), method, path, operation))
+
+    # 기존 생성 모듈 정리 (손으로 작성한 cafe24_client/__init__.py는 유지)
+    for api_type in ('admin', 'front'):
+        shutil.rmtree(OUTPUT_DIR / api_type, ignore_errors=True)
+
+    total = 0
+    for api_type, categories in grouped.items():
+        package_dir = OUTPUT_DIR / api_type
+        package_dir.mkdir(parents=True, exist_ok=True)
+
+        for category, operations in categories.items():
+            # 같은 이름이 생기면 번호를 붙여 구분
+            seen = defaultdict(int)
+            unique = []
+            for name, method, path, operation in operations:
+                seen[name] += 1
+                if seen[name] > 1:
+                    name = f"{name}_{seen[name]}"
+                unique.append((name, method, path, operation))
+
+            (package_dir / f"{category}.py").write_text(render_module(api_type, category, unique), encoding='utf-8')
+            total += len(unique)
+
+        (package_dir / '__init__.py').write_text(render_subpackage(api_type, categories), encoding='utf-8')
+        print(f"  ✓ {package_dir}/ ({len(categories)}개 모듈)")
+
+    print(f"\n✅ {total}개 작업 생성 (예시 경로 {skipped}개 제외)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Vision 분석 전 이미지 전처리
+- 본문 영역으로 자르기 (사이드바 제외)
+- 여백 제거
+- 거의 빈 타일은 분석 생략
+- 축소 / 흑백 변환 / JPEG·WebP 재인코딩 (선택)
+
+Pillow 필요: pip install pillow
+"""
+import io
+import math
+from PIL import Image, ImageChops
+
+FORMATS = {
+    'png': ('PNG', 'image/png'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'webp': ('WEBP', 'image/webp'),
+}
+
+
+class ImagePreprocessor:
+    def __init__(self, crop_left=0, crop_right=0, trim=True, blank_ratio=0.005, max_width=None,
+                 grayscale=False, image_format='png', quality=80):
+        if image_format not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {image_format}")
+        self.crop_left = crop_left      # 왼쪽에서 잘라낼 폭 (사이드바)
+        self.crop_right = crop_right    # 오른쪽에서 잘라낼 폭
+        self.trim = trim
+        self.blank_ratio = blank_ratio  # 내용 픽셀 비율이 이보다 작으면 빈 타일
+        self.max_width = max_width
+        self.grayscale = grayscale
+        self.image_format = image_format
+        self.quality = quality
+
+    def describe(self):
+        """설정 요약 (벤치마크/보고서용)"""
+        return {
+            'crop_left': self.crop_left,
+            'crop_right': self.crop_right,
+            'trim': self.trim,
+            'blank_ratio': self.blank_ratio,
+            'max_width': self.max_width,
+            'grayscale': self.grayscale,
+            'format': self.image_format,
+            'quality': self.quality,
+        }
+
+    @staticmethod
+    def content_bbox(image):
+        """배경색(왼쪽 위 픽셀)과 다른 영역의 경계 상자"""
+        rgb = image.convert('RGB')
+        background = Image.new('RGB', rgb.size, rgb.getpixel((0, 0)))
+        diff = ImageChops.difference(rgb, background).convert('L')
+        # 압축 잡음은 무시
+        mask = diff.point(lambda v: 255 if v > 16 else 0)
+        return mask, mask.getbbox()
+
+    def process(self, image_bytes):
+        """(이미지 바이트, MIME 타입) 반환, 빈 타일이면 None"""
+        image = Image.open(io.BytesIO(image_bytes))
+        image.load()
+
+        if self.crop_left or self.crop_right:
+            width, height = image.size
+            right = max(self.crop_left + 1, width - self.crop_right)
+            image = image.crop((self.crop_left, 0, right, height))
+
+        mask, bbox = self.content_bbox(image)
+        if bbox is None:
+            return None
+        content_pixels = mask.histogram()[255]
+        if content_pixels / float(image.size[0] * image.size[1]) < self.blank_ratio:
+            return None
+
+        if self.trim:
+            image = image.crop(bbox)
+
+        if self.max_width and image.size[0] > self.max_width:
+            ratio = self.max_width / float(image.size[0])
+            image = image.resize((self.max_width, max(1, int(image.size[1] * ratio))), Image.LANCZOS)
+
+        if self.grayscale:
+            image = image.convert('L')
+        elif image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        pil_format, mime = FORMATS[self.image_format]
+        buffer = io.BytesIO()
+        if pil_format == 'PNG':
+            image.save(buffer, format=pil_format)
+        else:
+            image.save(buffer, format=pil_format, quality=self.quality)
+        return buffer.getvalue(), mime
+
+
+def estimate_image_tokens(width, height):
+    """OpenAI high detail 이미지 토큰 추정 (2048 안으로 축소 → 짧은 변 768 → 512 타일당 170 + 85)"""
+    scale = min(1.0, 2048.0 / max(width, height))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768.0 / min(width, height))
+    width, height = width * scale, height * scale
+    return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
+
+def image_size(image_bytes):
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return image.size
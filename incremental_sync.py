@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Cafe24 증분 동기화 CLI
+- 쇼핑몰/리소스별 high-water mark(마지막 동기화 시각) 유지
+- updated_start_date/updated_end_date 필터로 변경된 레코드만 조회
+- 경계 누락 방지를 위해 약간의 겹침 구간(overlap)을 두고 재조회
+- 로컬 SQLite 미러(mirror.db)에 upsert
+- 주문은 조회 기간이 필수이고 한 번에 최대 90일이므로 기간을 90일씩 나눠 조회
+  처음 / --full 동기화는 --orders-since 부터 (기본: 최근 90일, 그 전 주문은 --orders-since 로 지정해야 미러에 들어감)
+
+사용 예:
+    python incremental_sync.py
+    python incremental_sync.py --resources products --overlap 30
+    python incremental_sync.py --shops myshop1 --full
+    python incremental_sync.py --resources orders --full --orders-since 2020-01-01
+"""
+import json
+import sqlite3
+import argparse
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from account_store import load_accounts
+from cafe24_api import Cafe24Session, RESOURCES
+from bulk_export import log, PAGE_LIMIT
+
+MIRROR_DB = 'mirror.db'
+KST = timezone(timedelta(hours=9))  # Cafe24 API 기준 시간대
+ORDER_WINDOW_DAYS = 90  # 주문 조회 한 번의 최대 기간
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    shop_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    updated_date TEXT,
+    data TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (shop_id, resource, record_id)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    shop_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    high_water TEXT NOT NULL,
+    PRIMARY KEY (shop_id, resource)
+);
+"""
+
+
+def connect(db_path):
+    """미러 DB 연결 (여러 스레드가 동시에 쓰므로 WAL 모드)"""
+    conn = sqlite3.connect(db_path, timeout=60)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def get_watermark(conn, shop_id, resource):
+    row = conn.execute(
+        'SELECT high_water FROM watermarks WHERE shop_id = ? AND resource = ?',
+        (shop_id, resource)
+    ).fetchone()
+    return datetime.fromisoformat(row[0]) if row else None
+
+
+def set_watermark(conn, shop_id, resource, high_water):
+    conn.execute(
+        'INSERT INTO watermarks (shop_id, resource, high_water) VALUES (?, ?, ?) '
+        'ON CONFLICT(shop_id, resource) DO UPDATE SET high_water = excluded.high_water',
+        (shop_id, resource, high_water.isoformat())
+    )
+
+
+def upsert_records(conn, shop_id, resource, items):
+    """페이지 단위 upsert (더 오래된 데이터로 덮어쓰지 않음)"""
+    spec = RESOURCES[resource]
+    synced_at = datetime.now(KST).isoformat()
+    rows = [
+        (shop_id, resource, str(item.get(spec['id_field'])), item.get('updated_date'),
+         json.dumps(item, ensure_ascii=False), synced_at)
+        for item in items
+    ]
+    conn.executemany(
+        'INSERT INTO records (shop_id, resource, record_id, updated_date, data, synced_at) '
+        'VALUES (?, ?, ?, ?, ?, ?) '
+        'ON CONFLICT(shop_id, resource, record_id) DO UPDATE SET '
+        'updated_date = excluded.updated_date, data = excluded.data, synced_at = excluded.synced_at '
+        'WHERE records.updated_date IS NULL OR excluded.updated_date IS NULL '
+        'OR excluded.updated_date >= records.updated_date',
+        rows
+    )
+
+
+def order_windows(first_day, last_day):
+    """[first_day, last_day] 를 ORDER_WINDOW_DAYS 이하 구간 (시작일, 종료일) 으로 나눔"""
+    windows = []
+    start = first_day
+    while start <= last_day:
+        end = min(start + timedelta(days=ORDER_WINDOW_DAYS - 1), last_day)
+        windows.append((start, end))
+        start = end + timedelta(days=1)
+    return windows
+
+
+def fetch_pages(session, conn, resource, params):
+    """조회 조건 하나를 끝까지 페이지네이션하며 upsert, 받은 건수 반환"""
+    spec = RESOURCES[resource]
+    fetched = 0
+    offset = 0
+    since = None
+    while True:
+        page_params = dict(params)
+        if spec['since_param']:
+            if since is not None:
+                page_params[spec['since_param']] = since
+        else:
+            page_params['offset'] = offset
+
+        items = session.get(spec['path'], params=page_params).get(spec['key'], [])
+        if items:
+            with conn:
+                upsert_records(conn, session.shop_id, resource, items)
+            fetched += len(items)
+            offset += len(items)
+            if spec['since_param']:
+                since = items[-1].get(spec['id_field'])
+
+        if len(items) < PAGE_LIMIT:
+            return fetched
+
+
+def sync_resource(session, conn, resource, overlap, full, orders_since=None):
+    """리소스 하나를 마지막 high-water mark 이후 변경분만 동기화
+
+    orders_since: 처음 / 전체 동기화에서 주문을 가져올 시작일 (None이면 최근 ORDER_WINDOW_DAYS 일)
+    """
+    shop_id = session.shop_id
+
+    # 조회 구간: [마지막 mark - overlap, 현재]
+    window_end = datetime.now(KST).replace(microsecond=0)
+    high_water = None if full else get_watermark(conn, shop_id, resource)
+
+    window_start = (high_water - overlap) if high_water else None
+
+    params = {'limit': PAGE_LIMIT}
+    if window_start:
+        params['updated_start_date'] = window_start.isoformat()
+        params['updated_end_date'] = window_end.isoformat()
+
+    if resource == 'orders':
+        # 주문 조회는 기간 필수, 기간은 기본으로 주문일 기준이므로 증분 조회는 수정일 기준으로 지정
+        # (예전에 주문했다가 최근에 취소/배송 상태가 바뀐 주문도 포함)
+        if window_start:
+            params['date_type'] = 'updated_date'
+            first_day = window_start.date()
+        else:
+            first_day = orders_since or (window_end - timedelta(days=ORDER_WINDOW_DAYS - 1)).date()
+        fetched = 0
+        for start, end in order_windows(first_day, window_end.date()):
+            fetched += fetch_pages(session, conn, resource, dict(params, start_date=start.strftime('%Y-%m-%d'),
+                                                                 end_date=end.strftime('%Y-%m-%d')))
+        mode = f"{window_start.isoformat()} 이후" if window_start else f"{first_day.isoformat()} 이후 주문"
+    else:
+        fetched = fetch_pages(session, conn, resource, params)
+        mode = f"{window_start.isoformat()} 이후" if window_start else '전체'
+
+    # 구간 전체를 받아온 뒤에만 mark 이동 (중간 실패 시 다음 실행에서 재조회)
+    with conn:
+        set_watermark(conn, shop_id, resource, window_end)
+
+    log(f"  ✓ {shop_id}/{resource}: {fetched}건 동기화 ({mode})")
+    return fetched
+
+
+def sync_shop(shop_id, account, resources, db_path, overlap, full, orders_since=None):
+    """쇼핑몰 하나 동기화 (리소스 순차 처리)"""
+    conn = connect(db_path)
+    session = Cafe24Session(shop_id, account)
+    counts = {}
+    try:
+        for resource in resources:
+            counts[resource] = sync_resource(session, conn, resource, overlap, full, orders_since)
+    finally:
+        session.close()
+        conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cafe24 증분 동기화 (SQLite 미러)')
+    parser.add_argument('--shops', nargs='*', help='대상 Shop ID (기본: 등록된 전체 계정)')
+    parser.add_argument('--resources', nargs='*', default=list(RESOURCES.keys()),
+                        choices=list(RESOURCES.keys()), help='동기화할 리소스')
+    parser.add_argument('--db', default=MIRROR_DB, help='SQLite 미러 파일 경로')
+    parser.add_argument('--workers', type=int, default=8, help='동시에 처리할 쇼핑몰 수')
+    parser.add_argument('--overlap', type=int, default=10, help='겹침 구간 (분)')
+    parser.add_argument('--full', action='store_true', help='high-water mark를 무시하고 전체 동기화')
+    parser.add_argument('--orders-since', type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+                        help=f'처음 / --full 동기화에서 주문을 가져올 시작일 YYYY-MM-DD '
+                             f'(기본: 최근 {ORDER_WINDOW_DAYS}일, 그 전 주문은 가져오지 않음, {ORDER_WINDOW_DAYS}일씩 나눠 조회)')
+    args = parser.parse_args()
+
+    accounts = load_accounts()['accounts']
+    shop_ids = args.shops or list(accounts.keys())
+    overlap = timedelta(minutes=args.overlap)
+
+    # 스키마는 스레드 시작 전에 한 번 생성
+    connect(args.db).close()
+
+    print("=" * 60)
+    print("🔄 Cafe24 증분 동기화")
+    print("=" * 60)
+    print(f"  - 대상 쇼핑몰: {len(shop_ids)}개")
+    print(f"  - 리소스: {', '.join(args.resources)}")
+    print(f"  - 미러 DB: {args.db}")
+    if 'orders' in args.resources:
+        print(f"  - 처음 / 전체 동기화 주문 시작일: {args.orders_since or f'최근 {ORDER_WINDOW_DAYS}일'}")
+    print()
+
+    failed = []
+    total = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for shop_id in shop_ids:
+            account = accounts.get(shop_id)
+            if not account:
+                log(f"  ✗ {shop_id}: 계정을 찾을 수 없습니다.")
+                failed.append(shop_id)
+                continue
+            future = executor.submit(sync_shop, shop_id, account, args.resources, args.db, overlap, args.full,
+                                     args.orders_since)
+            futures[future] = shop_id
+
+        for future in as_completed(futures):
+            shop_id = futures[future]
+            try:
+                counts = future.result()
+                total += sum(counts.values())
+            except Exception as e:
+                log(f"❌ {shop_id}: 동기화 실패 - {e}")
+                failed.append(shop_id)
+
+    print()
+    print("=" * 60)
+    print(f"완료: 변경 레코드 {total}건, {len(shop_ids) - len(failed)}개 성공, {len(failed)}개 실패")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
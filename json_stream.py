@@ -0,0 +1,102 @@
+"""
+최상위 JSON 객체의 배열/객체 값 하나를 항목 단위로 읽는 스트리밍 리더
+파일 전체를 메모리에 올리지 않고 json.JSONDecoder.raw_decode 로 한 항목씩 파싱
+
+    for endpoint in iter_json_items('docs/cafe24/specs/admin.json', 'endpoints'):
+        ...
+    for path, item in iter_json_items('docs/cafe24/cafe24-openapi.json', 'paths'):
+        ...
+"""
+import json
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """필요할 때만 다음 청크를 붙이는 버퍼 (이미 읽은 앞부분은 버림)"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 (파일 끝이면 '')"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}' 필요 (위치 {self.pos})")
+        self.pos += 1
+
+    def value(self):
+        """다음 JSON 값 하나 (청크 경계에서 잘렸으면 더 읽고 다시 시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # 숫자/리터럴이 버퍼 끝에서 끝나면 뒤가 더 있을 수 있음
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self.fill():
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+
+
+def iter_json_items(path, key, chunk_size=CHUNK_SIZE):
+    """최상위 객체의 key 값이 배열이면 원소를, 객체면 (키, 값)을 하나씩 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        reader.expect('{')
+        while reader.peek() != '}':
+            name = reader.value()
+            reader.expect(':')
+            if name != key:
+                reader.value()  # 다른 최상위 값은 건너뜀
+            else:
+                opening = reader.peek()
+                if not opening or opening not in '[{':
+                    raise ValueError(f"{key}: 배열이나 객체가 아닙니다")
+                closing = ']' if opening == '[' else '}'
+                reader.pos += 1
+                while reader.peek() != closing:
+                    if opening == '[':
+                        yield reader.value()
+                    else:
+                        item_key = reader.value()
+                        reader.expect(':')
+                        yield item_key, reader.value()
+                    if reader.peek() == ',':
+                        reader.pos += 1
+                reader.pos += 1
+                return
+            if reader.peek() == ',':
+                reader.pos += 1
+        raise KeyError(key)
@@ -0,0 +1,213 @@
+"""
+스크래핑한 스펙의 파라미터로 만든 요청 검증기
+Cafe24로 보내기 전에 타입 / 필수 여부 / enum 을 확인해서 잘못된 요청은 로컬에서 400으로 돌려줌
+(호출 제한을 쓰지 않고, 어떤 필드가 틀렸는지 바로 알 수 있음)
+
+- 작업(method + 경로 템플릿)마다 검사 목록을 한 번 만들어 두고 요청마다 그대로 실행
+- 경로는 route_trie 로 작업을 찾고, 경로 / 쿼리 / 본문 값을 검사
+- header 파라미터(Authorization 등)는 프록시가 채우므로 검사하지 않음
+- 스펙에 없는 파라미터는 통과 (스크래핑한 스펙이 전부가 아닐 수 있음)
+- 검사 범위는 스크래핑한 스펙에 달려 있음: 파라미터가 기록된 작업만 검사하고 나머지는 그대로 통과
+  (현재 docs/cafe24/specs 기준 522개 작업 중 17개, 실행 시 출력되는 '검사 대상' 수로 확인)
+
+사용법:
+    python param_validators.py GET /api/v2/admin/categories/abc/products
+    python param_validators.py --bench
+"""
+import re
+import time
+import argparse
+import threading
+from urllib.parse import parse_qsl
+from json_stream import iter_json_items
+from endpoint_index import endpoint_key
+import route_trie
+
+SPEC_FILES = ['docs/cafe24/specs/admin.json', 'docs/cafe24/specs/front.json']
+SKIPPED_LOCATIONS = ('header',)
+
+# 경로 / 쿼리 값은 문자열 (쿼리의 정수는 Cafe24처럼 쉼표로 여러 개 허용)
+PATH_INTEGER_RE = re.compile(r'-?\d+')
+QUERY_INTEGER_RE = re.compile(r'-?\d+(?:,-?\d+)*')
+NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+BOOLEAN_VALUES = frozenset(('true', 'false', 'T', 'F'))
+
+TYPE_NAMES = {
+    'integer': '정수',
+    'number': '숫자',
+    'boolean': '불리언',
+    'string': '문자열',
+    'object': '객체',
+    'array': '배열',
+}
+
+_load_lock = threading.Lock()
+_default_validators = None
+
+
+def _text_check(type_name, location):
+    """문자열 값(경로/쿼리) 타입 검사 함수 (검사할 필요가 없으면 None)"""
+    if type_name == 'integer':
+        return (QUERY_INTEGER_RE if location == 'query' else PATH_INTEGER_RE).fullmatch
+    if type_name == 'number':
+        return NUMBER_RE.fullmatch
+    if type_name == 'boolean':
+        return BOOLEAN_VALUES.__contains__
+    return None
+
+
+def _json_check(type_name):
+    """본문(JSON) 값 타입 검사 함수"""
+    if type_name == 'integer':
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
+    if type_name == 'number':
+        return lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+    if type_name == 'boolean':
+        return lambda value: isinstance(value, bool)
+    if type_name == 'string':
+        return lambda value: isinstance(value, str)
+    if type_name == 'object':
+        return lambda value: isinstance(value, dict)
+    if type_name == 'array':
+        return lambda value: isinstance(value, list)
+    return None
+
+
+class OperationValidator:
+    """작업 하나의 파라미터 검사 목록"""
+    __slots__ = ('checks', 'required')
+
+    def __init__(self, parameters):
+        # 위치별 {이름: (타입 검사, 타입 이름, enum)}
+        self.checks = {'path': {}, 'query': {}, 'body': {}}
+        self.required = []
+        for param in parameters:
+            if not isinstance(param, dict) or not param.get('name'):
+                continue
+            location = param.get('in', 'query')
+            if location in SKIPPED_LOCATIONS:
+                continue
+            if location == 'formData':
+                location = 'body'
+            if location not in self.checks:
+                continue
+
+            type_name = param.get('type')
+            check = _json_check(type_name) if location == 'body' else _text_check(type_name, location)
+            enum = param.get('enum')
+            if enum:
+                enum = frozenset(enum) if location == 'body' else frozenset(str(value) for value in enum)
+            self.checks[location][param['name']] = (check, type_name, enum)
+            # 'in: body' 파라미터는 본문 전체를 가리키므로 필드 필수 검사에서 제외
+            if param.get('required') and location != 'path' and param.get('in') != 'body':
+                self.required.append((location, param['name']))
+
+    def validate(self, path_params, query, body):
+        """필드별 오류 목록 (문제가 없으면 빈 목록)"""
+        errors = []
+        values = {'path': path_params, 'query': query, 'body': body if isinstance(body, dict) else {}}
+
+        for location, name in self.required:
+            if values[location].get(name) in (None, ''):
+                errors.append({'field': name, 'in': location, 'message': '필수 파라미터입니다'})
+
+        for location, checks in self.checks.items():
+            given = values[location]
+            if not given:
+                continue
+            for name, (check, type_name, enum) in checks.items():
+                value = given.get(name)
+                if value is None or value == '':
+                    continue
+                if check is not None and not check(value):
+                    errors.append({'field': name, 'in': location,
+                                   'message': f"{TYPE_NAMES.get(type_name, type_name)} 값이어야 합니다 (입력: {value!r})"})
+                elif enum is not None and (value if location == 'body' else str(value)) not in enum:
+                    errors.append({'field': name, 'in': location,
+                                   'message': f"허용 값: {', '.join(sorted(map(str, enum)))} (입력: {value!r})"})
+        return errors
+
+
+class RequestValidators:
+    def __init__(self, spec_files=SPEC_FILES, trie=None):
+        self.trie = trie or route_trie.load_trie()
+        self.operations = {}
+        for spec_file in spec_files:
+            for ep in iter_json_items(spec_file, 'endpoints'):
+                key = endpoint_key(ep)
+                if ep.get('parameters') and key not in self.operations:
+                    self.operations[key] = OperationValidator(ep['parameters'])
+
+    def validate(self, method, endpoint, body=None):
+        """실제 요청(쿼리 문자열 포함 경로)을 검사해서 (작업, 오류 목록) 반환
+
+        문서에 없는 경로면 작업은 None, 오류는 빈 목록 (막지 않음)
+        """
+        operation = self.trie.resolve(method, endpoint)
+        if operation is None:
+            return None, []
+        validator = self.operations.get((operation['method'], operation['template']))
+        if validator is None:
+            return operation, []
+
+        query = dict(parse_qsl(endpoint.partition('?')[2], keep_blank_values=True))
+        return operation, validator.validate(operation['params'], query, body)
+
+
+def get_validators():
+    """기본 스펙 파일 기준 검증기 (처음 호출할 때 한 번 생성)"""
+    global _default_validators
+    if _default_validators is None:
+        with _load_lock:
+            if _default_validators is None:
+                _default_validators = RequestValidators()
+    return _default_validators
+
+
+def validate_request(method, endpoint, body=None):
+    return get_validators().validate(method, endpoint, body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='요청 파라미터 검사')
+    parser.add_argument('method', nargs='?', default='GET', help='HTTP 메서드')
+    parser.add_argument('endpoint', nargs='?', default='/api/v2/admin/categories/abc/products',
+                        help='경로 (쿼리 문자열 포함)')
+    parser.add_argument('--bench', action='store_true', help='요청당 검사 시간 측정')
+    parser.add_argument('--iterations', type=int, default=100000, help='--bench 반복 횟수')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    validators = get_validators()
+    print(f"✓ 검증기 생성: 검사 대상 작업 {len(validators.operations)}개 / 문서화된 작업 {len(validators.trie.operations)}개 "
+          f"({(time.perf_counter() - started) * 1000:.1f}ms)")
+
+    operation, errors = validators.validate(args.method.upper(), args.endpoint)
+    if operation is None:
+        print(f"\n  {args.method.upper()} {args.endpoint}: 문서화된 작업 없음 (검사 안 함)")
+    elif not errors:
+        print(f"\n  ✓ {args.method.upper()} {args.endpoint}: 통과 ({operation['template']})")
+    else:
+        print(f"\n  ❌ {args.method.upper()} {args.endpoint}: 오류 {len(errors)}개 ({operation['template']})")
+        for error in errors:
+            print(f"    - {error['in']}.{error['field']}: {error['message']}")
+
+    if args.bench:
+        samples = [
+            ('GET', '/api/v2/admin/categories/12/products?limit=10'),
+            ('GET', '/api/v2/admin/categories/abc/products'),
+            ('GET', '/api/v2/admin/products?brand_code=B0000001'),
+            ('DELETE', '/api/v2/admin/categories/12/products/34'),
+            ('GET', '/api/v2/admin/unknown/path'),
+        ]
+        print(f"\n⏱  요청당 검사 시간 ({args.iterations:,}회 평균, 경로 → 작업 찾기 포함)")
+        for method, endpoint in samples:
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                validators.validate(method, endpoint)
+            took = (time.perf_counter() - started) / args.iterations * 1_000_000
+            print(f"    - {method:6} {endpoint}: {took:.2f}µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+"""
+Cafe24 API 경로 트라이
+cafe24-openapi.json 의 경로를 세그먼트 단위 트라이로 컴파일해서
+실제 URL (예: /api/v2/admin/products/123/variants/P000ABC)이 어떤 문서화된 작업인지 찾음
+
+- 고정 세그먼트를 {param} 보다 우선 (/products/count 는 /products/{product_no} 가 아님)
+- 고정 세그먼트 쪽이 끝까지 맞지 않을 때만 {param} 쪽으로 되돌아감
+- 결과: 작업(method + 경로 템플릿), 태그, 카테고리, 필요한 scope, 경로 파라미터 값
+- 컴파일 결과는 .cache/route-trie.json 에 저장, 스펙 파일이 바뀌면 다시 컴파일
+
+사용법:
+    python route_trie.py /api/v2/admin/products/123/variants/P000ABC
+    python route_trie.py /api/v2/admin/products/count --method GET
+    python route_trie.py --rebuild
+"""
+import os
+import json
+import time
+import argparse
+import threading
+
+OPENAPI_FILE = 'docs/cafe24/cafe24-openapi.json'
+TRIE_FILE = '.cache/route-trie.json'
+TRIE_VERSION = 1
+
+# 노드: {'/': {고정 세그먼트: 노드}, '*': {param} 노드, '$': {METHOD: 작업 번호}}
+# ({param} 이름은 작업마다 다를 수 있어 트라이에 두지 않고 작업의 경로 템플릿에서 읽음)
+LITERAL = '/'
+PARAM = '*'
+OPERATIONS = '$'
+
+# 카테고리 -> Cafe24 권한 그룹 (mall.read_<그룹> / mall.write_<그룹>)
+SCOPE_GROUPS = {
+    'application': ['apps', 'appstore', 'scripttags', 'webhooks', 'recipes', 'databridge'],
+    'category': ['categories', 'mains', 'autodisplay'],
+    'product': ['products', 'productsdetail', 'bundleproducts', 'icons', 'images', 'restocknotification'],
+    'collection': ['brands', 'classifications', 'manufacturers', 'origin', 'trends'],
+    'supply': ['suppliers'],
+    'personal': ['carts', 'personal'],
+    'order': ['orders', 'orderform', 'cancellation', 'cancellationrequests', 'exchange', 'exchangerequests',
+              'return', 'returnrequests', 'refunds', 'shipments', 'fulfillments', 'labels', 'collectrequests',
+              'unpaidorders', 'reservations', 'control', 'cashreceipt', 'payments', 'subscription'],
+    'community': ['boards', 'commenttemplates', 'urgentinquiry'],
+    'customer': ['customers', 'customergroups', 'dormantaccount', 'socials'],
+    'notification': ['automails', 'automessages', 'sms', 'kakaoalimtalk', 'recipientgroups'],
+    'store': ['shops', 'store', 'users', 'currency', 'policy', 'information', 'menus', 'mobile', 'seo',
+              'redirects', 'activitylogs', 'dashboard', 'paymentgateway', 'paymentmethods', 'payment',
+              'kakaopay', 'naverpay', 'translations', 'shippingmanager', 'taxmanager'],
+    'promotion': ['benefits', 'coupons', 'serialcoupons', 'discountcodes', 'commonevents', 'customerevents'],
+    'design': ['themes'],
+    'mileage': ['points', 'credits'],
+    'shipping': ['carriers', 'shipping', 'shippingorigins', 'regionalsurcharges'],
+    'salesreport': ['reports', 'financials'],
+    'privacy': ['privacy', 'customersprivacy'],
+}
+CATEGORY_SCOPES = {category: group for group, categories in SCOPE_GROUPS.items() for category in categories}
+
+_load_lock = threading.Lock()
+_default_trie = None
+
+
+def split_path(path):
+    """쿼리 문자열과 앞뒤 '/'를 뗀 세그먼트 목록"""
+    path = path.split('?', 1)[0].strip('/')
+    return path.split('/') if path else []
+
+
+def required_scope(method, category):
+    group = CATEGORY_SCOPES.get(category)
+    if not group:
+        return None
+    return f"mall.{'read' if method == 'GET' else 'write'}_{group}"
+
+
+def _is_example(path):
+    """문서 예시로 들어간 경로 (쿼리 문자열이나 실제 값이 박힌 경로)는 제외"""
+    return '?' in path or any(segment.isdigit() for segment in split_path(path))
+
+
+def _tag(operation, category):
+    """스펙 태그 (예시 경로에서 잘못 뽑힌 '{product_no}' 같은 태그면 카테고리 이름)"""
+    tags = operation.get('tags') or []
+    if tags and str(tags[0]).isalpha():
+        return tags[0]
+    return category.capitalize()
+
+
+def compile_spec(spec):
+    """OpenAPI 스펙을 트라이로 컴파일 ({'root': 노드, 'operations': [...]})"""
+    from verify_and_categorize import get_category
+
+    root = {}
+    operations = []
+    for path, methods in spec.get('paths', {}).items():
+        if _is_example(path):
+            continue
+        api_type = 'admin' if path.startswith('/api/v2/admin/') else 'front'
+        category = get_category(path, api_type)
+
+        node = root
+        for segment in split_path(path):
+            if segment.startswith('{') and segment.endswith('}'):
+                node = node.setdefault(PARAM, {})
+            else:
+                node = node.setdefault(LITERAL, {}).setdefault(segment, {})
+
+        for method, operation in methods.items():
+            method = method.upper()
+            if method in node.get(OPERATIONS, {}):
+                continue
+            node.setdefault(OPERATIONS, {})[method] = len(operations)
+            operations.append({
+                'method': method,
+                'template': path,
+                'summary': operation.get('summary', ''),
+                'tag': _tag(operation, category),
+                'api_type': api_type,
+                'category': category,
+                'scope': required_scope(method, category)
+            })
+
+    return {'root': root, 'operations': operations}
+
+
+class RouteTrie:
+    def __init__(self, compiled):
+        self.root = compiled['root']
+        self.operations = compiled['operations']
+
+    @classmethod
+    def from_spec_file(cls, spec_file=OPENAPI_FILE):
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            return cls(compile_spec(json.load(f)))
+
+    def _match(self, node, segments, index):
+        if index == len(segments):
+            return node if OPERATIONS in node else None
+
+        literal = node.get(LITERAL, {}).get(segments[index])
+        if literal is not None:
+            found = self._match(literal, segments, index + 1)
+            if found is not None:
+                return found
+
+        param = node.get(PARAM)
+        if param is not None and segments[index]:
+            return self._match(param, segments, index + 1)
+        return None
+
+    def match(self, path):
+        """경로에 맞는 {METHOD: 작업}, 문서화된 경로가 아니면 None"""
+        node = self._match(self.root, split_path(path), 0)
+        if node is None:
+            return None
+        return {method: self.operations[index] for method, index in node[OPERATIONS].items()}
+
+    def resolve(self, method, path):
+        """method + 실제 경로에 해당하는 작업과 경로 파라미터 값 (없으면 None)"""
+        segments = split_path(path)
+        node = self._match(self.root, segments, 0)
+        if node is None:
+            return None
+        index = node[OPERATIONS].get(method.upper())
+        if index is None:
+            return None
+
+        operation = self.operations[index]
+        params = {
+            name[1:-1]: value
+            for name, value in zip(split_path(operation['template']), segments)
+            if name.startswith('{')
+        }
+        return dict(operation, params=params)
+
+
+def _source_stamp(spec_file):
+    stat = os.stat(spec_file)
+    return [TRIE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+
+def build_trie(spec_file=OPENAPI_FILE, trie_file=TRIE_FILE):
+    """스펙을 컴파일해서 저장 (임시 파일에 쓴 뒤 교체)"""
+    stamp = _source_stamp(spec_file)
+    trie = RouteTrie.from_spec_file(spec_file)
+
+    os.makedirs(os.path.dirname(trie_file) or '.', exist_ok=True)
+    tmp_path = f"{trie_file}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'source': stamp, 'root': trie.root, 'operations': trie.operations},
+                  f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, trie_file)
+    return trie
+
+
+def load_trie(spec_file=OPENAPI_FILE, trie_file=TRIE_FILE):
+    """저장된 트라이 로드 (없거나 스펙 파일이 바뀌었으면 다시 컴파일)"""
+    try:
+        with open(trie_file, 'r', encoding='utf-8') as f:
+            compiled = json.load(f)
+        if compiled.get('source') == _source_stamp(spec_file):
+            return RouteTrie(compiled)
+    except (OSError, ValueError):
+        pass
+    return build_trie(spec_file, trie_file)
+
+
+def resolve(method, path):
+    """기본 스펙 파일 기준으로 작업 찾기 (트라이는 처음 호출할 때 한 번 로드)"""
+    global _default_trie
+    if _default_trie is None:
+        with _load_lock:
+            if _default_trie is None:
+                _default_trie = load_trie()
+    return _default_trie.resolve(method, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cafe24 API 경로 -> 작업 찾기')
+    parser.add_argument('paths', nargs='*', help='찾을 경로')
+    parser.add_argument('--method', default='GET', help='HTTP 메서드')
+    parser.add_argument('--spec', default=OPENAPI_FILE, help='OpenAPI 스펙 파일')
+    parser.add_argument('--trie', default=TRIE_FILE, help='컴파일된 트라이 파일')
+    parser.add_argument('--rebuild', action='store_true', help='트라이 다시 컴파일')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    trie = build_trie(args.spec, args.trie) if args.rebuild else load_trie(args.spec, args.trie)
+    print(f"✓ 트라이 로드: 작업 {len(trie.operations)}개 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+
+    for path in args.paths:
+        started = time.perf_counter()
+        route = trie.resolve(args.method, path)
+        took = (time.perf_counter() - started) * 1_000_000
+        if route is None:
+            methods = trie.match(path)
+            allowed = f" (가능한 메서드: {', '.join(sorted(methods))})" if methods else ''
+            print(f"\n  ❌ {args.method.upper()} {path}: 문서화된 작업 없음{allowed}")
+            continue
+        print(f"\n  {route['method']} {path}  ({took:.1f}µs)")
+        print(f"    - 작업: {route['method']} {route['template']}  {route['summary']}")
+        print(f"    - 태그: {route['tag']}, 카테고리: {route['api_type']}/{route['category']}")
+        print(f"    - scope: {route['scope'] or '-'}")
+        if route['params']:
+            print(f"    - 파라미터: {route['params']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,31 +3,178 @@ Cafe24 API Documentation Scraper - OpenRouter Vision Edition
 GPT-4o Vision을 사용하여 Cafe24 문서를 스크린샷으로 분석하고 OpenAPI 스펙 생성
 """
 import asyncio
+import argparse
 import json
-import base64
 import os
+import sys
+import time
+import tempfile
+from contextlib import asynccontextmanager
 from datetime import datetime
 from playwright.async_api import async_playwright
-from openai import OpenAI
+from json_stream import iter_json_items
+from vision_cache import VisionCache, DEFAULT_CACHE_DIR
+from dom_extractor import extract_sections
+from endpoint_index import EndpointIndex
+from vision_budget import UsageBudget, BatchSizer, DEFAULT_INPUT_PRICE, DEFAULT_OUTPUT_PRICE
+from scrape_manifest import RunManifest, DEFAULT_MANIFEST_FILE, tile_digest
+from vision_analyzers import (OpenRouterAnalyzer, RecordingAnalyzer, ReplayAnalyzer, StubAnalyzer,
+                              DEFAULT_RECORD_DIR)
+
+VISION_MODEL = "openai/gpt-4o"  # GPT-4o: 빠르고 저렴
+VIEWPORT = {'width': 1920, 'height': 1080}
+DOM_TILE_MAX_HEIGHT = 2000  # DOM 모드에서 Vision으로 넘기는 섹션 캡처의 최대 높이
+OUTPUT_TOKENS_PER_TILE = 2000  # 타일 하나당 max_tokens
+MAX_OUTPUT_TOKENS = 16000  # 요청 하나의 max_tokens 상한 (GPT-4o 출력 한도 안)
+USAGE_REPORT_FILE = 'docs/cafe24/specs/vision-usage.json'
+# 조각 병합 시 값이 충돌하면 신뢰도가 높은 쪽 사용 (응답에 confidence가 있으면 그 값 우선)
+DOM_CONFIDENCE = 1.0
+VISION_CONFIDENCE = 0.6
+
+# Vision API 프롬프트
+EXTRACTION_PROMPT = """You are analyzing a Cafe24 API documentation page screenshot.
+
+Extract ALL API endpoints visible in this screenshot with the following information:
+
+1. HTTP Method (GET, POST, PUT, DELETE, etc.)
+2. API Path (e.g., /api/v2/admin/products)
+3. Endpoint Title/Summary
+4. Brief Description (if visible)
+5. Request Parameters (name, type, required/optional, description)
+6. Response Fields (name, type, description)
+
+Return ONLY valid JSON in this exact format:
+{
+  "endpoints": [
+    {
+      "method": "GET",
+      "path": "/api/v2/admin/products",
+      "summary": "상품 목록 조회",
+      "description": "쇼핑몰의 상품 목록을 조회합니다",
+      "parameters": [
+        {
+          "name": "shop_no",
+          "in": "query",
+          "type": "integer",
+          "required": false,
+          "description": "쇼핑몰 번호"
+        }
+      ],
+      "responses": {
+        "200": {
+          "description": "성공",
+          "schema": {
+            "type": "object",
+            "properties": {
+              "products": {
+                "type": "array",
+                "description": "상품 배열"
+              }
+            }
+          }
+        }
+      }
+    }
+  ]
+}
+
+If no API endpoints are visible in this screenshot, return: {"endpoints": []}
+
+IMPORTANT:
+- Extract ALL visible endpoints, not just one
+- Include Korean descriptions if present
+- Be accurate with HTTP methods and paths
+- If parameter/response details are not clearly visible, omit them rather than guessing
+"""
+
+# 여러 타일을 한 요청으로 보낼 때 EXTRACTION_PROMPT 앞에 붙이는 설명
+BATCH_PROMPT_HEADER = """The {count} images below are consecutive screenshots of the same documentation page, in order from top to bottom.
+Adjacent images overlap vertically, so an endpoint or a parameter table may continue from one image into the next.
+Treat them as one continuous page and return a single combined result. Wherever this prompt says "this screenshot", read it as all of the images together.
+
+"""
+
+# DOM 모드에서 해석하지 못한 섹션만 잘라 보낼 때의 설명 (이어진 화면이 아님)
+SECTION_BATCH_PROMPT_HEADER = """The {count} images below are crops of separate sections of the same documentation page, in page order.
+They do not overlap and are not contiguous: content between them has been left out, so do not join an endpoint or a table across images.
+The only exception is a tall section split into consecutive crops, where a parameter table may continue directly into the next image.
+Return a single combined result covering all of the images. Wherever this prompt says "this screenshot", read it as all of the images together.
+
+"""
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (초당 rate회, 최대 burst회 연속 허용)"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class VisionAPIScraper:
-    def __init__(self):
+    def __init__(self, max_concurrency=4, requests_per_second=2.0, cache=None, mode='vision',
+                 capture_mode='fullpage', tile_height=1080, tile_overlap=100, preprocessor=None,
+                 batch_size=1, usage=None, manifest=None, offline=False, analyzer=None, force=False,
+                 output_dir='docs/cafe24'):
         self.admin_url = "https://developers.cafe24.com/docs/api/admin/"
         self.front_url = "https://developers.cafe24.com/docs/api/front/"
 
-        # OpenRouter API 설정
-        api_key = os.getenv('OPENROUTER_API_KEY')
-        if not api_key:
-            raise ValueError("OPENROUTER_API_KEY 환경변수를 설정해주세요")
-
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-            default_headers={
-                "HTTP-Referer": "http://localhost:5001",
-                "X-Title": "Cafe24 API Scraper"
-            }
-        )
+        # 분석 백엔드 (vision_analyzers, 기본은 OpenRouter)
+        # offline이면 매니페스트에서 스펙만 다시 만들므로 필요 없음
+        self.analyzer = analyzer
+        if self.analyzer is None and not offline:
+            self.analyzer = OpenRouterAnalyzer(VISION_MODEL)
+
+        # 동시 분석 수 제한 + 초당 요청 수 제한
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(requests_per_second, burst=max_concurrency)
+
+        # 분석 결과 캐시 (None이면 사용 안 함)
+        self.cache = cache
+
+        # 추출 모드: dom (DOM 우선, Vision은 보조) / vision (전체 스크린샷 분석)
+        self.mode = mode
+
+        # 캡처 방식: fullpage (전체 페이지 좌표로 타일 영역 캡처) / scroll (스크롤하며 캡처)
+        if tile_overlap >= tile_height:
+            raise ValueError("타일 겹침은 타일 높이보다 작아야 합니다")
+        self.capture_mode = capture_mode
+        self.tile_height = tile_height
+        self.tile_overlap = tile_overlap
+
+        # 분석 전 이미지 전처리 (image_preprocess.ImagePreprocessor, None이면 원본 전송)
+        self.preprocessor = preprocessor
+
+        # 요청당 최대 타일 수 (1이면 타일마다 요청) + 토큰/비용 예산과 사용량 기록
+        # 배치 경계는 항상 batch_size 개씩 (캐시 키가 실행마다 같도록), BatchSizer는 배치를 반씩 나눌지만 정함
+        self.batch_size = max(1, batch_size)
+        self.batch_sizer = BatchSizer(batch_size, MAX_OUTPUT_TOKENS) if batch_size > 1 else None
+        self.usage = usage or UsageBudget()
+
+        # 실행 매니페스트 (scrape_manifest.RunManifest, None이면 기록하지 않음)
+        self.manifest = manifest
+        self.incomplete = set()  # 분석이 실패했거나 건너뛴 타일이 있는 API 종류
+
+        # 스펙 파일 출력 위치 + 기존 스펙을 빈 결과로 덮어쓰는 것 허용 여부 (--force)
+        self.output_dir = output_dir
+        self.force = force
+
+        # run()에서 띄운 공유 브라우저 (없으면 페이지마다 직접 실행)
+        self.browser = None
 
         self.openapi_spec = {
             "openapi": "3.0.0",
@@ -71,177 +218,363 @@ class VisionAPIScraper:
         }
 
         os.makedirs('docs/cafe24/screenshots', exist_ok=True)
-        os.makedirs('docs/cafe24/specs', exist_ok=True)
+        os.makedirs(os.path.join(output_dir, 'specs'), exist_ok=True)
+
+    def load_tile(self, screenshot):
+        """타일 이미지 바이트 (메모리에 없으면 디스크에서 필요할 때 읽음)"""
+        if screenshot.get('bytes') is not None:
+            return screenshot['bytes']
+        with open(screenshot['path'], 'rb') as f:
+            return f.read()
+
+    @asynccontextmanager
+    async def open_page(self, url):
+        """문서 페이지 열기 (run()에서 띄운 브라우저가 있으면 별도 컨텍스트로 공유)"""
+        if self.browser:
+            context = await self.browser.new_context(viewport=VIEWPORT)
+            try:
+                page = await context.new_page()
+                await page.goto(url, wait_until='networkidle', timeout=60000)
+                yield page
+            finally:
+                await context.close()
+        else:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                try:
+                    page = await browser.new_page(viewport=VIEWPORT)
+                    await page.goto(url, wait_until='networkidle', timeout=60000)
+                    yield page
+                finally:
+                    await browser.close()
+
+    async def save_tile(self, api_type, index, position, image_bytes, screenshots, queue):
+        """타일 저장 후 목록/큐에 추가"""
+        screenshot_path = f"docs/cafe24/screenshots/{api_type}_{index:03d}.png"
+        with open(screenshot_path, 'wb') as f:
+            f.write(image_bytes)
+
+        tile = {
+            'index': index,
+            'position': position,
+            'path': screenshot_path,
+            'sha256': tile_digest(image_bytes)
+        }
+        screenshots.append(tile)
+        if self.manifest:
+            self.manifest.record_capture(api_type, tile)
+
+        if self.manifest and self.manifest.find_analysis(api_type, tile['sha256']):
+            # 이전 실행에서 같은 이미지를 이미 분석함
+            print(f"  ✓ 스크린샷 {index + 1} 저장: {screenshot_path} (분석 결과 재사용)")
+            return
+        if queue is not None:
+            await queue.put(tile)
 
-    def encode_image_base64(self, image_bytes):
-        """이미지를 base64로 인코딩"""
-        return base64.b64encode(image_bytes).decode('utf-8')
+        print(f"  ✓ 스크린샷 {index + 1} 저장: {screenshot_path}")
 
-    async def capture_screenshots(self, url, api_type):
-        """페이지를 스크롤하며 섹션별로 스크린샷 캡처"""
+    async def capture_screenshots(self, url, api_type, queue=None):
+        """페이지를 섹션별 스크린샷 타일로 캡처
+
+        queue가 주어지면 타일을 저장하는 즉시 경로를 넣어 분석과 동시에 진행
+        (이미지 바이트는 메모리에 보관하지 않음)
+        """
         print(f"\n{'='*60}")
         print(f"📸 {api_type} API 스크린샷 캡처 시작: {url}")
         print(f"{'='*60}")
 
         screenshots = []
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page(viewport={'width': 1920, 'height': 1080})
+        if self.capture_mode == 'saved':
+            await self.load_saved_screenshots(api_type, screenshots, queue)
+            print(f"\n  ✅ 총 {len(screenshots)}개 스크린샷 로드 완료")
+            return screenshots
 
-            print("  → 페이지 로딩 중...")
-            await page.goto(url, wait_until='networkidle', timeout=60000)
+        print("  → 페이지 로딩 중...")
+        async with self.open_page(url) as page:
             print("  ✓ 페이지 로드 완료")
 
-            # 전체 페이지 높이 가져오기
-            total_height = await page.evaluate('document.documentElement.scrollHeight')
-            viewport_height = 1080
-
-            print(f"  → 전체 페이지 높이: {total_height}px")
-            print(f"  → 뷰포트 높이: {viewport_height}px")
+            if self.capture_mode == 'fullpage':
+                await self.capture_full_page(page, api_type, screenshots, queue)
+            else:
+                await self.capture_by_scrolling(page, api_type, screenshots, queue)
 
-            # 섹션별로 스크린샷 캡처 (겹치는 부분 포함)
-            current_position = 0
-            screenshot_index = 0
-            overlap = 100  # 100px 겹침으로 연속성 확보
-
-            while current_position < total_height:
-                # 스크롤
-                await page.evaluate(f'window.scrollTo(0, {current_position})')
-                await page.wait_for_timeout(1000)  # 렌더링 대기
-
-                # 스크린샷 캡처
-                screenshot_bytes = await page.screenshot(type='png')
-                screenshot_path = f"docs/cafe24/screenshots/{api_type}_{screenshot_index:03d}.png"
-
-                with open(screenshot_path, 'wb') as f:
-                    f.write(screenshot_bytes)
-
-                screenshots.append({
-                    'index': screenshot_index,
-                    'position': current_position,
-                    'bytes': screenshot_bytes,
-                    'path': screenshot_path
-                })
-
-                print(f"  ✓ 스크린샷 {screenshot_index + 1} 저장: {screenshot_path}")
-
-                screenshot_index += 1
-                current_position += (viewport_height - overlap)
-
-            print(f"\n  ✅ 총 {len(screenshots)}개 스크린샷 캡처 완료")
-
-            await browser.close()
+        print(f"\n  ✅ 총 {len(screenshots)}개 스크린샷 캡처 완료")
 
         return screenshots
 
-    async def analyze_screenshot_with_vision(self, screenshot, api_type, index, total):
-        """GPT-4o Vision으로 스크린샷 분석"""
-        print(f"\n  🤖 Vision AI 분석 중... ({index + 1}/{total})")
-
-        # Base64 인코딩
-        base64_image = self.encode_image_base64(screenshot['bytes'])
-
-        # Vision API 프롬프트
-        prompt = f"""You are analyzing a Cafe24 API documentation page screenshot.
-
-Extract ALL API endpoints visible in this screenshot with the following information:
-
-1. HTTP Method (GET, POST, PUT, DELETE, etc.)
-2. API Path (e.g., /api/v2/admin/products)
-3. Endpoint Title/Summary
-4. Brief Description (if visible)
-5. Request Parameters (name, type, required/optional, description)
-6. Response Fields (name, type, description)
-
-Return ONLY valid JSON in this exact format:
-{{
-  "endpoints": [
-    {{
-      "method": "GET",
-      "path": "/api/v2/admin/products",
-      "summary": "상품 목록 조회",
-      "description": "쇼핑몰의 상품 목록을 조회합니다",
-      "parameters": [
-        {{
-          "name": "shop_no",
-          "in": "query",
-          "type": "integer",
-          "required": false,
-          "description": "쇼핑몰 번호"
-        }}
-      ],
-      "responses": {{
-        "200": {{
-          "description": "성공",
-          "schema": {{
-            "type": "object",
-            "properties": {{
-              "products": {{
-                "type": "array",
-                "description": "상품 배열"
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-  ]
-}}
-
-If no API endpoints are visible in this screenshot, return: {{"endpoints": []}}
+    async def load_saved_screenshots(self, api_type, screenshots, queue):
+        """브라우저 없이 이전에 저장한 타일을 다시 사용 (docs/cafe24/screenshots/{api_type}_NNN.png)"""
+        directory = 'docs/cafe24/screenshots'
+        names = sorted(name for name in os.listdir(directory)
+                       if name.startswith(f"{api_type}_") and name[len(api_type) + 1:-4].isdigit()
+                       and name.endswith('.png'))
+        for index, name in enumerate(names):
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                digest = tile_digest(f.read())
+            tile = {'index': index, 'position': None, 'path': path, 'sha256': digest}
+            screenshots.append(tile)
+            if self.manifest:
+                self.manifest.record_capture(api_type, tile)
+                if self.manifest.find_analysis(api_type, digest):
+                    continue
+            if queue is not None:
+                await queue.put(tile)
+
+    async def wait_for_stable_layout(self, page, interval=250, stable_checks=3, timeout=10000):
+        """페이지 높이가 연속으로 변하지 않을 때까지 대기"""
+        last_height = None
+        stable = 0
+        waited = 0
+        while stable < stable_checks and waited < timeout:
+            height = await page.evaluate('document.documentElement.scrollHeight')
+            stable = stable + 1 if height == last_height else 0
+            last_height = height
+            await page.wait_for_timeout(interval)
+            waited += interval
+        return last_height
+
+    async def capture_full_page(self, page, api_type, screenshots, queue):
+        """전체 페이지 좌표에서 겹치는 타일 영역만 하나씩 캡처 (스크롤 없음)
+
+        페이지 전체를 이미지 하나로 만들지 않으므로 긴 문서도 메모리는 타일 하나 크기만 사용
+        """
+        total_height = await self.wait_for_stable_layout(page)
+        width = await page.evaluate('document.documentElement.scrollWidth') or VIEWPORT['width']
+        print(f"  → 전체 페이지 높이: {total_height}px")
+        print(f"  → 타일 높이: {self.tile_height}px (겹침 {self.tile_overlap}px)")
+
+        step = self.tile_height - self.tile_overlap
+        for index, top in enumerate(range(0, total_height, step)):
+            clip = {'x': 0, 'y': top, 'width': width, 'height': min(self.tile_height, total_height - top)}
+            tile_bytes = await page.screenshot(full_page=True, clip=clip, type='png')
+            await self.save_tile(api_type, index, top, tile_bytes, screenshots, queue)
+
+            if top + self.tile_height >= total_height:
+                break
+
+    async def capture_by_scrolling(self, page, api_type, screenshots, queue):
+        """페이지를 스크롤하며 뷰포트 단위로 캡처"""
+        # 전체 페이지 높이 가져오기
+        total_height = await page.evaluate('document.documentElement.scrollHeight')
+        viewport_height = VIEWPORT['height']
+
+        print(f"  → 전체 페이지 높이: {total_height}px")
+        print(f"  → 뷰포트 높이: {viewport_height}px")
+
+        # 섹션별로 스크린샷 캡처 (겹치는 부분 포함)
+        current_position = 0
+        screenshot_index = 0
+        overlap = self.tile_overlap  # 겹침으로 연속성 확보
+
+        while current_position < total_height:
+            # 스크롤
+            await page.evaluate(f'window.scrollTo(0, {current_position})')
+            await page.wait_for_timeout(1000)  # 렌더링 대기
+
+            # 스크린샷 캡처
+            screenshot_bytes = await page.screenshot(type='png')
+            await self.save_tile(api_type, screenshot_index, current_position, screenshot_bytes, screenshots, queue)
+
+            screenshot_index += 1
+            current_position += (viewport_height - overlap)
+
+    def build_prompt(self, count, sections=False):
+        """타일 수에 맞는 프롬프트 (여러 장이면 설명을 한 번만 앞에 붙임)
+
+        sections: DOM 섹션을 잘라낸 타일 (겹치는 연속 화면이 아니므로 다른 설명을 붙임)
+        """
+        if count == 1:
+            return EXTRACTION_PROMPT
+        header = SECTION_BATCH_PROMPT_HEADER if sections else BATCH_PROMPT_HEADER
+        return header.format(count=count) + EXTRACTION_PROMPT
+
+    def next_batch_size(self):
+        """다음 요청에 묶을 타일 수 (예산이 얼마 남지 않으면 최대로 묶음)"""
+        if not self.batch_sizer:
+            return 1
+        return self.batch_sizer.next_size(degrade=self.usage.degraded())
+
+    @staticmethod
+    def parse_vision_content(content):
+        """응답 본문에서 JSON 추출 (마크다운 코드 블록 제거)"""
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0].strip()
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0].strip()
+        return json.loads(content)
+
+    async def analyze_batch(self, tiles, api_type, total=None):
+        """연속된 타일들을 요청 하나로 분석 (프롬프트는 한 번만 전송)
+
+        BatchSizer가 고른 크기보다 크거나 출력이 max_tokens에서 잘리면 배치를 절반으로 나눠 분석
+        나눈 배치는 캐시에 표시해 두고 다음 실행에서도 같은 경계로 나눔 (조각마다 캐시 사용)
+        """
+        first, last = tiles[0]['index'] + 1, tiles[-1]['index'] + 1
+        span = f"{first}" if first == last else f"{first}-{last}"
+        progress = f"{span}/{total}" if total else span
+
+        images = []
+        for tile in tiles:
+            image_bytes = self.load_tile(tile)
+            mime_type = 'image/png'
+            if self.preprocessor:
+                processed = self.preprocessor.process(image_bytes)
+                if processed is None:
+                    continue
+                image_bytes, mime_type = processed
+            images.append((image_bytes, mime_type))
+
+        if not images:
+            print(f"\n  ⏭️  빈 타일 건너뜀 ({progress})")
+            return {"endpoints": []}
 
-IMPORTANT:
-- Extract ALL visible endpoints, not just one
-- Include Korean descriptions if present
-- Be accurate with HTTP methods and paths
-- If parameter/response details are not clearly visible, omit them rather than guessing
-"""
+        # 같은 이미지 + 프롬프트 + 모델이면 캐시 사용 (재생/가짜 분석기 결과는 캐시하지 않음)
+        prompt = self.build_prompt(len(images), sections=any('section' in tile for tile in tiles))
+        cache_key = None
+        if self.cache and self.analyzer.recorded:
+            if len(images) == 1:
+                key_bytes = images[0][0]
+            else:
+                key_bytes = b''.join(len(data).to_bytes(8, 'big') + data for data, _ in images)
+            cache_key = VisionCache.make_key(key_bytes, prompt, self.analyzer.model)
+            cached = self.cache.get(cache_key)
+            if cached is not None and cached.get('split'):
+                return await self.analyze_split(tiles, api_type, total)
+            if cached is not None:
+                self.usage.record_cache_hit()
+                print(f"\n  💾 캐시 사용 ({progress}): {len(cached.get('endpoints', []))}개 엔드포인트")
+                return cached
+
+        if len(images) > 1 and len(images) > self.next_batch_size():
+            if cache_key:
+                self.cache.put(cache_key, {'split': True})
+            return await self.analyze_split(tiles, api_type, total)
+
+        if self.usage.exhausted():
+            self.usage.skip(api_type, tiles)
+            print(f"\n  ⛔ 예산 소진으로 분석 생략 ({progress})")
+            return {"endpoints": [], "skipped": True}
+
+        print(f"\n  🤖 Vision AI 분석 중... ({progress}, 이미지 {len(images)}장)")
 
         try:
-            response = self.client.chat.completions.create(
-                model="openai/gpt-4o",  # GPT-4o: 빠르고 저렴
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{base64_image}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=2000,
-                temperature=0  # 정확성을 위해 0으로 설정
+            await self.rate_limiter.acquire()
+            response = await self.analyzer.complete(
+                prompt, images, min(MAX_OUTPUT_TOKENS, OUTPUT_TOKENS_PER_TILE * len(images))
             )
+        except Exception as e:
+            print(f"  ❌ 분석 실패: {e}")
+            return {"endpoints": [], "error": str(e)}
 
-            # 응답 파싱
-            content = response.choices[0].message.content
-
-            # JSON 추출 (마크다운 코드 블록 제거)
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(content)
-
-            endpoints_count = len(result.get('endpoints', []))
-            print(f"  ✅ {endpoints_count}개 엔드포인트 발견")
+        # 토큰 사용량 기록
+        prompt_tokens, completion_tokens = response['prompt_tokens'], response['completion_tokens']
+        finish_reason = response['finish_reason']
+        self.usage.record(api_type, [tile['index'] for tile in tiles],
+                          prompt_tokens, completion_tokens, finish_reason)
+        print(f"  💰 토큰 사용: {prompt_tokens + completion_tokens} (입력: {prompt_tokens}, 출력: {completion_tokens})")
 
-            # 토큰 사용량 표시
-            usage = response.usage
-            print(f"  💰 토큰 사용: {usage.total_tokens} (입력: {usage.prompt_tokens}, 출력: {usage.completion_tokens})")
+        truncated = finish_reason == 'length'
+        if self.batch_sizer:
+            self.batch_sizer.observe(len(images), completion_tokens, truncated)
 
-            return result
+        if truncated and len(tiles) > 1:
+            print(f"  ✂️  출력이 잘려 나눠서 다시 분석 ({progress})")
+            if cache_key:
+                self.cache.put(cache_key, {'split': True})
+            return await self.analyze_split(tiles, api_type, total)
 
+        try:
+            result = self.parse_vision_content(response['content'])
         except Exception as e:
             print(f"  ❌ 분석 실패: {e}")
-            return {"endpoints": []}
+            return {"endpoints": [], "error": str(e)}
+
+        endpoints_count = len(result.get('endpoints', []))
+        print(f"  ✅ {endpoints_count}개 엔드포인트 발견")
+
+        if cache_key:
+            self.cache.put(cache_key, result, {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens
+            })
+
+        return result
+
+    async def analyze_split(self, tiles, api_type, total=None):
+        """배치를 절반으로 나눠 차례로 분석한 결과를 합침"""
+        middle = len(tiles) // 2
+        head = await self.analyze_batch(tiles[:middle], api_type, total)
+        tail = await self.analyze_batch(tiles[middle:], api_type, total)
+        merged = {"endpoints": head.get('endpoints', []) + tail.get('endpoints', [])}
+        for flag in ('error', 'skipped'):
+            if flag in head or flag in tail:
+                merged[flag] = head.get(flag) or tail.get(flag)
+        return merged
+
+    def start_analysis_workers(self, queue, api_type, on_result, total=None):
+        """큐에서 연속된 타일을 배치로 꺼내 분석하는 작업자 실행 (결과마다 on_result(배치 첫 타일 번호, 결과))
+
+        작업자마다 종료 표시(None)를 하나씩 넣어야 함
+        배치는 들어온 순서대로 batch_size 개씩 끊음 (작업자 속도나 BatchSizer 상태와 관계없이 같은 경계)
+        """
+        lock = asyncio.Lock()
+
+        async def worker():
+            done = False
+            while not done:
+                # 배치가 연속된 타일이 되도록 꺼내는 동안은 한 작업자만
+                batch = []
+                async with lock:
+                    while len(batch) < self.batch_size:
+                        tile = await queue.get()
+                        if tile is None:
+                            done = True
+                            break
+                        batch.append(tile)
+                if batch:
+                    result = await self.analyze_batch(batch, api_type, total)
+                    on_result(batch[0]['index'], result)
+                    self.record_analysis(api_type, batch, result)
+
+        return [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+
+    def record_analysis(self, api_type, tiles, result):
+        """실패하거나 예산으로 건너뛴 묶음은 다음 실행에서 다시 분석하도록 기록하지 않음"""
+        if 'error' in result or 'skipped' in result:
+            self.incomplete.add(api_type)
+        elif self.manifest:
+            self.manifest.record_analysis(api_type, tiles, result.get('endpoints', []))
+
+    def reused_results(self, api_type, tiles):
+        """이전 실행의 분석 기록 중 이번 타일과 같은 이미지를 다룬 것 ({첫 타일 번호: 결과})"""
+        results = {}
+        seen = set()
+        for tile in tiles:
+            record = self.manifest.find_analysis(api_type, tile['sha256']) if self.manifest else None
+            if record is None or id(record) in seen:
+                continue
+            seen.add(id(record))
+            results[tile['index']] = {"endpoints": record['endpoints']}
+        return results
+
+    async def analyze_tiles(self, screenshots, api_type):
+        """스크린샷 병렬 분석 (동시 실행 수 제한), {묶음 첫 타일 번호: 결과} 반환"""
+        queue = asyncio.Queue()
+        for screenshot in screenshots:
+            queue.put_nowait(screenshot)
+        for _ in range(self.max_concurrency):
+            queue.put_nowait(None)
+
+        results = {}
+        await asyncio.gather(*self.start_analysis_workers(queue, api_type, results.__setitem__, len(screenshots)))
+        return results
+
+    async def analyze_screenshots(self, screenshots, api_type):
+        """스크린샷 병렬 분석 (결과는 스크린샷 순서대로, 묶어서 보낸 타일은 결과 하나)"""
+        results = await self.analyze_tiles(screenshots, api_type)
+        return [results[index] for index in sorted(results)]
 
     async def scrape_with_vision(self, url, api_type):
         """Vision API로 전체 스크래핑"""
@@ -249,44 +582,123 @@ IMPORTANT:
         print(f"🚀 {api_type} API Vision 스크래핑 시작")
         print(f"{'='*60}")
 
-        # 1. 스크린샷 캡처
-        screenshots = await self.capture_screenshots(url, api_type)
+        # 캡처(생산자)와 분석(소비자)을 큐로 연결해 동시에 진행
+        # 분석 결과는 도착하는 대로 인덱스에 병합 (겹치는 타일의 조각을 합침)
+        queue = asyncio.Queue()
+        index = EndpointIndex()
 
-        # 2. Vision API로 각 스크린샷 분석
-        all_endpoints = []
-        total_screenshots = len(screenshots)
+        def merge(position, result):
+            index.add_all(result.get('endpoints', []), VISION_CONFIDENCE, position)
 
-        for i, screenshot in enumerate(screenshots):
-            result = await self.analyze_screenshot_with_vision(
-                screenshot, api_type, i, total_screenshots
-            )
+        workers = self.start_analysis_workers(queue, api_type, merge)
 
-            endpoints = result.get('endpoints', [])
-            all_endpoints.extend(endpoints)
+        # 1. 스크린샷 캡처 (저장되는 대로 분석 시작)
+        try:
+            screenshots = await self.capture_screenshots(url, api_type, queue)
+        finally:
+            for _ in workers:
+                await queue.put(None)
 
-            # Rate limiting 방지 (초당 1-2 요청)
-            if i < total_screenshots - 1:
-                print(f"  ⏳ 1초 대기 (Rate limit 방지)...")
-                await asyncio.sleep(1)
+        # 2. 남은 분석 완료 대기
+        await asyncio.gather(*workers)
+        total_screenshots = len(screenshots)
 
-        # 중복 제거 (같은 path + method)
-        unique_endpoints = {}
-        for ep in all_endpoints:
-            key = f"{ep['method']}:{ep['path']}"
-            if key not in unique_endpoints:
-                unique_endpoints[key] = ep
+        # --resume: 이전 실행에서 분석한 타일의 결과
+        for position, result in self.reused_results(api_type, screenshots).items():
+            merge(position, result)
 
-        final_endpoints = list(unique_endpoints.values())
+        final_endpoints = index.endpoints()
 
         print(f"\n{'='*60}")
         print(f"✅ {api_type} API 스크래핑 완료")
         print(f"  - 총 스크린샷: {total_screenshots}개")
-        print(f"  - 발견된 엔드포인트: {len(all_endpoints)}개")
-        print(f"  - 중복 제거 후: {len(final_endpoints)}개")
+        print(f"  - 발견된 엔드포인트 조각: {index.fragments}개")
+        print(f"  - 병합 후: {len(final_endpoints)}개")
         print(f"{'='*60}")
 
         return final_endpoints
 
+    def dedupe_endpoints(self, endpoints):
+        """같은 method + path 조각을 하나로 병합 (순서는 처음 나온 순서)"""
+        index = EndpointIndex(default_confidence=VISION_CONFIDENCE)
+        index.add_all(endpoints)
+        return index.endpoints()
+
+    async def scrape_with_dom(self, url, api_type):
+        """DOM에서 직접 추출하고, 해석하지 못한 섹션만 Vision으로 분석"""
+        print(f"\n{'='*60}")
+        print(f"⚡ {api_type} API DOM 추출 시작: {url}")
+        print(f"{'='*60}")
+
+        tiles = []
+        async with self.open_page(url) as page:
+            endpoints, unresolved = await extract_sections(page)
+            print(f"  ✓ DOM에서 {len(endpoints)}개 엔드포인트 추출, Vision 필요 섹션 {len(unresolved)}개")
+
+            # 해석하지 못한 섹션 영역만 캡처
+            for section_index, section in enumerate(unresolved):
+                if not section.get('clip'):
+                    print(f"  ⚠️  화면에 보이지 않는 섹션은 건너뜀: {section['title'][:50]}")
+                    continue
+                clip = dict(section['clip'])
+                while clip['height'] > 0:
+                    tile_clip = dict(clip, height=min(clip['height'], DOM_TILE_MAX_HEIGHT))
+                    tile_path = f"docs/cafe24/screenshots/{api_type}_dom_{len(tiles):03d}.png"
+                    image_bytes = await page.screenshot(path=tile_path, full_page=True, clip=tile_clip)
+                    tile = {'index': len(tiles), 'position': tile_clip['y'], 'path': tile_path,
+                            'sha256': tile_digest(image_bytes), 'section': section_index}
+                    tiles.append(tile)
+                    if self.manifest:
+                        self.manifest.record_capture(api_type, tile)
+                    clip['y'] += tile_clip['height']
+                    clip['height'] -= tile_clip['height']
+
+        if not endpoints and not tiles:
+            # 문서 구조를 전혀 찾지 못한 경우 전체 Vision 스크래핑
+            print("  ⚠️  DOM에서 섹션을 찾지 못했습니다. Vision 스크래핑으로 전환")
+            return await self.scrape_with_vision(url, api_type)
+
+        if self.manifest:
+            self.manifest.record_dom(api_type, endpoints)
+
+        # DOM 결과를 먼저 넣고 Vision 결과는 낮은 신뢰도로 병합
+        index = EndpointIndex()
+        index.add_all(endpoints, DOM_CONFIDENCE, position=-1)
+
+        # --resume: 이전 실행에서 분석한 섹션은 다시 보내지 않음
+        results = self.reused_results(api_type, tiles)
+        pending = [tile for tile in tiles
+                   if not (self.manifest and self.manifest.find_analysis(api_type, tile['sha256']))]
+        results.update(await self.analyze_tiles(pending, api_type))
+        for position in sorted(results):
+            index.add_all(results[position].get('endpoints', []), VISION_CONFIDENCE, position)
+
+        final_endpoints = index.endpoints()
+
+        print(f"\n{'='*60}")
+        print(f"✅ {api_type} API DOM 추출 완료")
+        print(f"  - Vision 분석 타일: {len(tiles)}개")
+        print(f"  - 병합 후: {len(final_endpoints)}개")
+        print(f"{'='*60}")
+
+        return final_endpoints
+
+    async def scrape(self, url, api_type):
+        """설정된 모드로 스크래핑 (dom: DOM 우선 + Vision 보조, vision: 전체 Vision)"""
+        if self.manifest and api_type in self.manifest.completed:
+            endpoints = self.manifest.completed[api_type]
+            print(f"\n⏩ {api_type} API는 이전 실행에서 완료됨 ({len(endpoints)}개 엔드포인트)")
+            return endpoints
+
+        if self.mode == 'dom' and self.capture_mode != 'saved':
+            endpoints = await self.scrape_with_dom(url, api_type)
+        else:
+            endpoints = await self.scrape_with_vision(url, api_type)
+
+        if self.manifest and api_type not in self.incomplete:
+            self.manifest.record_completed(api_type, endpoints)
+        return endpoints
+
     def convert_to_openapi(self, endpoints):
         """추출된 엔드포인트를 OpenAPI 형식으로 변환"""
         for endpoint in endpoints:
@@ -330,11 +742,86 @@ IMPORTANT:
         print("🎨 Cafe24 API Vision Scraper")
         print("="*60)
 
-        # Admin API 스크래핑
-        admin_endpoints = await self.scrape_with_vision(self.admin_url, "admin")
+        if self.manifest:
+            self.manifest.record_run({
+                'mode': self.mode,
+                'capture_mode': self.capture_mode,
+                'tile_height': self.tile_height,
+                'tile_overlap': self.tile_overlap,
+                'model': self.analyzer.model,
+                'preprocess': self.preprocessor.describe() if self.preprocessor else None
+            })
+
+        # Admin / Front API 스크래핑 (브라우저 하나를 띄우고 컨텍스트를 나눠 병렬 진행)
+        if self.capture_mode == 'saved':
+            admin_endpoints, front_endpoints = await self.scrape_all()
+        else:
+            async with async_playwright() as p:
+                self.browser = await p.chromium.launch(headless=True)
+                try:
+                    admin_endpoints, front_endpoints = await self.scrape_all()
+                finally:
+                    await self.browser.close()
+                    self.browser = None
+
+        return self.save_outputs(admin_endpoints, front_endpoints)
+
+    async def scrape_all(self):
+        """(Admin 엔드포인트, Front 엔드포인트) 병렬 스크래핑"""
+        return await asyncio.gather(
+            self.scrape(self.admin_url, "admin"),
+            self.scrape(self.front_url, "front")
+        )
+
+    def rebuild_from_manifest(self):
+        """매니페스트 기록만으로 스펙 파일 다시 생성 (브라우저/네트워크 사용 안 함)
+
+        완료되지 않은 API 종류는 그때까지 분석된 타일의 결과로 만듦
+        기록이 하나도 없으면 (경로 오타, 빈 매니페스트 등) 아무 파일도 쓰지 않고 False
+        """
+        print("\n" + "="*60)
+        print(f"📒 매니페스트에서 스펙 재구성: {self.manifest.path}")
+        print("="*60)
+
+        endpoints = {}
+        for api_type in ('admin', 'front'):
+            collected = self.manifest.collect_endpoints(api_type)
+            if api_type not in self.manifest.completed:
+                collected = self.dedupe_endpoints(collected)
+                print(f"  ⚠️  {api_type}: 완료되지 않은 실행, 분석된 타일까지만 사용")
+            endpoints[api_type] = collected
+
+        if not endpoints['admin'] and not endpoints['front']:
+            print(f"\n❌ 매니페스트에 엔드포인트 기록이 없습니다: {self.manifest.path}")
+            print("   스펙 파일은 변경하지 않았습니다")
+            return False
 
-        # Front API 스크래핑
-        front_endpoints = await self.scrape_with_vision(self.front_url, "front")
+        return self.save_outputs(endpoints['admin'], endpoints['front'])
+
+    @staticmethod
+    def has_endpoints(spec_file):
+        """기존 스펙 파일에 엔드포인트가 하나라도 있는지 (첫 항목만 읽음)"""
+        try:
+            for _ in iter_json_items(spec_file, 'endpoints'):
+                return True
+        except (OSError, ValueError, KeyError):
+            pass
+        return False
+
+    def save_outputs(self, admin_endpoints, front_endpoints):
+        """OpenAPI 스펙과 API 종류별 파일 저장 (저장하지 않았으면 False)
+
+        기존 스펙에 엔드포인트가 있는데 새 결과가 비어 있으면 --force 없이는 덮어쓰지 않음
+        """
+        if not self.force:
+            emptied = [
+                api_type for api_type, endpoints in (('admin', admin_endpoints), ('front', front_endpoints))
+                if not endpoints and self.has_endpoints(os.path.join(self.output_dir, 'specs', f'{api_type}.json'))
+            ]
+            if emptied:
+                print(f"\n❌ {', '.join(emptied)} 결과가 비어 있어 기존 스펙을 덮어쓰지 않았습니다")
+                print("   빈 결과로 덮어쓰려면 --force 를 사용하세요")
+                return False
 
         # OpenAPI 스펙으로 변환
         print("\n" + "="*60)
@@ -345,18 +832,20 @@ IMPORTANT:
         self.convert_to_openapi(all_endpoints)
 
         # 저장
-        output_file = 'docs/cafe24/cafe24-openapi.json'
+        output_file = os.path.join(self.output_dir, 'cafe24-openapi.json')
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(self.openapi_spec, f, indent=2, ensure_ascii=False)
 
         # 분리된 파일로도 저장
         admin_spec = {"endpoints": admin_endpoints}
         front_spec = {"endpoints": front_endpoints}
+        admin_file = os.path.join(self.output_dir, 'specs', 'admin.json')
+        front_file = os.path.join(self.output_dir, 'specs', 'front.json')
 
-        with open('docs/cafe24/specs/admin.json', 'w', encoding='utf-8') as f:
+        with open(admin_file, 'w', encoding='utf-8') as f:
             json.dump(admin_spec, f, indent=2, ensure_ascii=False)
 
-        with open('docs/cafe24/specs/front.json', 'w', encoding='utf-8') as f:
+        with open(front_file, 'w', encoding='utf-8') as f:
             json.dump(front_spec, f, indent=2, ensure_ascii=False)
 
         # 요약
@@ -373,14 +862,123 @@ IMPORTANT:
         print(f"  - 총 API 작업: {total_operations}개")
         print(f"\n💾 생성된 파일:")
         print(f"  - {output_file} (OpenAPI 3.0 전체 스펙)")
-        print(f"  - docs/cafe24/specs/admin.json (Admin API)")
-        print(f"  - docs/cafe24/specs/front.json (Front API)")
+        print(f"  - {admin_file} (Admin API)")
+        print(f"  - {front_file} (Front API)")
         print(f"  - docs/cafe24/screenshots/ (스크린샷 {len(os.listdir('docs/cafe24/screenshots'))}개)")
         print(f"{'='*60}")
+        return True
 
 async def main():
-    scraper = VisionAPIScraper()
-    await scraper.run()
+    parser = argparse.ArgumentParser(description='Cafe24 API Vision Scraper')
+    parser.add_argument('--mode', choices=['dom', 'vision'], default='vision',
+                        help='dom: DOM에서 직접 추출하고 필요한 섹션만 Vision 분석 / vision: 전체 스크린샷 분석')
+    parser.add_argument('--capture', choices=['fullpage', 'scroll', 'saved'], default='fullpage',
+                        help='fullpage: 전체 페이지 좌표로 타일 영역만 캡처 / scroll: 스크롤하며 캡처 / '
+                             'saved: 저장된 스크린샷 재사용 (브라우저 없음, vision 모드로 동작)')
+    parser.add_argument('--analyzer', choices=['openrouter', 'replay', 'stub'], default='openrouter',
+                        help='openrouter: 실제 Vision API / replay: 녹화된 응답 재생 / stub: 가짜 응답')
+    parser.add_argument('--record', action='store_true', help='openrouter 응답을 녹화 (replay에서 사용)')
+    parser.add_argument('--record-dir', default=DEFAULT_RECORD_DIR, help='녹화 디렉토리')
+    parser.add_argument('--tile-height', type=int, default=1080, help='타일 높이 (px)')
+    parser.add_argument('--tile-overlap', type=int, default=100, help='타일 겹침 (px)')
+    parser.add_argument('--preprocess', action='store_true', help='분석 전 이미지 전처리 사용 (Pillow 필요)')
+    parser.add_argument('--crop-left', type=int, default=0, help='왼쪽에서 잘라낼 폭 (사이드바, px)')
+    parser.add_argument('--crop-right', type=int, default=0, help='오른쪽에서 잘라낼 폭 (px)')
+    parser.add_argument('--max-width', type=int, default=None, help='최대 폭 (넘으면 축소, px)')
+    parser.add_argument('--grayscale', action='store_true', help='흑백 변환')
+    parser.add_argument('--image-format', choices=['png', 'jpeg', 'webp'], default='png', help='전송 이미지 형식')
+    parser.add_argument('--quality', type=int, default=80, help='JPEG/WebP 품질')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='요청 하나에 묶을 최대 타일 수 (이 수만큼씩 고정으로 묶고 출력 길이에 따라 반씩 나눔, 1이면 타일마다 요청)')
+    parser.add_argument('--max-tokens-budget', type=int, default=None, help='실행 전체 토큰 한도')
+    parser.add_argument('--max-cost', type=float, default=None, help='실행 전체 비용 한도 (USD)')
+    parser.add_argument('--input-price', type=float, default=DEFAULT_INPUT_PRICE, help='입력 100만 토큰당 가격 (USD)')
+    parser.add_argument('--output-price', type=float, default=DEFAULT_OUTPUT_PRICE, help='출력 100만 토큰당 가격 (USD)')
+    parser.add_argument('--usage-report', default=None, help=f'사용량 보고서 파일 (기본: {USAGE_REPORT_FILE})')
+    parser.add_argument('--manifest', default=None, help=f'실행 매니페스트 파일 (NDJSON, 기본: {DEFAULT_MANIFEST_FILE})')
+    parser.add_argument('--output-dir', default=None,
+                        help='스펙 파일 출력 디렉토리 (기본: docs/cafe24, replay/stub 분석기는 임시 디렉토리)')
+    parser.add_argument('--resume', action='store_true', help='매니페스트를 이어서 완료된 캡처/분석은 건너뜀')
+    parser.add_argument('--from-manifest', action='store_true',
+                        help='스크래핑 없이 매니페스트만으로 스펙 파일 다시 생성 (네트워크 사용 안 함)')
+    parser.add_argument('--force', action='store_true', help='결과가 비어 있어도 기존 스펙 파일을 덮어씀')
+    parser.add_argument('--no-cache', action='store_true', help='Vision 결과 캐시 사용 안 함')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='캐시 디렉토리')
+    parser.add_argument('--cache-max-mb', type=int, default=200, help='캐시 최대 용량 (MB)')
+    parser.add_argument('--cache-max-age-days', type=int, default=90, help='캐시 보관 기간 (일)')
+    parser.add_argument('--cache-stats', action='store_true', help='캐시 통계만 출력하고 종료')
+    args = parser.parse_args()
+
+    # replay / stub 결과는 실제 분석이 아니므로 실제 스펙 / 매니페스트 / 보고서를 덮어쓰지 않도록
+    # 따로 지정하지 않으면 임시 디렉토리에 쓰고 Vision 캐시도 사용하지 않음
+    output_dir = args.output_dir
+    if args.analyzer in ('replay', 'stub') and not args.from_manifest:
+        output_dir = output_dir or tempfile.mkdtemp(prefix=f'cafe24-{args.analyzer}-')
+        args.no_cache = True
+        print(f"📁 {args.analyzer} 분석기: 출력 {output_dir}, Vision 캐시 사용 안 함")
+    output_dir = output_dir or 'docs/cafe24'
+    if args.manifest is None:
+        args.manifest = (DEFAULT_MANIFEST_FILE if output_dir == 'docs/cafe24'
+                         else os.path.join(output_dir, os.path.basename(DEFAULT_MANIFEST_FILE)))
+    if args.usage_report is None:
+        args.usage_report = (USAGE_REPORT_FILE if output_dir == 'docs/cafe24'
+                             else os.path.join(output_dir, 'specs', os.path.basename(USAGE_REPORT_FILE)))
+
+    if args.from_manifest:
+        scraper = VisionAPIScraper(manifest=RunManifest(args.manifest, resume=True), offline=True,
+                                   force=args.force, output_dir=output_dir)
+        if not scraper.rebuild_from_manifest():
+            sys.exit(1)
+        return
+
+    cache = None
+    if not args.no_cache:
+        cache = VisionCache(args.cache_dir, args.cache_max_mb * 1024 * 1024, args.cache_max_age_days)
+        if args.cache_stats:
+            cache.print_stats()
+            return
+
+    preprocessor = None
+    if args.preprocess:
+        from image_preprocess import ImagePreprocessor
+        preprocessor = ImagePreprocessor(
+            crop_left=args.crop_left, crop_right=args.crop_right, max_width=args.max_width,
+            grayscale=args.grayscale, image_format=args.image_format, quality=args.quality
+        )
+
+    if args.analyzer == 'replay':
+        analyzer = ReplayAnalyzer(args.record_dir)
+    elif args.analyzer == 'stub':
+        analyzer = StubAnalyzer()
+    else:
+        analyzer = OpenRouterAnalyzer(VISION_MODEL)
+        if args.record:
+            analyzer = RecordingAnalyzer(analyzer, args.record_dir)
+
+    usage = UsageBudget(max_tokens=args.max_tokens_budget, max_cost=args.max_cost,
+                        input_price=args.input_price, output_price=args.output_price)
+    scraper = VisionAPIScraper(cache=cache, mode=args.mode, capture_mode=args.capture,
+                               tile_height=args.tile_height, tile_overlap=args.tile_overlap,
+                               preprocessor=preprocessor, batch_size=args.batch_size, usage=usage,
+                               manifest=RunManifest(args.manifest, resume=args.resume), analyzer=analyzer,
+                               force=args.force, output_dir=output_dir)
+    try:
+        saved = await scraper.run()
+    finally:
+        scraper.manifest.close()
+        # 중간에 실패해도 그때까지의 사용량은 남김
+        usage.save(args.usage_report)
+        usage.print_summary()
+        print(f"  - 보고서: {args.usage_report}")
+
+    if cache:
+        removed = cache.evict()
+        cache.print_stats()
+        if removed:
+            print(f"  - 정리된 항목: {removed}개")
+
+    if not saved:
+        sys.exit(1)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,129 @@
+"""
+스크래핑 실행 매니페스트 (NDJSON, 한 줄에 이벤트 하나)
+- run: 실행 설정
+- captured: 캡처한 타일 (번호, 경로, 이미지 SHA-256)
+- analyzed: 분석한 타일 묶음과 추출된 엔드포인트
+- dom: DOM에서 직접 추출한 엔드포인트
+- completed: API 종류별 최종 엔드포인트
+
+줄마다 flush/fsync 하므로 중간에 죽어도 그때까지의 결과가 남고,
+--resume 으로 이어서 실행하거나 네트워크 없이 스펙을 다시 만들 수 있음
+"""
+import os
+import json
+import time
+import hashlib
+
+DEFAULT_MANIFEST_FILE = 'docs/cafe24/scrape-manifest.ndjson'
+
+
+def tile_digest(image_bytes):
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+class RunManifest:
+    def __init__(self, path=DEFAULT_MANIFEST_FILE, resume=False):
+        self.path = path
+        self.file = None
+        self.records = []
+        self.analyzed = {}   # (api_type, sha256) -> analyzed 레코드
+        self.completed = {}  # api_type -> 최종 엔드포인트
+        self.dom = {}        # api_type -> DOM 추출 엔드포인트 (마지막 기록)
+
+        if resume:
+            for record in self.read(path):
+                self._index(record)
+        elif os.path.exists(path):
+            # 새 실행이면 이전 매니페스트를 비움
+            open(path, 'w').close()
+
+    @staticmethod
+    def read(path):
+        """매니페스트 레코드 읽기 (죽으면서 잘린 마지막 줄은 무시)"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def _index(self, record):
+        self.records.append(record)
+        event = record['event']
+        api_type = record.get('api_type')
+        if event == 'analyzed':
+            for tile in record['tiles']:
+                self.analyzed[(api_type, tile['sha256'])] = record
+        elif event == 'completed':
+            self.completed[api_type] = record['endpoints']
+        elif event == 'dom':
+            self.dom[api_type] = record['endpoints']
+
+    def append(self, record):
+        record = dict(record, at=time.time())
+        if self.file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.file = open(self.path, 'a', encoding='utf-8')
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._index(record)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def record_run(self, settings):
+        self.append({'event': 'run', 'settings': settings})
+
+    def record_capture(self, api_type, tile):
+        self.append({
+            'event': 'captured',
+            'api_type': api_type,
+            'index': tile['index'],
+            'position': tile.get('position'),
+            'path': tile.get('path'),
+            'sha256': tile['sha256']
+        })
+
+    def record_analysis(self, api_type, tiles, endpoints):
+        self.append({
+            'event': 'analyzed',
+            'api_type': api_type,
+            'tiles': [{'index': tile['index'], 'sha256': tile['sha256']} for tile in tiles],
+            'endpoints': endpoints
+        })
+
+    def record_dom(self, api_type, endpoints):
+        self.append({'event': 'dom', 'api_type': api_type, 'endpoints': endpoints})
+
+    def record_completed(self, api_type, endpoints):
+        self.append({'event': 'completed', 'api_type': api_type, 'endpoints': endpoints})
+
+    def find_analysis(self, api_type, sha256):
+        """같은 이미지를 이미 분석한 기록 (없으면 None)"""
+        return self.analyzed.get((api_type, sha256))
+
+    def api_types(self):
+        seen = []
+        for record in self.records:
+            api_type = record.get('api_type')
+            if api_type and api_type not in seen:
+                seen.append(api_type)
+        return seen
+
+    def collect_endpoints(self, api_type):
+        """완료된 실행이면 최종 결과, 아니면 DOM 추출 + 분석 기록을 타일 순서대로 모은 목록"""
+        if api_type in self.completed:
+            return self.completed[api_type]
+
+        endpoints = list(self.dom.get(api_type, []))
+        records = {id(record): record for (kind, _), record in self.analyzed.items() if kind == api_type}
+        for record in sorted(records.values(), key=lambda r: r['tiles'][0]['index']):
+            endpoints.extend(record['endpoints'])
+        return endpoints
@@ -0,0 +1,218 @@
+"""
+스크래핑 결과 비교 (스펙 diff)
+두 번의 스크래핑 결과에서 작업(method + 경로)마다 정규화한 파라미터 / 응답의 해시를 만들고
+해시가 다른 작업만 필드 단위로 비교
+
+- 추가 / 삭제 / 변경된 작업과 변경된 필드 (예: parameters.query.brand_code.type)
+- 영향받는 카테고리와 클라이언트 모듈 (cafe24_client/{admin,front}/{category}.py) 목록
+  → 해당 부분만 다시 스크래핑 / 생성할 때 사용
+- OpenAPI 형식(cafe24-openapi.json)과 엔드포인트 목록 형식(specs/admin.json) 모두 지원
+- 이전 스펙은 메모리에 해시 + 정규화 결과로, 새 스펙은 스트리밍으로 한 번씩만 읽음
+
+사용법:
+    git show HEAD~1:docs/cafe24/cafe24-openapi.json > /tmp/old-openapi.json
+    python spec_diff.py /tmp/old-openapi.json docs/cafe24/cafe24-openapi.json
+    python spec_diff.py old/admin.json docs/cafe24/specs/admin.json --report spec-diff.json
+"""
+import json
+import hashlib
+import argparse
+from json_stream import iter_json_items
+from endpoint_index import endpoint_key
+
+IDENTITY_FIELDS = ('method', 'path', 'confidence')
+MAX_PRINTED_CHANGES = 5
+
+
+def iter_operations(spec_file):
+    """(method, path, 작업) 를 하나씩 반환 (OpenAPI 형식이면 paths, 아니면 endpoints)"""
+    try:
+        for path, methods in iter_json_items(spec_file, 'paths'):
+            for method, operation in methods.items():
+                yield method.upper(), path, operation
+    except KeyError:
+        for endpoint in iter_json_items(spec_file, 'endpoints'):
+            method, path = endpoint_key(endpoint)
+            yield method, path, endpoint
+
+
+def _normalize_value(value):
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {str(key): _normalize_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize_value(item) for item in value]
+    return value
+
+
+def normalize_operation(operation):
+    """비교용 정규화 (파라미터는 '위치.이름' 키의 객체로 바꿔 순서 차이를 무시)"""
+    normalized = {}
+    for field, value in operation.items():
+        if field in IDENTITY_FIELDS:
+            continue
+        if field == 'parameters':
+            params = {}
+            for param in value or []:
+                if isinstance(param, dict) and param.get('name'):
+                    params[f"{param.get('in', 'query')}.{param['name']}"] = {
+                        key: _normalize_value(item) for key, item in param.items() if key not in ('name', 'in')
+                    }
+            value = params
+        else:
+            value = _normalize_value(value)
+        if value not in (None, '', [], {}):
+            normalized[field] = value
+    return normalized
+
+
+def fingerprint(normalized):
+    data = json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def diff_values(old, new, prefix='', changes=None):
+    """두 값의 필드 단위 차이 [{'field', 'old', 'new'}] (객체는 키별로 재귀)"""
+    if changes is None:
+        changes = []
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            field = f"{prefix}.{key}" if prefix else key
+            if key not in new:
+                changes.append({'field': field, 'old': old[key], 'new': None})
+            elif key not in old:
+                changes.append({'field': field, 'old': None, 'new': new[key]})
+            elif old[key] != new[key]:
+                diff_values(old[key], new[key], field, changes)
+    elif old != new:
+        changes.append({'field': prefix, 'old': old, 'new': new})
+    return changes
+
+
+def _location(method, path):
+    """(api_type, 카테고리, 클라이언트 모듈 경로)"""
+    from verify_and_categorize import get_category
+    from generate_client import split_path, identifier
+
+    api_type = 'admin' if path.startswith('/api/v2/admin/') else 'front'
+    parsed = split_path(path)
+    module = f"cafe24_client/{parsed[0]}/{identifier(parsed[1])}.py" if parsed else None
+    return api_type, get_category(path, api_type), module
+
+
+def diff_specs(old_file, new_file):
+    """두 스펙 파일의 변경 보고서"""
+    # 같은 작업이 여러 번 나오면 처음 것 기준 (스크래퍼 / 변환기와 같은 규칙)
+    old_ops = {}
+    for method, path, operation in iter_operations(old_file):
+        key = (method, path)
+        if key not in old_ops:
+            normalized = normalize_operation(operation)
+            old_ops[key] = (fingerprint(normalized), normalized)
+
+    added = []
+    changed = []
+    seen = set()
+    unchanged = 0
+    for method, path, operation in iter_operations(new_file):
+        key = (method, path)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        normalized = normalize_operation(operation)
+        old = old_ops.get(key)
+        if old is None:
+            added.append({'method': method, 'path': path, 'summary': normalized.get('summary', '')})
+        elif old[0] == fingerprint(normalized):
+            unchanged += 1
+        else:
+            changes = sorted(diff_values(old[1], normalized), key=lambda change: change['field'])
+            changed.append({'method': method, 'path': path, 'summary': normalized.get('summary', ''),
+                            'changes': changes})
+
+    removed = [
+        {'method': method, 'path': path, 'summary': normalized.get('summary', '')}
+        for (method, path), (_, normalized) in old_ops.items() if (method, path) not in seen
+    ]
+
+    categories = {}
+    modules = set()
+    for kind, operations in (('added', added), ('removed', removed), ('changed', changed)):
+        for operation in operations:
+            api_type, category, module = _location(operation['method'], operation['path'])
+            operation['category'] = f"{api_type}/{category}"
+            categories.setdefault(operation['category'], {'added': 0, 'removed': 0, 'changed': 0})[kind] += 1
+            if module:
+                modules.add(module)
+
+    return {
+        'old': old_file,
+        'new': new_file,
+        'summary': {
+            'added': len(added),
+            'removed': len(removed),
+            'changed': len(changed),
+            'unchanged': unchanged
+        },
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'affected_categories': dict(sorted(categories.items())),
+        'affected_client_modules': sorted(modules)
+    }
+
+
+def _short(value):
+    text = json.dumps(value, ensure_ascii=False) if not isinstance(value, str) else value
+    return text if len(text) <= 60 else text[:57] + '...'
+
+
+def print_report(report):
+    summary = report['summary']
+    print("\n" + "="*60)
+    print(f"🔍 스펙 비교: {report['old']} → {report['new']}")
+    print("="*60)
+    print(f"\n  추가 {summary['added']}개, 삭제 {summary['removed']}개, "
+          f"변경 {summary['changed']}개, 동일 {summary['unchanged']}개")
+
+    for title, key, mark in (('추가된 작업', 'added', '+'), ('삭제된 작업', 'removed', '-')):
+        if report[key]:
+            print(f"\n📌 {title}")
+            for operation in report[key]:
+                print(f"  {mark} {operation['method']:6} {operation['path']}  {operation['summary']}")
+
+    if report['changed']:
+        print("\n📌 변경된 작업")
+        for operation in report['changed']:
+            print(f"  ~ {operation['method']:6} {operation['path']}")
+            for change in operation['changes'][:MAX_PRINTED_CHANGES]:
+                print(f"      {change['field']}: {_short(change['old'])} → {_short(change['new'])}")
+            if len(operation['changes']) > MAX_PRINTED_CHANGES:
+                print(f"      ... 외 {len(operation['changes']) - MAX_PRINTED_CHANGES}개 필드")
+
+    if report['affected_client_modules']:
+        print("\n📦 다시 생성할 클라이언트 모듈")
+        for module in report['affected_client_modules']:
+            print(f"  - {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='두 스크래핑 결과(스펙 파일) 비교')
+    parser.add_argument('old', help='이전 스펙 파일')
+    parser.add_argument('new', help='새 스펙 파일')
+    parser.add_argument('--report', help='변경 보고서를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    report = diff_specs(args.old, args.new)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 {args.report} 저장")
+
+
+if __name__ == '__main__':
+    main()
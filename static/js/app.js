@@ -1,3 +1,29 @@
+// 선택한 계정은 브라우저에 저장하고 요청마다 X-Shop-Id 헤더로 전달
+// (서버 파일을 바꾸지 않으므로 여러 사용자/탭이 서로 다른 쇼핑몰을 동시에 사용 가능)
+const SELECTED_SHOP_KEY = 'cafe24.selectedShop';
+
+function getSelectedShop() {
+    return localStorage.getItem(SELECTED_SHOP_KEY);
+}
+
+function setSelectedShop(shopId) {
+    if (shopId) {
+        localStorage.setItem(SELECTED_SHOP_KEY, shopId);
+    } else {
+        localStorage.removeItem(SELECTED_SHOP_KEY);
+    }
+}
+
+// 선택한 계정을 헤더에 붙여서 요청
+function shopFetch(url, options = {}) {
+    const headers = Object.assign({}, options.headers);
+    const shopId = getSelectedShop();
+    if (shopId) {
+        headers['X-Shop-Id'] = shopId;
+    }
+    return fetch(url, Object.assign({}, options, { headers }));
+}
+
 // 페이지 로드 시 초기화
 document.addEventListener('DOMContentLoaded', function() {
     loadAccounts();
@@ -21,6 +47,7 @@ async function loadAccounts() {
         const accountsList = document.getElementById('accounts-list');
 
         if (!data.accounts || Object.keys(data.accounts).length === 0) {
+            setSelectedShop(null);
             accountsList.innerHTML = `
                 <div class="no-accounts">
                     <p>등록된 계정이 없습니다.</p>
@@ -30,11 +57,18 @@ async function loadAccounts() {
             return;
         }
 
+        // 선택한 계정이 없거나 삭제됐으면 서버의 기본 계정 사용
+        let selectedShop = getSelectedShop();
+        if (!selectedShop || !(selectedShop in data.accounts)) {
+            selectedShop = data.current_account || Object.keys(data.accounts)[0];
+            setSelectedShop(selectedShop);
+        }
+
         const accountsContainer = document.createElement('div');
         accountsContainer.className = 'accounts-container';
 
         for (const [shopId, account] of Object.entries(data.accounts)) {
-            const isActive = shopId === data.current_account;
+            const isActive = shopId === selectedShop;
             const tokenStatus = account.token_status || { has_token: false };
 
             const accountCard = document.createElement('div');
@@ -89,31 +123,19 @@ function toggleShopIdVisibility(shopId) {
     element.classList.toggle('visible');
 }
 
-// 계정 전환
+// 계정 전환 (브라우저에만 저장, 서버 요청 없음)
 async function switchAccount(shopId) {
     try {
-        const response = await fetch('/api/accounts/switch', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({ shop_id: shopId })
-        });
+        setSelectedShop(shopId);
 
-        const result = await response.json();
+        // 계정 목록 새로고침
+        await loadAccounts();
+        // 현재 계정 설정 로드
+        await loadConfig();
+        // 토큰 상태 업데이트
+        await loadTokenStatus();
 
-        if (result.success) {
-            // 계정 목록 새로고침
-            await loadAccounts();
-            // 현재 계정 설정 로드
-            await loadConfig();
-            // 토큰 상태 업데이트
-            await loadTokenStatus();
-
-            showMessage('config-message', result.message, 'success');
-        } else {
-            showMessage('config-message', result.message, 'error');
-        }
+        showMessage('config-message', `${shopId} 계정으로 전환되었습니다.`, 'success');
     } catch (error) {
         showMessage('config-message', '계정 전환 실패: ' + error.message, 'error');
     }
@@ -137,6 +159,9 @@ async function deleteAccount(shopId) {
         const result = await response.json();
 
         if (result.success) {
+            if (getSelectedShop() === shopId) {
+                setSelectedShop(null);
+            }
             // 계정 목록 새로고침
             await loadAccounts();
             // 현재 계정 설정 로드
@@ -156,7 +181,7 @@ async function deleteAccount(shopId) {
 // 설정 로드
 async function loadConfig() {
     try {
-        const response = await fetch('/api/config');
+        const response = await shopFetch('/api/config');
         const config = await response.json();
 
         if (config) {
@@ -202,6 +227,8 @@ async function saveConfig(e) {
         showMessage('config-message', result.message, result.success ? 'success' : 'error');
 
         if (result.success) {
+            // 저장한 계정을 선택
+            setSelectedShop(result.shop_id);
             // 계정 목록 새로고침
             loadAccounts();
             // 단계 2 활성화
@@ -217,7 +244,7 @@ async function startAuth() {
     try {
         showMessage('auth-message', '인증 URL을 생성하는 중...', 'info');
 
-        const response = await fetch('/api/auth/start');
+        const response = await shopFetch('/api/auth/start');
         const result = await response.json();
 
         if (result.success) {
@@ -244,7 +271,7 @@ async function startAuth() {
 // 토큰 상태 로드
 async function loadTokenStatus() {
     try {
-        const response = await fetch('/api/token/status');
+        const response = await shopFetch('/api/token/status');
         const status = await response.json();
 
         const tokenStatusDiv = document.getElementById('token-status');
@@ -282,7 +309,7 @@ async function refreshToken() {
     try {
         showMessage('token-message', '토큰을 갱신하는 중...', 'info');
 
-        const response = await fetch('/api/token/refresh', {
+        const response = await shopFetch('/api/token/refresh', {
             method: 'POST'
         });
 
@@ -303,7 +330,7 @@ async function testApi() {
     try {
         showMessage('token-message', 'API를 테스트하는 중...', 'info');
 
-        const response = await fetch('/api/test', {
+        const response = await shopFetch('/api/test', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
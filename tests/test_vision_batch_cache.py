@@ -0,0 +1,56 @@
+"""
+배치 분석 캐시: 같은 타일로 다시 실행하면 Vision 요청이 없어야 함
+(작업자 수 / 응답 속도 / BatchSizer 상태와 관계없이 배치 경계가 같아야 캐시 키가 같음)
+"""
+import os
+import sys
+import random
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_cafe24_vision import VisionAPIScraper
+from vision_analyzers import StubAnalyzer
+from vision_cache import VisionCache
+
+
+class CountingAnalyzer(StubAnalyzer):
+    """요청 수를 세는 가짜 백엔드 (캐시하도록 recorded = True, 응답 시간은 무작위)"""
+    recorded = True
+
+    def __init__(self, seed):
+        super().__init__()
+        self.random = random.Random(seed)
+        self.requests = 0
+
+    async def complete(self, prompt, images, max_tokens):
+        self.requests += 1
+        await asyncio.sleep(self.random.uniform(0, 0.005))
+        return await super().complete(prompt, images, max_tokens)
+
+
+def make_tiles(count):
+    return [{'index': index, 'position': index * 980, 'bytes': f"tile {index}".encode(), 'sha256': str(index)}
+            for index in range(count)]
+
+
+def run_once(cache_dir, seed, concurrency):
+    analyzer = CountingAnalyzer(seed)
+    scraper = VisionAPIScraper(max_concurrency=concurrency, requests_per_second=10000,
+                               cache=VisionCache(cache_dir), batch_size=8, analyzer=analyzer)
+    results = asyncio.run(scraper.analyze_tiles(make_tiles(30), 'admin'))
+    paths = sorted(endpoint['path'] for result in results.values() for endpoint in result['endpoints'])
+    return analyzer.requests, paths
+
+
+def test_second_run_uses_cache_only(tmp_path):
+    for concurrency in (1, 4):
+        cache_dir = str(tmp_path / f"cache-{concurrency}")
+        first_requests, first_paths = run_once(cache_dir, seed=1, concurrency=concurrency)
+        assert first_requests > 0
+        assert len(first_paths) == 30
+
+        for seed in (2, 3):
+            requests, paths = run_once(cache_dir, seed=seed, concurrency=concurrency)
+            assert requests == 0
+            assert paths == first_paths
@@ -0,0 +1,284 @@
+"""
+여러 서버(인스턴스)가 함께 쓰는 토큰 캐시 (선택 사항)
+로드밸런서 뒤에 app.py 를 여러 대 띄우면 서버마다 accounts.json 이 따로라서
+한 서버가 갱신한 토큰이 다른 서버에서는 예전 토큰으로 남음
+
+- 공유 저장소: Redis 프로토콜 (redis 패키지 설치 + TOKEN_CACHE_URL=redis://...)
+  또는 같은 프로세스 안에서만 공유하는 LocalBackend (TOKEN_CACHE_URL=local://, 테스트용)
+- 키 TTL = expires_at - 현재 시각 (만료된 토큰은 저장소에 남지 않음)
+- 토큰을 갱신한 서버가 무효화 메시지를 발행하면 다른 서버는 자기 L1 캐시에서 지움
+- 읽기는 서버마다 있는 작은 L1 캐시(LRU)에서 먼저 (무효화를 놓쳐도 l1_ttl 초 뒤에는 다시 읽음)
+- 갱신 잠금(acquire_refresh_lock / release_refresh_lock): 쇼핑몰별 SET NX 키로 여러 서버가 같은 토큰을 동시에 갱신하지 않음
+- 저장소 오류(Redis 중단 등)는 예외를 올리지 않음: 읽기는 없는 것으로, 쓰기는 건너뛰고
+  잠금은 잠그지 않은 채 진행 (accounts.json 만 쓰던 때와 같은 동작)
+
+TOKEN_CACHE_URL 이 없으면 사용하지 않음 (accounts.json 만 사용, 기존과 같음)
+"""
+import os
+import json
+import time
+import uuid
+import threading
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+KEY_PREFIX = 'cafe24:token:'
+LOCK_PREFIX = 'cafe24:token-lock:'
+INVALIDATE_CHANNEL = 'cafe24:token:invalidate'
+
+# 저장소를 쓸 수 없을 때 나는 예외 (accounts.json 으로 대신함)
+BACKEND_ERRORS = (OSError,) if redis is None else (OSError, redis.RedisError)
+
+
+class LocalBackend:
+    """Redis 대신 쓰는 프로세스 내 저장소 (같은 객체를 공유하는 TokenCache 끼리만 공유)"""
+
+    def __init__(self):
+        self.values = {}
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                return None
+            value, deadline = entry
+            if time.monotonic() >= deadline:
+                del self.values[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.values[key] = (value, time.monotonic() + ttl)
+
+    def delete(self, key):
+        with self.lock:
+            self.values.pop(key, None)
+
+    def set_nx(self, key, value, ttl):
+        """키가 없을 때만 저장, 저장했으면 True"""
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return False
+            self.values[key] = (value, time.monotonic() + ttl)
+            return True
+
+    def delete_if(self, key, value):
+        """값이 같을 때만 삭제 (다른 서버가 잡은 잠금은 지우지 않음)"""
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is not None and entry[0] == value:
+                del self.values[key]
+
+    def publish(self, channel, message):
+        with self.lock:
+            callbacks = list(self.subscribers.get(channel, []))
+        for callback in callbacks:
+            callback(message)
+
+    def subscribe(self, channel, callback):
+        with self.lock:
+            self.subscribers.setdefault(channel, []).append(callback)
+
+    def close(self):
+        with self.lock:
+            self.subscribers.clear()
+
+
+class RedisBackend:
+    """Redis 저장소 (구독은 백그라운드 스레드에서 처리)"""
+
+    # 값이 같을 때만 삭제 (GET 과 DEL 사이에 잠금이 바뀌지 않도록 한 번에 실행)
+    DELETE_IF_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, url):
+        if redis is None:
+            raise ValueError("redis 패키지가 설치되어 있지 않습니다 (pip install redis)")
+        self.client = redis.Redis.from_url(url, decode_responses=True, socket_timeout=2, socket_connect_timeout=2)
+        self.delete_if_script = self.client.register_script(self.DELETE_IF_SCRIPT)
+        self.pubsub = None
+        self.thread = None
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def set(self, key, value, ttl):
+        self.client.set(key, value, ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        self.client.delete(key)
+
+    def set_nx(self, key, value, ttl):
+        return bool(self.client.set(key, value, nx=True, ex=max(1, int(ttl))))
+
+    def delete_if(self, key, value):
+        self.delete_if_script(keys=[key], args=[value])
+
+    def publish(self, channel, message):
+        self.client.publish(channel, message)
+
+    def subscribe(self, channel, callback):
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.subscribe(**{channel: lambda message: callback(message['data'])})
+        self.thread = self.pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def close(self):
+        if self.thread:
+            self.thread.stop()
+        if self.pubsub:
+            self.pubsub.close()
+        self.client.close()
+
+
+class TokenCache:
+    """공유 저장소 + 서버별 L1 캐시"""
+
+    def __init__(self, backend, l1_size=256, l1_ttl=30.0):
+        self.backend = backend
+        self.l1_size = l1_size
+        self.l1_ttl = l1_ttl
+        self.l1 = OrderedDict()  # shop_id -> (토큰, L1 만료 시각)
+        self.lock = threading.Lock()
+        self.node_id = uuid.uuid4().hex
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        try:
+            backend.subscribe(INVALIDATE_CHANNEL, self._on_invalidate)
+        except BACKEND_ERRORS as e:
+            # 무효화 알림 없이도 L1 항목은 l1_ttl 뒤에 다시 읽음
+            self._backend_error('구독', e)
+
+    @classmethod
+    def from_env(cls):
+        """TOKEN_CACHE_URL 설정에 맞는 캐시, 설정이 없으면 None"""
+        url = os.environ.get('TOKEN_CACHE_URL')
+        if not url:
+            return None
+        if url.startswith('local://'):
+            return cls(LocalBackend())
+        return cls(RedisBackend(url))
+
+    def _backend_error(self, action, error):
+        self.errors += 1
+        print(f"  ⚠️  토큰 캐시 {action} 실패 (accounts.json 만 사용): {error}")
+
+    def _l1_put(self, shop_id, token, now):
+        deadline = now + self.l1_ttl
+        with self.lock:
+            self.l1[shop_id] = (token, deadline)
+            self.l1.move_to_end(shop_id)
+            while len(self.l1) > self.l1_size:
+                self.l1.popitem(last=False)
+
+    def _on_invalidate(self, message):
+        try:
+            event = json.loads(message)
+        except (TypeError, ValueError):
+            return
+        if event.get('node') == self.node_id:
+            return
+        with self.lock:
+            if self.l1.pop(event.get('shop_id'), None) is not None:
+                self.invalidations += 1
+
+    def get(self, shop_id):
+        """공유된 토큰 (없거나 만료됐으면 None)"""
+        now = time.monotonic()
+        with self.lock:
+            entry = self.l1.get(shop_id)
+            if entry is not None and now < entry[1]:
+                self.l1.move_to_end(shop_id)
+                self.hits += 1
+                token = entry[0]
+            else:
+                token = None
+        if token is not None:
+            return token if token.get('expires_at', 0) > time.time() else None
+
+        self.misses += 1
+        try:
+            value = self.backend.get(KEY_PREFIX + shop_id)
+        except BACKEND_ERRORS as e:
+            self._backend_error('읽기', e)
+            return None
+        if value is None:
+            return None
+        token = json.loads(value)
+        self._l1_put(shop_id, token, now)
+        return token
+
+    def put(self, shop_id, token):
+        """갱신한 토큰 공유 (TTL = 만료까지 남은 시간) 후 다른 서버에 무효화 알림"""
+        try:
+            ttl = int(token.get('expires_at', 0)) - time.time()
+        except (TypeError, ValueError):
+            ttl = 0
+        if ttl > 0:
+            self._l1_put(shop_id, token, time.monotonic())
+        else:
+            with self.lock:
+                self.l1.pop(shop_id, None)
+        try:
+            if ttl > 0:
+                self.backend.set(KEY_PREFIX + shop_id, json.dumps(token), ttl)
+            else:
+                self.backend.delete(KEY_PREFIX + shop_id)
+            self.backend.publish(INVALIDATE_CHANNEL, json.dumps({'shop_id': shop_id, 'node': self.node_id}))
+        except BACKEND_ERRORS as e:
+            self._backend_error('쓰기', e)
+
+    def acquire_refresh_lock(self, shop_id, ttl=60):
+        """쇼핑몰 토큰 갱신 잠금, 잠금 값(release_refresh_lock 에 전달) 또는 None(다른 서버가 갱신 중)
+
+        저장소 오류면 잠그지 않고 진행하도록 잠금 값을 돌려줌
+        ttl: 잠금을 잡은 서버가 죽어도 이 시간 뒤에는 풀림
+        """
+        value = f"{self.node_id}:{uuid.uuid4().hex}"
+        try:
+            return value if self.backend.set_nx(LOCK_PREFIX + shop_id, value, ttl) else None
+        except BACKEND_ERRORS as e:
+            self._backend_error('잠금', e)
+            return value
+
+    def release_refresh_lock(self, shop_id, value):
+        try:
+            self.backend.delete_if(LOCK_PREFIX + shop_id, value)
+        except BACKEND_ERRORS as e:
+            self._backend_error('잠금 해제', e)
+
+    def fresher(self, shop_id, token):
+        """로컬 토큰과 공유된 토큰 중 만료가 늦은 쪽 (다른 서버가 갱신했으면 공유된 토큰)"""
+        shared = self.get(shop_id)
+        if shared is None:
+            return token
+        try:
+            local_expires = int((token or {}).get('expires_at', 0))
+        except (TypeError, ValueError):
+            local_expires = 0
+        return shared if int(shared.get('expires_at', 0)) > local_expires else token
+
+    def stats(self):
+        with self.lock:
+            size = len(self.l1)
+        return {'l1_size': size, 'hits': self.hits, 'misses': self.misses, 'invalidations': self.invalidations,
+                'errors': self.errors}
+
+    def close(self):
+        try:
+            self.backend.close()
+        except BACKEND_ERRORS:
+            pass
@@ -0,0 +1,174 @@
+"""
+Cafe24 토큰 갱신
+- refresh_access_token: Refresh Token으로 새 Access Token 발급 (app.py의 수동 갱신 / 자동 갱신 공용)
+- RefreshAheadPolicy: 만료 전 구간(window) 안의 무작위 시점에 미리 갱신
+  여러 쇼핑몰을 한꺼번에 등록해서 만료 시각이 몰려도 갱신 요청은 고르게 퍼짐
+
+갱신 시점은 (shop_id, expires_at) 해시로 정하므로 주기마다 바뀌지 않고,
+토큰이 갱신되면 새 expires_at 기준으로 다시 정해짐 (저장할 상태 없음)
+갱신에 실패한 토큰만 실패 횟수를 메모리에 두고 점점 길게 쉬었다가 다시 시도
+(Refresh Token까지 만료된 쇼핑몰이 주기마다 급한 갱신으로 요청을 보내지 않도록)
+
+한 주기에 갱신하는 수는 max_per_cycle 로 제한하고, 같은 주기 안에서도 간격을 두고 보냄
+여유가 있는 주기에는 곧 갱신할 토큰을 당겨서 갱신 (몰리는 구간을 앞 주기들로 분산)
+다음 주기 전에 만료되는 토큰은 제한과 관계없이 갱신 (제한 때문에 만료시키지 않음)
+"""
+import os
+import time
+import base64
+import hashlib
+from datetime import datetime
+import requests
+
+DEFAULT_EXPIRES_IN = 7200  # Cafe24 Access Token 기본 2시간
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def refresh_access_token(shop_id, account, timeout=30):
+    """Refresh Token으로 새 토큰 발급 (저장은 호출하는 쪽에서), 실패하면 requests 예외"""
+    token = account['token']
+    credentials = f"{account['client_id']}:{account['client_secret']}"
+    encoded_credentials = base64.b64encode(credentials.encode()).decode()
+
+    response = requests.post(
+        f"https://{shop_id}.cafe24api.com/api/v2/oauth/token",
+        data={
+            'grant_type': 'refresh_token',
+            'refresh_token': token['refresh_token']
+        },
+        headers={
+            'Authorization': f'Basic {encoded_credentials}',
+            'Content-Type': 'application/x-www-form-urlencoded'
+        },
+        timeout=timeout
+    )
+    response.raise_for_status()
+    result = response.json()
+
+    return {
+        'access_token': result['access_token'],
+        'refresh_token': result.get('refresh_token', token['refresh_token']),
+        'expires_at': int(time.time()) + result.get('expires_in', DEFAULT_EXPIRES_IN),
+        'issued_at': datetime.now().isoformat()
+    }
+
+
+def token_expires_at(token):
+    try:
+        return int(token.get('expires_at', 0))
+    except (ValueError, TypeError):
+        return 0
+
+
+class RefreshAheadPolicy:
+    """만료 전 무작위 시점 갱신 + 주기당 제한 + 평탄화
+
+    window: 만료 몇 초 전부터 갱신할 수 있는지
+    interval: 자동 갱신 주기 (초), 갱신 시점은 만료 interval * 2 초 전보다 늦지 않게 잡음
+    max_per_cycle: 한 주기에 갱신할 최대 수 (급한 토큰 제외)
+    spread: 한 주기 안에서 갱신을 나눠 보낼 시간 비율 (0이면 몰아서)
+
+    max_backoff: 연속으로 실패한 토큰을 다시 시도하기까지 최대 대기 (초)
+
+    쇼핑몰 수가 max_per_cycle * (window - interval * 2) / interval 보다 많으면
+    한꺼번에 등록한 토큰을 구간 안에 다 갱신하지 못하고 급한 갱신이 몰릴 수 있음
+    """
+
+    def __init__(self, window=None, interval=None, max_per_cycle=None, spread=0.5, max_backoff=None):
+        self.interval = interval or _env_int('TOKEN_REFRESH_INTERVAL', 300)
+        self.window = max(window or _env_int('TOKEN_REFRESH_WINDOW', 3600), self.interval * 3)
+        self.max_per_cycle = max_per_cycle or _env_int('TOKEN_REFRESH_MAX_PER_CYCLE', 20)
+        self.spread = spread
+        self.min_lead = self.interval * 2
+        # 토큰 하나가 구간 안에서 맞는 주기 수
+        self.cycles = max(1, (self.window - self.min_lead) // self.interval)
+        self.max_backoff = max_backoff or _env_int('TOKEN_REFRESH_MAX_BACKOFF', 21600)
+        # 갱신에 실패한 토큰: shop_id -> (연속 실패 수, 다시 시도할 시각, 실패한 토큰의 expires_at)
+        self.failures = {}
+
+    def record_failure(self, shop_id, expires_at, now=None):
+        """갱신 실패 기록, 다음 시도까지 대기 시간(초) 반환 (interval부터 두 배씩, 최대 max_backoff)"""
+        if now is None:
+            now = int(time.time())
+        count = self.failures.get(shop_id, (0, 0, None))[0] + 1
+        delay = min(self.interval * 2 ** (count - 1), self.max_backoff)
+        self.failures[shop_id] = (count, now + delay, expires_at)
+        return delay
+
+    def record_success(self, shop_id):
+        self.failures.pop(shop_id, None)
+
+    def refresh_at(self, shop_id, expires_at):
+        """이 토큰을 갱신할 시각 (expires_at - window ~ expires_at - min_lead 사이, 토큰마다 고정)"""
+        digest = hashlib.sha256(f"{shop_id}:{expires_at}".encode()).digest()
+        fraction = int.from_bytes(digest[:8], 'big') / 2 ** 64
+        return expires_at - self.min_lead - int((self.window - self.min_lead) * fraction)
+
+    def plan(self, accounts, now=None):
+        """이번 주기에 갱신할 [(shop_id, 남은 시간)]과 {'waiting', 'deferred', 'urgent', 'backoff'} 집계
+
+        0. 최근 갱신에 실패한 토큰은 다시 시도할 시각까지 제외 (토큰이 바뀌었으면 실패 기록 삭제)
+        1. 급한 토큰(다음 주기 전에 만료)은 항상 갱신
+        2. 갱신 시점이 지난 토큰은 먼저 만료되는 순서로 max_per_cycle 까지
+        3. 구간 안 토큰 수 / 구간 주기 수 (지금 구간을 고르게 비우는 속도)보다 적으면
+           아직 시점이 안 된 구간 안 토큰을 당겨서 채움 → 갱신이 몰리기 전에 미리 분산
+        """
+        if now is None:
+            now = int(time.time())
+        urgent = []
+        due = []
+        early = []
+        waiting = 0
+        backoff = 0
+        for shop_id, account in accounts.items():
+            token = account.get('token') or {}
+            if not token.get('refresh_token'):
+                continue
+            expires_at = token_expires_at(token)
+            failure = self.failures.get(shop_id)
+            if failure is not None:
+                if failure[2] != expires_at:
+                    # 재인증 / 다른 서버의 갱신으로 토큰이 바뀜
+                    del self.failures[shop_id]
+                elif now < failure[1]:
+                    backoff += 1
+                    continue
+            remaining = expires_at - now
+            refresh_at = self.refresh_at(shop_id, expires_at)
+            if remaining < self.interval + 60:
+                urgent.append((expires_at, shop_id, remaining))
+            elif now >= refresh_at:
+                due.append((expires_at, shop_id, remaining))
+            elif remaining <= self.window:
+                early.append((refresh_at, shop_id, remaining))
+            else:
+                waiting += 1
+
+        urgent.sort()
+        due.sort()
+        early.sort()
+        in_window = len(urgent) + len(due) + len(early)
+        target = -(-in_window // self.cycles)  # 올림
+        count = max(len(urgent), min(self.max_per_cycle, max(target, len(urgent) + len(due))))
+
+        selected = (urgent + due + early)[:count]
+        pulled = max(0, count - len(urgent) - len(due))
+        stats = {
+            'urgent': len(urgent),
+            'deferred': len(due) - min(len(due), count - len(urgent)),
+            'waiting': waiting + len(early) - pulled,
+            'backoff': backoff
+        }
+        return [(shop_id, remaining) for _, shop_id, remaining in selected], stats
+
+    def pace(self, count):
+        """한 주기 안에서 갱신 사이 간격 (초)"""
+        if count <= 1 or not self.spread:
+            return 0.0
+        return self.interval * self.spread / count
@@ -4,27 +4,258 @@ Cafe24 API 검증 및 카테고리화
 2. 카테고리별 분류
 3. 구조화된 문서 생성
 """
-import json
+import os
 import re
+import json
+import shutil
+import sqlite3
+import hashlib
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from json_stream import iter_json_items
+from docs_search import SearchIndexBuilder, SEARCH_DB
+from docs_assets import write_compressed_variants, remove_compressed_variants
+
+# 경로 매칭 (모듈 로드 시 한 번만 컴파일)
+PATH_CATEGORY_RE = re.compile(r'/api/v2/(admin|front)/([^/?]+)')
+ADMIN_CATEGORY_RE = re.compile(r'/api/v2/admin/([^/?]+)')
+FRONT_CATEGORY_RE = re.compile(r'/api/v2/([^/?]+)')
+NUMERIC_SEGMENT_RE = re.compile(r'/\d+')
+PARAM_SEGMENT_RE = re.compile(r'/\{[^}]+\}')
+
+REQUIRED_FIELDS = ('method', 'path', 'summary')
+
+DOCS_DIR = "docs/cafe24"
+# 생성한 파일의 내용 해시 (다음 실행에서 바뀐 파일만 다시 씀)
+MANIFEST_FILE = "docs/cafe24/generation-manifest.json"
+WRITE_WORKERS = 8
+
+# 빠른 참조에 넣을 주요 카테고리
+IMPORTANT_CATEGORIES = [
+    'products', 'categories', 'orders', 'customers',
+    'shipping', 'coupons', 'oauth', 'store'
+]
+
+
+def get_category(path, api_type):
+    """경로에서 카테고리 추출"""
+    if api_type == 'admin':
+        # Admin API: /api/v2/admin/{category}
+        match = ADMIN_CATEGORY_RE.search(path)
+        if match:
+            return match.group(1)
+    else:
+        # Front API: /api/v2/{category} (front 없음)
+        match = FRONT_CATEGORY_RE.search(path)
+        if match:
+            category = match.group(1)
+            # Front API 주요 카테고리 매핑
+            if category in ['products', 'productsdetail']:
+                return 'products'
+            elif category == 'categories':
+                return 'categories'
+            elif category in ['carts', 'mains']:
+                return 'personal'
+            return category
+    return 'other'
+
+
+def content_digest(chunks):
+    """문자열 조각들을 UTF-8로 쓸 때의 (SHA-256, 바이트 수)"""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode('utf-8')
+        digest.update(data)
+        size += len(data)
+    return digest.hexdigest(), size
+
+
+def write_atomic(path, chunks):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 교체 (중간에 죽어도 반쯤 쓴 파일이 남지 않음)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class CategoryBucket:
+    """카테고리 하나: 엔드포인트 본문은 임시 파일에 이어 쓰고, 인덱스용 요약만 메모리에 보관"""
+
+    def __init__(self, category, api_type, spool_path):
+        self.category = category
+        self.api_type = api_type
+        self.count = 0
+        self.methods = defaultdict(list)
+        self.common_operations = {}
+        self.spool_path = spool_path
+        self.spool = open(self.spool_path, 'w', encoding='utf-8')
+
+    def add(self, ep):
+        # json.dump(indent=2)로 파일 전체를 쓸 때와 같은 모양 (endpoints 배열 안 들여쓰기 4칸)
+        if self.count:
+            self.spool.write(',\n')
+        self.spool.write('    ' + json.dumps(ep, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+        self.count += 1
+
+        self.methods[ep['method']].append({
+            "path": ep['path'],
+            "summary": ep.get('summary', '')
+        })
+
+    def chunks(self):
+        """카테고리 파일 내용 (머리글 + 임시 파일 내용)"""
+        self.spool.close()
+        yield (
+            '{\n'
+            f'  "category": {json.dumps(self.category, ensure_ascii=False)},\n'
+            f'  "api_type": "{self.api_type}",\n'
+            f'  "endpoint_count": {self.count},\n'
+            '  "endpoints": [\n'
+        )
+        with open(self.spool_path, 'r', encoding='utf-8') as spool:
+            while True:
+                chunk = spool.read(64 * 1024)
+                if not chunk:
+                    break
+                yield chunk
+        yield '\n  ]\n}'
+
+    def close(self):
+        if not self.spool.closed:
+            self.spool.close()
+
 
 class APIVerifier:
+    """스펙 파일을 한 번만 스트리밍으로 읽어 검증 통계, 카테고리, 인덱스를 함께 계산
+
+    엔드포인트 본문은 카테고리별 임시 파일로 흘려보내므로 메모리 사용량은
+    스펙 크기가 아니라 인덱스 요약(경로, 요약) 크기에 비례
+    """
+
     def __init__(self):
         self.admin_file = "docs/cafe24/specs/admin.json"
         self.front_file = "docs/cafe24/specs/front.json"
         self.openapi_file = "docs/cafe24/cafe24-openapi.json"
 
-    def load_data(self):
-        """데이터 로드"""
-        with open(self.admin_file, 'r', encoding='utf-8') as f:
-            self.admin_data = json.load(f)
-
-        with open(self.front_file, 'r', encoding='utf-8') as f:
-            self.front_data = json.load(f)
-
-        with open(self.openapi_file, 'r', encoding='utf-8') as f:
-            self.openapi_data = json.load(f)
+        self.endpoint_counts = {'admin': 0, 'front': 0}
+        self.openapi_path_count = 0
+        self.complete_count = 0
+        self.incomplete_count = 0
+        self.incomplete_samples = []
+        self.method_counts = defaultdict(int)
+        self.path_categories = defaultdict(int)
+        self.buckets = {'admin': {}, 'front': {}}
+        self.spool_dir = None
+        self.search_index = None
+
+        self.manifest = self.load_manifest()
+        self.new_manifest = {}
+        self.deleted = 0
+
+    def scan(self):
+        """admin/front 스펙과 OpenAPI 경로를 한 번씩 훑기 (검색 인덱스도 함께 생성)"""
+        self.spool_dir = tempfile.mkdtemp(prefix='cafe24-categories-')
+        try:
+            self.search_index = SearchIndexBuilder(SEARCH_DB)
+        except sqlite3.NotSupportedError as e:
+            print(f"⚠️  검색 인덱스 생략: {e}")
+        for api_type, file_path in (('admin', self.admin_file), ('front', self.front_file)):
+            for ep in iter_json_items(file_path, 'endpoints'):
+                self.add_endpoint(api_type, ep)
+        if self.search_index:
+            self.search_index.finish()
+            self.search_index = None
+
+        self.openapi_path_count = sum(1 for _ in iter_json_items(self.openapi_file, 'paths'))
+
+    def add_endpoint(self, api_type, ep):
+        """엔드포인트 하나로 모든 통계 갱신"""
+        self.endpoint_counts[api_type] += 1
+
+        # 완전성
+        if all(ep.get(field) for field in REQUIRED_FIELDS):
+            self.complete_count += 1
+        else:
+            self.incomplete_count += 1
+            if len(self.incomplete_samples) < 3:
+                self.incomplete_samples.append(ep)
+
+        # HTTP 메서드 분포
+        self.method_counts[ep.get('method', 'UNKNOWN')] += 1
+
+        # 경로 패턴 (/api/v2/admin|front/{category})
+        match = PATH_CATEGORY_RE.search(ep.get('path', ''))
+        if match:
+            self.path_categories[match.group(2)] += 1
+
+        # 카테고리 분류
+        category = self.get_category(ep['path'], api_type)
+        bucket = self.buckets[api_type].get(category)
+        if bucket is None:
+            spool_path = os.path.join(self.spool_dir, f"{api_type}-{len(self.buckets[api_type])}.part")
+            bucket = self.buckets[api_type][category] = CategoryBucket(category, api_type, spool_path)
+        bucket.add(ep)
+        if self.search_index:
+            self.search_index.add(api_type, category, ep)
+
+        if api_type == 'admin' and category in IMPORTANT_CATEGORIES:
+            self.add_common_operation(bucket.common_operations, ep)
+
+    @staticmethod
+    def load_manifest():
+        try:
+            with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)['files']
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def save_manifest(self):
+        """파일 목록이나 해시가 바뀌었을 때만 저장"""
+        if self.new_manifest == self.manifest and os.path.exists(MANIFEST_FILE):
+            return
+        content = json.dumps({'files': dict(sorted(self.new_manifest.items()))}, indent=2, ensure_ascii=False)
+        write_atomic(MANIFEST_FILE, [content + '\n'])
+
+    def write_if_changed(self, relative_path, chunks):
+        """내용 해시가 매니페스트와 같고 파일이 그대로 있으면 쓰지 않음, 쓴 경우 True
+
+        chunks는 호출할 때마다 같은 내용을 돌려주는 함수 (해시 계산과 쓰기에 두 번 사용)
+        .gz / .br 압축본은 없거나 원본보다 오래된 경우에만 다시 만듦 (app.py 서빙용)
+        """
+        path = os.path.join(DOCS_DIR, relative_path)
+        digest, size = content_digest(chunks())
+        self.new_manifest[relative_path] = {'sha256': digest, 'size': size}
+
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            previous = self.manifest.get(relative_path)
+            if previous:
+                unchanged = previous['sha256'] == digest
+            else:
+                # 매니페스트가 없으면 기존 파일 내용으로 비교
+                with open(path, 'rb') as f:
+                    unchanged = hashlib.sha256(f.read()).hexdigest() == digest
+            if unchanged:
+                write_compressed_variants(path)
+                return False
+
+        write_atomic(path, chunks())
+        write_compressed_variants(path)
+        return True
+
+    def cleanup(self):
+        if self.search_index:
+            self.search_index.abort()
+            self.search_index = None
+        for buckets in self.buckets.values():
+            for bucket in buckets.values():
+                bucket.close()
+        if self.spool_dir:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+            self.spool_dir = None
 
     def verify_data_quality(self):
         """데이터 품질 검증"""
@@ -32,177 +263,98 @@ class APIVerifier:
         print("📊 데이터 품질 검증")
         print("="*60)
 
-        admin_endpoints = self.admin_data['endpoints']
-        front_endpoints = self.front_data['endpoints']
+        total = self.endpoint_counts['admin'] + self.endpoint_counts['front']
 
         # 1. 기본 통계
         print(f"\n1️⃣ 기본 통계:")
-        print(f"  - Admin API 엔드포인트: {len(admin_endpoints)}개")
-        print(f"  - Front API 엔드포인트: {len(front_endpoints)}개")
-        print(f"  - OpenAPI 경로: {len(self.openapi_data['paths'])}개")
+        print(f"  - Admin API 엔드포인트: {self.endpoint_counts['admin']}개")
+        print(f"  - Front API 엔드포인트: {self.endpoint_counts['front']}개")
+        print(f"  - OpenAPI 경로: {self.openapi_path_count}개")
 
         # 2. 완전성 검증
         print(f"\n2️⃣ 데이터 완전성:")
-        complete_endpoints = []
-        incomplete_endpoints = []
-
-        for ep in admin_endpoints + front_endpoints:
-            required_fields = ['method', 'path', 'summary']
-            if all(field in ep and ep[field] for field in required_fields):
-                complete_endpoints.append(ep)
-            else:
-                incomplete_endpoints.append(ep)
-
-        print(f"  - 완전한 데이터: {len(complete_endpoints)}개 ({len(complete_endpoints)/(len(admin_endpoints)+len(front_endpoints))*100:.1f}%)")
-        print(f"  - 불완전한 데이터: {len(incomplete_endpoints)}개")
+        print(f"  - 완전한 데이터: {self.complete_count}개 ({self.complete_count/total*100 if total else 0:.1f}%)")
+        print(f"  - 불완전한 데이터: {self.incomplete_count}개")
 
-        if incomplete_endpoints[:3]:
+        if self.incomplete_samples:
             print(f"\n  불완전한 데이터 샘플:")
-            for ep in incomplete_endpoints[:3]:
+            for ep in self.incomplete_samples:
                 print(f"    - {ep.get('method', 'N/A')} {ep.get('path', 'N/A')}: {ep.get('summary', 'N/A')}")
 
         # 3. HTTP 메서드 분포
         print(f"\n3️⃣ HTTP 메서드 분포:")
-        method_counts = defaultdict(int)
-        for ep in admin_endpoints + front_endpoints:
-            method_counts[ep.get('method', 'UNKNOWN')] += 1
-
-        for method, count in sorted(method_counts.items(), key=lambda x: x[1], reverse=True):
+        for method, count in sorted(self.method_counts.items(), key=lambda x: x[1], reverse=True):
             print(f"  - {method}: {count}개")
 
         # 4. 경로 패턴 분석
         print(f"\n4️⃣ 주요 API 카테고리 (경로 분석):")
-        categories = self.extract_categories(admin_endpoints + front_endpoints)
-
-        for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True)[:15]:
+        for category, count in sorted(self.path_categories.items(), key=lambda x: x[1], reverse=True)[:15]:
             print(f"  - {category}: {count}개")
 
         return {
-            'complete_endpoints': complete_endpoints,
-            'incomplete_endpoints': incomplete_endpoints,
-            'method_counts': dict(method_counts),
-            'categories': dict(categories)
+            'complete_count': self.complete_count,
+            'incomplete_count': self.incomplete_count,
+            'method_counts': dict(self.method_counts),
+            'categories': dict(self.path_categories)
         }
 
-    def extract_categories(self, endpoints):
-        """경로에서 카테고리 추출"""
-        categories = defaultdict(int)
-
-        for ep in endpoints:
-            path = ep.get('path', '')
-
-            # /api/v2/admin/{category} 형식에서 카테고리 추출
-            match = re.search(r'/api/v2/(admin|front)/([^/?]+)', path)
-            if match:
-                category = match.group(2)
-                categories[category] += 1
-
-        return categories
-
     def categorize_endpoints(self):
-        """엔드포인트를 카테고리별로 분류"""
+        """카테고리별 분류 결과 출력 ({api_type: {카테고리: 엔드포인트 수}} 반환)"""
         print("\n" + "="*60)
         print("📂 카테고리별 분류")
         print("="*60)
 
-        admin_endpoints = self.admin_data['endpoints']
-        front_endpoints = self.front_data['endpoints']
-
-        # Admin API 분류
-        admin_categorized = defaultdict(list)
-        for ep in admin_endpoints:
-            category = self.get_category(ep['path'], 'admin')
-            admin_categorized[category].append(ep)
-
-        # Front API 분류
-        front_categorized = defaultdict(list)
-        for ep in front_endpoints:
-            category = self.get_category(ep['path'], 'front')
-            front_categorized[category].append(ep)
+        summary = {}
+        for api_type, label in (('admin', 'Admin'), ('front', 'Front')):
+            buckets = self.buckets[api_type]
+            print(f"\n📋 {label} API 카테고리 ({len(buckets)}개):")
+            for category, bucket in sorted(buckets.items(), key=lambda x: x[1].count, reverse=True):
+                print(f"  - {category}: {bucket.count}개 엔드포인트")
+            summary[api_type] = {category: bucket.count for category, bucket in buckets.items()}
 
-        print(f"\n📋 Admin API 카테고리 ({len(admin_categorized)}개):")
-        for category, eps in sorted(admin_categorized.items(), key=lambda x: len(x[1]), reverse=True):
-            print(f"  - {category}: {len(eps)}개 엔드포인트")
-
-        print(f"\n📋 Front API 카테고리 ({len(front_categorized)}개):")
-        for category, eps in sorted(front_categorized.items(), key=lambda x: len(x[1]), reverse=True):
-            print(f"  - {category}: {len(eps)}개 엔드포인트")
-
-        return {
-            'admin': dict(admin_categorized),
-            'front': dict(front_categorized)
-        }
+        return summary
 
     def get_category(self, path, api_type):
         """경로에서 카테고리 추출"""
-        if api_type == 'admin':
-            # Admin API: /api/v2/admin/{category}
-            match = re.search(r'/api/v2/admin/([^/?]+)', path)
-            if match:
-                return match.group(1)
-        else:
-            # Front API: /api/v2/{category} (front 없음)
-            match = re.search(r'/api/v2/([^/?]+)', path)
-            if match:
-                category = match.group(1)
-                # Front API 주요 카테고리 매핑
-                if category in ['products', 'productsdetail']:
-                    return 'products'
-                elif category == 'categories':
-                    return 'categories'
-                elif category in ['carts', 'mains']:
-                    return 'personal'
-                return category
-        return 'other'
-
-    def create_categorized_files(self, categorized_data):
+        return get_category(path, api_type)
+
+    def create_categorized_files(self):
         """카테고리별 파일 생성"""
         print("\n" + "="*60)
         print("📝 카테고리별 파일 생성")
         print("="*60)
 
-        output_dir = Path("docs/cafe24/categories")
+        output_dir = Path(DOCS_DIR) / "categories"
         output_dir.mkdir(exist_ok=True)
 
-        # Admin API 카테고리별 파일
-        admin_dir = output_dir / "admin"
-        admin_dir.mkdir(exist_ok=True)
-
-        for category, endpoints in categorized_data['admin'].items():
-            file_path = admin_dir / f"{category}.json"
-
-            data = {
-                "category": category,
-                "api_type": "admin",
-                "endpoint_count": len(endpoints),
-                "endpoints": endpoints
-            }
+        jobs = []
+        for api_type in ('admin', 'front'):
+            type_dir = output_dir / api_type
+            type_dir.mkdir(exist_ok=True)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # 이번에 없는 카테고리 파일 삭제
+            for stale in sorted(type_dir.glob('*.json')):
+                if stale.stem not in self.buckets[api_type]:
+                    stale.unlink()
+                    remove_compressed_variants(str(stale))
+                    self.deleted += 1
+                    print(f"  🗑️  {stale} (카테고리 없음)")
 
-            print(f"  ✓ {file_path} ({len(endpoints)}개 엔드포인트)")
+            for category, bucket in self.buckets[api_type].items():
+                jobs.append((f"categories/{api_type}/{category}.json", bucket))
 
-        # Front API 카테고리별 파일
-        front_dir = output_dir / "front"
-        front_dir.mkdir(exist_ok=True)
+        # 해시 비교와 쓰기는 병렬로 (결과 출력은 원래 순서대로)
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            written = list(executor.map(lambda job: self.write_if_changed(job[0], job[1].chunks), jobs))
 
-        for category, endpoints in categorized_data['front'].items():
-            file_path = front_dir / f"{category}.json"
+        for (relative_path, bucket), changed in zip(jobs, written):
+            if changed:
+                print(f"  ✓ {DOCS_DIR}/{relative_path} ({bucket.count}개 엔드포인트)")
 
-            data = {
-                "category": category,
-                "api_type": "front",
-                "endpoint_count": len(endpoints),
-                "endpoints": endpoints
-            }
+        print(f"\n  - 새로 쓴 파일: {sum(written)}개, 변경 없음: {len(written) - sum(written)}개, "
+              f"삭제: {self.deleted}개")
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            print(f"  ✓ {file_path} ({len(endpoints)}개 엔드포인트)")
-
-    def create_index(self, categorized_data):
+    def create_index(self):
         """전체 인덱스 생성"""
         print("\n" + "="*60)
         print("🗺️  인덱스 파일 생성")
@@ -212,58 +364,38 @@ class APIVerifier:
             "title": "Cafe24 API Documentation Index",
             "description": "Complete reference for all Cafe24 Admin and Front APIs",
             "version": "2.0",
-            "total_categories": len(categorized_data['admin']) + len(categorized_data['front']),
-            "total_endpoints": sum(len(eps) for eps in categorized_data['admin'].values()) +
-                              sum(len(eps) for eps in categorized_data['front'].values()),
+            "total_categories": len(self.buckets['admin']) + len(self.buckets['front']),
+            "total_endpoints": self.endpoint_counts['admin'] + self.endpoint_counts['front'],
             "admin_api": {},
             "front_api": {},
             "quick_reference": {}
         }
 
-        # Admin API 인덱스
-        for category, endpoints in sorted(categorized_data['admin'].items()):
-            methods = defaultdict(list)
-            for ep in endpoints:
-                methods[ep['method']].append({
-                    "path": ep['path'],
-                    "summary": ep.get('summary', '')
-                })
-
-            index['admin_api'][category] = {
-                "file": f"categories/admin/{category}.json",
-                "endpoint_count": len(endpoints),
-                "methods": dict(methods),
-                "description": self.get_category_description(category)
-            }
-
-        # Front API 인덱스
-        for category, endpoints in sorted(categorized_data['front'].items()):
-            methods = defaultdict(list)
-            for ep in endpoints:
-                methods[ep['method']].append({
-                    "path": ep['path'],
-                    "summary": ep.get('summary', '')
-                })
-
-            index['front_api'][category] = {
-                "file": f"categories/front/{category}.json",
-                "endpoint_count": len(endpoints),
-                "methods": dict(methods),
-                "description": self.get_category_description(category)
-            }
+        for api_type in ('admin', 'front'):
+            for category, bucket in sorted(self.buckets[api_type].items()):
+                index[f'{api_type}_api'][category] = {
+                    "file": f"categories/{api_type}/{category}.json",
+                    "endpoint_count": bucket.count,
+                    "methods": dict(bucket.methods),
+                    "description": self.get_category_description(category)
+                }
 
         # Quick Reference (주요 API만)
-        index['quick_reference'] = self.create_quick_reference(categorized_data)
+        index['quick_reference'] = self.create_quick_reference()
 
-        # 저장
-        index_file = "docs/cafe24/api-index.json"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False)
-
-        print(f"  ✓ {index_file} 생성 완료")
+        # 저장 (바뀐 경우만)
+        index_content = json.dumps(index, indent=2, ensure_ascii=False)
+        if self.write_if_changed("api-index.json", lambda: [index_content]):
+            print(f"  ✓ {DOCS_DIR}/api-index.json 생성 완료")
+        else:
+            print(f"  - {DOCS_DIR}/api-index.json 변경 없음")
 
         # README도 생성
-        self.create_readme(index)
+        readme_content = self.create_readme(index)
+        if self.write_if_changed("README.md", lambda: [readme_content]):
+            print(f"  ✓ {DOCS_DIR}/README.md 생성 완료")
+        else:
+            print(f"  - {DOCS_DIR}/README.md 변경 없음")
 
     def get_category_description(self, category):
         """카테고리 설명"""
@@ -295,65 +427,48 @@ class APIVerifier:
         }
         return descriptions.get(category, category)
 
-    def create_quick_reference(self, categorized_data):
+    def create_quick_reference(self):
         """자주 쓰는 API 빠른 참조"""
-        # 주요 카테고리만 선별
-        important_categories = [
-            'products', 'categories', 'orders', 'customers',
-            'shipping', 'coupons', 'oauth', 'store'
-        ]
-
         quick_ref = {}
 
-        for category in important_categories:
-            if category in categorized_data['admin']:
-                endpoints = categorized_data['admin'][category]
+        for category in IMPORTANT_CATEGORIES:
+            if category in self.buckets['admin']:
                 quick_ref[category] = {
                     "api_type": "admin",
                     "file": f"categories/admin/{category}.json",
-                    "common_operations": self.extract_common_operations(endpoints)
+                    "common_operations": self.buckets['admin'][category].common_operations
                 }
 
         return quick_ref
 
-    def extract_common_operations(self, endpoints):
-        """일반적인 CRUD 작업 추출"""
-        operations = {}
-
-        for ep in endpoints:
-            method = ep['method']
-            path = ep['path']
-            summary = ep.get('summary', '')
-
-            # 목록 조회
-            if method == 'GET' and not re.search(r'/\d+', path) and not re.search(r'/\{', path):
-                if 'list' not in operations:
-                    operations['list'] = {"method": method, "path": path, "summary": summary}
-
-            # 상세 조회
-            elif method == 'GET' and (re.search(r'/\d+', path) or re.search(r'/\{[^}]+\}', path)):
-                if 'get' not in operations:
-                    operations['get'] = {"method": method, "path": path, "summary": summary}
-
-            # 생성
-            elif method == 'POST':
-                if 'create' not in operations:
-                    operations['create'] = {"method": method, "path": path, "summary": summary}
-
-            # 수정
-            elif method == 'PUT':
-                if 'update' not in operations:
-                    operations['update'] = {"method": method, "path": path, "summary": summary}
-
-            # 삭제
-            elif method == 'DELETE':
-                if 'delete' not in operations:
-                    operations['delete'] = {"method": method, "path": path, "summary": summary}
+    def add_common_operation(self, operations, ep):
+        """일반적인 CRUD 작업 (작업마다 처음 나온 엔드포인트)"""
+        method = ep['method']
+        path = ep['path']
+        summary = ep.get('summary', '')
+
+        is_detail = NUMERIC_SEGMENT_RE.search(path)
+
+        # 목록 조회
+        if method == 'GET' and not is_detail and '/{' not in path:
+            operation = 'list'
+        # 상세 조회
+        elif method == 'GET' and (is_detail or PARAM_SEGMENT_RE.search(path)):
+            operation = 'get'
+        elif method == 'POST':
+            operation = 'create'
+        elif method == 'PUT':
+            operation = 'update'
+        elif method == 'DELETE':
+            operation = 'delete'
+        else:
+            return
 
-        return operations
+        if operation not in operations:
+            operations[operation] = {"method": method, "path": path, "summary": summary}
 
     def create_readme(self, index):
-        """README.md 생성"""
+        """README.md 내용 생성"""
         readme_content = f"""# Cafe24 API Documentation
 
 ## 📊 개요
@@ -467,11 +582,7 @@ cat docs/cafe24/categories/admin/orders.json
 생성 날짜: Vision AI 스크래핑으로 자동 생성
 """
 
-        readme_file = "docs/cafe24/README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-
-        print(f"  ✓ {readme_file} 생성 완료")
+        return readme_content
 
 def main():
     verifier = APIVerifier()
@@ -480,22 +591,28 @@ def main():
     print("🔍 Cafe24 API 검증 및 구조화")
     print("="*60)
 
-    # 1. 데이터 로드
-    print("\n📂 데이터 로드 중...")
-    verifier.load_data()
-    print("  ✓ 로드 완료")
+    try:
+        # 1. 데이터 읽기 (한 번만 스트리밍으로 훑으며 모든 통계 계산)
+        print("\n📂 데이터 스캔 중...")
+        verifier.scan()
+        print("  ✓ 스캔 완료")
+
+        # 2. 품질 검증
+        verifier.verify_data_quality()
 
-    # 2. 품질 검증
-    verification_result = verifier.verify_data_quality()
+        # 3. 카테고리별 분류
+        verifier.categorize_endpoints()
 
-    # 3. 카테고리별 분류
-    categorized_data = verifier.categorize_endpoints()
+        # 4. 카테고리별 파일 생성
+        verifier.create_categorized_files()
 
-    # 4. 카테고리별 파일 생성
-    verifier.create_categorized_files(categorized_data)
+        # 5. 인덱스 생성
+        verifier.create_index()
 
-    # 5. 인덱스 생성
-    verifier.create_index(categorized_data)
+        # 6. 다음 실행을 위한 해시 매니페스트
+        verifier.save_manifest()
+    finally:
+        verifier.cleanup()
 
     print("\n" + "="*60)
     print("✅ 모든 작업 완료!")
@@ -505,6 +622,7 @@ def main():
     print("  - docs/cafe24/README.md (사용 가이드)")
     print("  - docs/cafe24/categories/admin/*.json (Admin API 카테고리별)")
     print("  - docs/cafe24/categories/front/*.json (Front API 카테고리별)")
+    print(f"  - {SEARCH_DB} (검색 인덱스, python docs_search.py 로 검색)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,161 @@
+"""
+Vision 분석 백엔드
+- OpenRouterAnalyzer: OpenRouter 경유 GPT-4o Vision (실제 API 호출)
+- ReplayAnalyzer: 녹화된 응답을 타일 해시로 찾아 재생 (네트워크 없음)
+- StubAnalyzer: 타일 해시로 만든 가짜 응답 (네트워크/녹화 없이 파이프라인 프로파일링용)
+- RecordingAnalyzer: 다른 백엔드의 응답을 ReplayAnalyzer가 읽을 수 있게 녹화
+
+complete()는 {'content', 'finish_reason', 'prompt_tokens', 'completion_tokens'} 반환
+ReplayAnalyzer / StubAnalyzer는 실제 분석이 아니므로 recorded = False
+(스크래퍼는 이 결과를 Vision 캐시에 넣거나 실제 스펙 파일에 쓰지 않음)
+"""
+import os
+import json
+import base64
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+DEFAULT_RECORD_DIR = '.cache/vision-recordings'
+
+
+def recording_key(images):
+    """전송하는 이미지들의 해시 (이미지 하나면 그 이미지의 SHA-256)"""
+    if len(images) == 1:
+        return hashlib.sha256(images[0][0]).hexdigest()
+    digest = hashlib.sha256()
+    for image_bytes, _ in images:
+        digest.update(hashlib.sha256(image_bytes).digest())
+    return digest.hexdigest()
+
+
+class RecordingMissing(LookupError):
+    """재생할 녹화가 없음 (빈 결과로 대신하면 캐시/매니페스트에 빈 분석이 남음)"""
+
+
+class VisionAnalyzer(ABC):
+    """분석 백엔드 인터페이스"""
+    model = None
+    recorded = True  # 실제 모델 응답인지 (False면 캐시 / 실제 스펙 출력에 쓰지 않음)
+
+    @abstractmethod
+    async def complete(self, prompt, images, max_tokens):
+        """프롬프트와 (이미지 바이트, MIME 타입) 목록을 보내고 응답 반환"""
+
+
+class OpenRouterAnalyzer(VisionAnalyzer):
+    def __init__(self, model, api_key=None):
+        from openai import AsyncOpenAI
+
+        api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+        if not api_key:
+            raise ValueError("OPENROUTER_API_KEY 환경변수를 설정해주세요")
+
+        self.model = model
+        self.client = AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+            default_headers={
+                "HTTP-Referer": "http://localhost:5001",
+                "X-Title": "Cafe24 API Scraper"
+            }
+        )
+
+    async def complete(self, prompt, images, max_tokens):
+        content = [{"type": "text", "text": prompt}]
+        for image_bytes, mime_type in images:
+            content.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+                }
+            })
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": content}],
+            max_tokens=max_tokens,
+            temperature=0  # 정확성을 위해 0으로 설정
+        )
+        return {
+            'content': response.choices[0].message.content,
+            'finish_reason': response.choices[0].finish_reason,
+            'prompt_tokens': response.usage.prompt_tokens,
+            'completion_tokens': response.usage.completion_tokens
+        }
+
+
+class RecordingAnalyzer(VisionAnalyzer):
+    """감싼 백엔드의 응답을 record_dir/<타일 해시>.json 으로 저장"""
+
+    def __init__(self, analyzer, record_dir=DEFAULT_RECORD_DIR):
+        self.analyzer = analyzer
+        self.model = analyzer.model
+        self.record_dir = Path(record_dir)
+        self.record_dir.mkdir(parents=True, exist_ok=True)
+
+    async def complete(self, prompt, images, max_tokens):
+        response = await self.analyzer.complete(prompt, images, max_tokens)
+        path = self.record_dir / f"{recording_key(images)}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(response, model=self.model), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return response
+
+
+class ReplayAnalyzer(VisionAnalyzer):
+    """녹화된 응답 재생 (녹화가 없는 타일은 RecordingMissing, misses로 집계)"""
+    model = 'replay'
+    recorded = False
+
+    def __init__(self, record_dir=DEFAULT_RECORD_DIR, latency=0.0):
+        self.record_dir = Path(record_dir)
+        self.latency = latency
+        self.hits = 0
+        self.misses = 0
+
+    async def complete(self, prompt, images, max_tokens):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        key = recording_key(images)
+        try:
+            with open(self.record_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                recorded = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            raise RecordingMissing(f"녹화된 응답 없음 ({key[:12]})")
+        self.hits += 1
+        return {key: recorded[key] for key in ('content', 'finish_reason', 'prompt_tokens', 'completion_tokens')}
+
+
+class StubAnalyzer(VisionAnalyzer):
+    """이미지마다 해시로 정해지는 엔드포인트 하나를 돌려주는 가짜 백엔드 (결과는 실행마다 같음)"""
+    model = 'stub'
+    recorded = False
+
+    def __init__(self, latency=0.0, prompt_tokens_per_image=1000, completion_tokens_per_image=300):
+        self.latency = latency
+        self.prompt_tokens_per_image = prompt_tokens_per_image
+        self.completion_tokens_per_image = completion_tokens_per_image
+
+    async def complete(self, prompt, images, max_tokens):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        endpoints = []
+        for image_bytes, _ in images:
+            digest = hashlib.sha256(image_bytes).hexdigest()[:8]
+            endpoints.append({
+                'method': 'GET',
+                'path': f"/api/v2/admin/stub/{digest}",
+                'summary': f"stub {digest}",
+                'parameters': [{'name': 'shop_no', 'in': 'query', 'type': 'integer', 'required': False}]
+            })
+        return {
+            'content': json.dumps({'endpoints': endpoints}),
+            'finish_reason': 'stop',
+            'prompt_tokens': len(prompt) // 4 + self.prompt_tokens_per_image * len(images),
+            'completion_tokens': self.completion_tokens_per_image * len(images)
+        }
@@ -0,0 +1,155 @@
+"""
+Vision 분석 토큰/비용 예산과 배치 크기 조절
+- UsageBudget: 요청별 response.usage 누적, 예산 소진 시 중단, 보고서 저장
+- BatchSizer: 관측된 출력 길이와 잘림(finish_reason == 'length')에 따라 한 요청에 묶을 타일 수 조절
+"""
+import os
+import json
+import time
+
+# openai/gpt-4o 기준 100만 토큰당 가격 (USD)
+DEFAULT_INPUT_PRICE = 2.5
+DEFAULT_OUTPUT_PRICE = 10.0
+
+
+class UsageBudget:
+    def __init__(self, max_tokens=None, max_cost=None, input_price=DEFAULT_INPUT_PRICE,
+                 output_price=DEFAULT_OUTPUT_PRICE, degrade_ratio=0.8):
+        self.max_tokens = max_tokens    # 총 토큰 한도 (None이면 무제한)
+        self.max_cost = max_cost        # 총 비용 한도 (USD, None이면 무제한)
+        self.input_price = input_price
+        self.output_price = output_price
+        self.degrade_ratio = degrade_ratio  # 이 비율을 넘으면 배치를 최대로 키워 프롬프트 반복을 줄임
+        self.started_at = time.time()
+
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.requests = []
+        self.cache_hits = 0
+        self.truncated = 0
+        self.skipped = []
+
+    @property
+    def total_tokens(self):
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cost(self):
+        return (self.prompt_tokens * self.input_price + self.completion_tokens * self.output_price) / 1_000_000
+
+    def spent_ratio(self):
+        """한도 대비 사용 비율 (토큰/비용 중 큰 쪽, 한도가 없으면 0)"""
+        ratios = [0.0]
+        if self.max_tokens:
+            ratios.append(self.total_tokens / self.max_tokens)
+        if self.max_cost:
+            ratios.append(self.cost / self.max_cost)
+        return max(ratios)
+
+    def exhausted(self):
+        return self.spent_ratio() >= 1.0
+
+    def degraded(self):
+        return self.spent_ratio() >= self.degrade_ratio
+
+    def record(self, api_type, tiles, prompt_tokens, completion_tokens, finish_reason):
+        """API 응답 하나의 사용량 기록"""
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        if finish_reason == 'length':
+            self.truncated += 1
+        self.requests.append({
+            'api_type': api_type,
+            'tiles': tiles,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'finish_reason': finish_reason
+        })
+
+    def record_cache_hit(self):
+        self.cache_hits += 1
+
+    def skip(self, api_type, tiles):
+        """예산 소진으로 분석하지 못한 타일 기록 (다음 실행에서 다시 분석)"""
+        self.skipped.extend({'api_type': api_type, 'index': tile['index'], 'path': tile.get('path')}
+                            for tile in tiles)
+
+    def report(self):
+        analyzed_tiles = sum(len(request['tiles']) for request in self.requests)
+        return {
+            'started_at': self.started_at,
+            'finished_at': time.time(),
+            'requests': len(self.requests),
+            'analyzed_tiles': analyzed_tiles,
+            'tiles_per_request': round(analyzed_tiles / len(self.requests), 2) if self.requests else 0,
+            'cache_hits': self.cache_hits,
+            'truncated': self.truncated,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'total_tokens': self.total_tokens,
+            'estimated_cost_usd': round(self.cost, 4),
+            'budget': {
+                'max_tokens': self.max_tokens,
+                'max_cost_usd': self.max_cost,
+                'exhausted': self.exhausted()
+            },
+            'skipped_tiles': self.skipped,
+            'per_request': self.requests
+        }
+
+    def save(self, path):
+        """임시 파일에 쓴 뒤 교체"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def print_summary(self):
+        report = self.report()
+        print(f"\n💰 Vision 사용량")
+        print(f"  - 요청: {report['requests']}회 (요청당 타일 {report['tiles_per_request']}개, 캐시 사용 {report['cache_hits']}회)")
+        print(f"  - 토큰: {report['total_tokens']:,} (입력: {report['prompt_tokens']:,}, 출력: {report['completion_tokens']:,})")
+        print(f"  - 추정 비용: ${report['estimated_cost_usd']}")
+        if report['truncated']:
+            print(f"  - 출력 잘림: {report['truncated']}회")
+        if self.skipped:
+            print(f"  ⚠️  예산 소진으로 건너뛴 타일: {len(self.skipped)}개")
+
+
+class BatchSizer:
+    """요청당 타일 수를 출력 토큰 한도 안에서 조절
+
+    타일당 출력 토큰의 이동 평균으로 한도의 target_ratio를 채우는 크기를 고르고,
+    출력이 잘리면 상한을 절반으로 낮춘 뒤 잘리지 않는 요청마다 하나씩 회복
+    """
+
+    def __init__(self, max_size, max_output_tokens, start=2, target_ratio=0.6, smoothing=0.3):
+        self.max_size = max_size
+        self.max_output_tokens = max_output_tokens
+        self.target_ratio = target_ratio
+        self.smoothing = smoothing
+        self.limit = max_size
+        self.size = max(1, min(start, max_size))
+        self.per_tile = None
+
+    def next_size(self, degrade=False):
+        return self.limit if degrade else self.size
+
+    def observe(self, tiles, completion_tokens, truncated):
+        if truncated:
+            self.limit = max(1, tiles // 2)
+            self.size = min(self.size, self.limit)
+            return
+
+        per_tile = completion_tokens / float(tiles)
+        if self.per_tile is None:
+            self.per_tile = per_tile
+        else:
+            self.per_tile = self.smoothing * per_tile + (1 - self.smoothing) * self.per_tile
+
+        self.limit = min(self.max_size, self.limit + 1)
+        target = int(self.max_output_tokens * self.target_ratio / max(self.per_tile, 1.0))
+        self.size = max(1, min(self.limit, target))
@@ -0,0 +1,109 @@
+"""
+Vision 분석 결과 디스크 캐시
+- 키: PNG 바이트 + 프롬프트 + 모델의 SHA-256 (내용이 같으면 같은 키)
+- 문서가 바뀌지 않았으면 재실행 시 API 호출 없이 캐시에서 결과 사용
+- 크기/기간 기준 정리 (오래된 항목, 최근에 쓰지 않은 항목부터 삭제)
+"""
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = '.cache/vision'
+
+
+class VisionCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024, max_age_days=90):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(image_bytes, prompt, model):
+        digest = hashlib.sha256()
+        digest.update(model.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(prompt.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(image_bytes)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """캐시된 결과 반환, 없으면 None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # 최근 사용 시각 갱신 (LRU 정리 기준)
+        os.utime(path)
+        self.hits += 1
+        return entry['result']
+
+    def put(self, key, result, usage=None):
+        """임시 파일에 쓴 뒤 교체"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {'result': result, 'usage': usage, 'created_at': time.time()}
+
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _entries(self):
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def evict(self):
+        """기간 초과 항목 삭제 후, 용량 초과분을 오래 안 쓴 순서로 삭제"""
+        now = time.time()
+        removed = 0
+        entries = []
+        for path, size, mtime in self._entries():
+            if now - mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        return removed
+
+    def stats(self):
+        entries = list(self._entries())
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def print_stats(self):
+        stats = self.stats()
+        print(f"\n💾 Vision 캐시 ({self.cache_dir})")
+        print(f"  - 항목: {stats['entries']}개 ({stats['bytes'] / 1024 / 1024:.1f}MB)")
+        print(f"  - 적중: {stats['hits']}회, 미스: {stats['misses']}회 (적중률 {stats['hit_rate'] * 100:.1f}%)")
@@ -0,0 +1,310 @@
+"""
+Cafe24 웹훅 수신 큐
+- 수신 즉시 로컬 SQLite 큐(webhooks.db)에 저장하고 응답 (처리는 비동기)
+- 멱등성 키로 중복 수신 이벤트 제거
+- 워커 풀이 배치 단위로 큐를 비우며, 같은 쇼핑몰의 이벤트는 항상 같은 워커가 순서대로 처리
+- 배치는 임대(lease)로 가져감: 여러 프로세스(gunicorn 워커)가 같은 DB를 써도 한 파티션은
+  한 번에 한 곳에서만 처리하고, 처리 중 프로세스가 죽으면 임대가 끝난 뒤 다시 처리
+- 핸들러가 실패한 이벤트는 점점 길게 기다렸다가 다시 시도 (그동안 같은 쇼핑몰의 뒤 이벤트도 대기)
+- 워커는 DB 오류 등 예외가 나도 멈추지 않고 잠시 뒤 다시 시도
+- event_no 별로 핸들러를 등록해서 사용
+
+핸들러 등록 예:
+    from webhook_queue import register_handler
+
+    @register_handler(90023)
+    def on_product_updated(event):
+        print(event['shop_id'], event['payload'])
+"""
+import hmac
+import json
+import time
+import zlib
+import base64
+import hashlib
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+WEBHOOK_DB = 'webhooks.db'
+MAX_ATTEMPTS = 5
+LEASE_SECONDS = 300  # 가져간 배치를 처리해야 하는 시간 (넘으면 다른 워커가 다시 가져감)
+RETRY_BASE_SECONDS = 30  # 첫 재시도까지 대기, 실패할 때마다 두 배 (30s, 1m, 2m, 4m)
+RETRY_MAX_SECONDS = 3600
+WORKER_ERROR_MAX_SECONDS = 60  # 워커 오류 후 다시 시도하기까지 최대 대기
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    shop_id TEXT NOT NULL,
+    partition INTEGER NOT NULL,
+    event_no INTEGER,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    lease_until REAL,
+    next_attempt_at REAL,
+    received_at TEXT NOT NULL,
+    processed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_pending ON events (partition, status, id);
+"""
+
+# event_no -> 핸들러 목록 ('*'는 모든 이벤트)
+HANDLERS = defaultdict(list)
+
+
+def register_handler(event_no='*'):
+    """이벤트 핸들러 등록 데코레이터"""
+    def decorator(func):
+        HANDLERS[event_no].append(func)
+        return func
+    return decorator
+
+
+def verify_signature(account, raw_body, headers):
+    """웹훅 요청 검증
+
+    - X-Cafe24-Hmac-Sha256: 앱 Service Key로 본문을 HMAC-SHA256 서명한 값(base64)
+    - X-Api-Key: 앱 Service Key
+    """
+    service_key = account.get('service_key') or ''
+    if not service_key:
+        return False
+
+    signature = headers.get('X-Cafe24-Hmac-Sha256')
+    if signature:
+        digest = hmac.new(service_key.encode(), raw_body, hashlib.sha256).digest()
+        expected = base64.b64encode(digest).decode()
+        return hmac.compare_digest(expected, signature)
+
+    api_key = headers.get('X-Api-Key')
+    if api_key:
+        return hmac.compare_digest(service_key, api_key)
+
+    return False
+
+
+def idempotency_key(raw_body, headers):
+    """중복 수신 판별 키 (Trace ID가 없으면 본문 해시)"""
+    trace_id = headers.get('X-Trace-Id')
+    if trace_id:
+        return trace_id
+    return hashlib.sha256(raw_body).hexdigest()
+
+
+class WebhookQueue:
+    """SQLite 기반 내구성 있는 웹훅 큐 + 워커 풀"""
+
+    def __init__(self, db_path=WEBHOOK_DB, workers=4, batch_size=50, poll_interval=1.0):
+        self.db_path = db_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.wakeups = [threading.Event() for _ in range(workers)]
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.start_lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(events)')}
+            # 임대 / 재시도 대기 도입 전에 만든 DB
+            for column in ('lease_until', 'next_attempt_at'):
+                if column not in columns:
+                    conn.execute(f'ALTER TABLE events ADD COLUMN {column} REAL')
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def partition_of(self, shop_id):
+        """쇼핑몰별 고정 파티션 (같은 쇼핑몰 = 같은 워커 → 순서 보장)"""
+        return zlib.crc32(shop_id.encode()) % self.workers
+
+    def enqueue(self, shop_id, payload, key):
+        """이벤트 저장, 이미 받은 이벤트면 False"""
+        partition = self.partition_of(shop_id)
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    'INSERT OR IGNORE INTO events '
+                    '(idempotency_key, shop_id, partition, event_no, payload, received_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, shop_id, partition, payload.get('event_no'),
+                     json.dumps(payload, ensure_ascii=False), datetime.now().isoformat())
+                )
+        finally:
+            conn.close()
+
+        if cursor.rowcount:
+            self.wakeups[partition].set()
+            return True
+        return False
+
+    def start(self):
+        """워커 스레드 시작 (이미 시작했으면 아무것도 하지 않음)
+
+        import 시점이 아니라 요청을 받는 프로세스 안에서 호출 (gunicorn fork 후)
+        """
+        with self.start_lock:
+            if self.threads:
+                return
+            self._start_threads()
+
+    def _start_threads(self):
+        for partition in range(self.workers):
+            thread = threading.Thread(target=self._worker, args=(partition,), daemon=True,
+                                      name=f"webhook-worker-{partition}")
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self):
+        self.stop_event.set()
+        for wakeup in self.wakeups:
+            wakeup.set()
+        for thread in self.threads:
+            thread.join(timeout=5)
+
+    def _worker(self, partition):
+        """파티션 처리 루프 (예외가 나도 스레드를 끝내지 않음: 연결을 새로 열고 점점 길게 쉬었다가 다시 시도)"""
+        conn = None
+        wakeup = self.wakeups[partition]
+        errors = 0
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    if conn is None:
+                        conn = self._connect()
+                    processed = self.drain_batch(conn, partition)
+                    errors = 0
+                except Exception as e:
+                    errors += 1
+                    delay = min(self.poll_interval * 2 ** errors, WORKER_ERROR_MAX_SECONDS)
+                    print(f"  ⚠️  웹훅 워커 {partition} 오류 ({delay:.0f}초 뒤 다시 시도): {e}")
+                    if conn is not None:
+                        conn.close()
+                        conn = None
+                    self.stop_event.wait(delay)
+                    continue
+                if processed < self.batch_size:
+                    wakeup.wait(self.poll_interval)
+                    wakeup.clear()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def claim_batch(self, conn, partition, now=None):
+        """파티션의 대기 이벤트를 한 배치 임대 (다른 프로세스가 처리 중인 파티션이면 빈 목록)
+
+        BEGIN IMMEDIATE 로 쓰기 잠금을 잡은 채 고르고 표시하므로 두 워커가 같은 이벤트를 가져가지 않음
+        임대가 끝난 'processing' 이벤트는 처리 중 죽은 워커의 것이므로 다시 가져감
+        재시도 시각(next_attempt_at)이 안 된 이벤트가 있는 쇼핑몰은 순서 유지를 위해 통째로 건너뜀
+        """
+        if now is None:
+            now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            leased = conn.execute(
+                "SELECT 1 FROM events WHERE partition = ? AND status = 'processing' AND lease_until >= ? LIMIT 1",
+                (partition, now)
+            ).fetchone()
+            rows = [] if leased else conn.execute(
+                "SELECT id, shop_id, event_no, payload, attempts FROM events "
+                "WHERE partition = ? AND status IN ('pending', 'processing') "
+                "AND shop_id NOT IN (SELECT shop_id FROM events WHERE partition = ? AND status = 'pending' "
+                "AND next_attempt_at > ?) ORDER BY id LIMIT ?",
+                (partition, partition, now, self.batch_size)
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE events SET status = 'processing', lease_until = ? "
+                    f"WHERE id IN ({','.join('?' * len(rows))}) AND status IN ('pending', 'processing')",
+                    [now + LEASE_SECONDS] + [row[0] for row in rows]
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return rows
+
+    def drain_batch(self, conn, partition):
+        """파티션의 대기 이벤트를 한 배치 처리, 처리한 건수 반환"""
+        rows = self.claim_batch(conn, partition)
+
+        done = []
+        retries = []
+        failed = []
+        blocked_shops = set()  # 실패한 이벤트 뒤의 같은 쇼핑몰 이벤트는 순서 유지를 위해 보류
+
+        for event_id, shop_id, event_no, payload, attempts in rows:
+            if shop_id in blocked_shops:
+                continue
+
+            try:
+                # 읽을 수 없는 본문도 핸들러 실패처럼 재시도 후 failed 로 남김
+                event = {
+                    'id': event_id,
+                    'shop_id': shop_id,
+                    'event_no': event_no,
+                    'payload': json.loads(payload)
+                }
+                for handler in HANDLERS.get(event_no, []) + HANDLERS.get('*', []):
+                    handler(event)
+                done.append(event_id)
+            except Exception as e:
+                if attempts + 1 >= MAX_ATTEMPTS:
+                    failed.append((str(e), event_id))
+                    print(f"  ✗ 웹훅 {event_id} ({shop_id}, {event_no}): 처리 실패 - {e}")
+                else:
+                    delay = min(RETRY_BASE_SECONDS * 2 ** attempts, RETRY_MAX_SECONDS)
+                    retries.append((str(e), time.time() + delay, event_id))
+                    blocked_shops.add(shop_id)
+
+        now = datetime.now().isoformat()
+        finished = set(done) | {event_id for _, event_id in failed}
+        retried = {event_id for _, _, event_id in retries}
+        with conn:
+            conn.executemany(
+                "UPDATE events SET status = 'done', processed_at = ?, lease_until = NULL, next_attempt_at = NULL "
+                "WHERE id = ?",
+                [(now, event_id) for event_id in done]
+            )
+            conn.executemany(
+                "UPDATE events SET status = 'pending', attempts = attempts + 1, last_error = ?, "
+                "next_attempt_at = ?, lease_until = NULL WHERE id = ?",
+                retries
+            )
+            conn.executemany(
+                "UPDATE events SET status = 'failed', attempts = attempts + 1, last_error = ?, "
+                "lease_until = NULL, next_attempt_at = NULL WHERE id = ?",
+                failed
+            )
+            # 보류한 이벤트는 임대를 풀어 다음 배치에서 다시 처리 (앞 이벤트의 재시도 시각까지는 건너뜀)
+            conn.executemany(
+                "UPDATE events SET status = 'pending', lease_until = NULL WHERE id = ?",
+                [(row[0],) for row in rows if row[0] not in finished and row[0] not in retried]
+            )
+
+        return len(done) + len(failed)
+
+    def stats(self):
+        """상태별 이벤트 수"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('SELECT status, COUNT(*) FROM events GROUP BY status').fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
+
+
+@register_handler()
+def log_event(event):
+    """기본 핸들러: 수신 로그"""
+    print(f"  📨 웹훅 처리: {event['shop_id']} event_no={event['event_no']}")